@@ -1,5 +1,12 @@
 #include <iostream>
 #include <chrono>
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <exception>
+#include <mutex>
+#include <thread>
+#include <vector>
 #include "CProgram.h"
 #include "problem/AProblem.h"
 #include "factories/problem/CProblemFactory.h"
@@ -7,9 +14,11 @@
 #include "method/AMethod.h"
 #include "factories/method/CMethodFactory.h"
 #include "utils/logger/CExperimentLogger.h"
+#include "method/AGeneticMethod.h"
+#include "method/island/CIslandModel.h"
 
 // Initialize a static member variable of AMethod to count the number of experiment runs
-int AMethod::m_ExperimentRunCounter = 0;
+thread_local int AMethod::m_ExperimentRunCounter = 0;
 
 // Define the 'Run' method of the CProgram class, which executes the main program logic
 void CProgram::Run(const SProgramParams &programParams)
@@ -26,31 +35,33 @@ void CProgram::Run(const SProgramParams &programParams)
             *problem
     );
 
-    // Initialize a random number generator
-    CRandom::SetSeed(programParams.m_Seed);
-
-    // Loop through the number of executions specified in the program parameters
-    for (int i = 0; i < programParams.m_ExecutionsCount; i++, AMethod::m_ExperimentRunCounter++)
+    // Islands exchange individuals only in genetic methods, other methods would just run several times
+    if (CIslandModel::IsEnabled() && dynamic_cast<AGeneticMethod*>(method) == nullptr)
     {
-        CRandom::SetSeed(programParams.m_Seed+i);
-
-        // Create a prefix for output data paths for each experiment run
-        CExperimentLogger::CreateOutputDataPrefix();
-
-        // Record the start time of the optimization process
-        auto start = std::chrono::high_resolution_clock::now();
+        throw std::runtime_error("Island model is supported only by genetic methods");
+    }
 
-        // Output a message indicating the start of an optimization run
-        std::cout << "Optimization run #" << i << " ongoing ..." << std::endl;
+    // Islands fork the whole process, which cannot be done while other runs are executed in threads
+    int workersCount = std::min(programParams.m_WorkersCount, programParams.m_ExecutionsCount);
+    if (workersCount > 1 && CIslandModel::IsEnabled())
+    {
+        throw std::runtime_error("Island model cannot be combined with parallel runs");
+    }
 
-        // Run the optimization process and then reset the method for the next iteration
-        method->RunOptimization();
-        method->Reset();
+    // Initialize a random number generator
+    CRandom::SetSeed(programParams.m_Seed);
 
-        // Record the end time, calculate, and output the duration of the optimization
-        auto end = std::chrono::high_resolution_clock::now();
-        auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end - start);
-        std::cout << "Finished in " << duration.count() << "ms" << std::endl;
+    if (workersCount > 1)
+    {
+        RunParallel(programParams, *problem, *method, workersCount);
+    }
+    else
+    {
+        // Loop through the number of executions specified in the program parameters
+        for (int i = 0; i < programParams.m_ExecutionsCount; i++, AMethod::m_ExperimentRunCounter++)
+        {
+            ExecuteRun(programParams, *problem, *method, i);
+        }
     }
 
     // Clean up and delete objects created by the problem and method factories
@@ -60,4 +71,132 @@ void CProgram::Run(const SProgramParams &programParams)
     // Free the memory allocated for 'method' and 'problem' pointers
     delete method;
     delete problem;
-}
\ No newline at end of file
+}
+
+void CProgram::ExecuteRun(const SProgramParams &programParams, AProblem &problem, AMethod &method, int runIdx)
+{
+    CRandom::SetSeed(programParams.m_Seed + runIdx);
+
+    // Create a prefix for output data paths for each experiment run
+    CExperimentLogger::CreateOutputDataPrefix();
+
+    // Record the start time of the optimization process
+    auto start = std::chrono::high_resolution_clock::now();
+
+    // Output a message indicating the start of an optimization run, as a single write so parallel runs do not mix lines
+    std::cout << "Optimization run #" + std::to_string(runIdx) + " ongoing ...\n" << std::flush;
+
+    // Split the run into island processes if configured, only the main island continues after the run
+    CIslandModel::StartRun(programParams.m_Seed + runIdx);
+
+    // Run the optimization process and then reset the method for the next iteration
+    method.RunOptimization();
+    CIslandModel::FinishRun();
+    problem.LogAdditionalData();
+    method.Reset();
+    CExperimentLogger::FinishRun();
+
+    // Record the end time, calculate, and output the duration of the optimization
+    auto end = std::chrono::high_resolution_clock::now();
+    auto duration = std::chrono::duration_cast<std::chrono::milliseconds>(end - start);
+    std::cout << "Finished in " + std::to_string(duration.count()) + "ms\n" << std::flush;
+
+    // Record what produced this run directory, so result tools do not have to guess it from paths
+    CExperimentLogger::LogRunInfo(programParams, programParams.m_Seed + runIdx, duration.count());
+}
+
+void CProgram::RunParallel(const SProgramParams &programParams, AProblem &problem, AMethod &method, int workersCount)
+{
+    const int firstRunCounter = AMethod::m_ExperimentRunCounter;
+    std::atomic<int> nextRunIdx{0};
+    std::vector<std::exception_ptr> errors(workersCount);
+
+    // Runs are taken in order by whichever worker is free, every run depends only on its own seed
+    auto executeRuns = [&](AProblem &workerProblem, AMethod &workerMethod, int workerIdx)
+    {
+        try
+        {
+            for (int i = nextRunIdx++; i < programParams.m_ExecutionsCount; i = nextRunIdx++)
+            {
+                AMethod::m_ExperimentRunCounter = firstRunCounter + i;
+                ExecuteRun(programParams, workerProblem, workerMethod, i);
+            }
+        }
+        catch (...)
+        {
+            errors[workerIdx] = std::current_exception();
+            // Other workers finish their current runs and stop
+            nextRunIdx = programParams.m_ExecutionsCount;
+        }
+    };
+
+    // Workers create their own problem and method, the parsed instance is shared. Creation is serialized, because
+    // the method factory configures process wide settings, and all workers are created before any run starts.
+    std::mutex creationMutex;
+    std::condition_variable creationCondition;
+    int workersToCreate = workersCount - 1;
+    bool isCreationFailed = false;
+
+    std::vector<std::thread> workers;
+    workers.reserve(workersCount - 1);
+    for (int w = 1; w < workersCount; ++w)
+    {
+        workers.emplace_back([&, w]()
+        {
+            AProblem *workerProblem = nullptr;
+            AMethod *workerMethod = nullptr;
+            {
+                std::unique_lock<std::mutex> lock(creationMutex);
+                try
+                {
+                    workerProblem = CProblemFactory::CreateProblem(
+                            programParams.m_ProblemName,
+                            programParams.m_ProblemInstancePath
+                    );
+                    workerMethod = CMethodFactory::CreateMethod(programParams.m_MethodConfigPath, *workerProblem);
+                }
+                catch (...)
+                {
+                    errors[w] = std::current_exception();
+                    isCreationFailed = true;
+                }
+                --workersToCreate;
+                creationCondition.notify_all();
+                creationCondition.wait(lock, [&]() { return workersToCreate == 0; });
+            }
+
+            if (!isCreationFailed)
+            {
+                executeRuns(*workerProblem, *workerMethod, w);
+            }
+
+            // Method factory objects are owned by the thread which created them
+            CMethodFactory::DeleteObjects();
+            delete workerMethod;
+            delete workerProblem;
+        });
+    }
+
+    {
+        std::unique_lock<std::mutex> lock(creationMutex);
+        creationCondition.wait(lock, [&]() { return workersToCreate == 0; });
+    }
+    if (!isCreationFailed)
+    {
+        executeRuns(problem, method, 0);
+    }
+
+    for (std::thread &worker: workers)
+    {
+        worker.join();
+    }
+    AMethod::m_ExperimentRunCounter = firstRunCounter + programParams.m_ExecutionsCount;
+
+    for (const std::exception_ptr &error: errors)
+    {
+        if (error)
+        {
+            std::rethrow_exception(error);
+        }
+    }
+}
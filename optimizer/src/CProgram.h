@@ -2,6 +2,7 @@
 
 #include <string>
 #include "SProgramParams.h"
+#include "method/AMethod.h"
 
 /**
  * @brief Class representing the main program.
@@ -25,4 +26,29 @@ public:
      *                      required for program execution.
      */
     static void Run(const SProgramParams &programParams);
+
+private:
+    /**
+     * @brief Executes a single optimization run with its own seed and output directory.
+     *
+     * @param programParams Program parameters of the whole experiment.
+     * @param problem       Problem optimized by the method, it logs its additional data after the run.
+     * @param method        Method used for the run, it is reset afterwards.
+     * @param runIdx        Index of the run, its seed is the experiment seed plus this index.
+     */
+    static void ExecuteRun(const SProgramParams &programParams, AProblem &problem, AMethod &method, int runIdx);
+
+    /**
+     * @brief Executes all runs concurrently in worker threads.
+     *
+     * The calling thread is one of the workers and uses the already created problem and method,
+     * other workers create their own problem and method sharing the parsed instance.
+     * Output of every run is the same as when runs are executed sequentially.
+     *
+     * @param programParams Program parameters of the whole experiment.
+     * @param problem       Problem used by the calling thread.
+     * @param method        Method used by the calling thread.
+     * @param workersCount  Number of worker threads, including the calling one.
+     */
+    static void RunParallel(const SProgramParams &programParams, AProblem &problem, AMethod &method, int workersCount);
 };
\ No newline at end of file
@@ -19,4 +19,7 @@ struct SProgramParams
 
     // <Optional> Seed for random generation
     int m_Seed;
+
+    // <Optional> Number of runs executed concurrently in threads
+    int m_WorkersCount;
 };
\ No newline at end of file
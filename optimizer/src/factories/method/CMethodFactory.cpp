@@ -20,14 +20,16 @@
 #include "methods/MO/BNTGA/CBNTGAFactory.h"
 #include "methods/MO/SPEA2/CSPEA2Factory.h"
 #include "../../utils/fileReader/CReadUtils.h"
+#include "../../method/island/CIslandModel.h"
+#include "../../utils/logger/CExperimentLogger.h"
 
 
 
 // Static members of CMethodFactory, initialized to nullptr. These will hold various components of an optimization method.
-SConfigMap* CMethodFactory::configMap = nullptr;
-AInitialization* CMethodFactory::initialization = nullptr;
-ACrossover* CMethodFactory::crossover = nullptr;
-AMutation* CMethodFactory::mutation = nullptr;
+thread_local SConfigMap* CMethodFactory::configMap = nullptr;
+thread_local AInitialization* CMethodFactory::initialization = nullptr;
+thread_local ACrossover* CMethodFactory::crossover = nullptr;
+thread_local AMutation* CMethodFactory::mutation = nullptr;
 
 // Static method to create an optimization method based on a configuration file and a problem instance.
 AMethod* CMethodFactory::CreateMethod(
@@ -47,6 +49,12 @@ AMethod* CMethodFactory::CreateMethod(
         throw std::runtime_error("MethodName not provided in method configuration");
     }
 
+    // Read optional island model parameters (Islands, MigrationInterval, MigrationTopology, MigrantsCount)
+    CIslandModel::Configure(configMap);
+
+    // Read optional sampling of logged generation data (DataLogInterval)
+    CExperimentLogger::Configure(configMap);
+
     // Create initialization strategy based on the configuration map.
     initialization = CInitializationFactory::Create(configMap, problem);
 
@@ -138,6 +146,6 @@ void CMethodFactory::DeleteObjects() {
     CSPEA2Factory::DeleteObjects();
     CACOFactory::DeleteObjects();
     CNTGA2_ALNSFactory::DeleteObjects();
-    CGPHHFactory:DeleteObjects();
+    CGPHHFactory::DeleteObjects();
 
 }
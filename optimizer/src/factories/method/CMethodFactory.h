@@ -13,8 +13,8 @@ public:
     );
     static void DeleteObjects();
 private:
-    static SConfigMap *configMap;
-    static AInitialization *initialization;
-    static ACrossover *crossover;
-    static AMutation *mutation;
+    static thread_local SConfigMap *configMap;
+    static thread_local AInitialization *initialization;
+    static thread_local ACrossover *crossover;
+    static thread_local AMutation *mutation;
 };
@@ -1,7 +1,7 @@
 #include "CANTGAFactory.h"
 #include "../../../operators/selection/CSelectionFactory.h"
 
-CGapSelectionByRandomDim* CANTGAFactory::gapSelectionByRandomDim = nullptr;
+thread_local CGapSelectionByRandomDim* CANTGAFactory::gapSelectionByRandomDim = nullptr;
 
 CANTGA* CANTGAFactory::CreateANTGA(SConfigMap* configMap, AProblem& problem, AInitialization* initialization,
                                    ACrossover* crossover, AMutation* mutation)
@@ -12,5 +12,5 @@ public:
                                AMutation* mutation);
     static void DeleteObjects();
 private:
-    static CGapSelectionByRandomDim* gapSelectionByRandomDim;
+    static thread_local CGapSelectionByRandomDim* gapSelectionByRandomDim;
 };
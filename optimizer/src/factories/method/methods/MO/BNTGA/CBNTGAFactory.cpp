@@ -1,7 +1,7 @@
 #include "CBNTGAFactory.h"
 #include "../../../operators/selection/CSelectionFactory.h"
 
-CGapSelectionByRandomDim *CBNTGAFactory::gapSelectionByRandomDim = nullptr;
+thread_local CGapSelectionByRandomDim *CBNTGAFactory::gapSelectionByRandomDim = nullptr;
 
 CBNTGA *CBNTGAFactory::CreateBNTGA(SConfigMap *configMap, AProblem &problem, AInitialization *initialization,
                                    ACrossover *crossover, AMutation *mutation)
@@ -5,7 +5,7 @@
 #include "../../../operators/selection/CSelectionFactory.h"
 #include "../../../operators/initialization/CInitializationFactory.h"
 
-CRankedTournament *CNSGAIIFactory::rankedTournament = nullptr;
+thread_local CRankedTournament *CNSGAIIFactory::rankedTournament = nullptr;
 
 CNSGAII *CNSGAIIFactory::CreateNSGAII(SConfigMap *configMap, AProblem &problem, AInitialization *initialization,
                                       ACrossover *crossover,
@@ -12,5 +12,5 @@ public:
                                  AMutation *mutation);
     static void DeleteObjects();
 private:
-    static CRankedTournament *rankedTournament;
+    static thread_local CRankedTournament *rankedTournament;
 };
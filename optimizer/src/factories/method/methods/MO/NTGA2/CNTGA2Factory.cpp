@@ -5,8 +5,8 @@
 #include "../../../operators/mutation/CMutationFactory.h"
 #include "../../../operators/crossover/CCrossoverFactory.h"
 
-CRankedTournament *CNTGA2Factory::rankedTournament = nullptr;
-CGapSelectionByRandomDim *CNTGA2Factory::gapSelectionByRandomDim = nullptr;
+thread_local CRankedTournament *CNTGA2Factory::rankedTournament = nullptr;
+thread_local CGapSelectionByRandomDim *CNTGA2Factory::gapSelectionByRandomDim = nullptr;
 
 CNTGA2 *CNTGA2Factory::CreateNTGA2(SConfigMap *configMap, AProblem &problem, AInitialization *initialization,
                                    ACrossover *crossover,
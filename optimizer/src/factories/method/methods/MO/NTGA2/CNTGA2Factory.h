@@ -11,6 +11,6 @@ public:
                                AMutation *mutation);
     static void DeleteObjects();
 private:
-    static CRankedTournament *rankedTournament;
-    static CGapSelectionByRandomDim *gapSelectionByRandomDim;
+    static thread_local CRankedTournament *rankedTournament;
+    static thread_local CGapSelectionByRandomDim *gapSelectionByRandomDim;
 };
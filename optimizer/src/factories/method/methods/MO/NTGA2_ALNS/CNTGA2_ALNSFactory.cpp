@@ -5,10 +5,10 @@
 #include "../../../operators/mutation/CMutationFactory.h"
 #include "../../../operators/crossover/CCrossoverFactory.h"
 
-CRankedTournament * CNTGA2_ALNSFactory::rankedTournament = nullptr;
-CGapSelectionByRandomDim * CNTGA2_ALNSFactory::gapSelectionByRandomDim = nullptr;
-std::vector<AMutation*>* CNTGA2_ALNSFactory::s_alnsRemovalMutations;
-std::vector<AMutation*>* CNTGA2_ALNSFactory::s_alnsInsertionMutations;
+thread_local CRankedTournament * CNTGA2_ALNSFactory::rankedTournament = nullptr;
+thread_local CGapSelectionByRandomDim * CNTGA2_ALNSFactory::gapSelectionByRandomDim = nullptr;
+thread_local std::vector<AMutation*>* CNTGA2_ALNSFactory::s_alnsRemovalMutations;
+thread_local std::vector<AMutation*>* CNTGA2_ALNSFactory::s_alnsInsertionMutations;
 
 CNTGA2_ALNS * CNTGA2_ALNSFactory::CreateNTGA2_ALNS(SConfigMap *configMap
     , AProblem &problem
@@ -15,8 +15,8 @@ public:
         , std::vector<AMutation*>* alnsInsertionMutations);
     static void DeleteObjects();
 private:
-    static CRankedTournament *rankedTournament;
-    static CGapSelectionByRandomDim *gapSelectionByRandomDim;
-    static std::vector<AMutation*>* s_alnsRemovalMutations;
-    static std::vector<AMutation*>* s_alnsInsertionMutations;
+    static thread_local CRankedTournament *rankedTournament;
+    static thread_local CGapSelectionByRandomDim *gapSelectionByRandomDim;
+    static thread_local std::vector<AMutation*>* s_alnsRemovalMutations;
+    static thread_local std::vector<AMutation*>* s_alnsInsertionMutations;
 };
@@ -3,7 +3,7 @@
 #include "../../../../../utils/fileReader/CReadUtils.h"
 #include <string>
 
-std::vector<float> *CACOFactory::objectiveWeights = nullptr;
+thread_local std::vector<float> *CACOFactory::objectiveWeights = nullptr;
 
 CACO *CACOFactory::CreateACO(SConfigMap *configMap, AProblem &problem, AInitialization *initialization,const char *optimizerConfigPath) {
     objectiveWeights = new std::vector<float>();
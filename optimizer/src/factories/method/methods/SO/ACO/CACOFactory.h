@@ -9,5 +9,5 @@ public:
     static CACO *CreateACO(SConfigMap *configMap, AProblem &problem, AInitialization *initialization,const char *optimizerConfigPath);
     static void DeleteObjects();
 private:
-    static std::vector<float> *objectiveWeights;
+    static thread_local std::vector<float> *objectiveWeights;
 };
@@ -2,7 +2,7 @@
 #include "CDEFactory.h"
 #include "../../../../../utils/fileReader/CReadUtils.h"
 
-std::vector<float>* CDEFactory::objectiveWeights = nullptr;
+thread_local std::vector<float>* CDEFactory::objectiveWeights = nullptr;
 
 CDE* CDEFactory::CreateDE(SConfigMap* configMap, AProblem& problem, AInitialization* initialization)
 {
@@ -8,5 +8,5 @@ public:
     static CDE* CreateDE(SConfigMap* configMap, AProblem& problem, AInitialization* initialization);
     static void DeleteObjects();
 private:
-    static std::vector<float>* objectiveWeights;
+    static thread_local std::vector<float>* objectiveWeights;
 };
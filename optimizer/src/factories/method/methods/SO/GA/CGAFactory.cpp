@@ -4,8 +4,8 @@
 #include "../../../../../utils/fileReader/CReadUtils.h"
 #include "../../../operators/selection/CSelectionFactory.h"
 
-std::vector<float> *CGAFactory::objectiveWeights = nullptr;
-CFitnessTournament *CGAFactory::fitnessTournament = nullptr;
+thread_local std::vector<float> *CGAFactory::objectiveWeights = nullptr;
+thread_local CFitnessTournament *CGAFactory::fitnessTournament = nullptr;
 
 CGA *CGAFactory::CreateGA(SConfigMap *configMap, AProblem &problem, AInitialization *initialization,
                           ACrossover *crossover,
@@ -4,8 +4,8 @@
 #include "../../../../../utils/fileReader/CReadUtils.h"
 #include "../../../operators/selection/CSelectionFactory.h"
 
-std::vector<float> *CGPHHFactory::objectiveWeights = nullptr;
-CFitnessTournament *CGPHHFactory::fitnessTournament = nullptr;
+thread_local std::vector<float> *CGPHHFactory::objectiveWeights = nullptr;
+thread_local CFitnessTournament *CGPHHFactory::fitnessTournament = nullptr;
 
 CGPHH *CGPHHFactory::CreateGPHH(SConfigMap *configMap, AProblem &problem, AInitialization *initialization,
                           ACrossover *crossover,
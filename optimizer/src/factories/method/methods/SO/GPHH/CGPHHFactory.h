@@ -11,6 +11,6 @@ public:
                          AMutation *mutation);
     static void DeleteObjects();
 private:
-    static std::vector<float> *objectiveWeights;
-    static CFitnessTournament *fitnessTournament;
+    static thread_local std::vector<float> *objectiveWeights;
+    static thread_local CFitnessTournament *fitnessTournament;
 };
@@ -3,7 +3,7 @@
 #include "../../../../../utils/fileReader/CReadUtils.h"
 #include "../../../../../method/methods/SO/PSO/CPSO.h"
 
-std::vector<float>* CPSOFactory::objectiveWeights = nullptr;
+thread_local std::vector<float>* CPSOFactory::objectiveWeights = nullptr;
 
 CPSO* CPSOFactory::CreatePSO(SConfigMap* configMap, AProblem& problem, AInitialization* initialization)
 {
@@ -9,6 +9,6 @@ public:
     static CPSO* CreatePSO(SConfigMap* configMap, AProblem& problem, AInitialization* initialization);
     static void DeleteObjects();
 private:
-    static std::vector<float>* objectiveWeights;
+    static thread_local std::vector<float>* objectiveWeights;
 };
 
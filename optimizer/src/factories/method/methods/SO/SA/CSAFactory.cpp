@@ -2,7 +2,7 @@
 #include "CSAFactory.h"
 #include "../../../../../utils/fileReader/CReadUtils.h"
 
-std::vector<float>* CSAFactory::objectiveWeights = nullptr;
+thread_local std::vector<float>* CSAFactory::objectiveWeights = nullptr;
 
 CSA* CSAFactory::CreateSA(SConfigMap* configMap, AProblem& problem, AInitialization* initialization)
 {
@@ -2,7 +2,7 @@
 #include "CTSFactory.h"
 #include "../../../../../utils/fileReader/CReadUtils.h"
 
-std::vector<float>* CTSFactory::objectiveWeights = nullptr;
+thread_local std::vector<float>* CTSFactory::objectiveWeights = nullptr;
 // Other specific members for CTS
 
 CTS* CTSFactory::CreateTS(SConfigMap* configMap, AProblem& problem, AInitialization* initialization)
@@ -9,5 +9,5 @@ public:
     static CTS* CreateTS(SConfigMap* configMap, AProblem& problem, AInitialization* initialization);
     static void DeleteObjects();
 private:
-    static std::vector<float>* objectiveWeights;
+    static thread_local std::vector<float>* objectiveWeights;
 };
\ No newline at end of file
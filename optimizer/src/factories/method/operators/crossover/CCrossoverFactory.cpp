@@ -4,7 +4,9 @@
 #include "CCrossoverFactory.h"
 #include "method/operators/crossover/crossovers/CUniformCX.h"
 #include "method/operators/crossover/crossovers/CTTP_OS_SX.h"
+#include "method/operators/crossover/crossovers/CTTP_OS_UX.h"
 #include "method/operators/crossover/crossovers/CCVRP_OX.h"
+#include "method/operators/crossover/crossovers/CSBX.h"
 #include "utils/fileReader/CReadUtils.h"
 
 ACrossover *CCrossoverFactory::Create(SConfigMap *configMap, const std::string& configKey, AProblem& problem)
@@ -30,11 +32,23 @@ ACrossover *CCrossoverFactory::Create(SConfigMap *configMap, const std::string&
         float knapCrProb = std::stof(vec[2]);
         return new CTTP_OS_SX(routeCrProb, knapCrProb);
     }
+    else if (strcmp(opName, "TTP_OX_UX") == 0 && encodingTypes.find(EEncodingType::PERMUTATION) != encodingTypes.end())
+    {
+        float routeCrProb = std::stof(vec[1]);
+        float knapCrProb = std::stof(vec[2]);
+        return new CTTP_OS_UX(routeCrProb, knapCrProb);
+    }
     else if (strcmp(opName, "CVRP_OX") == 0 && encodingTypes.find(EEncodingType::PERMUTATION) != encodingTypes.end())
     {
         float oxProb = std::stof(vec[1]);
         return new CCVRP_OX(oxProb);
     }
+    else if (strcmp(opName, "SBX") == 0 && encodingTypes.find(EEncodingType::ASSOCIATION) != encodingTypes.end())
+    {
+        float cxProb = std::stof(vec[1]);
+        float distributionIndex = std::stof(vec[2]);
+        return new CSBX(cxProb, distributionIndex);
+    }
 
     return nullptr;
 }
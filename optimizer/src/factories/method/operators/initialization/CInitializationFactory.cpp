@@ -1,11 +1,32 @@
 
+#include <limits>
 #include <stdexcept>
 #include <cstring>
 #include "CInitializationFactory.h"
 #include "method/operators/initialization/initializations/CInitialization.h"
 #include "method/operators/initialization/initializations/CECVRPTWInitialization.h"
+#include "method/operators/initialization/initializations/CWarmStartInitialization.h"
+#include "problem/AProblem.h"
+#include "utils/logger/ErrorUtils.h"
 
 AInitialization *CInitializationFactory::Create(SConfigMap* configMap, AProblem& problem)
+{
+    AInitialization* initialization = CreateBase(configMap, problem);
+
+    // Optional seeding from earlier runs (WarmStart, WarmStartCount), on top of any initialization
+    std::string warmStartSources;
+    if (configMap->TakeValue("WarmStart", warmStartSources))
+    {
+        int warmStartCount = std::numeric_limits<int>::max();
+        configMap->TakeValue("WarmStartCount", warmStartCount);
+        ErrorUtils::LowerThanZeroI("WarmStart", "WarmStartCount", warmStartCount);
+        return new CWarmStartInitialization(initialization, problem.GetProblemEncoding(), warmStartSources,
+                                            size_t(warmStartCount));
+    }
+    return initialization;
+}
+
+AInitialization *CInitializationFactory::CreateBase(SConfigMap* configMap, AProblem& problem)
 {
     std::string initializationName;
 
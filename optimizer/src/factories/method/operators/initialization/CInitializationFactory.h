@@ -9,4 +9,7 @@ class CInitializationFactory
 {
 public:
     static AInitialization* Create(SConfigMap* configMap, AProblem& problem);
+
+private:
+    static AInitialization* CreateBase(SConfigMap* configMap, AProblem& problem);
 };
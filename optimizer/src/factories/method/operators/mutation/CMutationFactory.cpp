@@ -1,12 +1,17 @@
 #include <regex>
 #include <cstring>
+#include <stdexcept>
 #include "CMutationFactory.h"
 #include "method/operators/mutation/mutations/CRandomBit.h"
+#include "method/operators/mutation/mutations/CPolynomialMutation.h"
 #include "method/operators/mutation/mutations/CTTPReverseFlip.h"
+#include "method/operators/mutation/mutations/CTTPReverseBitFlip.h"
 #include "method/operators/mutation/mutations/CCVRPReverseFlip.h"
 #include "method/operators/mutation/mutations/CCheapestResourceMutation.h"
 #include "method/operators/mutation/mutations/CLeastAssignedResourceMutation.h"
+#include "method/operators/mutation/mutations/CRouteLocalSearch.h"
 #include "utils/fileReader/CReadUtils.h"
+#include "utils/logger/ErrorUtils.h"
 #include "problem/problems/MSRCPSP/CMSRCPSP_TA.h"
 #include "problem/problems/ECVRPTW/CECVRPTW.h"
 #include "method/operators/mutation/mutations/ECVRPTW/CECVRPTWRandomClientRemoval.h"
@@ -15,6 +20,39 @@
 #include "method/operators/mutation/mutations/ECVRPTW/CECVRPTWRandomClientInsertion.h"
 
 AMutation *CMutationFactory::Create(SConfigMap *configMap, const std::string& configKey, AProblem &problem)
+{
+    AMutation* mutation = CreateBase(configMap, configKey, problem);
+
+    // Optional memetic local search of the route after the mutation (LocalSearch, LocalSearchNeighbours, LocalSearchBudget)
+    float localSearchProbability = 0.f;
+    if (mutation != nullptr && configMap->TakeValue("LocalSearch", localSearchProbability))
+    {
+        ErrorUtils::OutOfScopeF("LocalSearch", "LocalSearch", localSearchProbability);
+        int neighboursCount = 8;
+        configMap->TakeValue("LocalSearchNeighbours", neighboursCount);
+        if (neighboursCount < 1)
+        {
+            throw std::runtime_error("LocalSearch parameter LocalSearchNeighbours lower than 1");
+        }
+        int budget = 0;
+        configMap->TakeValue("LocalSearchBudget", budget);
+        ErrorUtils::LowerThanZeroI("LocalSearch", "LocalSearchBudget", budget);
+
+        // Route is the permutation of the integer genotype, its distances come with the problem encoding
+        const SProblemEncoding &encoding = problem.GetProblemEncoding();
+        const std::vector<std::vector<float>> &distances = encoding.m_additionalProblemData;
+        if (encoding.m_Encoding.empty() || encoding.m_Encoding[0].m_SectionType != EEncodingType::PERMUTATION
+            || encoding.m_Encoding[0].m_SectionDescription.size() != distances.size())
+        {
+            delete mutation;
+            throw std::runtime_error("LocalSearch requires a route problem with a distance matrix (TSP, TTP, CVRP)");
+        }
+        return new CRouteLocalSearch(mutation, distances, localSearchProbability, size_t(neighboursCount), size_t(budget));
+    }
+    return mutation;
+}
+
+AMutation *CMutationFactory::CreateBase(SConfigMap *configMap, const std::string& configKey, AProblem &problem)
 {
     std::string rawMutationString;
     if (!configMap->TakeValue(configKey, rawMutationString))
@@ -31,12 +69,24 @@ AMutation *CMutationFactory::Create(SConfigMap *configMap, const std::string& co
         float mutProb = std::stof(vec[1]);
         return new CRandomBit(mutProb);
     }
+    else if (strcmp(opName, "Polynomial") == 0 && encodingTypes.find(EEncodingType::ASSOCIATION) != encodingTypes.end())
+    {
+        float mutProb = std::stof(vec[1]);
+        float distributionIndex = std::stof(vec[2]);
+        return new CPolynomialMutation(mutProb, distributionIndex);
+    }
     else if (strcmp(opName, "TTP_Reverse_Flip") == 0 && encodingTypes.find(EEncodingType::PERMUTATION) != encodingTypes.end())
     {
         float mutProb = std::stof(vec[1]);
         float etaCoef = std::stof(vec[2]);
         return new CTTPReverseFlip(mutProb, etaCoef);
     }
+    else if (strcmp(opName, "TTP_Reverse_BitFlip") == 0 && encodingTypes.find(EEncodingType::PERMUTATION) != encodingTypes.end())
+    {
+        float reverseMutProb = std::stof(vec[1]);
+        float flipMutProb = std::stof(vec[2]);
+        return new CTTPReverseBitFlip(reverseMutProb, flipMutProb);
+    }
     else if (strcmp(opName, "CVRP_Reverse_Flip") == 0 && encodingTypes.find(EEncodingType::PERMUTATION) != encodingTypes.end())
     {
         float mutProb = std::stof(vec[1]);
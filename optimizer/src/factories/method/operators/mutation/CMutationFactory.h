@@ -10,4 +10,7 @@ class CMutationFactory
 public:
     static AMutation *Create(SConfigMap *configMap, const std::string& configKey, AProblem& problem);
     static std::set<EEncodingType> GetAllEncodingTypes(const std::vector<SEncodingSection>& encoding);
+
+private:
+    static AMutation *CreateBase(SConfigMap *configMap, const std::string& configKey, AProblem& problem);
 };
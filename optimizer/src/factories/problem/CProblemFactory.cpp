@@ -6,6 +6,8 @@
 #include "CVRP/CCVRPFactory.h"
 #include "ECVRPTW/CECVRPTWFactory.h"
 #include "TSP/CTSPFactory.h"
+#include "ZDT/CZDTFactory.h"
+#include "DTLZ/CDTLZFactory.h"
 
 // Define the static method 'CreateProblem' in the 'CProblemFactory' class
 // This method creates instances of different problem types based on the provided problem name
@@ -20,6 +22,8 @@ AProblem *CProblemFactory::CreateProblem(const char *problemName, const char *pr
     if (strcmp(problemName, "TTP2") == 0) return CTTPFactory::CreateTTP2(problemConfigurationPath);
     if (strcmp(problemName, "CVRP") == 0) return CCVRPFactory::CreateCVRP(problemConfigurationPath);
     if (strcmp(problemName, "ECVRPTW") == 0) return CECVRPTWFactory::CreateECVRPTW(problemConfigurationPath);
+    if (strcmp(problemName, "ZDT") == 0) return CZDTFactory::CreateZDT(problemConfigurationPath);
+    if (strcmp(problemName, "DTLZ") == 0) return CDTLZFactory::CreateDTLZ(problemConfigurationPath);
 
     // If none of the above conditions are met, throw a runtime error indicating the problem name is not supported
     throw std::runtime_error("Problem name: " + std::string(problemName) + " not supported");
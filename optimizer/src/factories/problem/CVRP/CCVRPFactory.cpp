@@ -14,12 +14,16 @@ const std::string CCVRPFactory::s_DepotSectionKey = "DEPOT_SECTION";
 CCVRPTemplate *CCVRPFactory::cvrpTemplate = nullptr;
 
 CCVRP *CCVRPFactory::CreateCVRP(const char *problemDefinitionPath) {
-    cvrpTemplate = ReadCVRPTemplate(problemDefinitionPath);
+    // Instance is read once, problems created for parallel runs share it
+    if (cvrpTemplate == nullptr) {
+        cvrpTemplate = ReadCVRPTemplate(problemDefinitionPath);
+    }
     return new CCVRP(*cvrpTemplate);
 }
 
 void CCVRPFactory::DeleteObjects() {
     delete cvrpTemplate;
+    cvrpTemplate = nullptr;
 }
 
 /// <summary>
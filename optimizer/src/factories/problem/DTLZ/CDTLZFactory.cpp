@@ -0,0 +1,27 @@
+#include "CDTLZFactory.h"
+#include "utils/fileReader/CReadUtils.h"
+#include <fstream>
+#include <stdexcept>
+
+const std::string CDTLZFactory::s_Delimiter = " ";
+const std::string CDTLZFactory::s_FunctionKey = "Function";
+const std::string CDTLZFactory::s_ObjCountKey = "ObjCount";
+const std::string CDTLZFactory::s_DimCountKey = "DimCount";
+
+CDTLZ *CDTLZFactory::CreateDTLZ(const char *problemDefinitionPath) {
+    std::ifstream readFileStream(problemDefinitionPath);
+
+    int function = 0;
+    if (!CReadUtils::GotoReadIntegerByKey(readFileStream, s_FunctionKey, s_Delimiter, function))
+        throw std::runtime_error("Error reading function for DTLZ");
+    int objCount = 0;
+    if (!CReadUtils::GotoReadIntegerByKey(readFileStream, s_ObjCountKey, s_Delimiter, objCount))
+        throw std::runtime_error("Error reading objectives count for DTLZ");
+    int dimCount = 0;
+    if (!CReadUtils::GotoReadIntegerByKey(readFileStream, s_DimCountKey, s_Delimiter, dimCount))
+        throw std::runtime_error("Error reading dimension count for DTLZ");
+    if (objCount < 0 || dimCount < 0)
+        throw std::runtime_error("DTLZ objectives or dimension count lower than 0");
+
+    return new CDTLZ(function, objCount, dimCount);
+}
@@ -0,0 +1,14 @@
+#pragma once
+
+#include "../../../problem/problems/DTLZ/CDTLZ.h"
+#include <string>
+
+class CDTLZFactory {
+public:
+    static CDTLZ *CreateDTLZ(const char *problemDefinitionPath);
+private:
+    static const std::string s_Delimiter;
+    static const std::string s_FunctionKey;
+    static const std::string s_ObjCountKey;
+    static const std::string s_DimCountKey;
+};
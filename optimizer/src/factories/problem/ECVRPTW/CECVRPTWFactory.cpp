@@ -1,5 +1,6 @@
 #include "CECVRPTWFactory.h"
 #include "utils/fileReader/CReadUtils.h"
+#include "utils/instanceCache/CInstanceCache.h"
 #include <regex>
 #include <iostream>
 
@@ -12,21 +13,39 @@ const std::string CECVRPTWFactory::s_InverseRefuelingRateKey = "g";
 const std::string CECVRPTWFactory::s_VelocityKey = "v";
 const std::string CECVRPTWFactory::s_VehicleCountKey = "n";
 const std::string CECVRPTWFactory::s_CitiesSectionKey = "StringID";
+const std::string CECVRPTWFactory::s_CacheKind = "ECVRPTW";
 
 CECVRPTWTemplate* CECVRPTWFactory::cvrpTemplate = nullptr;
 
 CECVRPTW* CECVRPTWFactory::CreateECVRPTW(const char* problemDefinitionPath) {
-    cvrpTemplate = ReadECVRPTWTemplate(problemDefinitionPath);
+    // Instance is read once, problems created for parallel runs share it
+    if (cvrpTemplate == nullptr) {
+        cvrpTemplate = ReadECVRPTWTemplate(problemDefinitionPath);
+    }
     return new CECVRPTW(*cvrpTemplate);
 }
 
 void CECVRPTWFactory::DeleteObjects() {
     delete cvrpTemplate;
+    cvrpTemplate = nullptr;
 }
 
 CECVRPTWTemplate* CECVRPTWFactory::ReadECVRPTWTemplate(const char* problemDefinitionPath) {
     auto* result = new CECVRPTWTemplate();
 
+    std::string pathString(problemDefinitionPath);
+    size_t fileNameStartPos = pathString.rfind("/") + 1;
+    size_t fileNameEndPos = pathString.rfind(".");
+    result->SetFileName(pathString.substr(fileNameStartPos, fileNameEndPos - fileNameStartPos));
+
+    // Reuse parsed instance and its context data from previous runs if the instance file did not change
+    CInstanceCache instanceCache(s_CacheKind, problemDefinitionPath);
+    CBinaryReader cacheReader;
+    if (instanceCache.Read(cacheReader) && result->ReadCache(cacheReader))
+    {
+        return result;
+    }
+
     std::ifstream readFileStream(problemDefinitionPath);
 
     int dimension = 0;
@@ -82,10 +101,6 @@ CECVRPTWTemplate* CECVRPTWFactory::ReadECVRPTWTemplate(const char* problemDefini
         }
     }
 
-    std::string pathString(problemDefinitionPath);
-    size_t fileNameStartPos = pathString.rfind("/") + 1;
-    size_t fileNameEndPos = pathString.rfind(".");
-    result->SetFileName(pathString.substr(fileNameStartPos, fileNameEndPos - fileNameStartPos));
     result->SetData(cities,
                     capacity,
                     fuelTankCapacity,
@@ -103,6 +118,10 @@ CECVRPTWTemplate* CECVRPTWFactory::ReadECVRPTWTemplate(const char* problemDefini
         throw std::runtime_error("Instance is invalid: " + std::string(problemDefinitionPath));
     }
 
+    CBinaryWriter cacheWriter;
+    result->WriteCache(cacheWriter);
+    instanceCache.Write(cacheWriter);
+
     return result;
 }
 
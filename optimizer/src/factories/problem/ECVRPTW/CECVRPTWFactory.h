@@ -17,6 +17,7 @@ private:
     static const std::string s_InverseRefuelingRateKey;
     static const std::string s_VelocityKey;
     static const std::string s_VehicleCountKey;
+    static const std::string s_CacheKind;
 
     static CECVRPTWTemplate* cvrpTemplate;
     static CECVRPTWTemplate* ReadECVRPTWTemplate(const char* problemDefinitionPath);
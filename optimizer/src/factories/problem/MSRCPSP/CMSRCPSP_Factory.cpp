@@ -2,25 +2,34 @@
 #include "utils/fileReader/CReadUtils.h"
 #include <fstream>
 #include "CMSRCPSP_Factory.h"
+#include "utils/instanceCache/CInstanceCache.h"
 
 const std::string CMSRCPSP_Factory::s_Delimiter = " ";
 const std::string CMSRCPSP_Factory::s_TasksKey = "Tasks:";
 const std::string CMSRCPSP_Factory::s_ResourcesKey = "Resources:";
 const std::string CMSRCPSP_Factory::s_ResourcesSectionKey = "ResourceID";
 const std::string CMSRCPSP_Factory::s_TasksSectionKey = "TaskID";
+const std::string CMSRCPSP_Factory::s_CacheKind = "MSRCPSP";
 
 CScheduler *CMSRCPSP_Factory::scheduler = nullptr;
 
 CMSRCPSP_TA *CMSRCPSP_Factory::CreateMSRCPSP_TA(const char *problemConfigurationPath, size_t objCount)
 {
-    scheduler = CreateScheduler(problemConfigurationPath);
+    // Instance is read once, problems created for parallel runs copy it
+    if (scheduler == nullptr)
+    {
+        scheduler = CreateScheduler(problemConfigurationPath);
+    }
 
     return new CMSRCPSP_TA(*scheduler, objCount);
 }
 
 CMSRCPSP_TO* CMSRCPSP_Factory::CreateMSRCPSP_TO(const char* problemConfigurationPath, size_t objCount)
 {
-    scheduler = CreateScheduler(problemConfigurationPath);
+    if (scheduler == nullptr)
+    {
+        scheduler = CreateScheduler(problemConfigurationPath);
+    }
 
     return new CMSRCPSP_TO(*scheduler, objCount);
 }
@@ -28,12 +37,22 @@ CMSRCPSP_TO* CMSRCPSP_Factory::CreateMSRCPSP_TO(const char* problemConfiguration
 void CMSRCPSP_Factory::DeleteObjects()
 {
     delete scheduler;
+    scheduler = nullptr;
 }
 
 CScheduler *CMSRCPSP_Factory::CreateScheduler(const char *problemConfigurationPath)
 {
     scheduler = new CScheduler();
 
+    // Reuse parsed instance from previous runs if the instance file did not change
+    CInstanceCache instanceCache(s_CacheKind, problemConfigurationPath);
+    CBinaryReader cacheReader;
+    if (instanceCache.Read(cacheReader) && scheduler->ReadCache(cacheReader))
+    {
+        scheduler->Reset();
+        return scheduler;
+    }
+
     std::ifstream readFileStream(problemConfigurationPath);
     
     std::string instanceName;
@@ -74,6 +93,10 @@ CScheduler *CMSRCPSP_Factory::CreateScheduler(const char *problemConfigurationPa
     scheduler->SetTasks(tasks);
     scheduler->Reset();
 
+    CBinaryWriter cacheWriter;
+    scheduler->WriteCache(cacheWriter);
+    instanceCache.Write(cacheWriter);
+
     return scheduler;
 }
 
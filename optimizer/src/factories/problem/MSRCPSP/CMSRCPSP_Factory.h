@@ -17,6 +17,7 @@ private:
     static const std::string s_ResourcesKey;
     static const std::string s_ResourcesSectionKey;
     static const std::string s_TasksSectionKey;
+    static const std::string s_CacheKind;
 
     static CScheduler *scheduler;
 
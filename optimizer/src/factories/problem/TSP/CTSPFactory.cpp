@@ -3,5 +3,6 @@
 const std::string CTSPFactory::s_Delimiter = " ";
 const std::string CTSPFactory::s_DimensionKey = "DIMENSION:";
 const std::string CTSPFactory::s_CitiesSectionKey = "NODE_COORD_SECTION";
+const std::string CTSPFactory::s_CacheKind = "TSP";
 
 CTSPTemplate *CTSPFactory::tspTemplate = nullptr;
\ No newline at end of file
@@ -2,6 +2,7 @@
 
 #include "../../../utils/fileReader/CReadUtils.h"
 #include "../../../problem/problems/TSP/CTSP.h"
+#include "../../../utils/instanceCache/CInstanceCache.h"
 #include <string>
 #include <vector>
 #include <fstream>
@@ -12,6 +13,7 @@ private:
     static const std::string s_Delimiter;
     static const std::string s_DimensionKey;
     static const std::string s_CitiesSectionKey;
+    static const std::string s_CacheKind;
 
     static CTSPTemplate *tspTemplate;
 
@@ -33,6 +35,13 @@ public:
     static CTSPTemplate* ReadCTSPTemplate(const char *problemDefinitionPath) {
         auto *result = new CTSPTemplate();
 
+        // Reuse parsed instance and its distance matrix from previous runs if the instance file did not change
+        CInstanceCache instanceCache(s_CacheKind, problemDefinitionPath);
+        CBinaryReader cacheReader;
+        if (instanceCache.Read(cacheReader) && result->ReadCache(cacheReader)) {
+            return result;
+        }
+
         std::ifstream readFileStream(problemDefinitionPath);
         int dim = 0;
         if (!CReadUtils::GotoReadIntegerByKey(readFileStream, s_DimensionKey, s_Delimiter, dim)) {
@@ -44,16 +53,24 @@ public:
         result->SetCities(cities);
 
         readFileStream.close();
+
+        CBinaryWriter cacheWriter;
+        result->WriteCache(cacheWriter);
+        instanceCache.Write(cacheWriter);
         return result;
     }
     
     static CTSP* CreateTSP(const char *problemDefinitionPath) {
-        tspTemplate = ReadCTSPTemplate(problemDefinitionPath);
-        tspTemplate->CalculateMaxDistance();
+        // Instance is read once, problems created for parallel runs share it
+        if (tspTemplate == nullptr) {
+            tspTemplate = ReadCTSPTemplate(problemDefinitionPath);
+            tspTemplate->CalculateMaxDistance();
+        }
         return new CTSP(*tspTemplate);
     }
 
     static void DeleteObjects() {
         delete tspTemplate;
+        tspTemplate = nullptr;
     }
 };
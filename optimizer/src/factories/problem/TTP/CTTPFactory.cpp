@@ -1,5 +1,6 @@
 #include "CTTPFactory.h"
 #include "utils/fileReader/CReadUtils.h"
+#include "utils/instanceCache/CInstanceCache.h"
 #include <string>
 #include <vector>
 
@@ -14,6 +15,7 @@ const std::string CTTPFactory::s_MaxSpeedKey = "MAX SPEED:";
 const std::string CTTPFactory::s_RentingRatioKey = "RENTING RATIO:";
 const std::string CTTPFactory::s_CitiesSectionKey = "NODE_COORD_SECTION	(INDEX, X, Y):";
 const std::string CTTPFactory::s_ItemsSectionKey = "ITEMS SECTION	(INDEX, PROFIT, WEIGHT, ASSIGNED NODE NUMBER):";
+const std::string CTTPFactory::s_CacheKind = "TTP";
 
 CTTPTemplate *CTTPFactory::ttpTemplate = nullptr;
 
@@ -25,19 +27,37 @@ CTTP1 *CTTPFactory::CreateTTP1(const char *problemDefinitionPath)
 
 CTTP2 *CTTPFactory::CreateTTP2(const char *problemDefinitionPath)
 {
-    ttpTemplate = ReadTTPTemplate(problemDefinitionPath);
+    // Instance is read once, problems created for parallel runs share it
+    if (ttpTemplate == nullptr)
+    {
+        ttpTemplate = ReadTTPTemplate(problemDefinitionPath);
+    }
     return new CTTP2(*ttpTemplate);
 }
 
 void CTTPFactory::DeleteObjects()
 {
     delete ttpTemplate;
+    ttpTemplate = nullptr;
 }
 
 CTTPTemplate *CTTPFactory::ReadTTPTemplate(const char *problemDefinitionPath)
 {
     auto *result = new CTTPTemplate();
 
+    std::string pathString(problemDefinitionPath);
+    size_t fileNameStartPos = pathString.rfind('/') + 1;
+    size_t fileNameEndPos = pathString.rfind('.');
+    result->SetFileName(pathString.substr(fileNameStartPos, fileNameEndPos - fileNameStartPos));
+
+    // Reuse parsed instance and its context data from previous runs if the instance file did not change
+    CInstanceCache instanceCache(s_CacheKind, problemDefinitionPath);
+    CBinaryReader cacheReader;
+    if (instanceCache.Read(cacheReader) && result->ReadCache(cacheReader))
+    {
+        return result;
+    }
+
     std::ifstream readFileStream(problemDefinitionPath);
 
     int dim = 0;
@@ -87,10 +107,6 @@ CTTPTemplate *CTTPFactory::ReadTTPTemplate(const char *problemDefinitionPath)
     items.emplace_back(0, 0, 0, 0);
 #endif
 
-    std::string pathString(problemDefinitionPath);
-    size_t fileNameStartPos = pathString.rfind('/') + 1;
-    size_t fileNameEndPos = pathString.rfind('.');
-    result->SetFileName(pathString.substr(fileNameStartPos, fileNameEndPos - fileNameStartPos));
 #if READ_TTP
     result->SetData(cities, items, capacity, minSpeed, maxSpeed, rentRatio);
 #else
@@ -99,6 +115,10 @@ CTTPTemplate *CTTPFactory::ReadTTPTemplate(const char *problemDefinitionPath)
 
     readFileStream.close();
 
+    CBinaryWriter cacheWriter;
+    result->WriteCache(cacheWriter);
+    instanceCache.Write(cacheWriter);
+
     return result;
 }
 
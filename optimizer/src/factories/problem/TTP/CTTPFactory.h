@@ -22,6 +22,7 @@ private:
     static const std::string s_RentingRatioKey;
     static const std::string s_CitiesSectionKey;
     static const std::string s_ItemsSectionKey;
+    static const std::string s_CacheKind;
 
     static CTTPTemplate *ttpTemplate;
     static CTTPTemplate *ReadTTPTemplate(const char *problemDefinitionPath);
@@ -0,0 +1,23 @@
+#include "CZDTFactory.h"
+#include "utils/fileReader/CReadUtils.h"
+#include <fstream>
+#include <stdexcept>
+
+const std::string CZDTFactory::s_Delimiter = " ";
+const std::string CZDTFactory::s_FunctionKey = "Function";
+const std::string CZDTFactory::s_DimCountKey = "DimCount";
+
+CZDT *CZDTFactory::CreateZDT(const char *problemDefinitionPath) {
+    std::ifstream readFileStream(problemDefinitionPath);
+
+    int function = 0;
+    if (!CReadUtils::GotoReadIntegerByKey(readFileStream, s_FunctionKey, s_Delimiter, function))
+        throw std::runtime_error("Error reading function for ZDT");
+    int dimCount = 0;
+    if (!CReadUtils::GotoReadIntegerByKey(readFileStream, s_DimCountKey, s_Delimiter, dimCount))
+        throw std::runtime_error("Error reading dimension count for ZDT");
+    if (dimCount < 0)
+        throw std::runtime_error("ZDT dimension count lower than 0");
+
+    return new CZDT(function, dimCount);
+}
@@ -0,0 +1,13 @@
+#pragma once
+
+#include "../../../problem/problems/ZDT/CZDT.h"
+#include <string>
+
+class CZDTFactory {
+public:
+    static CZDT *CreateZDT(const char *problemDefinitionPath);
+private:
+    static const std::string s_Delimiter;
+    static const std::string s_FunctionKey;
+    static const std::string s_DimCountKey;
+};
@@ -1,5 +1,7 @@
 #include <iostream> // Standard I/O library
 #include <random> // Library for random number generation
+#include <thread> // Library for querying hardware threads
+#include <algorithm> // Library for std::max
 #include "SProgramParams.h" // Custom header file for program parameters structure
 #include "CProgram.h" // Custom header file for the main program class
 #include "utils/logger/CExperimentLogger.h" // Custom header for an experiment logger utility class
@@ -14,8 +16,10 @@ static const int PROBLEM_DEFINITION_INDEX = 3; // Index in argv for problem defi
 static const int OUTPUT_DIR_PATH_INDEX = 4; // Index in argv for output path directory where results and experiments will be logged
 static const int EXECUTION_COUNT_INDEX = 5; // Index in argv for the number of executions
 static const int SEED_INDEX = 6; // Index in argv for the number of executions
+static const int WORKERS_COUNT_INDEX = 7; // Index in argv for the number of runs executed concurrently
 
 static const int DEFAULT_EXECUTIONS_NUMBER = 1; // Default number of executions if not specified
+static const int DEFAULT_WORKERS_COUNT = 1; // Default number of concurrent runs, runs are executed sequentially
 
 void showErrorAndExit(const char *message, const char *detail = ""); // Function prototype for error handling
 
@@ -37,7 +41,7 @@ int main(int argc, char *argv[])
     {
         // Print usage instructions if not enough arguments
         std::cerr << "Usage: " << argv[0]
-                  << " <MethodConfigPath> <ProblemName> <ProblemInstancePath> <OutputDirectory> [ExecutionsCount] [Seed]"
+                  << " <MethodConfigPath> <ProblemName> <ProblemInstancePath> <OutputDirectory> [ExecutionsCount] [Seed] [WorkersCount]"
                   << std::endl;
         return -1;
     }
@@ -69,6 +73,15 @@ int main(int argc, char *argv[])
 
     std::random_device rd;
     programParams.m_Seed = (argc > SEED_INDEX) ? std::stoi(argv[SEED_INDEX]) : rd();
+
+    // Set the number of concurrent runs, 0 uses all hardware threads
+    programParams.m_WorkersCount = (argc > WORKERS_COUNT_INDEX) ?
+                                   std::stoi(argv[WORKERS_COUNT_INDEX]) :
+                                   DEFAULT_WORKERS_COUNT;
+    if (programParams.m_WorkersCount <= 0)
+    {
+        programParams.m_WorkersCount = std::max(1, (int)std::thread::hardware_concurrency());
+    }
     
     CProgram::Run(programParams);
 
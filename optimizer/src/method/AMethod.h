@@ -8,7 +8,8 @@
 class AMethod
 {
 public:
-    static int m_ExperimentRunCounter;
+    // Index of the run executed by the current thread, used to name its output directory
+    static thread_local int m_ExperimentRunCounter;
 
     explicit AMethod(AProblem &evaluator, AInitialization &initialization) : m_Problem(evaluator), m_Initialization(initialization)
     {};
@@ -0,0 +1,73 @@
+#include "CGenotypeCSV.h"
+#include <limits>
+
+void CGenotypeCSV::ToCSV(std::ostringstream& ostringstream, const SGenotype& genotype)
+{
+    // Floats are written with all digits, so genotypes are read back unchanged
+    std::streamsize precision = ostringstream.precision(std::numeric_limits<float>::max_digits10);
+    for (size_t i = 0; i < genotype.m_FloatGenotype.size(); ++i)
+    {
+        ostringstream << (i == 0 ? "" : " ") << genotype.m_FloatGenotype[i];
+    }
+    ostringstream.precision(precision);
+    ostringstream << ";";
+    for (size_t i = 0; i < genotype.m_IntGenotype.size(); ++i)
+    {
+        ostringstream << (i == 0 ? "" : " ") << genotype.m_IntGenotype[i];
+    }
+    ostringstream << ";";
+    for (size_t i = 0; i < genotype.m_BoolGenotype.size(); ++i)
+    {
+        ostringstream << (genotype.m_BoolGenotype[i] ? '1' : '0');
+    }
+    ostringstream << "\n";
+}
+
+bool CGenotypeCSV::FromCSV(const std::string& line, SGenotype& genotype)
+{
+    size_t floatsEnd = line.find(';');
+    size_t intsEnd = floatsEnd == std::string::npos ? std::string::npos : line.find(';', floatsEnd + 1);
+    if (intsEnd == std::string::npos)
+    {
+        return false;
+    }
+
+    genotype.m_FloatGenotype.clear();
+    genotype.m_IntGenotype.clear();
+    genotype.m_BoolGenotype.clear();
+
+    std::istringstream floats(line.substr(0, floatsEnd));
+    float floatGene;
+    while (floats >> floatGene)
+    {
+        genotype.m_FloatGenotype.push_back(floatGene);
+    }
+    if (!floats.eof())
+    {
+        return false;
+    }
+
+    std::istringstream ints(line.substr(floatsEnd + 1, intsEnd - floatsEnd - 1));
+    int intGene;
+    while (ints >> intGene)
+    {
+        genotype.m_IntGenotype.push_back(intGene);
+    }
+    if (!ints.eof())
+    {
+        return false;
+    }
+
+    for (size_t i = intsEnd + 1; i < line.size(); ++i)
+    {
+        if (line[i] == '0' || line[i] == '1')
+        {
+            genotype.m_BoolGenotype.push_back(line[i] == '1');
+        }
+        else if (line[i] != '\r')
+        {
+            return false;
+        }
+    }
+    return true;
+}
@@ -0,0 +1,18 @@
+#pragma once
+
+#include <sstream>
+#include <string>
+#include "SGenotype.h"
+
+// Genotypes stored in text, one per line: float genes, int genes and bits, separated by ';', genes by spaces.
+// Final archives (best solution of single-objective methods) are written to genotypes.csv of every run directory,
+// so later runs can start from them.
+class CGenotypeCSV
+{
+public:
+    static constexpr const char* s_FileName = "genotypes.csv";
+
+    static void ToCSV(std::ostringstream& ostringstream, const SGenotype& genotype);
+    // Returns false if the line is not a genotype
+    static bool FromCSV(const std::string& line, SGenotype& genotype);
+};
@@ -0,0 +1,50 @@
+#pragma once
+
+#include <vector>
+
+// Individuals released by a method are kept for reuse. A recycled individual keeps the capacity of its
+// genotype and evaluation vectors, so copying a parent into it does not allocate.
+template<class TIndividual>
+class CIndividualPool
+{
+public:
+    CIndividualPool() = default;
+    CIndividualPool(const CIndividualPool &other) = delete;
+    CIndividualPool &operator=(const CIndividualPool &other) = delete;
+
+    ~CIndividualPool()
+    {
+        Clear();
+    }
+
+    // Returns individual in the same state as one copy constructed from source
+    TIndividual *Acquire(const TIndividual &source)
+    {
+        if (m_FreeIndividuals.empty())
+        {
+            return new TIndividual(source);
+        }
+
+        TIndividual *individual = m_FreeIndividuals.back();
+        m_FreeIndividuals.pop_back();
+        individual->CopyFrom(source);
+        return individual;
+    }
+
+    void Release(TIndividual *individual)
+    {
+        m_FreeIndividuals.push_back(individual);
+    }
+
+    void Clear()
+    {
+        for (TIndividual *individual: m_FreeIndividuals)
+        {
+            delete individual;
+        }
+        m_FreeIndividuals.clear();
+    }
+
+private:
+    std::vector<TIndividual *> m_FreeIndividuals;
+};
@@ -15,6 +15,24 @@ public:
         : AIndividual(other)
         , m_MetaInfo(other.m_MetaInfo)
     {};
+
+    // Same as copy construction, but reuses already allocated vectors
+    void CopyFrom(const SMOIndividual& other)
+    {
+        m_Genotype = other.m_Genotype;
+        m_Evaluation = other.m_Evaluation;
+        m_NormalizedEvaluation = other.m_NormalizedEvaluation;
+        m_MetaInfo = other.m_MetaInfo;
+        m_isValid = true;
+        ResetSelection();
+    }
+
+    void ResetSelection()
+    {
+        m_Rank = 0;
+        m_CrowdingDistance = 0.0f;
+        m_Selected = 0;
+    }
     
     bool IsDominatedBy(const SMOIndividual* otherSolution) const
     {
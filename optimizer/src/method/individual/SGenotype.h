@@ -2,18 +2,20 @@
 
 #include <vector>
 #include <cmath>
+#include "../../utils/dataStructures/CBitset.h"
 
 class SGenotype
 {
 public:
     SGenotype() = default;
 
-    SGenotype(const SGenotype &other) : m_FloatGenotype(other.m_FloatGenotype), m_IntGenotype(other.m_IntGenotype),
-                                        m_BoolGenotype(other.m_BoolGenotype)
-    {};
+    SGenotype(const SGenotype &other) = default;
+    SGenotype(SGenotype &&other) noexcept = default;
+    SGenotype &operator=(const SGenotype &other) = default;
+    SGenotype &operator=(SGenotype &&other) noexcept = default;
 
     // TODO - why three different genotypes?
     std::vector<float> m_FloatGenotype;
     std::vector<int> m_IntGenotype;
-    std::vector<bool> m_BoolGenotype;
+    CBitset m_BoolGenotype;
 };
@@ -0,0 +1,554 @@
+#include "CIslandModel.h"
+#include "../../utils/instanceCache/CBinaryStream.h"
+#include "../../utils/logger/CExperimentLogger.h"
+#include "../../utils/logger/ErrorUtils.h"
+#include "../../utils/random/CRandom.h"
+#include <algorithm>
+#include <chrono>
+#include <condition_variable>
+#include <cstdio>
+#include <iostream>
+#include <map>
+#include <mutex>
+#include <stdexcept>
+#include <thread>
+
+#ifndef _WIN32
+#include <cerrno>
+#include <csignal>
+#include <pthread.h>
+#include <sys/mman.h>
+#include <sys/wait.h>
+#include <unistd.h>
+#endif
+
+const std::string CIslandModel::s_IslandsKey = "Islands";
+const std::string CIslandModel::s_MigrationIntervalKey = "MigrationInterval";
+const std::string CIslandModel::s_MigrationTopologyKey = "MigrationTopology";
+const std::string CIslandModel::s_MigrantsCountKey = "MigrantsCount";
+const unsigned int CIslandModel::s_IslandSeedStride = 1000003;
+
+size_t CIslandModel::m_IslandsCount = 1;
+size_t CIslandModel::m_MigrationInterval = 0;
+size_t CIslandModel::m_MigrantsCount = 0;
+EMigrationTopology CIslandModel::m_Topology = EMigrationTopology::Ring;
+size_t CIslandModel::m_IslandIndex = 0;
+int CIslandModel::m_ExchangeCounter = 0;
+
+namespace
+{
+    // Tag of the message with final results of an island, migration messages are tagged with exchange number
+    const int FINAL_TAG = -1;
+
+    struct SMessageHeader
+    {
+        int32_t m_Source;
+        int32_t m_Tag;
+        uint64_t m_Size;
+    };
+
+    void WriteIndividuals(CBinaryWriter &writer, const std::vector<const AIndividual *> &individuals)
+    {
+        writer.Write<uint64_t>(individuals.size());
+        for (const AIndividual *individual: individuals)
+        {
+            const SGenotype &genotype = individual->m_Genotype;
+            writer.WriteVector(genotype.m_FloatGenotype);
+            writer.WriteVector(genotype.m_IntGenotype);
+            writer.Write<uint64_t>(genotype.m_BoolGenotype.size());
+            writer.WriteVector(genotype.m_BoolGenotype.GetWords());
+            writer.WriteVector(individual->m_Evaluation);
+            writer.WriteVector(individual->m_NormalizedEvaluation);
+        }
+    }
+
+    void ReadIndividuals(const std::vector<char> &payload, std::vector<SMigrant> &migrants)
+    {
+        CBinaryReader reader(payload.data(), payload.size());
+        uint64_t count = 0;
+        bool isRead = reader.Read(count);
+        for (uint64_t i = 0; isRead && i < count; ++i)
+        {
+            SMigrant migrant;
+            uint64_t boolGenotypeSize = 0;
+            std::vector<uint64_t> boolGenotypeWords;
+            isRead = reader.ReadVector(migrant.m_Genotype.m_FloatGenotype)
+                     && reader.ReadVector(migrant.m_Genotype.m_IntGenotype)
+                     && reader.Read(boolGenotypeSize)
+                     && reader.ReadVector(boolGenotypeWords)
+                     && boolGenotypeWords.size() == CBitset::GetWordsCount(boolGenotypeSize)
+                     && reader.ReadVector(migrant.m_Evaluation)
+                     && reader.ReadVector(migrant.m_NormalizedEvaluation);
+            if (isRead)
+            {
+                migrant.m_Genotype.m_BoolGenotype.assign(boolGenotypeSize, boolGenotypeWords);
+            }
+            migrants.push_back(std::move(migrant));
+        }
+        if (!isRead || !reader.IsAtEnd())
+        {
+            throw std::runtime_error("Malformed message received from another island");
+        }
+    }
+
+#ifndef _WIN32
+    // Every island has one inbox pipe written by all other islands. Writes to the same inbox are serialized
+    // with process shared mutexes, so messages never interleave. Inbox is drained by a reader thread,
+    // hence writers never wait for the receiving island to reach its exchange point.
+    struct SIslandChannels
+    {
+        std::vector<int> m_InboxReadFds;
+        std::vector<int> m_InboxWriteFds;
+        pthread_mutex_t *m_InboxLocks = nullptr;
+        size_t m_InboxLocksSize = 0;
+        std::vector<pid_t> m_Children;
+        pid_t m_MainPid = 0;
+
+        std::thread m_Reader;
+        std::mutex m_MailboxMutex;
+        std::condition_variable m_MailboxCondition;
+        std::map<std::pair<int, size_t>, std::vector<char>> m_Mailbox;
+        bool m_IsReaderFinished = false;
+    };
+
+    SIslandChannels channels;
+
+    bool ReadAll(int fd, char *data, size_t size)
+    {
+        while (size > 0)
+        {
+            ssize_t count = read(fd, data, size);
+            if (count < 0 && errno == EINTR)
+            {
+                continue;
+            }
+            if (count <= 0)
+            {
+                return false;
+            }
+            data += count;
+            size -= count;
+        }
+        return true;
+    }
+
+    void WriteAll(int fd, const char *data, size_t size)
+    {
+        while (size > 0)
+        {
+            ssize_t count = write(fd, data, size);
+            if (count < 0 && errno == EINTR)
+            {
+                continue;
+            }
+            if (count <= 0)
+            {
+                throw std::runtime_error("Unable to send message to another island");
+            }
+            data += count;
+            size -= count;
+        }
+    }
+
+    void ReadInbox(int fd)
+    {
+        SMessageHeader header{};
+        while (ReadAll(fd, reinterpret_cast<char *>(&header), sizeof(header)))
+        {
+            std::vector<char> payload(header.m_Size);
+            if (!ReadAll(fd, payload.data(), payload.size()))
+            {
+                break;
+            }
+            std::lock_guard<std::mutex> lock(channels.m_MailboxMutex);
+            channels.m_Mailbox[{header.m_Tag, (size_t)header.m_Source}] = std::move(payload);
+            channels.m_MailboxCondition.notify_all();
+        }
+        std::lock_guard<std::mutex> lock(channels.m_MailboxMutex);
+        channels.m_IsReaderFinished = true;
+        channels.m_MailboxCondition.notify_all();
+    }
+
+    void Send(size_t source, size_t target, int tag, const std::vector<char> &payload)
+    {
+        SMessageHeader header{(int32_t)source, tag, payload.size()};
+        pthread_mutex_t *lock = &channels.m_InboxLocks[target];
+        pthread_mutex_lock(lock);
+        try
+        {
+            WriteAll(channels.m_InboxWriteFds[target], reinterpret_cast<const char *>(&header), sizeof(header));
+            WriteAll(channels.m_InboxWriteFds[target], payload.data(), payload.size());
+        }
+        catch (...)
+        {
+            pthread_mutex_unlock(lock);
+            throw;
+        }
+        pthread_mutex_unlock(lock);
+    }
+
+    // Reaps finished islands, returns false if any of them failed
+    bool CheckChildren(bool wait)
+    {
+        bool isSuccess = true;
+        for (pid_t &child: channels.m_Children)
+        {
+            int status = 0;
+            if (child != 0 && waitpid(child, &status, wait ? 0 : WNOHANG) == child)
+            {
+                isSuccess = isSuccess && WIFEXITED(status) && WEXITSTATUS(status) == 0;
+                child = 0;
+            }
+        }
+        return isSuccess;
+    }
+
+    std::vector<char> Receive(int tag, size_t source)
+    {
+        std::unique_lock<std::mutex> lock(channels.m_MailboxMutex);
+        while (true)
+        {
+            auto it = channels.m_Mailbox.find({tag, source});
+            if (it != channels.m_Mailbox.end())
+            {
+                std::vector<char> payload = std::move(it->second);
+                channels.m_Mailbox.erase(it);
+                return payload;
+            }
+            if (channels.m_IsReaderFinished)
+            {
+                throw std::runtime_error("Island " + std::to_string(source) + " closed connection");
+            }
+
+            channels.m_MailboxCondition.wait_for(lock, std::chrono::milliseconds(100));
+
+            // Do not wait forever for islands that will never send anything
+            if (channels.m_MainPid == getpid())
+            {
+                if (!CheckChildren(false))
+                {
+                    throw std::runtime_error("Island process terminated unexpectedly");
+                }
+            }
+            else if (getppid() != channels.m_MainPid)
+            {
+                _exit(1);
+            }
+        }
+    }
+
+    void CloseChannels()
+    {
+        for (int fd: channels.m_InboxWriteFds)
+        {
+            if (fd >= 0)
+            {
+                close(fd);
+            }
+        }
+        if (channels.m_Reader.joinable())
+        {
+            channels.m_Reader.join();
+        }
+        for (int fd: channels.m_InboxReadFds)
+        {
+            if (fd >= 0)
+            {
+                close(fd);
+            }
+        }
+        if (channels.m_InboxLocks != nullptr)
+        {
+            munmap(channels.m_InboxLocks, channels.m_InboxLocksSize);
+        }
+        channels.m_InboxReadFds.clear();
+        channels.m_InboxWriteFds.clear();
+        channels.m_InboxLocks = nullptr;
+        channels.m_Children.clear();
+        channels.m_Mailbox.clear();
+        channels.m_IsReaderFinished = false;
+    }
+#endif
+}
+
+void CIslandModel::Configure(SConfigMap *configMap)
+{
+    m_IslandsCount = 1;
+    m_MigrationInterval = 0;
+    m_MigrantsCount = 0;
+    m_Topology = EMigrationTopology::Ring;
+
+    if (!configMap->HasValue(s_IslandsKey))
+    {
+        return;
+    }
+
+    int islandsCount = 1;
+    configMap->TakeValue(s_IslandsKey, islandsCount);
+    ErrorUtils::LowerThanZeroI("IslandModel", s_IslandsKey, islandsCount);
+    m_IslandsCount = std::max(1, islandsCount);
+
+    int migrationInterval = 0;
+    configMap->TakeValue(s_MigrationIntervalKey, migrationInterval);
+    ErrorUtils::LowerThanZeroI("IslandModel", s_MigrationIntervalKey, migrationInterval);
+    m_MigrationInterval = migrationInterval;
+
+    int migrantsCount = 0;
+    configMap->TakeValue(s_MigrantsCountKey, migrantsCount);
+    ErrorUtils::LowerThanZeroI("IslandModel", s_MigrantsCountKey, migrantsCount);
+    m_MigrantsCount = migrantsCount;
+
+    std::string topology = "Ring";
+    configMap->TakeValue(s_MigrationTopologyKey, topology);
+    if (topology == "Ring")
+    {
+        m_Topology = EMigrationTopology::Ring;
+    }
+    else if (topology == "AllToAll")
+    {
+        m_Topology = EMigrationTopology::AllToAll;
+    }
+    else
+    {
+        throw std::runtime_error("MigrationTopology: " + topology + " not supported, use Ring or AllToAll");
+    }
+}
+
+bool CIslandModel::IsEnabled()
+{
+    return m_IslandsCount > 1;
+}
+
+bool CIslandModel::IsMainIsland()
+{
+    return m_IslandIndex == 0;
+}
+
+size_t CIslandModel::GetIslandIndex()
+{
+    return m_IslandIndex;
+}
+
+size_t CIslandModel::GetMigrantsCount()
+{
+    return m_MigrantsCount;
+}
+
+bool CIslandModel::IsMigrationGeneration(size_t generation)
+{
+    return IsEnabled() && m_MigrationInterval > 0 && m_MigrantsCount > 0
+           && generation > 0 && generation % m_MigrationInterval == 0;
+}
+
+std::vector<size_t> CIslandModel::GetTargets()
+{
+    std::vector<size_t> targets;
+    if (m_Topology == EMigrationTopology::Ring)
+    {
+        targets.push_back((m_IslandIndex + 1) % m_IslandsCount);
+    }
+    else
+    {
+        for (size_t i = 0; i < m_IslandsCount; ++i)
+        {
+            if (i != m_IslandIndex)
+            {
+                targets.push_back(i);
+            }
+        }
+    }
+    return targets;
+}
+
+std::vector<size_t> CIslandModel::GetSources()
+{
+    std::vector<size_t> sources;
+    if (m_Topology == EMigrationTopology::Ring)
+    {
+        sources.push_back((m_IslandIndex + m_IslandsCount - 1) % m_IslandsCount);
+    }
+    else
+    {
+        for (size_t i = 0; i < m_IslandsCount; ++i)
+        {
+            if (i != m_IslandIndex)
+            {
+                sources.push_back(i);
+            }
+        }
+    }
+    return sources;
+}
+
+#ifndef _WIN32
+
+void CIslandModel::StartRun(unsigned int seed)
+{
+    // Runs without islands may be executed concurrently, so shared state is left untouched
+    if (!IsEnabled())
+    {
+        return;
+    }
+    m_IslandIndex = 0;
+    m_ExchangeCounter = 0;
+
+    // Buffered output would be written once by every island otherwise
+    std::cout.flush();
+    fflush(nullptr);
+    signal(SIGPIPE, SIG_IGN);
+
+    channels.m_InboxLocksSize = m_IslandsCount * sizeof(pthread_mutex_t);
+    void *locks = mmap(nullptr, channels.m_InboxLocksSize, PROT_READ | PROT_WRITE, MAP_SHARED | MAP_ANONYMOUS, -1, 0);
+    if (locks == MAP_FAILED)
+    {
+        throw std::runtime_error("Unable to allocate shared memory for islands");
+    }
+    channels.m_InboxLocks = static_cast<pthread_mutex_t *>(locks);
+
+    pthread_mutexattr_t lockAttributes;
+    pthread_mutexattr_init(&lockAttributes);
+    pthread_mutexattr_setpshared(&lockAttributes, PTHREAD_PROCESS_SHARED);
+    for (size_t i = 0; i < m_IslandsCount; ++i)
+    {
+        pthread_mutex_init(&channels.m_InboxLocks[i], &lockAttributes);
+    }
+    pthread_mutexattr_destroy(&lockAttributes);
+
+    channels.m_InboxReadFds.assign(m_IslandsCount, -1);
+    channels.m_InboxWriteFds.assign(m_IslandsCount, -1);
+    for (size_t i = 0; i < m_IslandsCount; ++i)
+    {
+        int fds[2];
+        if (pipe(fds) != 0)
+        {
+            CloseChannels();
+            throw std::runtime_error("Unable to create pipes for islands");
+        }
+        channels.m_InboxReadFds[i] = fds[0];
+        channels.m_InboxWriteFds[i] = fds[1];
+    }
+
+    channels.m_MainPid = getpid();
+    for (size_t i = 1; i < m_IslandsCount; ++i)
+    {
+        pid_t pid = fork();
+        if (pid < 0)
+        {
+            throw std::runtime_error("Unable to start island process");
+        }
+        if (pid == 0)
+        {
+            m_IslandIndex = i;
+            channels.m_Children.clear();
+            break;
+        }
+        channels.m_Children.push_back(pid);
+    }
+
+    // Every island reads only its own inbox
+    for (size_t i = 0; i < m_IslandsCount; ++i)
+    {
+        if (i != m_IslandIndex)
+        {
+            close(channels.m_InboxReadFds[i]);
+            channels.m_InboxReadFds[i] = -1;
+        }
+    }
+
+    if (!IsMainIsland())
+    {
+        CRandom::SetSeed(seed + (unsigned int)m_IslandIndex * s_IslandSeedStride);
+        CExperimentLogger::m_IsMuted = true;
+    }
+
+    channels.m_Reader = std::thread(ReadInbox, channels.m_InboxReadFds[m_IslandIndex]);
+}
+
+void CIslandModel::FinishRun()
+{
+    if (!IsEnabled())
+    {
+        return;
+    }
+
+    if (!IsMainIsland())
+    {
+        std::cout.flush();
+        _exit(0);
+    }
+
+    bool isSuccess = CheckChildren(true);
+    CloseChannels();
+    if (!isSuccess)
+    {
+        throw std::runtime_error("Island process terminated unexpectedly");
+    }
+}
+
+std::vector<SMigrant> CIslandModel::Exchange(const std::vector<const AIndividual *> &migrants)
+{
+    const int tag = m_ExchangeCounter++;
+    CBinaryWriter writer;
+    WriteIndividuals(writer, migrants);
+    for (size_t target: GetTargets())
+    {
+        Send(m_IslandIndex, target, tag, writer.GetBuffer());
+    }
+
+    // Sources are always read in the same order, so the run is reproducible for a given seed
+    std::vector<SMigrant> received;
+    for (size_t source: GetSources())
+    {
+        ReadIndividuals(Receive(tag, source), received);
+    }
+    return received;
+}
+
+std::vector<SMigrant> CIslandModel::Gather(const std::vector<const AIndividual *> &individuals)
+{
+    std::vector<SMigrant> received;
+    if (!IsEnabled())
+    {
+        return received;
+    }
+
+    if (!IsMainIsland())
+    {
+        CBinaryWriter writer;
+        WriteIndividuals(writer, individuals);
+        Send(m_IslandIndex, 0, FINAL_TAG, writer.GetBuffer());
+        return received;
+    }
+
+    for (size_t source = 1; source < m_IslandsCount; ++source)
+    {
+        ReadIndividuals(Receive(FINAL_TAG, source), received);
+    }
+    return received;
+}
+
+#else
+
+void CIslandModel::StartRun(unsigned int seed)
+{
+    if (IsEnabled())
+    {
+        throw std::runtime_error("Island model is not supported on this platform");
+    }
+}
+
+void CIslandModel::FinishRun()
+{
+}
+
+std::vector<SMigrant> CIslandModel::Exchange(const std::vector<const AIndividual *> &migrants)
+{
+    return {};
+}
+
+std::vector<SMigrant> CIslandModel::Gather(const std::vector<const AIndividual *> &individuals)
+{
+    return {};
+}
+
+#endif
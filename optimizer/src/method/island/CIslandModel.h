@@ -0,0 +1,63 @@
+#pragma once
+
+#include <string>
+#include <vector>
+#include "../configMap/SConfigMap.h"
+#include "../individual/AIndividual.h"
+
+enum class EMigrationTopology
+{
+    Ring,
+    AllToAll
+};
+
+// Individual received from another island, evaluation is transferred so it does not have to be evaluated again
+struct SMigrant
+{
+    SGenotype m_Genotype;
+    std::vector<float> m_Evaluation;
+    std::vector<float> m_NormalizedEvaluation;
+};
+
+// Island model of a single optimization run. Each run is split into Islands processes evolving the same method
+// on the same instance with different seeds. Every MigrationInterval generations islands synchronously exchange
+// MigrantsCount individuals with their neighbours in the configured topology. At the end all islands send their
+// results to the main island, which is the only one logging them.
+class CIslandModel
+{
+public:
+    static void Configure(SConfigMap *configMap);
+
+    static bool IsEnabled();
+    static bool IsMainIsland();
+    static size_t GetIslandIndex();
+    static size_t GetMigrantsCount();
+
+    // Forks island processes, returns in every island with its own seed set
+    static void StartRun(unsigned int seed);
+    // Terminates island processes, returns only in the main island after all of them have finished
+    static void FinishRun();
+
+    static bool IsMigrationGeneration(size_t generation);
+    // Sends migrants to neighbouring islands and returns migrants received from them
+    static std::vector<SMigrant> Exchange(const std::vector<const AIndividual *> &migrants);
+    // Sends individuals to the main island, in the main island returns individuals of all other islands
+    static std::vector<SMigrant> Gather(const std::vector<const AIndividual *> &individuals);
+
+private:
+    static const std::string s_IslandsKey;
+    static const std::string s_MigrationIntervalKey;
+    static const std::string s_MigrationTopologyKey;
+    static const std::string s_MigrantsCountKey;
+    static const unsigned int s_IslandSeedStride;
+
+    static size_t m_IslandsCount;
+    static size_t m_MigrationInterval;
+    static size_t m_MigrantsCount;
+    static EMigrationTopology m_Topology;
+    static size_t m_IslandIndex;
+    static int m_ExchangeCounter;
+
+    static std::vector<size_t> GetTargets();
+    static std::vector<size_t> GetSources();
+};
@@ -0,0 +1,71 @@
+#include "AMOGeneticMethod.h"
+#include "../../../utils/random/CRandom.h"
+#include "utils/archive/ArchiveUtils.h"
+#include <algorithm>
+
+void AMOGeneticMethod::MigrateIslands(size_t generation)
+{
+    if (!CIslandModel::IsMigrationGeneration(generation))
+    {
+        return;
+    }
+
+    std::vector<size_t> indices(m_Archive.size());
+    for (size_t i = 0; i < indices.size(); ++i)
+    {
+        indices[i] = i;
+    }
+    std::vector<const AIndividual*> migrants;
+    const size_t migrantsCount = std::min(CIslandModel::GetMigrantsCount(), m_Archive.size());
+    for (size_t i = 0; i < migrantsCount; ++i)
+    {
+        std::swap(indices[i], indices[CRandom::GetInt((int)i, (int)indices.size())]);
+        migrants.push_back(m_Archive[indices[i]]);
+    }
+
+    for (SMigrant& migrant : CIslandModel::Exchange(migrants))
+    {
+        auto* immigrant = new SMOIndividual(migrant.m_Genotype, migrant.m_Evaluation, migrant.m_NormalizedEvaluation);
+        ArchiveUtils::CopyToArchiveWithFiltering(immigrant, m_Archive);
+        m_Hypervolume.Insert(immigrant);
+        if (m_Population.empty())
+        {
+            delete immigrant;
+            continue;
+        }
+        size_t replacedIdx = CRandom::GetInt(0, (int)m_Population.size());
+        delete m_Population[replacedIdx];
+        m_Population[replacedIdx] = immigrant;
+    }
+}
+
+void AMOGeneticMethod::MergeIslandArchives()
+{
+    std::vector<const AIndividual*> archive(m_Archive.begin(), m_Archive.end());
+    for (SMigrant& migrant : CIslandModel::Gather(archive))
+    {
+        SMOIndividual individual(migrant.m_Genotype, migrant.m_Evaluation, migrant.m_NormalizedEvaluation);
+        ArchiveUtils::CopyToArchiveWithFiltering(&individual, m_Archive);
+    }
+}
+
+void AMOGeneticMethod::EvaluatePopulation(const std::vector<SMOIndividual*>& population)
+{
+    m_EvaluationBatch.assign(population.begin(), population.end());
+    m_Problem.EvaluateBatch(m_EvaluationBatch);
+}
+
+void AMOGeneticMethod::EvaluateOffspring(std::vector<SMOIndividual*>& offspring, size_t count)
+{
+    if (m_Surrogate.IsEnabled() && offspring.size() > count)
+    {
+        m_Surrogate.Screen(offspring, count);
+        for (size_t i = count; i < offspring.size(); ++i)
+        {
+            m_IndividualPool.Release(offspring[i]);
+        }
+        offspring.resize(count);
+    }
+    EvaluatePopulation(offspring);
+    m_Surrogate.Train(offspring, m_Problem.GetProblemEncoding());
+}
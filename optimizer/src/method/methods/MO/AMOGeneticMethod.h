@@ -2,7 +2,11 @@
 
 #include "../../AMethod.h"
 #include "../../individual/MO/SMOIndividual.h"
+#include "../../individual/CIndividualPool.h"
 #include "../../AGeneticMethod.h"
+#include "../../island/CIslandModel.h"
+#include "utils/surrogate/CSurrogate.h"
+#include "utils/hypervolume/CHypervolumeTracker.h"
 
 class AMOGeneticMethod : public AGeneticMethod
 {
@@ -30,9 +34,36 @@ public:
             delete i;
         }
         m_Archive.clear();
+        m_Surrogate.Reset();
+        m_Hypervolume.Reset();
     };
 protected:
+    // Sends random archive members to neighbouring islands, immigrants join the archive and replace random population members
+    void MigrateIslands(size_t generation);
+
+    // Main island merges archives of all islands, other islands send their archives to it
+    void MergeIslandArchives();
+
+    // Evaluates all individuals in one batch of the problem
+    void EvaluatePopulation(const std::vector<SMOIndividual*>& population);
+
+    // Number of offspring to create per generation, more than the population size when the surrogate screens them
+    size_t GetOffspringCount() const { return m_PopulationSize * m_Surrogate.GetOversampling(); }
+
+    // Evaluates offspring, with the surrogate enabled only the population size of them predicted best are kept
+    // and evaluated, the others are returned to the pool
+    void EvaluateOffspring(std::vector<SMOIndividual*>& offspring) { EvaluateOffspring(offspring, m_PopulationSize); }
+    void EvaluateOffspring(std::vector<SMOIndividual*>& offspring, size_t count);
+
     std::vector<SMOIndividual*> m_Population;
     std::vector<SMOIndividual*> m_NextPopulation;
     std::vector<SMOIndividual*> m_Archive;
+    // Offspring are taken from and discarded individuals returned to the pool instead of allocating them every generation
+    CIndividualPool<SMOIndividual> m_IndividualPool;
+    CSurrogate m_Surrogate;
+    // Individuals added to the archive are inserted, so it holds the hypervolume of the archive
+    CHypervolumeTracker m_Hypervolume;
+
+private:
+    std::vector<AIndividual*> m_EvaluationBatch;
 };
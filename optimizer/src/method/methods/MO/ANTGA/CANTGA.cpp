@@ -22,6 +22,7 @@ CANTGA::CANTGA(AProblem& evaluator, AInitialization& initialization,
     ErrorUtils::LowerThanZeroI("ANTGA", "GenerationLimit", m_GenerationLimit);
 
     m_MultiMutation = CMultiMutationFactory::Create(configMap, evaluator);
+    CSurrogate::RejectConfiguration(configMap, "ANTGA");
 }
 
 CANTGA::~CANTGA()
@@ -51,6 +52,7 @@ void CANTGA::RunOptimization()
 
     while (m_Generation < m_GenerationLimit)
     {
+        MigrateIslands(m_Generation);
         EvolveToNextGeneration();
 
         LogIndividualsToCSV(m_PopulationHistory, m_NextPopulation);
@@ -66,6 +68,7 @@ void CANTGA::RunOptimization()
         m_Generation++;
     }
 
+    MergeIslandArchives();
     ArchiveUtils::LogParetoFront(m_Archive);
     CExperimentLogger::LogResult(m_PopulationHistory.ToStringStream().str().c_str(), "PopHist.csv");
     CExperimentLogger::LogResult(m_ArchiveHistory.ToStringStream().str().c_str(), "ArchHist.csv");
@@ -15,6 +15,9 @@ CBNTGA::CBNTGA(AProblem &evaluator, AInitialization &initialization,
 
     configMap->TakeValue("GenerationLimit", m_GenerationLimit);
     ErrorUtils::LowerThanZeroI("BNTGA", "GenerationLimit", m_GenerationLimit);
+
+    m_Hypervolume.Configure(configMap, "BNTGA");
+    CSurrogate::RejectConfiguration(configMap, "BNTGA");
 }
 
 
@@ -27,15 +30,17 @@ void CBNTGA::RunOptimization()
         SProblemEncoding& problemEncoding = m_Problem.GetProblemEncoding();
         auto* newInd = m_Initialization.CreateMOIndividual(problemEncoding);
 
-        m_Problem.Evaluate(*newInd);
-
         m_Population.push_back(newInd);
     }
+    EvaluatePopulation(m_Population);
 
     ArchiveUtils::CopyToArchiveWithFiltering(m_Population, m_Archive);
+    m_Hypervolume.Insert(m_Population);
+    m_Hypervolume.FinishGeneration();
 
     while (generation < m_GenerationLimit)
     {
+        MigrateIslands(generation);
         EvolveToNextGeneration();
 
         for (SMOIndividual* ind : m_Population)
@@ -47,9 +52,15 @@ void CBNTGA::RunOptimization()
         m_NextPopulation.reserve(m_Population.size());
 
         generation++;
+        if (m_Hypervolume.FinishGeneration())
+        {
+            break;
+        }
     }
     
+    MergeIslandArchives();
     ArchiveUtils::LogParetoFront(m_Archive);
+    m_Hypervolume.LogHistory();
 }
 
 void CBNTGA::EvolveToNextGeneration()
@@ -63,7 +74,9 @@ void CBNTGA::EvolveToNextGeneration()
     {
         CrossoverAndMutate(parentPair.first, parentPair.second);
     }
+    EvaluatePopulation(m_NextPopulation);
     ArchiveUtils::CopyToArchiveWithFiltering(m_NextPopulation, m_Archive);
+    m_Hypervolume.Insert(m_NextPopulation);
 }
 
 void CBNTGA::CrossoverAndMutate(SMOIndividual* firstParent, SMOIndividual* secondParent)
@@ -82,9 +95,6 @@ void CBNTGA::CrossoverAndMutate(SMOIndividual* firstParent, SMOIndividual* secon
     m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *firstChild);
     m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *secondChild);
 
-    m_Problem.Evaluate(*firstChild);
-    m_Problem.Evaluate(*secondChild);
-
     m_NextPopulation.emplace_back(firstChild);
     m_NextPopulation.emplace_back(secondChild);
 }
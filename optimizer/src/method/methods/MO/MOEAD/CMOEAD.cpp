@@ -1,4 +1,6 @@
 #include <algorithm>
+#include <cfloat>
+#include <cmath>
 #include <sstream>
 #include "CMOEAD.h"
 #include "../utils/archive/ArchiveUtils.h"
@@ -6,6 +8,10 @@
 #include "../../../../utils/random/CRandom.h"
 #include "../../../../utils/logger/ErrorUtils.h"
 
+const std::string CMOEAD::s_ScalarizationKey = "Scalarization";
+const std::string CMOEAD::s_PBIThetaKey = "PBITheta";
+const std::string CMOEAD::s_ReplacementLimitKey = "ReplacementLimit";
+
 CMOEAD::CMOEAD(AProblem &problem, AInitialization &initialization, ACrossover &crossover, AMutation &mutation, SConfigMap *configMap)
         : AMOGeneticMethod(problem, initialization, crossover, mutation)
 {
@@ -17,6 +23,34 @@ CMOEAD::CMOEAD(AProblem &problem, AInitialization &initialization, ACrossover &c
 
     configMap->TakeValue("NeighbourhoodSize", m_NeighbourhoodSize);
     ErrorUtils::LowerThanZeroI("CMOEAD", "NeighbourhoodSize", m_NeighbourhoodSize);
+
+    std::string scalarization = "WeightedSum";
+    configMap->TakeValue(s_ScalarizationKey, scalarization);
+    if (scalarization == "WeightedSum")
+    {
+        m_Scalarization = EScalarization::WeightedSum;
+    }
+    else if (scalarization == "Tchebycheff")
+    {
+        m_Scalarization = EScalarization::Tchebycheff;
+    }
+    else if (scalarization == "PBI")
+    {
+        m_Scalarization = EScalarization::PBI;
+    }
+    else
+    {
+        throw std::runtime_error("Scalarization: " + scalarization + " not supported, use WeightedSum, Tchebycheff or PBI");
+    }
+
+    configMap->TakeValue(s_PBIThetaKey, m_PBITheta);
+    ErrorUtils::LowerThanZeroF("CMOEAD", s_PBIThetaKey, m_PBITheta);
+
+    configMap->TakeValue(s_ReplacementLimitKey, m_ReplacementLimit);
+    ErrorUtils::LowerThanZeroI("CMOEAD", s_ReplacementLimitKey, m_ReplacementLimit);
+
+    m_Hypervolume.Configure(configMap, "CMOEAD");
+    CSurrogate::RejectConfiguration(configMap, "CMOEAD");
 }
 
 
@@ -33,20 +67,36 @@ void CMOEAD::RunOptimization()
         SProblemEncoding& problemEncoding = m_Problem.GetProblemEncoding();
         auto* newInd = m_Initialization.CreateMOIndividual(problemEncoding);
 
-        m_Problem.Evaluate(*newInd);
-
         m_Population.push_back(newInd);
     }
-    
+    EvaluatePopulation(m_Population);
+
+    m_IdealPoint.assign(m_Problem.GetProblemEncoding().m_objectivesNumber, FLT_MAX);
+    for (const SMOIndividual* individual : m_Population)
+    {
+        UpdateIdealPoint(*individual);
+    }
+    // Incumbent values are calculated when they are needed for the first time
+    ++m_IdealPointVersion;
+
     ArchiveUtils::CopyToArchiveWithFiltering(m_Population, m_Archive);
+    m_Hypervolume.Insert(m_Population);
+    m_Hypervolume.FinishGeneration();
 
     while ( generation < m_GenerationLimit)
     {
+        MigrateIslands(generation);
         EvolveToNextGeneration();
         generation++;
+        if (m_Hypervolume.FinishGeneration())
+        {
+            break;
+        }
     }
 
+    MergeIslandArchives();
     ArchiveUtils::LogParetoFront(m_Archive);
+    m_Hypervolume.LogHistory();
 }
 
 void CMOEAD::ConstructSubproblems(size_t partitionsNumber, size_t neighborhoodSize)
@@ -102,7 +152,6 @@ void CMOEAD::ConstructSubproblemsMultiD(size_t partitionsNumber, size_t neighbor
 
     // Generate subproblems
     DasDennis ddGenerator(partitionsNumber, dimCount);
-    size_t subVecCount = ddGenerator.GetPointsNumber();
     ddGenerator.GeneratePoints();
     std::vector<std::vector<float>> subproblemVectors = ddGenerator.GetPoints();
 
@@ -117,57 +166,37 @@ void CMOEAD::ConstructSubproblemsMultiD(size_t partitionsNumber, size_t neighbor
         }
     }
 
-    // Calculate distances
-    using TNeighborhood = std::vector<std::pair<size_t, float>>;
-    std::vector<TNeighborhood> neighborhood = std::vector<TNeighborhood>(subVecCount, TNeighborhood(subVecCount));
+    // Only the nearest weight vectors are kept, including the subproblem itself. Partial sort does not order
+    // the whole row, and squared distances preserve the order of distances.
+    const size_t subVecCount = m_Subproblems.size();
+    const size_t keptCount = std::min(neighborhoodSize, subVecCount);
+    std::vector<std::pair<float, size_t>> distances(subVecCount);
     for (size_t i = 0; i < subVecCount; ++i)
     {
         auto& weightVectorI = m_Subproblems[i].m_WeightVector;
-        size_t entryIdx = 0;
         for (size_t j = 0; j < subVecCount; ++j)
         {
             auto& weightVectorJ = m_Subproblems[j].m_WeightVector;
-            std::pair<size_t, float>& entry = neighborhood[i][entryIdx];
-            entry.first = j;
-
             float dist = 0.f;
-            if (i != j)
+            for (size_t d = 0; d < dimCount; ++d)
             {
-                for (size_t d = 0; d < dimCount; ++d)
-                {
-                    dist += powf(weightVectorI[d] - weightVectorJ[d], 2);
-                }
-                dist = sqrtf(dist);
+                float diff = weightVectorI[d] - weightVectorJ[d];
+                dist += diff * diff;
             }
-            entry.second = dist;
-            ++entryIdx;
+            distances[j] = {dist, j};
         }
-    }
-
-    // Link neighborhood
-    for (TNeighborhood& nh : neighborhood)
-    {
-        // Sort ascending by distance, including distance to self
-        std::sort(nh.begin(), nh.end(), [](const std::pair<size_t, float>& a, const std::pair<size_t, float>& b) -> bool
-        {
-            return a.second < b.second;
-        });
-    }
 
-    for (size_t i = 0; i < subVecCount; ++i)
-    {
-        for (size_t j = 0; j < neighborhoodSize; ++j)
+        std::partial_sort(distances.begin(), distances.begin() + keptCount, distances.end());
+        m_Subproblems[i].m_Neighborhood.reserve(keptCount);
+        for (size_t j = 0; j < keptCount; ++j)
         {
-            m_Subproblems[i].m_Neighborhood.push_back(neighborhood[i][j].first);
+            m_Subproblems[i].m_Neighborhood.push_back(distances[j].second);
         }
     }
 }
 
 void CMOEAD::EvolveToNextGeneration()
 {
-// Temp individual used for testing new child genes
-    SMOIndividual* testIndividual = nullptr;
-
     for (size_t i = 0; i < m_Population.size(); ++i)
     {
         const SSubproblem& sp = m_Subproblems[i];
@@ -178,51 +207,125 @@ void CMOEAD::EvolveToNextGeneration()
         SMOIndividual* firstParent = m_Population[firstParentIdx];
         SMOIndividual* secondParent = m_Population[secondParentIdx];
 
-        auto *firstChild = new SMOIndividual{*firstParent};
-        auto *secondChild = new SMOIndividual{*secondParent};
+        auto *child = m_IndividualPool.Acquire(*firstParent);
+        // Crossover operators fill two children, the second one is discarded without mutation and evaluation
+        auto *discardedChild = m_IndividualPool.Acquire(*secondParent);
 
         m_Crossover.Crossover(
                 m_Problem.GetProblemEncoding(),
                 *firstParent,
                 *secondParent,
-                *firstChild,
-                *secondChild
+                *child,
+                *discardedChild
         );
+        m_IndividualPool.Release(discardedChild);
 
-        m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *firstChild);
-        m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *secondChild);
-
-        //Take only one child
-        testIndividual = firstChild;
-        m_Problem.Evaluate(*testIndividual);
-        delete secondChild;
+        m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *child);
+        m_Problem.Evaluate(*child);
+        UpdateIdealPoint(*child);
 
         // Now check if any neighborhood solution is improved
+        size_t replacedCount = 0;
         for (size_t j : sp.m_Neighborhood)
         {
-            if (IsBetterInSubproblem(testIndividual, m_Population[j], m_Subproblems[j]))
+            float childValue = Scalarize(*child, m_Subproblems[j]);
+            // Minimization
+            if (childValue < GetIncumbentValue(j))
             {
-                // I assume we can just copy whole individual
-                *m_Population[j] = *testIndividual;
+                m_Population[j]->CopyFrom(*child);
+                m_Subproblems[j].m_IncumbentValue = childValue;
+                if (m_ReplacementLimit > 0 && ++replacedCount >= m_ReplacementLimit)
+                {
+                    break;
+                }
             }
         }
 
-        ArchiveUtils::CopyToArchiveWithFiltering(testIndividual, m_Archive);
+        ArchiveUtils::CopyToArchiveWithFiltering(child, m_Archive);
+        m_Hypervolume.Insert(child);
+        // Population and archive hold copies, so child buffers are reused in the next iteration
+        m_IndividualPool.Release(child);
+    }
+}
+
+void CMOEAD::UpdateIdealPoint(const SMOIndividual &individual)
+{
+    bool isMoved = false;
+    for (size_t i = 0; i < m_IdealPoint.size(); ++i)
+    {
+        if (individual.m_NormalizedEvaluation[i] < m_IdealPoint[i])
+        {
+            m_IdealPoint[i] = individual.m_NormalizedEvaluation[i];
+            isMoved = true;
+        }
+    }
+    // Weighted sum does not depend on the ideal point, so its cached values stay valid
+    if (isMoved && m_Scalarization != EScalarization::WeightedSum)
+    {
+        ++m_IdealPointVersion;
     }
 }
 
-bool CMOEAD::IsBetterInSubproblem(SMOIndividual *newIndividual, SMOIndividual *&oldIndividual, CMOEAD::SSubproblem &subproblem)
+float CMOEAD::Scalarize(const SMOIndividual &individual, const SSubproblem &subproblem) const
 {
-    // Simple weighted sum
-    float newValue = 0.f;
-    float oldValue = 0.f;
-    const size_t objCount = m_Problem.GetProblemEncoding().m_objectivesNumber;
-    for (size_t i = 0; i < objCount; ++i)
+    const std::vector<float>& evaluation = individual.m_NormalizedEvaluation;
+    const std::vector<float>& weights = subproblem.m_WeightVector;
+    const size_t objCount = weights.size();
+    float value = 0.f;
+    switch (m_Scalarization)
     {
-        newValue += newIndividual->m_NormalizedEvaluation[i] * subproblem.m_WeightVector[i];
-        oldValue += oldIndividual->m_NormalizedEvaluation[i] * subproblem.m_WeightVector[i];
+        case EScalarization::WeightedSum:
+        {
+            for (size_t i = 0; i < objCount; ++i)
+            {
+                value += evaluation[i] * weights[i];
+            }
+            break;
+        }
+        case EScalarization::Tchebycheff:
+        {
+            value = -FLT_MAX;
+            for (size_t i = 0; i < objCount; ++i)
+            {
+                // Zero weight would ignore the objective entirely
+                float weight = std::max(weights[i], 1.0e-6f);
+                value = std::max(value, weight * std::fabs(evaluation[i] - m_IdealPoint[i]));
+            }
+            break;
+        }
+        case EScalarization::PBI:
+        {
+            // Distance along the weight vector and distance from it
+            float weightsNorm = 0.f;
+            float alongDist = 0.f;
+            for (size_t i = 0; i < objCount; ++i)
+            {
+                weightsNorm += weights[i] * weights[i];
+                alongDist += (evaluation[i] - m_IdealPoint[i]) * weights[i];
+            }
+            weightsNorm = std::sqrt(weightsNorm);
+            alongDist /= weightsNorm;
+
+            float perpendicularDist = 0.f;
+            for (size_t i = 0; i < objCount; ++i)
+            {
+                float diff = evaluation[i] - m_IdealPoint[i] - alongDist * weights[i] / weightsNorm;
+                perpendicularDist += diff * diff;
+            }
+            value = alongDist + m_PBITheta * std::sqrt(perpendicularDist);
+            break;
+        }
     }
-    // Minimization
-    return newValue < oldValue;
+    return value;
 }
 
+float CMOEAD::GetIncumbentValue(size_t subproblemIdx)
+{
+    SSubproblem& subproblem = m_Subproblems[subproblemIdx];
+    if (subproblem.m_IncumbentVersion != m_IdealPointVersion)
+    {
+        subproblem.m_IncumbentValue = Scalarize(*m_Population[subproblemIdx], subproblem);
+        subproblem.m_IncumbentVersion = m_IdealPointVersion;
+    }
+    return subproblem.m_IncumbentValue;
+}
@@ -4,6 +4,13 @@
 #include "../AMOGeneticMethod.h"
 #include "../../../configMap/SConfigMap.h"
 
+enum class EScalarization
+{
+    WeightedSum,
+    Tchebycheff,
+    PBI
+};
+
 class CMOEAD : public AMOGeneticMethod
 {
 public:
@@ -22,16 +29,34 @@ private:
     {
         std::vector<float> m_WeightVector;
         std::vector<size_t> m_Neighborhood;
+        // Scalarized value of the population member of this subproblem, valid for one version of the ideal point
+        float m_IncumbentValue = 0.f;
+        size_t m_IncumbentVersion = 0;
     };
-    
+
+    static const std::string s_ScalarizationKey;
+    static const std::string s_PBIThetaKey;
+    static const std::string s_ReplacementLimitKey;
+
     size_t m_PartitionsNumber = 0;
     size_t m_NeighbourhoodSize = 0;
     size_t m_GenerationLimit = 0;
+    EScalarization m_Scalarization = EScalarization::WeightedSum;
+    float m_PBITheta = 5.f;
+    // Maximum number of neighbours replaced by one child, 0 does not limit replacements
+    size_t m_ReplacementLimit = 0;
     std::vector<SSubproblem> m_Subproblems;
-    
+
+    // Best normalized value of every objective, reference point of Tchebycheff and PBI. Its version changes
+    // whenever it moves, which invalidates cached incumbent values.
+    std::vector<float> m_IdealPoint;
+    size_t m_IdealPointVersion = 0;
+
     void EvolveToNextGeneration();
     void ConstructSubproblems(size_t number, size_t size);
     void ConstructSubproblemsSimple2D(size_t number, size_t size);
     void ConstructSubproblemsMultiD(size_t number, size_t size, size_t count);
-    bool IsBetterInSubproblem(SMOIndividual *pIndividual, SMOIndividual *&pIndividual1, SSubproblem &subproblem);
+    void UpdateIdealPoint(const SMOIndividual &individual);
+    float Scalarize(const SMOIndividual &individual, const SSubproblem &subproblem) const;
+    float GetIncumbentValue(size_t subproblemIdx);
 };
\ No newline at end of file
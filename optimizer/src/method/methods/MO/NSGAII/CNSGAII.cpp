@@ -23,6 +23,9 @@ CNSGAII::CNSGAII(AProblem &evaluator,
 
     configMap->TakeValue("GenerationLimit", m_GenerationLimit);
     ErrorUtils::LowerThanZeroI("NSGAII", "GenerationLimit", m_GenerationLimit);
+
+    m_Surrogate.Configure(configMap, "NSGAII");
+    m_Hypervolume.Configure(configMap, "NSGAII");
 }
 
 
@@ -35,84 +38,45 @@ void CNSGAII::RunOptimization()
         SProblemEncoding& problemEncoding = m_Problem.GetProblemEncoding();
         auto* newInd = m_Initialization.CreateMOIndividual(problemEncoding);
 
-        m_Problem.Evaluate(*newInd);
-
         m_Population.push_back(newInd);
     }
+    EvaluatePopulation(m_Population);
+    m_Surrogate.Train(m_Population, m_Problem.GetProblemEncoding());
 
     ArchiveUtils::CopyToArchiveWithFiltering(m_Population, m_Archive);
+    m_Hypervolume.Insert(m_Population);
+    m_Hypervolume.FinishGeneration();
 
     while (generation < m_GenerationLimit)
     {
+        MigrateIslands(generation);
         EvolveToNextGeneration();
+        SelectSurvivors();
 
-        std::vector<SMOIndividual *> combinedPop;
-        combinedPop.reserve(m_Population.size() + m_NextPopulation.size());
-        combinedPop.insert(combinedPop.end(), m_Population.begin(), m_Population.end());
-        combinedPop.insert(combinedPop.end(), m_NextPopulation.begin(), m_NextPopulation.end());
-
-        CNonDominatedSorting nonDominatedSorting;
-        std::vector<std::vector<size_t>> combinedClusters;
-        nonDominatedSorting.Cluster(combinedPop, combinedClusters);
-
-        std::vector<SMOIndividual *> tempPopulation;
-        tempPopulation.reserve(m_PopulationSize);
-        for (size_t i = 0; tempPopulation.size() < m_PopulationSize; ++i)
-        {
-            std::vector<size_t> &cluster = combinedClusters[i];
-            // if this cluster exceeds the size
-            if (tempPopulation.size() + cluster.size() > m_PopulationSize)
-            {
-                CalcCrowdingDistance(combinedPop, cluster);
-                std::sort(cluster.begin(), cluster.end(), [combinedPop](const size_t &a, const size_t &b) -> bool
-                {
-                    return combinedPop[a]->m_CrowdingDistance < combinedPop[b]->m_CrowdingDistance;
-                });
-                for (size_t idx: cluster)
-                {
-                    // deep copy individuals as they fill be the new population
-                    tempPopulation.push_back(new SMOIndividual(*combinedPop[idx]));
-                    if (tempPopulation.size() >= m_PopulationSize)
-                        break;
-                }
-            }
-            else
-            {
-                for (size_t idx: cluster)
-                {
-                    tempPopulation.push_back(new SMOIndividual(*combinedPop[idx]));
-                }
-            }
-        }
-
-        // Clear both current and next population
-        for (SMOIndividual *ind: combinedPop)
+        generation++;
+        if (m_Hypervolume.FinishGeneration())
         {
-            delete ind;
+            break;
         }
-        m_Population.clear();
-        m_NextPopulation.clear();
-
-        m_Population.swap(tempPopulation);
-        m_NextPopulation.reserve(m_Population.size());
-
-        generation++;
     }
 
     ArchiveUtils::CopyToArchiveWithFiltering(m_NextPopulation, m_Archive);
+    MergeIslandArchives();
     ArchiveUtils::LogParetoFront(m_Archive);
+    m_Surrogate.LogStatistics();
+    m_Hypervolume.LogHistory();
 }
 
 void CNSGAII::EvolveToNextGeneration()
 {
 
-    for (size_t i = 0; i < m_PopulationSize; i += 2)
+    for (size_t i = 0; i < GetOffspringCount(); i += 2)
     {
         auto *firstParent = m_RankedTournament.Select(m_Population);
         auto *secondParent = m_RankedTournament.Select(m_Population);
 
-        auto *firstChild = new SMOIndividual{*firstParent};
-        auto *secondChild = new SMOIndividual{*secondParent};
+        auto *firstChild = m_IndividualPool.Acquire(*firstParent);
+        auto *secondChild = m_IndividualPool.Acquire(*secondParent);
 
         m_Crossover.Crossover(
                 m_Problem.GetProblemEncoding(),
@@ -125,33 +89,94 @@ void CNSGAII::EvolveToNextGeneration()
         m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *firstChild);
         m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *secondChild);
 
-        m_Problem.Evaluate(*firstChild);
-        m_Problem.Evaluate(*secondChild);
-
         m_NextPopulation.emplace_back(firstChild);
         m_NextPopulation.emplace_back(secondChild);
     }
+    EvaluateOffspring(m_NextPopulation);
     ArchiveUtils::CopyToArchiveWithFiltering(m_NextPopulation, m_Archive);
+    m_Hypervolume.Insert(m_NextPopulation);
 }
 
-void CNSGAII::CalcCrowdingDistance(std::vector<SMOIndividual *> &population, std::vector<size_t> &indices)
+void CNSGAII::SelectSurvivors()
 {
-    for (int objIdx = 0; objIdx < m_Problem.GetProblemEncoding().m_objectivesNumber; ++objIdx)
+    m_CombinedPopulation.clear();
+    m_CombinedPopulation.insert(m_CombinedPopulation.end(), m_Population.begin(), m_Population.end());
+    m_CombinedPopulation.insert(m_CombinedPopulation.end(), m_NextPopulation.begin(), m_NextPopulation.end());
+
+    size_t objectivesNumber = m_Problem.GetProblemEncoding().m_objectivesNumber;
+    m_Objectives.resize(m_CombinedPopulation.size() * objectivesNumber);
+    for (size_t i = 0; i < m_CombinedPopulation.size(); ++i)
     {
-        std::sort(indices.begin(), indices.end(), [objIdx, population](const size_t &a, const size_t &b) -> bool
+        const std::vector<float> &evaluation = m_CombinedPopulation[i]->m_NormalizedEvaluation;
+        std::copy(evaluation.begin(), evaluation.end(), m_Objectives.begin() + i * objectivesNumber);
+    }
+    m_NonDominatedSorting.Cluster(m_Objectives, objectivesNumber, m_Fronts);
+
+    m_Survivors.clear();
+    m_IsSurvivor.assign(m_CombinedPopulation.size(), false);
+    for (size_t i = 0; m_Survivors.size() < m_PopulationSize; ++i)
+    {
+        std::vector<size_t> &front = m_Fronts[i];
+        size_t survivorsCount = std::min(front.size(), m_PopulationSize - m_Survivors.size());
+        // Only the least crowded individuals of the front exceeding the size survive, they are not ordered among themselves
+        if (survivorsCount < front.size())
         {
-            return population[a]->m_NormalizedEvaluation[objIdx] < population[b]->m_NormalizedEvaluation[objIdx];
-        });
+            CalcCrowdingDistance(front);
+            std::nth_element(front.begin(), front.begin() + survivorsCount, front.end(), [this](size_t a, size_t b)
+            {
+                return m_CrowdingDistances[a] > m_CrowdingDistances[b];
+            });
+        }
+        for (size_t j = 0; j < survivorsCount; ++j)
+        {
+            m_Survivors.push_back(m_CombinedPopulation[front[j]]);
+            m_IsSurvivor[front[j]] = true;
+        }
+    }
+
+    // Survivors are moved to the next generation with cleared rank and crowding distance,
+    // other individuals of both current and next population are recycled
+    for (size_t i = 0; i < m_CombinedPopulation.size(); ++i)
+    {
+        if (m_IsSurvivor[i])
+        {
+            m_CombinedPopulation[i]->ResetSelection();
+        }
+        else
+        {
+            m_IndividualPool.Release(m_CombinedPopulation[i]);
+        }
+    }
+    m_NextPopulation.clear();
+    m_Population.swap(m_Survivors);
+}
+
+void CNSGAII::CalcCrowdingDistance(const std::vector<size_t> &front)
+{
+    size_t objectivesNumber = m_Problem.GetProblemEncoding().m_objectivesNumber;
+    m_CrowdingDistances.resize(m_CombinedPopulation.size());
+    for (size_t idx: front)
+    {
+        m_CrowdingDistances[idx] = 0.f;
+    }
 
-        population[indices[0]]->m_CrowdingDistance = FLT_MAX;
-        population[indices[indices.size() - 1]]->m_CrowdingDistance = FLT_MAX;
+    std::vector<size_t> &order = m_CrowdingOrder;
+    order.assign(front.begin(), front.end());
+    for (size_t objIdx = 0; objIdx < objectivesNumber; ++objIdx)
+    {
+        const float *objectives = m_Objectives.data() + objIdx;
+        std::sort(order.begin(), order.end(), [objectives, objectivesNumber](size_t a, size_t b)
+        {
+            return objectives[a * objectivesNumber] < objectives[b * objectivesNumber];
+        });
 
-        for (size_t i = 1; i < indices.size() - 1; ++i)
+        m_CrowdingDistances[order.front()] = FLT_MAX;
+        m_CrowdingDistances[order.back()] = FLT_MAX;
+        for (size_t i = 1; i + 1 < order.size(); ++i)
         {
-            float currDist = population[indices[i]]->m_CrowdingDistance;
-            float plusValue = population[indices[i + 1]]->m_NormalizedEvaluation[objIdx];
-            float minusValue = population[indices[i - 1]]->m_NormalizedEvaluation[objIdx];
-            population[indices[i]]->m_CrowdingDistance = currDist + plusValue - minusValue;
+            float plusValue = objectives[order[i + 1] * objectivesNumber];
+            float minusValue = objectives[order[i - 1] * objectivesNumber];
+            m_CrowdingDistances[order[i]] = m_CrowdingDistances[order[i]] + plusValue - minusValue;
         }
     }
-}
\ No newline at end of file
+}
@@ -5,6 +5,7 @@
 #include "../../../individual/MO/SMOIndividual.h"
 #include "../AMOGeneticMethod.h"
 #include "../../../operators/selection/selections/CRankedTournament.h"
+#include "../utils/clustering/CNonDominatedSorting.h"
 
 class CNSGAII : public AMOGeneticMethod
 {
@@ -23,6 +24,19 @@ public:
 private:
     CRankedTournament &m_RankedTournament;
 
+    // Buffers of the environmental selection are kept between generations
+    CNonDominatedSorting m_NonDominatedSorting;
+    std::vector<SMOIndividual *> m_CombinedPopulation;
+    std::vector<SMOIndividual *> m_Survivors;
+    std::vector<std::vector<size_t>> m_Fronts;
+    // Normalized evaluations of the combined population, one row per individual
+    std::vector<float> m_Objectives;
+    std::vector<float> m_CrowdingDistances;
+    // Front indices sorted by one objective at a time
+    std::vector<size_t> m_CrowdingOrder;
+    std::vector<char> m_IsSurvivor;
+
     void EvolveToNextGeneration();
-    void CalcCrowdingDistance(std::vector<SMOIndividual *> &population, std::vector<size_t> &indices);
+    void SelectSurvivors();
+    void CalcCrowdingDistance(const std::vector<size_t> &front);
 };
\ No newline at end of file
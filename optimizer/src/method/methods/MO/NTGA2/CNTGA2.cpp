@@ -27,6 +27,9 @@ CNTGA2::CNTGA2(AProblem &evaluator,
 
     configMap->TakeValue("GenerationLimit", m_GenerationLimit);
     ErrorUtils::LowerThanZeroI("NTGA2", "GenerationLimit", m_GenerationLimit);
+
+    m_Surrogate.Configure(configMap, "NTGA2");
+    m_Hypervolume.Configure(configMap, "NTGA2");
 }
 
 
@@ -39,15 +42,18 @@ void CNTGA2::RunOptimization()
         SProblemEncoding& problemEncoding = m_Problem.GetProblemEncoding();
         auto* newInd = m_Initialization.CreateMOIndividual(problemEncoding);
 
-        m_Problem.Evaluate(*newInd);
-
         m_Population.push_back(newInd);
     }
+    EvaluatePopulation(m_Population);
+    m_Surrogate.Train(m_Population, m_Problem.GetProblemEncoding());
 
     ArchiveUtils::CopyToArchiveWithFiltering(m_Population, m_Archive);
+    m_Hypervolume.Insert(m_Population);
+    m_Hypervolume.FinishGeneration();
 
     while (generation < m_GenerationLimit)
     {
+        MigrateIslands(generation);
         if ((generation % 100) < (100 - m_GapSelectionPercent))
         {
             // Without Gap
@@ -60,7 +66,7 @@ void CNTGA2::RunOptimization()
             std::vector<std::vector<size_t>> combinedClusters;
             nonDominatedSorting.Cluster(parentsVector, combinedClusters);
 
-            for (size_t i = 0; i < m_PopulationSize; i += 2)
+            for (size_t i = 0; i < GetOffspringCount(); i += 2)
             {
                 auto *firstParent = m_RankedTournament.Select(m_Population);
                 auto *secondParent = m_RankedTournament.Select(m_Population);
@@ -74,14 +80,16 @@ void CNTGA2::RunOptimization()
             const auto &parents = m_GapSelection.Select(
                     m_Archive,
                     m_Problem.GetProblemEncoding().m_objectivesNumber,
-                    m_PopulationSize
+                    GetOffspringCount()
             );
             for (auto& parentPair : parents)
             {
                 CrossoverAndMutate(*parentPair.first, *parentPair.second);
             }
         }
+        EvaluateOffspring(m_NextPopulation);
         ArchiveUtils::CopyToArchiveWithFiltering(m_NextPopulation, m_Archive);
+        m_Hypervolume.Insert(m_NextPopulation);
 
         for (SMOIndividual *ind: m_Population)
         {
@@ -92,15 +100,22 @@ void CNTGA2::RunOptimization()
         m_NextPopulation.reserve(m_Population.size());
 
         ++generation;
+        if (m_Hypervolume.FinishGeneration())
+        {
+            break;
+        }
     }
 
+    MergeIslandArchives();
     ArchiveUtils::LogParetoFront(m_Archive);
+    m_Surrogate.LogStatistics();
+    m_Hypervolume.LogHistory();
 }
 
 void CNTGA2::CrossoverAndMutate(SMOIndividual &firstParent, SMOIndividual &secondParent)
 {
-    auto *firstChild = new SMOIndividual{firstParent};
-    auto *secondChild = new SMOIndividual{secondParent};
+    auto *firstChild = m_IndividualPool.Acquire(firstParent);
+    auto *secondChild = m_IndividualPool.Acquire(secondParent);
 
     m_Crossover.Crossover(
             m_Problem.GetProblemEncoding(),
@@ -113,9 +128,6 @@ void CNTGA2::CrossoverAndMutate(SMOIndividual &firstParent, SMOIndividual &secon
     m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *firstChild);
     m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *secondChild);
 
-    m_Problem.Evaluate(*firstChild);
-    m_Problem.Evaluate(*secondChild);
-
     m_NextPopulation.emplace_back(firstChild);
     m_NextPopulation.emplace_back(secondChild);
 }
\ No newline at end of file
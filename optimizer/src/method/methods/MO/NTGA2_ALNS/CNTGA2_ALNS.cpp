@@ -1,5 +1,9 @@
 #include <algorithm>
+#include <atomic>
+#include <climits>
+#include <exception>
 #include <sstream>
+#include <thread>
 #include "CNTGA2_ALNS.h"
 #include "../utils/archive/ArchiveUtils.h"
 #include "../utils/clustering/CNonDominatedSorting.h"
@@ -55,6 +59,18 @@ CNTGA2_ALNS::CNTGA2_ALNS(AProblem &evaluator,
 
     configMap->TakeValue("ALNSProbabilityPercent", m_ALNSProbabilityPercent);
     ErrorUtils::OutOfScopeF("NTGA2_ALNS", "ALNSProbabilityPercent", m_ALNSProbabilityPercent / 100.f);
+
+    // Optional, 0 uses all hardware threads. Without the key ALNS runs inline and shares the random generator of the run
+    int alnsWorkers = 0;
+    if (configMap->TakeValue("ALNSWorkers", alnsWorkers))
+    {
+        ErrorUtils::LowerThanZeroI("NTGA2_ALNS", "ALNSWorkers", alnsWorkers);
+        m_IsALNSPoolEnabled = true;
+        m_ALNSWorkersCount = alnsWorkers > 0 ? alnsWorkers : std::max(1, (int)std::thread::hardware_concurrency());
+    }
+    m_ALNSWorkspaces.resize(m_ALNSWorkersCount);
+
+    m_Surrogate.Configure(configMap, "NTGA2_ALNS");
 }
 
 void CNTGA2_ALNS::RunOptimization()
@@ -70,12 +86,14 @@ void CNTGA2_ALNS::RunOptimization()
 
         m_Population.push_back(newInd);
     }
+    m_Surrogate.Train(m_Population, m_Problem.GetProblemEncoding());
 
     ArchiveUtils::CopyToArchiveWithFiltering(m_Population, m_Archive);
 
     while (generation < m_GenerationLimit)
     {
         CExperimentLogger::LogProgress(generation / (float)m_GenerationLimit);
+        MigrateIslands(generation);
         if ((generation % 100) < (100 - m_GapSelectionPercent))
         {
             RunGeneration();
@@ -84,6 +102,7 @@ void CNTGA2_ALNS::RunOptimization()
         {
             RunGenerationWithGap();
         }
+        EvaluateCrossoverOffspring();
 
         ArchiveUtils::CopyToArchiveWithFiltering(m_NextPopulation, m_Archive);
 
@@ -99,6 +118,7 @@ void CNTGA2_ALNS::RunOptimization()
         ++generation;
     }
 
+    MergeIslandArchives();
     LogResult();
 }
 
@@ -121,15 +141,13 @@ void CNTGA2_ALNS::RunGeneration()
         auto* secondParent = m_RankedTournament.Select(m_Population);
 
         if (shouldUseALNS && CRandom::GetInt(0, 101) < m_ALNSProbabilityPercent) {
-            auto* firstChild = RunALNS(*firstParent);
-            auto* secondChild = RunALNS(*secondParent);
-            EvaluateAndAdd(*firstChild);
-            EvaluateAndAdd(*secondChild);
+            RunALNSOnParents(*firstParent, *secondParent);
         }
         else {
             CrossoverAndMutate(*firstParent, *secondParent);
         }
     }
+    RunALNSTasks();
 }
 
 void CNTGA2_ALNS::RunGenerationWithGap()
@@ -143,35 +161,55 @@ void CNTGA2_ALNS::RunGenerationWithGap()
 
     for (auto parentsPair : parents) {
         if (shouldUseALNS && CRandom::GetInt(0, 101) < m_ALNSProbabilityPercent) {
-            auto* firstChild = RunALNS(*parentsPair.first);
-            auto* secondChild = RunALNS(*parentsPair.second);
-            EvaluateAndAdd(*firstChild);
-            EvaluateAndAdd(*secondChild);
+            RunALNSOnParents(*parentsPair.first, *parentsPair.second);
         }
         else {
             CrossoverAndMutate(*parentsPair.first, *parentsPair.second);
         }
     }
+    RunALNSTasks();
 }
 
 void CNTGA2_ALNS::CrossoverAndMutate(SMOIndividual &firstParent, SMOIndividual &secondParent)
 {
-    auto *firstChild = new SMOIndividual{firstParent};
-    auto *secondChild = new SMOIndividual{secondParent};
-
-    m_Crossover.Crossover(
-            m_Problem.GetProblemEncoding(),
-            firstParent,
-            secondParent,
-            *firstChild,
-            *secondChild
-    );
+    // With the surrogate enabled the parents get more children, the best predicted ones are kept
+    for (size_t i = 0; i < m_Surrogate.GetOversampling(); ++i)
+    {
+        auto *firstChild = m_IndividualPool.Acquire(firstParent);
+        auto *secondChild = m_IndividualPool.Acquire(secondParent);
+
+        m_Crossover.Crossover(
+                m_Problem.GetProblemEncoding(),
+                firstParent,
+                secondParent,
+                *firstChild,
+                *secondChild
+        );
+
+        m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *firstChild);
+        m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *secondChild);
 
-    m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *firstChild);
-    m_Mutation.Mutate(m_Problem.GetProblemEncoding(), *secondChild);
+        m_Offspring.push_back(firstChild);
+        m_Offspring.push_back(secondChild);
+    }
+    m_NextPopulation.push_back(nullptr);
+    m_NextPopulation.push_back(nullptr);
+}
 
-    EvaluateAndAdd(*firstChild);
-    EvaluateAndAdd(*secondChild);
+void CNTGA2_ALNS::EvaluateCrossoverOffspring()
+{
+    // Children of crossover take the places left in the next population by ALNS, in the order they were created
+    size_t count = std::count(m_NextPopulation.begin(), m_NextPopulation.end(), nullptr);
+    EvaluateOffspring(m_Offspring, count);
+    size_t offspringIdx = 0;
+    for (SMOIndividual*& individual : m_NextPopulation)
+    {
+        if (individual == nullptr)
+        {
+            individual = m_Offspring[offspringIdx++];
+        }
+    }
+    m_Offspring.clear();
 }
 
 void CNTGA2_ALNS::EvaluateAndAdd(SMOIndividual& individual)
@@ -209,50 +247,131 @@ bool CNTGA2_ALNS::AcceptWorseSolution(SMOIndividual& generated, SMOIndividual& c
     return CRandom::GetFloat(0, 1) < exp((generated.m_Evaluation[0] - current.m_Evaluation[0]) / temperature);
 }
 
-SMOIndividual* CNTGA2_ALNS::RunALNS(SMOIndividual& parent) 
+void CNTGA2_ALNS::RunALNSOnParents(SMOIndividual &firstParent, SMOIndividual &secondParent)
+{
+    if (!m_IsALNSPoolEnabled)
+    {
+        auto* firstChild = RunALNS(firstParent, m_ALNSWorkspaces[0]);
+        auto* secondChild = RunALNS(secondParent, m_ALNSWorkspaces[0]);
+        EvaluateAndAdd(*firstChild);
+        EvaluateAndAdd(*secondChild);
+        return;
+    }
+
+    // Seeds are drawn in generation order, so children do not depend on the number of workers
+    for (const SMOIndividual* parent : { &firstParent, &secondParent })
+    {
+        m_ALNSTasks.push_back(SALNSTask{ parent, (unsigned int)CRandom::GetInt(0, INT_MAX), m_NextPopulation.size(), nullptr });
+        m_NextPopulation.push_back(nullptr);
+    }
+}
+
+void CNTGA2_ALNS::RunALNSTasks()
+{
+    if (m_ALNSTasks.empty())
+    {
+        return;
+    }
+
+    // Tasks run only in pool threads, every task reseeds the generator of its thread
+    size_t workersCount = std::min(m_ALNSWorkersCount, m_ALNSTasks.size());
+    std::atomic<size_t> nextTaskIdx{0};
+    std::vector<std::exception_ptr> errors(workersCount);
+    auto runTasks = [&](size_t workerIdx)
+    {
+        try
+        {
+            for (size_t i = nextTaskIdx++; i < m_ALNSTasks.size(); i = nextTaskIdx++)
+            {
+                SALNSTask& task = m_ALNSTasks[i];
+                CRandom::SetSeed(task.m_Seed);
+                task.m_Child = RunALNS(*task.m_Parent, m_ALNSWorkspaces[workerIdx]);
+                m_Problem.Evaluate(*task.m_Child);
+            }
+        }
+        catch (...)
+        {
+            errors[workerIdx] = std::current_exception();
+            nextTaskIdx = m_ALNSTasks.size();
+        }
+    };
+
+    std::vector<std::thread> workers;
+    workers.reserve(workersCount);
+    for (size_t w = 0; w < workersCount; ++w)
+    {
+        workers.emplace_back(runTasks, w);
+    }
+    for (std::thread& worker : workers)
+    {
+        worker.join();
+    }
+    for (const std::exception_ptr& error : errors)
+    {
+        if (error)
+        {
+            std::rethrow_exception(error);
+        }
+    }
+
+    for (const SALNSTask& task : m_ALNSTasks)
+    {
+        m_NextPopulation[task.m_PopulationIdx] = task.m_Child;
+    }
+    m_ALNSTasks.clear();
+}
+
+SMOIndividual* CNTGA2_ALNS::RunALNS(const SMOIndividual& parent, SALNSWorkspace& workspace)
 {
     auto* best = new SMOIndividual{ parent };
-    auto* current = new SMOIndividual{ *best };
+    if (workspace.m_Current == nullptr)
+    {
+        workspace.m_Current = std::make_unique<SMOIndividual>(*best);
+        workspace.m_Generated = std::make_unique<SMOIndividual>(*best);
+    }
+    else
+    {
+        workspace.m_Current->CopyFrom(*best);
+    }
     int iteration = 1;
     int iterationsWithoutImprovement = 0;
     float temperature = 0;
-    std::vector<float> removalOperatorsProbabilityDistribution(m_alnsRemovalMutations.size(), 1.0f/m_alnsRemovalMutations.size());
-    std::vector<float> insertionOperatorsProbabilityDistribution(m_alnsInsertionMutations.size(), 1.0f / m_alnsInsertionMutations.size());
-    std::map<AMutation*, std::tuple<float, int>> removalOperatorsScores;
-    std::map<AMutation*, std::tuple<float, int>> insertOperatorsScores;
-    m_Problem.Evaluate(*current);
+    workspace.m_RemovalProbabilities.assign(m_alnsRemovalMutations.size(), 1.0f / m_alnsRemovalMutations.size());
+    workspace.m_InsertionProbabilities.assign(m_alnsInsertionMutations.size(), 1.0f / m_alnsInsertionMutations.size());
+    workspace.m_RemovalScores.assign(m_alnsRemovalMutations.size(), SALNSOperatorScore{ 0.f, 0 });
+    workspace.m_InsertionScores.assign(m_alnsInsertionMutations.size(), SALNSOperatorScore{ 0.f, 0 });
+    m_Problem.Evaluate(*workspace.m_Current);
     while (iteration < (m_ALNSIterations + 1) && iterationsWithoutImprovement < m_ALNSNoImprovementIterations) 
     {
-        auto* generated = new SMOIndividual(*current);
-        auto& removalOperator = m_alnsRemovalMutations[CRandom::GetWeightedInt(removalOperatorsProbabilityDistribution)];
-        auto& insertOperator = m_alnsInsertionMutations[CRandom::GetWeightedInt(insertionOperatorsProbabilityDistribution)];
-        removalOperator->Mutate(m_Problem.GetProblemEncoding(), *generated);
-        insertOperator->Mutate(m_Problem.GetProblemEncoding(), *generated);
-        m_Problem.Evaluate(*generated);
-        if (generated->m_isValid) 
+        // Generated solution is accepted by swapping it with the current one, so no individual is allocated
+        SMOIndividual& current = *workspace.m_Current;
+        SMOIndividual& generated = *workspace.m_Generated;
+        generated.CopyFrom(current);
+        size_t removalOperatorIdx = CRandom::GetWeightedInt(workspace.m_RemovalProbabilities);
+        size_t insertOperatorIdx = CRandom::GetWeightedInt(workspace.m_InsertionProbabilities);
+        m_alnsRemovalMutations[removalOperatorIdx]->Mutate(m_Problem.GetProblemEncoding(), generated);
+        m_alnsInsertionMutations[insertOperatorIdx]->Mutate(m_Problem.GetProblemEncoding(), generated);
+        m_Problem.Evaluate(generated);
+        if (generated.m_isValid) 
         {
-            if (generated->m_Evaluation[0] + generated->m_Evaluation[1] < current->m_Evaluation[0] + current->m_Evaluation[1])
+            if (generated.m_Evaluation[0] + generated.m_Evaluation[1] < current.m_Evaluation[0] + current.m_Evaluation[1])
             {
-                delete current;
-                current = generated;
+                std::swap(workspace.m_Current, workspace.m_Generated);
                 iterationsWithoutImprovement = 0;
-                if (current->m_Evaluation[0] + current->m_Evaluation[1] < best->m_Evaluation[0] + best->m_Evaluation[1])
+                if (generated.m_Evaluation[0] + generated.m_Evaluation[1] < best->m_Evaluation[0] + best->m_Evaluation[1])
                 {
-                    delete best;
-                    best = new SMOIndividual{ *current };
+                    best->CopyFrom(generated);
                 }
             }
-            else if(AcceptWorseSolution(*generated, *current, temperature)) 
+            else if(AcceptWorseSolution(generated, current, temperature)) 
             {
-                delete current;
-                current = generated;
+                std::swap(workspace.m_Current, workspace.m_Generated);
                 iterationsWithoutImprovement++;
             }
         }
-        else if(AcceptWorseSolution(*generated, *current, temperature)) 
+        else if(AcceptWorseSolution(generated, current, temperature)) 
         {
-            delete current;
-            current = generated;
+            std::swap(workspace.m_Current, workspace.m_Generated);
             iterationsWithoutImprovement++;
         }
         else 
@@ -260,21 +379,16 @@ SMOIndividual* CNTGA2_ALNS::RunALNS(SMOIndividual& parent)
             iterationsWithoutImprovement++;
         }
 
-        UpdateScores(current, 
-            best, 
-            removalOperator, 
-            insertOperator, 
-            removalOperatorsScores, 
-            insertOperatorsScores
+        UpdateScores(*workspace.m_Current,
+            *best,
+            removalOperatorIdx,
+            insertOperatorIdx,
+            workspace
         );
 
         if (iteration % m_ALNSProbabilityStepsIterations == 0)
         {
-            UpdateProbabilityTables(removalOperatorsScores,
-                removalOperatorsProbabilityDistribution,
-                insertOperatorsScores,
-                insertionOperatorsProbabilityDistribution
-            );
+            UpdateProbabilityTables(workspace);
         }
 
         iteration++;      
@@ -284,65 +398,56 @@ SMOIndividual* CNTGA2_ALNS::RunALNS(SMOIndividual& parent)
     return best;
 }
 
-void CNTGA2_ALNS::UpdateScores(SMOIndividual* current, 
-    SMOIndividual* best, 
-    AMutation*& removalOperator,
-    AMutation*& insertOperator,
-    std::map<AMutation*, std::tuple<float, int>>& removalOperatorsScores,
-    std::map<AMutation*, std::tuple<float, int>>& insertOperatorsScores
+void CNTGA2_ALNS::UpdateScores(const SMOIndividual& current,
+    const SMOIndividual& best,
+    size_t removalOperatorIdx,
+    size_t insertOperatorIdx,
+    SALNSWorkspace& workspace
 ) 
 {
-    float scoreIncrease = (current->m_Evaluation[0] + current->m_Evaluation[1]) - (best->m_Evaluation[0] + best->m_Evaluation[1]);
-    if (removalOperatorsScores.count(removalOperator))
-    {
-        removalOperatorsScores[removalOperator] = std::tuple<float, int>(std::get<0>(removalOperatorsScores[removalOperator]) + scoreIncrease, ++std::get<1>(removalOperatorsScores[removalOperator]));
-    }
-    else
-    {
-        removalOperatorsScores.emplace(removalOperator, std::tuple<float, int>(scoreIncrease, 1));
-    }
-    if (insertOperatorsScores.count(insertOperator))
-    {
-        insertOperatorsScores[insertOperator] = std::tuple<float, int>(std::get<0>(insertOperatorsScores[insertOperator]) + scoreIncrease, ++std::get<1>(insertOperatorsScores[insertOperator]));
-    }
-    else
-    {
-        insertOperatorsScores.emplace(insertOperator, std::tuple<float, int>(scoreIncrease, 1));
-    }
+    float scoreIncrease = (current.m_Evaluation[0] + current.m_Evaluation[1]) - (best.m_Evaluation[0] + best.m_Evaluation[1]);
+    SALNSOperatorScore& removalScore = workspace.m_RemovalScores[removalOperatorIdx];
+    removalScore.m_Score += scoreIncrease;
+    removalScore.m_Uses++;
+    SALNSOperatorScore& insertScore = workspace.m_InsertionScores[insertOperatorIdx];
+    insertScore.m_Score += scoreIncrease;
+    insertScore.m_Uses++;
 }
 
-void CNTGA2_ALNS::UpdateProbabilityTables(std::map<AMutation*, std::tuple<float, int>>& removalOperatorsScores, 
-    std::vector<float>& removalOperatorsProbabilityDistribution,
-    std::map<AMutation*, std::tuple<float, int>>& insertOperatorsScores,
-    std::vector<float>& insertionOperatorsProbabilityDistribution
-)
+void CNTGA2_ALNS::UpdateProbabilityTables(SALNSWorkspace& workspace)
 {
     float probabilityChange = CRandom::GetFloat(0.01f, 0.05f);
-    if (removalOperatorsScores.size() >= 2) {
-        using pair_type = std::map<AMutation*, std::tuple<float, int>>::value_type;
-        auto best = std::min_element(removalOperatorsScores.begin(), removalOperatorsScores.end(), [](const pair_type& p1, const pair_type& p2)
-            {
-                return std::get<0>(p1.second) / std::get<1>(p1.second) < std::get<0>(p2.second) / std::get<1>(p2.second);
-            });
-        auto worst = std::max_element(removalOperatorsScores.begin(), removalOperatorsScores.end(), [](const pair_type& p1, const pair_type& p2)
-            {
-                return std::get<0>(p1.second) / std::get<1>(p1.second) < std::get<0>(p2.second) / std::get<1>(p2.second);
-            });
-        removalOperatorsProbabilityDistribution[std::find(m_alnsRemovalMutations.begin(), m_alnsRemovalMutations.end(), best->first) - m_alnsRemovalMutations.begin()] += probabilityChange;
-        removalOperatorsProbabilityDistribution[std::find(m_alnsRemovalMutations.begin(), m_alnsRemovalMutations.end(), worst->first) - m_alnsRemovalMutations.begin()] -= probabilityChange;
+    ShiftProbability(workspace.m_RemovalScores, workspace.m_RemovalProbabilities, probabilityChange);
+    ShiftProbability(workspace.m_InsertionScores, workspace.m_InsertionProbabilities, probabilityChange);
+}
+
+void CNTGA2_ALNS::ShiftProbability(const std::vector<SALNSOperatorScore>& scores, std::vector<float>& probabilities, float probabilityChange)
+{
+    size_t usedCount = 0;
+    size_t bestIdx = 0;
+    size_t worstIdx = 0;
+    for (size_t i = 0; i < scores.size(); ++i)
+    {
+        if (scores[i].m_Uses == 0)
+        {
+            continue;
+        }
+        float averageScore = scores[i].m_Score / scores[i].m_Uses;
+        // Ties keep the first operator, as min_element and max_element do
+        if (usedCount == 0 || averageScore < scores[bestIdx].m_Score / scores[bestIdx].m_Uses)
+        {
+            bestIdx = i;
+        }
+        if (usedCount == 0 || averageScore > scores[worstIdx].m_Score / scores[worstIdx].m_Uses)
+        {
+            worstIdx = i;
+        }
+        usedCount++;
     }
-    if (insertOperatorsScores.size() >= 2) {
-        using pair_type = std::map<AMutation*, std::tuple<float, int>>::value_type;
-        auto best = std::min_element(insertOperatorsScores.begin(), insertOperatorsScores.end(), [](const pair_type& p1, const pair_type& p2)
-            {
-                return std::get<0>(p1.second) / std::get<1>(p1.second) < std::get<0>(p2.second) / std::get<1>(p2.second);
-            });
-        auto worst = std::max_element(insertOperatorsScores.begin(), insertOperatorsScores.end(), [](const pair_type& p1, const pair_type& p2)
-            {
-                return std::get<0>(p1.second) / std::get<1>(p1.second) < std::get<0>(p2.second) / std::get<1>(p2.second);
-            });
-        insertionOperatorsProbabilityDistribution[std::find(m_alnsInsertionMutations.begin(), m_alnsInsertionMutations.end(), best->first) - m_alnsInsertionMutations.begin()] += probabilityChange;
-        insertionOperatorsProbabilityDistribution[std::find(m_alnsInsertionMutations.begin(), m_alnsInsertionMutations.end(), worst->first) - m_alnsInsertionMutations.begin()] -= probabilityChange;
+    if (usedCount >= 2)
+    {
+        probabilities[bestIdx] += probabilityChange;
+        probabilities[worstIdx] -= probabilityChange;
     }
 }
 
@@ -353,5 +458,5 @@ void CNTGA2_ALNS::LogResult()
         m_Problem.LogSolution(*m_Archive[i]);
     }
     CExperimentLogger::LogData();
-    m_Problem.LogAdditionalData();
+    m_Surrogate.LogStatistics();
 }
\ No newline at end of file
@@ -1,11 +1,38 @@
 #pragma once
 
-#include <map>
+#include <memory>
 #include "../AMOGeneticMethod.h"
 #include "../../../configMap/SConfigMap.h"
 #include "../../../operators/selection/selections/CRankedTournament.h"
 #include "../../../operators/selection/selections/CGapSelectionByRandomDim.h"
 
+// Scores of an ALNS operator within one ALNS run, lower score is better
+struct SALNSOperatorScore
+{
+    float m_Score;
+    int m_Uses;
+};
+
+// Buffers of one ALNS worker, reused by every ALNS run the worker executes
+struct SALNSWorkspace
+{
+    std::unique_ptr<SMOIndividual> m_Current;
+    std::unique_ptr<SMOIndividual> m_Generated;
+    std::vector<float> m_RemovalProbabilities;
+    std::vector<float> m_InsertionProbabilities;
+    std::vector<SALNSOperatorScore> m_RemovalScores;
+    std::vector<SALNSOperatorScore> m_InsertionScores;
+};
+
+// ALNS run of one parent waiting for the worker pool, its child takes the reserved place in the next population
+struct SALNSTask
+{
+    const SMOIndividual* m_Parent;
+    unsigned int m_Seed;
+    size_t m_PopulationIdx;
+    SMOIndividual* m_Child;
+};
+
 class CNTGA2_ALNS : public AMOGeneticMethod
 {
 public:
@@ -32,15 +59,23 @@ private:
     float m_ALNSStartTemperature = 0;
     float m_ALNSTemperatureAnnealingRate = 0;
     int m_ALNSProbabilityStepsIterations = 0;
+    // ALNS runs of a generation are executed by a pool of workers when the ALNSWorkers key is set
+    bool m_IsALNSPoolEnabled = false;
+    size_t m_ALNSWorkersCount = 1;
 
     std::vector<SMOIndividual*> m_PreviousPopulation;
     std::vector<AMutation*>& m_alnsRemovalMutations;
     std::vector<AMutation*>& m_alnsInsertionMutations;
     CRankedTournament &m_RankedTournament;
     CGapSelectionByRandomDim &m_GapSelection;
+    std::vector<SALNSWorkspace> m_ALNSWorkspaces;
+    std::vector<SALNSTask> m_ALNSTasks;
+    // Children of crossover waiting for the evaluation at the end of the generation
+    std::vector<SMOIndividual*> m_Offspring;
     
     void CrossoverAndMutate(SMOIndividual &firstParent, SMOIndividual &secondParent);
     void EvaluateAndAdd(SMOIndividual& individual);
+    void EvaluateCrossoverOffspring();
     bool ShouldUseALNS(std::vector<SMOIndividual*>& previousPopulation, std::vector<SMOIndividual*> currentPopulation);
     bool AcceptWorseSolution(SMOIndividual& generated, SMOIndividual& current, float temperature);
 
@@ -49,19 +84,17 @@ private:
 
     void LogResult();
 
-    void UpdateProbabilityTables(std::map<AMutation*, std::tuple<float, int>>& removalOperatorsScores,
-        std::vector<float>& removalOperatorsProbabilityDistribution,
-        std::map<AMutation*, std::tuple<float, int>>& insertOperatorsScores,
-        std::vector<float>& insertionOperatorsProbabilityDistribution
-    );
+    void RunALNSOnParents(SMOIndividual &firstParent, SMOIndividual &secondParent);
+    void RunALNSTasks();
+    SMOIndividual* RunALNS(const SMOIndividual& parent, SALNSWorkspace& workspace);
 
-    void UpdateScores(SMOIndividual* current,
-        SMOIndividual* best,
-        AMutation*& removalOperator,
-        AMutation*& insertOperator,
-        std::map<AMutation*, std::tuple<float, int>>& removalOperatorsScores,
-        std::map<AMutation*, std::tuple<float, int>>& insertOperatorsScores
+    void UpdateScores(const SMOIndividual& current,
+        const SMOIndividual& best,
+        size_t removalOperatorIdx,
+        size_t insertOperatorIdx,
+        SALNSWorkspace& workspace
     );
-
-    SMOIndividual* RunALNS(SMOIndividual& parent);
+    void UpdateProbabilityTables(SALNSWorkspace& workspace);
+    // Moves probability from the worst to the best scored operator, if at least two operators were used
+    static void ShiftProbability(const std::vector<SALNSOperatorScore>& scores, std::vector<float>& probabilities, float probabilityChange);
 };
\ No newline at end of file
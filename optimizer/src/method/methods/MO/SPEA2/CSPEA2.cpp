@@ -19,6 +19,9 @@ CSPEA2::CSPEA2(AProblem &problem, AInitialization &initialization, ACrossover &c
     configMap->TakeValue("ArchiveSize", m_ArchiveSize);
     ErrorUtils::LowerThanZeroI("CSPEA2", "ArchiveSize", m_ArchiveSize);
     m_Archive.reserve(m_ArchiveSize);
+
+    m_Hypervolume.Configure(configMap, "CSPEA2");
+    CSurrogate::RejectConfiguration(configMap, "CSPEA2");
 }
 
 
@@ -41,10 +44,14 @@ void CSPEA2::RunOptimization()
     UpdateFineGrainedFitness(m_Population, neighborhood);
     
     ArchiveUtils::CopyToArchiveWithFiltering(m_Population, m_Archive);
+    m_Hypervolume.Insert(m_Population);
+    m_Hypervolume.FinishGeneration();
 
     while ( generation < m_GenerationLimit)
     {
+        MigrateIslands(generation);
         EvolveToNextGeneration();
+        m_Hypervolume.Insert(m_Population);
 
         std::vector<SMOIndividual*> combinedPop;
         combinedPop.reserve(m_Population.size() + m_Archive.size());
@@ -56,6 +63,10 @@ void CSPEA2::RunOptimization()
         EnviroSelection(combinedPop);
         
         generation++;
+        if (m_Hypervolume.FinishGeneration())
+        {
+            break;
+        }
     }
 
     std::vector<SMOIndividual*> allArchiveInd = m_Archive;
@@ -67,7 +78,9 @@ void CSPEA2::RunOptimization()
     }
     
     ArchiveUtils::CopyToArchiveWithFiltering(m_NextPopulation, m_Archive);
+    MergeIslandArchives();
     ArchiveUtils::LogParetoFront(m_Archive);
+    m_Hypervolume.LogHistory();
 }
 
 void CSPEA2::EvolveToNextGeneration()
@@ -74,10 +74,11 @@ std::vector<float> DasDennis::Linspace(float start, float end, size_t partitions
 
 float DasDennis::BinomialCoefficient(size_t n, size_t k) const
 {
-	return Factorial(n) / float(Factorial(k) * Factorial(n - k));
-}
-
-size_t DasDennis::Factorial(size_t n) const
-{
-	return n <= 1 ? 1 : n * Factorial(n - 1);
+	// Multiplicative formula, factorials overflow already for large weight sets
+	double coefficient = 1.0;
+	for (size_t i = 1; i <= k; ++i)
+	{
+		coefficient = coefficient * double(n - k + i) / double(i);
+	}
+	return float(coefficient);
 }
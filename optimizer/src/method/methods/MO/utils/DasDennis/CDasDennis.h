@@ -21,5 +21,4 @@ private:
 	float SumVector(const std::vector<float> vec) const;
 	std::vector<float> Linspace(float start, float end, size_t partitions) const;
 	float BinomialCoefficient(size_t n, size_t k) const;
-	size_t Factorial(size_t n) const;
 };
\ No newline at end of file
@@ -1,6 +1,7 @@
 ﻿#include "ArchiveUtils.h"
 #include "utils/logger/CExperimentLogger.h"
 #include "utils/dataStructures/CCSV.h"
+#include "method/individual/CGenotypeCSV.h"
 
 #include <ostream>
 #include <fstream>
@@ -137,4 +138,11 @@ void ArchiveUtils::LogParetoFront(const std::vector<SMOIndividual*>& archive)
     std::ostringstream oss;
     CCSV<float>::ToCSV(oss, ArchiveUtils::ToEvaluation(archive));
     CExperimentLogger::LogResult(oss.str().c_str());
+
+    std::ostringstream genotypes;
+    for (const SMOIndividual* ind: archive)
+    {
+        CGenotypeCSV::ToCSV(genotypes, ind->m_Genotype);
+    }
+    CExperimentLogger::LogResult(genotypes.str().c_str(), CGenotypeCSV::s_FileName);
 }
\ No newline at end of file
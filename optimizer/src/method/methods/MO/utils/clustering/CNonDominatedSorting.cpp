@@ -1,72 +1,105 @@
 #include "CNonDominatedSorting.h"
+#include <algorithm>
 
 void CNonDominatedSorting::Cluster(std::vector<SMOIndividual *> &population, std::vector<std::vector<size_t>> &clusters)
 {
-    size_t popSize = population.size();
-    std::vector<SSolution> solutions;
-    solutions.reserve(popSize);
+    size_t objectivesNumber = population.empty() ? 0 : population[0]->m_NormalizedEvaluation.size();
+    m_Objectives.resize(population.size() * objectivesNumber);
+    for (size_t i = 0; i < population.size(); ++i)
+    {
+        std::copy(population[i]->m_NormalizedEvaluation.begin(), population[i]->m_NormalizedEvaluation.end(),
+                  m_Objectives.begin() + i * objectivesNumber);
+    }
+
+    Cluster(m_Objectives, objectivesNumber, clusters);
+
+    // Assign ranks to population
+    for (size_t c = 0; c < clusters.size(); ++c)
+    {
+        for (size_t i = 0; i < clusters[c].size(); ++i)
+        {
+            population[clusters[c][i]]->m_Rank = c;
+        }
+    }
+}
+
+void CNonDominatedSorting::Cluster(const std::vector<float> &objectives, size_t objectivesNumber, std::vector<std::vector<size_t>> &clusters)
+{
+    size_t popSize = objectivesNumber == 0 ? 0 : objectives.size() / objectivesNumber;
+    if (m_Solutions.size() < popSize)
+    {
+        m_Solutions.resize(popSize);
+    }
     for (size_t i = 0; i < popSize; ++i)
     {
-        solutions.emplace_back(i);
+        m_Solutions[i].m_DominatedSolutions.clear();
+        m_Solutions[i].m_DominationCounter = 0;
+    }
+    for (std::vector<size_t> &cluster: clusters)
+    {
+        cluster.clear();
     }
 
     // clusters == fronts
-    clusters.push_back(std::vector<size_t>());
+    size_t clustersCount = 1;
+    if (clusters.empty())
+    {
+        clusters.emplace_back();
+    }
 
+    // Every pair is compared once, dominated solutions of p still end up ordered by index,
+    // as those before p were added while they were compared with earlier solutions
     for (size_t p = 0; p < popSize; ++p)
     {
-        for (size_t q = 0; q < popSize; ++q)
+        const float *pObjectives = objectives.data() + p * objectivesNumber;
+        for (size_t q = p + 1; q < popSize; ++q)
         {
-            if (p != q)
+            const float *qObjectives = objectives.data() + q * objectivesNumber;
+            bool isPBetter = false;
+            bool isQBetter = false;
+            for (size_t o = 0; o < objectivesNumber; ++o)
             {
-                if (population[q]->IsDominatedBy(population[p]))
-                {
-                    solutions[p].m_DominatedSolutions.push_back(&(solutions[q]));
-                }
-                else if (population[p]->IsDominatedBy(population[q]))
-                {
-                    solutions[p].m_DominationCounter += 1;
-                }
+                isPBetter |= pObjectives[o] < qObjectives[o];
+                isQBetter |= qObjectives[o] < pObjectives[o];
+            }
+            if (isPBetter && !isQBetter)
+            {
+                m_Solutions[p].m_DominatedSolutions.push_back(q);
+                m_Solutions[q].m_DominationCounter += 1;
+            }
+            else if (isQBetter && !isPBetter)
+            {
+                m_Solutions[q].m_DominatedSolutions.push_back(p);
+                m_Solutions[p].m_DominationCounter += 1;
             }
         }
-        if (solutions[p].m_DominationCounter == 0)
+        if (m_Solutions[p].m_DominationCounter == 0)
         {
             clusters[0].push_back(p);
         }
     }
 
-    size_t rank = 1;
-    while (!clusters[rank - 1].empty())
+    while (!clusters[clustersCount - 1].empty())
     {
-        clusters.push_back(std::vector<size_t>());
-        for (size_t solutionIdx: clusters[rank - 1])
+        if (clusters.size() == clustersCount)
+        {
+            clusters.emplace_back();
+        }
+        std::vector<size_t> &nextCluster = clusters[clustersCount];
+        for (size_t solutionIdx: clusters[clustersCount - 1])
         {
-            for (SSolution *dominatedSolution: solutions[solutionIdx].m_DominatedSolutions)
+            for (size_t dominatedIdx: m_Solutions[solutionIdx].m_DominatedSolutions)
             {
-                dominatedSolution->m_DominationCounter -= 1;
-                if (dominatedSolution->m_DominationCounter == 0)
+                m_Solutions[dominatedIdx].m_DominationCounter -= 1;
+                if (m_Solutions[dominatedIdx].m_DominationCounter == 0)
                 {
-                    clusters[rank].push_back(dominatedSolution->m_Idx);
+                    nextCluster.push_back(dominatedIdx);
                 }
             }
         }
-        ++rank;
+        ++clustersCount;
     }
 
     // Remove last, which is empty
-    clusters.pop_back();
-
-    // Assign ranks to population
-    for (size_t c = 0; c < clusters.size(); ++c)
-    {
-        for (size_t i = 0; i < clusters[c].size(); ++i)
-        {
-            population[clusters[c][i]]->m_Rank = c;
-        }
-    }
-}
-
-CNonDominatedSorting::SSolution::SSolution(size_t i)
-        : m_Idx(i), m_DominationCounter(0)
-{
+    clusters.resize(clustersCount - 1);
 }
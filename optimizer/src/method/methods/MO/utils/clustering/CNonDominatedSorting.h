@@ -8,14 +8,18 @@ public:
 
     void Cluster(std::vector<SMOIndividual *> &population, std::vector<std::vector<size_t>> &clusters);
 
+    // Same as above for a row-major matrix of normalized evaluations, ranks are not assigned.
+    // Buffers are kept between calls, so sorting with the same object does not allocate once it has grown.
+    void Cluster(const std::vector<float> &objectives, size_t objectivesNumber, std::vector<std::vector<size_t>> &clusters);
+
 private:
 
     struct SSolution
     {
-        SSolution(size_t i);
-
-        size_t m_Idx;
-        std::vector<SSolution *> m_DominatedSolutions;
-        size_t m_DominationCounter;
+        std::vector<size_t> m_DominatedSolutions;
+        size_t m_DominationCounter = 0;
     };
-};
\ No newline at end of file
+
+    std::vector<float> m_Objectives;
+    std::vector<SSolution> m_Solutions;
+};
@@ -0,0 +1,217 @@
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <iostream>
+#include <iterator>
+#include <random>
+#include <sstream>
+#include <stdexcept>
+#include "CHypervolumeTracker.h"
+#include "../../../../island/CIslandModel.h"
+#include "../../../../../utils/logger/CExperimentLogger.h"
+#include "../../../../../utils/logger/ErrorUtils.h"
+
+void CHypervolumeTracker::Configure(SConfigMap* configMap, const std::string& methodName)
+{
+    configMap->TakeValue("HypervolumeReference", m_Reference);
+    if (m_Reference <= 0.f)
+    {
+        throw std::runtime_error(methodName + " parameter HypervolumeReference not greater than 0");
+    }
+
+    int samplesCount = int(m_SamplesCount);
+    configMap->TakeValue("HypervolumeSamples", samplesCount);
+    if (samplesCount < 1)
+    {
+        throw std::runtime_error(methodName + " parameter HypervolumeSamples lower than 1");
+    }
+    m_SamplesCount = samplesCount;
+
+    int window = int(m_Window);
+    configMap->TakeValue("EarlyStoppingWindow", window);
+    ErrorUtils::LowerThanZeroI(methodName, "EarlyStoppingWindow", window);
+    m_Window = window;
+
+    configMap->TakeValue("EarlyStoppingThreshold", m_Threshold);
+    ErrorUtils::LowerThanZeroF(methodName, "EarlyStoppingThreshold", m_Threshold);
+
+    // Islands exchange migrants synchronously, an island stopped on its own would leave the others waiting
+    if (m_Window > 0 && CIslandModel::IsEnabled())
+    {
+        throw std::runtime_error(methodName + " parameter EarlyStoppingWindow not supported with Islands");
+    }
+}
+
+void CHypervolumeTracker::Insert(const SMOIndividual* individual)
+{
+    const std::vector<float>& point = individual->m_NormalizedEvaluation;
+    if (m_ObjectivesCount == 0)
+    {
+        m_ObjectivesCount = point.size();
+        if (m_ObjectivesCount != 2)
+        {
+            InitSamples();
+        }
+    }
+
+    if (m_ObjectivesCount == 2)
+    {
+        Insert2D(point[0], point[1]);
+    }
+    else
+    {
+        InsertSampled(point);
+    }
+}
+
+void CHypervolumeTracker::Insert(const std::vector<SMOIndividual*>& individuals)
+{
+    for (const SMOIndividual* individual: individuals)
+    {
+        Insert(individual);
+    }
+}
+
+bool CHypervolumeTracker::FinishGeneration()
+{
+    m_History.push_back(m_Hypervolume);
+    if (m_Window == 0 || m_History.size() <= m_Window)
+    {
+        return false;
+    }
+
+    // A front not reaching the box of the reference point yet is not considered stagnating
+    double previous = m_History[m_History.size() - 1 - m_Window];
+    if (m_Hypervolume <= 0.0 || m_Hypervolume - previous > m_Threshold * previous)
+    {
+        return false;
+    }
+
+    std::cout << "Early stopping at generation " + std::to_string(m_History.size() - 1) + ", hypervolume "
+                 + std::to_string(m_Hypervolume) + "\n" << std::flush;
+    return true;
+}
+
+void CHypervolumeTracker::LogHistory() const
+{
+    std::ostringstream oss;
+    for (size_t generation = 0; generation < m_History.size(); ++generation)
+    {
+        oss << generation << ";" << m_History[generation] << std::endl;
+    }
+    CExperimentLogger::LogResult(oss.str().c_str(), "hypervolume.csv");
+}
+
+void CHypervolumeTracker::Reset()
+{
+    m_ObjectivesCount = 0;
+    m_Hypervolume = 0.0;
+    m_History.clear();
+    m_Front.clear();
+    m_Samples.clear();
+}
+
+void CHypervolumeTracker::InitSamples()
+{
+    // Samples do not use the random generator of the method, so tracking does not change results of the run
+    std::mt19937 generator(s_SamplesSeed);
+    std::uniform_real_distribution<float> distribution(0.f, m_Reference);
+    std::vector<std::vector<float>> samples(m_SamplesCount, std::vector<float>(m_ObjectivesCount));
+    for (std::vector<float>& sample: samples)
+    {
+        for (float& value: sample)
+        {
+            value = distribution(generator);
+        }
+    }
+    // Samples ordered by the first objective, a point can dominate only the ones not before it in that objective
+    std::sort(samples.begin(), samples.end());
+
+    m_Samples.assign(m_ObjectivesCount, std::vector<float>(m_SamplesCount));
+    for (size_t i = 0; i < m_SamplesCount; ++i)
+    {
+        for (size_t o = 0; o < m_ObjectivesCount; ++o)
+        {
+            m_Samples[o][i] = samples[i][o];
+        }
+    }
+}
+
+void CHypervolumeTracker::Insert2D(float x, float y)
+{
+    x = std::max(x, 0.f);
+    y = std::max(y, 0.f);
+    if (x >= m_Reference || y >= m_Reference)
+    {
+        return;
+    }
+
+    // Point is dominated by the first point not after it in the first objective, if any dominates it
+    auto next = m_Front.lower_bound(x);
+    if (next != m_Front.end() && next->first == x && next->second <= y)
+    {
+        return;
+    }
+    if (next != m_Front.begin() && std::prev(next)->second <= y)
+    {
+        return;
+    }
+
+    // Points dominated by the new one directly follow it
+    while (next != m_Front.end() && next->second >= y)
+    {
+        m_Hypervolume -= GetContribution(next);
+        next = m_Front.erase(next);
+    }
+    auto inserted = m_Front.emplace_hint(next, x, y);
+    m_Hypervolume += GetContribution(inserted);
+}
+
+double CHypervolumeTracker::GetContribution(std::map<float, float>::const_iterator point) const
+{
+    auto next = std::next(point);
+    float nextX = next == m_Front.end() ? m_Reference : next->first;
+    float previousY = point == m_Front.begin() ? m_Reference : std::prev(point)->second;
+    return double(nextX - point->first) * double(previousY - point->second);
+}
+
+void CHypervolumeTracker::InsertSampled(const std::vector<float>& point)
+{
+    const std::vector<float>& firstColumn = m_Samples[0];
+    const size_t begin = std::lower_bound(firstColumn.begin(), firstColumn.end(), point[0]) - firstColumn.begin();
+    const size_t end = firstColumn.size();
+    m_IsDominated.assign(end - begin, 1);
+    uint32_t* isDominated = m_IsDominated.data();
+    for (size_t o = 1; o < m_ObjectivesCount; ++o)
+    {
+        const float value = point[o];
+        const float* column = m_Samples[o].data() + begin;
+        for (size_t i = 0; i < end - begin; ++i)
+        {
+            isDominated[i] &= uint32_t(value <= column[i]);
+        }
+    }
+    size_t dominatedCount = 0;
+    for (size_t i = 0; i < end - begin; ++i)
+    {
+        dominatedCount += isDominated[i];
+    }
+    if (dominatedCount == 0)
+    {
+        return;
+    }
+
+    // Removal keeps the order of the remaining samples
+    for (std::vector<float>& column: m_Samples)
+    {
+        size_t kept = begin;
+        for (size_t i = begin; i < end; ++i)
+        {
+            column[kept] = column[i];
+            kept += 1 - isDominated[i - begin];
+        }
+        column.resize(kept);
+    }
+    double boxVolume = std::pow(double(m_Reference), double(m_ObjectivesCount));
+    m_Hypervolume = boxVolume * double(m_SamplesCount - m_Samples[0].size()) / double(m_SamplesCount);
+}
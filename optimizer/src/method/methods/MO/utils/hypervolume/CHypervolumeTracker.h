@@ -0,0 +1,61 @@
+#pragma once
+
+#include <cstdint>
+#include <map>
+#include <string>
+#include <vector>
+#include "../../../../configMap/SConfigMap.h"
+#include "../../../../individual/MO/SMOIndividual.h"
+
+// Hypervolume of all non-dominated individuals found in the run, in normalized objective space, updated with every
+// inserted individual. It is the hypervolume of the archive, as the archive keeps exactly the non-dominated ones.
+// Two objectives are tracked exactly on a staircase ordered by the first objective, dominated points are removed
+// when inserting, so an insert takes O(log n) amortized. More objectives are approximated by the fraction of fixed
+// uniform samples of the box between the origin and the reference point dominated by any inserted point.
+// The hypervolume is recorded every generation, the run can be stopped once it stops improving.
+class CHypervolumeTracker
+{
+public:
+    // Reads optional HypervolumeReference (coordinate of the reference point in every objective),
+    // HypervolumeSamples (samples of the approximation of more than 2 objectives),
+    // EarlyStoppingWindow (generations the improvement is measured over, 0 disables early stopping)
+    // and EarlyStoppingThreshold (relative improvement over the window below which the run is stopped)
+    void Configure(SConfigMap* configMap, const std::string& methodName);
+
+    void Insert(const SMOIndividual* individual);
+    void Insert(const std::vector<SMOIndividual*>& individuals);
+
+    // Records the hypervolume after the generation, returns true when the run should be stopped
+    bool FinishGeneration();
+
+    double GetHypervolume() const { return m_Hypervolume; }
+
+    // Writes the hypervolume of every generation to hypervolume.csv
+    void LogHistory() const;
+    void Reset();
+
+private:
+    static constexpr unsigned int s_SamplesSeed = 5489u;
+
+    float m_Reference = 1.f;
+    size_t m_SamplesCount = 4096;
+    size_t m_Window = 0;
+    float m_Threshold = 0.001f;
+
+    size_t m_ObjectivesCount = 0;
+    double m_Hypervolume = 0.0;
+    std::vector<double> m_History;
+
+    // Staircase of 2 objectives, second objective decreases with the first one
+    std::map<float, float> m_Front;
+    // Samples of more objectives not dominated yet, one column per objective, so a point is compared with them
+    // without branches. Samples are ordered by the first objective and dominated ones are removed from the columns.
+    std::vector<std::vector<float>> m_Samples;
+    std::vector<uint32_t> m_IsDominated;
+
+    void InitSamples();
+    void Insert2D(float x, float y);
+    // Area dominated only by the point of the staircase
+    double GetContribution(std::map<float, float>::const_iterator point) const;
+    void InsertSampled(const std::vector<float>& point);
+};
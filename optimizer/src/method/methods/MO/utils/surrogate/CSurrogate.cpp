@@ -0,0 +1,269 @@
+#include <algorithm>
+#include <cmath>
+#include <iostream>
+#include <limits>
+#include <sstream>
+#include <stdexcept>
+#include "CSurrogate.h"
+#include "../../../../../utils/logger/CExperimentLogger.h"
+
+void CSurrogate::Configure(SConfigMap* configMap, const std::string& methodName)
+{
+    int oversampling = 1;
+    configMap->TakeValue("SurrogateOversampling", oversampling);
+    if (oversampling < 1)
+    {
+        throw std::runtime_error(methodName + " parameter SurrogateOversampling lower than 1");
+    }
+    m_Oversampling = oversampling;
+
+    int neighboursCount = int(m_NeighboursCount);
+    configMap->TakeValue("SurrogateNeighbours", neighboursCount);
+    if (neighboursCount < 1)
+    {
+        throw std::runtime_error(methodName + " parameter SurrogateNeighbours lower than 1");
+    }
+    m_NeighboursCount = neighboursCount;
+
+    int trainingSize = int(m_TrainingSize);
+    configMap->TakeValue("SurrogateTrainingSize", trainingSize);
+    if (trainingSize < 1)
+    {
+        throw std::runtime_error(methodName + " parameter SurrogateTrainingSize lower than 1");
+    }
+    m_TrainingSize = trainingSize;
+}
+
+void CSurrogate::RejectConfiguration(SConfigMap* configMap, const std::string& methodName)
+{
+    for (const char* key: { "SurrogateOversampling", "SurrogateNeighbours", "SurrogateTrainingSize" })
+    {
+        if (configMap->HasValue(key))
+        {
+            throw std::runtime_error(methodName + " parameter " + key + " not supported");
+        }
+    }
+}
+
+void CSurrogate::InitFeatures(const SProblemEncoding& encoding, const SMOIndividual& individual)
+{
+    m_FloatsCount = individual.m_Genotype.m_FloatGenotype.size();
+    m_IntsCount = individual.m_Genotype.m_IntGenotype.size();
+    m_BitsCount = individual.m_Genotype.m_BoolGenotype.size();
+    m_ObjectivesCount = individual.m_NormalizedEvaluation.size();
+
+    // Every kind of genes adds at most 1 to the distance, float genes are scaled by their range
+    m_FloatScales.assign(m_FloatsCount, m_FloatsCount > 0 ? 1.f / float(m_FloatsCount) : 0.f);
+    size_t floatIdx = 0;
+    for (const SEncodingSection& encodingSection: encoding.m_Encoding)
+    {
+        if (encodingSection.m_SectionType != EEncodingType::ASSOCIATION)
+        {
+            continue;
+        }
+        for (const SEncodingDescriptor& encDesc: encodingSection.m_SectionDescription)
+        {
+            float range = encDesc.m_MaxValue - encDesc.m_MinValue;
+            if (floatIdx < m_FloatsCount && range > 0)
+            {
+                m_FloatScales[floatIdx] /= range * range;
+            }
+            ++floatIdx;
+        }
+    }
+    m_IntWeight = m_IntsCount > 0 ? 1.f / float(m_IntsCount) : 0.f;
+    m_BitWeight = m_BitsCount > 0 ? 1.f / float(m_BitsCount) : 0.f;
+
+    m_Floats.resize(m_TrainingSize * m_FloatsCount);
+    m_Ints.resize(m_TrainingSize * m_IntsCount);
+    m_Bits.resize(m_TrainingSize);
+    m_Evaluations.resize(m_TrainingSize * m_ObjectivesCount);
+    m_SamplesCount = 0;
+    m_NextSample = 0;
+}
+
+void CSurrogate::Screen(std::vector<SMOIndividual*>& candidates, size_t count)
+{
+    m_KeptPredictions.clear();
+    if (candidates.size() <= count || m_SamplesCount < std::max(m_NeighboursCount, count))
+    {
+        return;
+    }
+
+    m_Predictions.resize(candidates.size() * m_ObjectivesCount);
+    for (size_t i = 0; i < candidates.size(); ++i)
+    {
+        Predict(candidates[i]->m_Genotype, m_Predictions.data() + i * m_ObjectivesCount);
+    }
+
+    // Candidates are kept by fronts of their predictions, the last front only partially
+    m_NonDominatedSorting.Cluster(m_Predictions, m_ObjectivesCount, m_Fronts);
+    m_Candidates.clear();
+    for (const std::vector<size_t>& front: m_Fronts)
+    {
+        for (size_t idx: front)
+        {
+            if (m_Candidates.size() < count)
+            {
+                const float* prediction = m_Predictions.data() + idx * m_ObjectivesCount;
+                m_KeptPredictions.insert(m_KeptPredictions.end(), prediction, prediction + m_ObjectivesCount);
+            }
+            m_Candidates.push_back(candidates[idx]);
+        }
+    }
+    candidates.swap(m_Candidates);
+    m_ScreenedCount += candidates.size() - count;
+}
+
+void CSurrogate::Train(const std::vector<SMOIndividual*>& evaluated, const SProblemEncoding& encoding)
+{
+    if (!IsEnabled() || evaluated.empty())
+    {
+        return;
+    }
+    if (m_ObjectivesCount == 0)
+    {
+        InitFeatures(encoding, *evaluated[0]);
+    }
+
+    if (m_KeptPredictions.size() == evaluated.size() * m_ObjectivesCount)
+    {
+        for (size_t i = 0; i < evaluated.size(); ++i)
+        {
+            for (size_t o = 0; o < m_ObjectivesCount; ++o)
+            {
+                m_AbsoluteErrorSum += std::fabs(m_KeptPredictions[i * m_ObjectivesCount + o] - evaluated[i]->m_NormalizedEvaluation[o]);
+            }
+        }
+        m_PredictedCount += evaluated.size();
+    }
+    m_KeptPredictions.clear();
+
+    for (const SMOIndividual* individual: evaluated)
+    {
+        const SGenotype& genotype = individual->m_Genotype;
+        if (genotype.m_FloatGenotype.size() != m_FloatsCount || genotype.m_IntGenotype.size() != m_IntsCount
+            || genotype.m_BoolGenotype.size() != m_BitsCount)
+        {
+            continue;
+        }
+        // The oldest sample is replaced once the model is full
+        size_t sample = m_NextSample;
+        std::copy(genotype.m_FloatGenotype.begin(), genotype.m_FloatGenotype.end(), m_Floats.begin() + sample * m_FloatsCount);
+        std::copy(genotype.m_IntGenotype.begin(), genotype.m_IntGenotype.end(), m_Ints.begin() + sample * m_IntsCount);
+        m_Bits[sample] = genotype.m_BoolGenotype;
+        std::copy(individual->m_NormalizedEvaluation.begin(), individual->m_NormalizedEvaluation.end(),
+                  m_Evaluations.begin() + sample * m_ObjectivesCount);
+        m_NextSample = (m_NextSample + 1) % m_TrainingSize;
+        m_SamplesCount = std::min(m_SamplesCount + 1, m_TrainingSize);
+    }
+    m_EvaluatedCount += evaluated.size();
+}
+
+float CSurrogate::Distance(const SGenotype& genotype, size_t sample, float bound) const
+{
+    float distance = 0.f;
+    const float* genes = genotype.m_FloatGenotype.data();
+    const float* floats = m_Floats.data() + sample * m_FloatsCount;
+    const float* scales = m_FloatScales.data();
+    for (size_t blockStart = 0; blockStart < m_FloatsCount && distance <= bound; blockStart += s_DistanceBlockSize)
+    {
+        size_t blockEnd = std::min(blockStart + s_DistanceBlockSize, m_FloatsCount);
+        for (size_t j = blockStart; j < blockEnd; ++j)
+        {
+            float diff = genes[j] - floats[j];
+            distance += scales[j] * diff * diff;
+        }
+    }
+    if (distance > bound)
+    {
+        return distance;
+    }
+
+    const int* ints = m_Ints.data() + sample * m_IntsCount;
+    size_t mismatchesCount = 0;
+    for (size_t j = 0; j < m_IntsCount; ++j)
+    {
+        mismatchesCount += genotype.m_IntGenotype[j] != ints[j];
+    }
+    distance += m_IntWeight * float(mismatchesCount);
+
+    if (m_BitsCount > 0)
+    {
+        distance += m_BitWeight * float(genotype.m_BoolGenotype.HammingDistance(m_Bits[sample]));
+    }
+    return distance;
+}
+
+void CSurrogate::Predict(const SGenotype& genotype, float* prediction)
+{
+    // Nearest samples are collected in a max-heap by distance
+    const size_t neighboursCount = std::min(m_NeighboursCount, m_SamplesCount);
+    m_Neighbours.clear();
+    for (size_t s = 0; s < m_SamplesCount; ++s)
+    {
+        float bound = m_Neighbours.size() < neighboursCount ? std::numeric_limits<float>::max() : m_Neighbours.front().first;
+        float distance = Distance(genotype, s, bound);
+        if (m_Neighbours.size() < neighboursCount)
+        {
+            m_Neighbours.emplace_back(distance, s);
+            std::push_heap(m_Neighbours.begin(), m_Neighbours.end());
+        }
+        else if (distance < m_Neighbours.front().first)
+        {
+            std::pop_heap(m_Neighbours.begin(), m_Neighbours.end());
+            m_Neighbours.back() = {distance, s};
+            std::push_heap(m_Neighbours.begin(), m_Neighbours.end());
+        }
+    }
+
+    // Evaluations of the neighbours weighted by inverse distance
+    std::fill(prediction, prediction + m_ObjectivesCount, 0.f);
+    float weightsSum = 0.f;
+    for (const auto& neighbour: m_Neighbours)
+    {
+        float weight = 1.f / (neighbour.first + 1e-6f);
+        const float* evaluation = m_Evaluations.data() + neighbour.second * m_ObjectivesCount;
+        for (size_t o = 0; o < m_ObjectivesCount; ++o)
+        {
+            prediction[o] += weight * evaluation[o];
+        }
+        weightsSum += weight;
+    }
+    for (size_t o = 0; o < m_ObjectivesCount; ++o)
+    {
+        prediction[o] /= weightsSum;
+    }
+}
+
+void CSurrogate::LogStatistics() const
+{
+    if (!IsEnabled())
+    {
+        return;
+    }
+    double meanAbsoluteError = m_PredictedCount > 0 ? m_AbsoluteErrorSum / double(m_PredictedCount * m_ObjectivesCount) : 0.0;
+
+    std::ostringstream oss;
+    oss << "Oversampling;" << m_Oversampling << std::endl;
+    oss << "Evaluations;" << m_EvaluatedCount << std::endl;
+    oss << "EvaluationsSaved;" << m_ScreenedCount << std::endl;
+    oss << "PredictedEvaluations;" << m_PredictedCount << std::endl;
+    oss << "MeanAbsoluteError;" << meanAbsoluteError << std::endl;
+    CExperimentLogger::LogResult(oss.str().c_str(), "surrogate.csv");
+
+    std::cout << "Surrogate: " + std::to_string(m_EvaluatedCount) + " evaluations, " + std::to_string(m_ScreenedCount)
+                 + " saved, mean absolute error " + std::to_string(meanAbsoluteError) + "\n" << std::flush;
+}
+
+void CSurrogate::Reset()
+{
+    m_ObjectivesCount = 0;
+    m_SamplesCount = 0;
+    m_NextSample = 0;
+    m_KeptPredictions.clear();
+    m_ScreenedCount = 0;
+    m_EvaluatedCount = 0;
+    m_PredictedCount = 0;
+    m_AbsoluteErrorSum = 0.0;
+}
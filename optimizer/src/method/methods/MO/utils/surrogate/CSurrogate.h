@@ -0,0 +1,76 @@
+#pragma once
+
+#include <string>
+#include <vector>
+#include "../../../../configMap/SConfigMap.h"
+#include "../../../../individual/MO/SMOIndividual.h"
+#include "../../../../../problem/SProblemEncoding.h"
+#include "../clustering/CNonDominatedSorting.h"
+
+// Online nearest-neighbour model of normalized evaluations, trained on evaluated individuals of the run.
+// Genetic methods create more offspring than needed and fully evaluate only the ones predicted to be non-dominated,
+// which saves evaluations of problems where evaluation is expensive (MSRCPSP schedules, ECVRPTW routes).
+class CSurrogate
+{
+public:
+    // Reads optional SurrogateOversampling (offspring created per evaluated one, 1 disables the surrogate),
+    // SurrogateNeighbours and SurrogateTrainingSize (most recent evaluated individuals kept by the model)
+    void Configure(SConfigMap* configMap, const std::string& methodName);
+    // Throws for methods which do not screen offspring when any surrogate key is set, so it is not silently ignored
+    static void RejectConfiguration(SConfigMap* configMap, const std::string& methodName);
+
+    bool IsEnabled() const { return m_Oversampling > 1; }
+    size_t GetOversampling() const { return m_Oversampling; }
+
+    // Keeps count candidates best by predicted evaluation at the front, discarded candidates follow them.
+    // Candidates are kept in their order until the model holds enough individuals.
+    void Screen(std::vector<SMOIndividual*>& candidates, size_t count);
+
+    // Adds evaluated individuals to the model, errors are measured for candidates kept by the last screening
+    void Train(const std::vector<SMOIndividual*>& evaluated, const SProblemEncoding& encoding);
+
+    // Writes accuracy and saved evaluations of the run to surrogate.csv
+    void LogStatistics() const;
+    void Reset();
+
+private:
+    // Float genes are compared in blocks, the distance to a sample is not finished once it exceeds the k-th nearest
+    static constexpr size_t s_DistanceBlockSize = 32;
+
+    size_t m_Oversampling = 1;
+    size_t m_NeighboursCount = 3;
+    size_t m_TrainingSize = 200;
+
+    // Training individuals are kept in a ring of rows, genes of one kind per matrix
+    size_t m_FloatsCount = 0;
+    size_t m_IntsCount = 0;
+    size_t m_BitsCount = 0;
+    size_t m_ObjectivesCount = 0;
+    std::vector<float> m_FloatScales;
+    float m_IntWeight = 0.f;
+    float m_BitWeight = 0.f;
+    std::vector<float> m_Floats;
+    std::vector<int> m_Ints;
+    std::vector<CBitset> m_Bits;
+    std::vector<float> m_Evaluations;
+    size_t m_SamplesCount = 0;
+    size_t m_NextSample = 0;
+
+    // Predictions of candidates, the ones of kept candidates are compared with their evaluation
+    std::vector<float> m_Predictions;
+    std::vector<float> m_KeptPredictions;
+    std::vector<SMOIndividual*> m_Candidates;
+    std::vector<std::vector<size_t>> m_Fronts;
+    CNonDominatedSorting m_NonDominatedSorting;
+    std::vector<std::pair<float, size_t>> m_Neighbours;
+
+    size_t m_ScreenedCount = 0;
+    size_t m_EvaluatedCount = 0;
+    size_t m_PredictedCount = 0;
+    double m_AbsoluteErrorSum = 0.0;
+
+    void InitFeatures(const SProblemEncoding& encoding, const SMOIndividual& individual);
+    // Distance may stop being summed once it exceeds the bound
+    float Distance(const SGenotype& genotype, size_t sample, float bound) const;
+    void Predict(const SGenotype& genotype, float* prediction);
+};
@@ -281,6 +281,10 @@ void CACO_TSP::ResetPheromoneMap(){
 }
 
 void CACO_TSP::AddExperimentData(int generation) {
+    if (!CExperimentLogger::IsDataLogged(generation)) {
+        return;
+    }
+
     SSOIndividual *best = *std::min_element(m_Population.begin(), m_Population.end(),
                                             [](const auto &a, const auto &b) {
                                                 return a->m_Fitness < b->m_Fitness;
@@ -296,11 +300,7 @@ void CACO_TSP::AddExperimentData(int generation) {
     }
     float meanFitness = totalFitness / float(m_Population.size());
 
-    std::string generationData = std::to_string(generation) + ';' +
-                                 std::to_string(best->m_Fitness) + ';' +
-                                 std::to_string(worst->m_Fitness) + ';' +
-                                 std::to_string(meanFitness);
-    CExperimentLogger::AddLine(generationData.c_str());
+    CExperimentLogger::AddValues(generation, best->m_Fitness, worst->m_Fitness, meanFitness);
 }
 
 void CACO_TSP::LogResultData() {
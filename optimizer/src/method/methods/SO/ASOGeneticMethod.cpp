@@ -0,0 +1,58 @@
+#include "ASOGeneticMethod.h"
+#include "utils/aggregatedFitness/CAggregatedFitness.h"
+#include <algorithm>
+
+void ASOGeneticMethod::MigrateIslands(size_t generation)
+{
+    if (!CIslandModel::IsMigrationGeneration(generation))
+    {
+        return;
+    }
+
+    std::vector<size_t> order(m_Population.size());
+    for (size_t i = 0; i < order.size(); ++i)
+    {
+        order[i] = i;
+    }
+    std::stable_sort(order.begin(), order.end(), [this](size_t a, size_t b) -> bool
+    {
+        return m_Population[a]->m_Fitness < m_Population[b]->m_Fitness;
+    });
+
+    std::vector<const AIndividual*> migrants;
+    const size_t migrantsCount = std::min(CIslandModel::GetMigrantsCount(), m_Population.size());
+    for (size_t i = 0; i < migrantsCount; ++i)
+    {
+        migrants.push_back(m_Population[order[i]]);
+    }
+
+    std::vector<SMigrant> immigrants = CIslandModel::Exchange(migrants);
+    for (size_t i = 0; i < immigrants.size() && i < order.size(); ++i)
+    {
+        SMigrant& migrant = immigrants[i];
+        auto* immigrant = new SSOIndividual(migrant.m_Genotype, migrant.m_Evaluation, migrant.m_NormalizedEvaluation);
+        CAggregatedFitness::CountFitness(*immigrant, m_ObjectiveWeights);
+
+        size_t replacedIdx = order[order.size() - 1 - i];
+        delete m_Population[replacedIdx];
+        m_Population[replacedIdx] = immigrant;
+    }
+}
+
+void ASOGeneticMethod::MergeIslandBests()
+{
+    std::vector<const AIndividual*> best;
+    if (!m_Population.empty())
+    {
+        best.push_back(*std::min_element(m_Population.begin(), m_Population.end(), [](const auto& a, const auto& b)
+        {
+            return a->m_Fitness < b->m_Fitness;
+        }));
+    }
+    for (SMigrant& migrant : CIslandModel::Gather(best))
+    {
+        auto* individual = new SSOIndividual(migrant.m_Genotype, migrant.m_Evaluation, migrant.m_NormalizedEvaluation);
+        CAggregatedFitness::CountFitness(*individual, m_ObjectiveWeights);
+        m_Population.push_back(individual);
+    }
+}
@@ -2,6 +2,7 @@
 
 #include "../../individual/MO/SMOIndividual.h"
 #include "../../AGeneticMethod.h"
+#include "../../island/CIslandModel.h"
 
 class ASOGeneticMethod : public AGeneticMethod
 {
@@ -21,6 +22,12 @@ public:
         m_Population.clear();
     };
 protected:
+    // Sends the best individuals to neighbouring islands, immigrants replace the worst individuals
+    void MigrateIslands(size_t generation);
+
+    // Main island adds best individuals of all islands to its population, other islands send their best to it
+    void MergeIslandBests();
+
     std::vector<float> &m_ObjectiveWeights;
     std::vector<SSOIndividual*> m_Population;
 };
@@ -4,6 +4,7 @@
 #include "../utils/experiment/CSOExperimentUtils.h"
 #include "../utils/aggregatedFitness/CAggregatedFitness.h"
 #include "../../../../utils/logger/ErrorUtils.h"
+#include <algorithm>
 #include <numeric>
 
 CDE::CDE(
@@ -31,10 +32,7 @@ void CDE::RunOptimization()
 {
     int generation = 0;
 
-    for (size_t i = 0; i < m_PopulationSize; ++i)
-    {
-        CreateIndividual();
-    }
+    InitPopulation();
 
     CSOExperimentUtils::AddExperimentData(generation, m_Population);
 
@@ -48,72 +46,114 @@ void CDE::RunOptimization()
     CSOExperimentUtils::LogResultData(*best, m_Problem);
 }
 
-void CDE::CreateIndividual()
+void CDE::InitPopulation()
 {
     SProblemEncoding& problemEncoding = m_Problem.GetProblemEncoding();
-    auto* newInd = m_Initialization.CreateSOIndividual(problemEncoding);
+    m_EvaluationBatch.clear();
+    for (size_t i = 0; i < m_PopulationSize; ++i)
+    {
+        auto* newInd = m_Initialization.CreateSOIndividual(problemEncoding);
+        m_Population.push_back(newInd);
+        m_EvaluationBatch.push_back(newInd);
+    }
+    m_Problem.EvaluateBatch(m_EvaluationBatch);
+
+    m_GenesCount = m_Population[0]->m_Genotype.m_FloatGenotype.size();
+    m_Genes.resize(m_PopulationSize * m_GenesCount);
+    m_TrialGenes.resize(m_PopulationSize * m_GenesCount);
+    m_Fitness.resize(m_PopulationSize);
+    m_EvaluationBatch.clear();
+    for (size_t i = 0; i < m_PopulationSize; ++i)
+    {
+        SSOIndividual* individual = m_Population[i];
+        CAggregatedFitness::CountFitness(*individual, m_ObjectiveWeights);
+        m_Fitness[i] = individual->m_Fitness;
+        const std::vector<float>& genotype = individual->m_Genotype.m_FloatGenotype;
+        std::copy(genotype.begin(), genotype.end(), m_Genes.begin() + i * m_GenesCount);
 
-    m_Problem.Evaluate(*newInd);
-    CAggregatedFitness::CountFitness(*newInd, m_ObjectiveWeights);
+        // Trials keep the rest of the genotype of their parent
+        auto* trial = new SSOIndividual(*individual);
+        m_Trials.push_back(trial);
+        m_EvaluationBatch.push_back(trial);
+    }
 
-    m_Population.push_back(newInd);
+    m_MinValues.assign(m_GenesCount, 0.f);
+    m_MaxValues.assign(m_GenesCount, 0.f);
+    m_CrossoverRates.assign(m_GenesCount, -1.f);
+    size_t sectionStartIndex = 0;
+    for (const auto& encodingSection: problemEncoding.m_Encoding)
+    {
+        const auto& sectionDesc = encodingSection.m_SectionDescription;
+        if (encodingSection.m_SectionType == EEncodingType::ASSOCIATION)
+        {
+            for (size_t j = 0; j < sectionDesc.size() && sectionStartIndex + j < m_GenesCount; ++j)
+            {
+                m_MinValues[sectionStartIndex + j] = sectionDesc[j].m_MinValue;
+                m_MaxValues[sectionStartIndex + j] = sectionDesc[j].m_MaxValue;
+                m_CrossoverRates[sectionStartIndex + j] = m_Cr;
+            }
+        }
+        sectionStartIndex += sectionDesc.size();
+    }
+
+    m_CrossoverRandoms.resize(m_GenesCount);
+    m_RepairRandoms.resize(m_GenesCount);
+    m_Indices.resize(m_PopulationSize);
+    std::iota(m_Indices.begin(), m_Indices.end(), 0);
 }
 
 void CDE::EvolveToNextGeneration()
 {
-    for (int i = 0; i < m_PopulationSize; i++)
+    // Trials of the whole generation are created first and evaluated at once
+    for (size_t i = 0; i < m_PopulationSize; ++i)
     {
-        auto* donor = new SSOIndividual(*m_Population[i]);
-        std::vector<int> indices(m_Population.size());
-        std::iota(indices.begin(), indices.end(), 0);
-        CRandom::Shuffle(0, indices.size(), indices);
-        auto& random1 = m_Population[indices[0]]->m_Genotype;
-        auto& random2 = m_Population[indices[1]]->m_Genotype;
-        auto& random3 = m_Population[indices[2]]->m_Genotype;
-
-        DifferentialEvolutionStep(donor->m_Genotype, random1, random2, random3);
-        m_Problem.Evaluate(*donor);
-        CAggregatedFitness::CountFitness(*donor, m_ObjectiveWeights);
-
-        if (donor->m_Fitness < m_Population[i]->m_Fitness)
-        {
-            delete m_Population[i];
-            m_Population[i] = donor;
-        }
-        else
+        DifferentialEvolutionStep(i);
+        const float* trialGenes = m_TrialGenes.data() + i * m_GenesCount;
+        std::copy(trialGenes, trialGenes + m_GenesCount, m_Trials[i]->m_Genotype.m_FloatGenotype.begin());
+    }
+    m_Problem.EvaluateBatch(m_EvaluationBatch);
+
+    for (size_t i = 0; i < m_PopulationSize; ++i)
+    {
+        SSOIndividual* trial = m_Trials[i];
+        CAggregatedFitness::CountFitness(*trial, m_ObjectiveWeights);
+        if (trial->m_Fitness < m_Fitness[i])
         {
-            delete donor;
+            const float* trialGenes = m_TrialGenes.data() + i * m_GenesCount;
+            std::copy(trialGenes, trialGenes + m_GenesCount, m_Genes.begin() + i * m_GenesCount);
+            m_Fitness[i] = trial->m_Fitness;
+            std::swap(m_Population[i], m_Trials[i]);
+            m_EvaluationBatch[i] = m_Trials[i];
         }
     }
 }
 
-void CDE::DifferentialEvolutionStep(SGenotype& donor, const SGenotype& gens1, const SGenotype& gens2, const SGenotype& gens3)
+void CDE::DifferentialEvolutionStep(size_t idx)
 {
-    size_t sectionStartIndex = 0;
-    for (const auto& encodingSection: m_Problem.GetProblemEncoding().m_Encoding)
+    // First three positions of a partial shuffle are the random individuals
+    for (int k = 0; k < 3; ++k)
     {
-        const auto& sectionDesc = encodingSection.m_SectionDescription;
-        const size_t sectionSize = sectionDesc.size();
-        switch (encodingSection.m_SectionType)
-        {
-            case EEncodingType::ASSOCIATION:
-            {
-                for (size_t j = 0; j < encodingSection.m_SectionDescription.size(); ++j)
-                {
-                    if (CRandom::GetFloat(0, 1) < m_Cr)
-                    {
-                        size_t g = sectionStartIndex + j;
-                        donor.m_FloatGenotype[g] = gens1.m_FloatGenotype[g] + m_F * (gens2.m_FloatGenotype[g] - gens3.m_FloatGenotype[g]);
-                        // Check constraints, use random if out of bounds
-                        if (donor.m_FloatGenotype[g] < sectionDesc[j].m_MinValue || donor.m_FloatGenotype[g] >= sectionDesc[j].m_MaxValue)
-                        {
-                            donor.m_FloatGenotype[g] = CRandom::GetFloat(sectionDesc[j].m_MaxValue, sectionDesc[j].m_MinValue);
-                        }
-                    }
-                }
-                break;
-            }
-        }
-        sectionStartIndex += sectionSize;
+        std::swap(m_Indices[k], m_Indices[CRandom::GetInt(k, (int)m_PopulationSize)]);
+    }
+    const float* x = m_Genes.data() + idx * m_GenesCount;
+    const float* gens1 = m_Genes.data() + m_Indices[0] * m_GenesCount;
+    const float* gens2 = m_Genes.data() + m_Indices[1] * m_GenesCount;
+    const float* gens3 = m_Genes.data() + m_Indices[2] * m_GenesCount;
+    float* trial = m_TrialGenes.data() + idx * m_GenesCount;
+
+    CRandom::GetFloats(0, 1, m_CrossoverRandoms);
+    CRandom::GetFloats(0, 1, m_RepairRandoms);
+    const float* minValues = m_MinValues.data();
+    const float* maxValues = m_MaxValues.data();
+    const float* crossoverRates = m_CrossoverRates.data();
+    const float* crossoverRandoms = m_CrossoverRandoms.data();
+    const float* repairRandoms = m_RepairRandoms.data();
+    for (size_t j = 0; j < m_GenesCount; ++j)
+    {
+        float mutant = gens1[j] + m_F * (gens2[j] - gens3[j]);
+        // Check constraints, use random if out of bounds
+        bool outOfBounds = mutant < minValues[j] || mutant >= maxValues[j];
+        mutant = outOfBounds ? minValues[j] + (maxValues[j] - minValues[j]) * repairRandoms[j] : mutant;
+        trial[j] = crossoverRandoms[j] < crossoverRates[j] ? mutant : x[j];
     }
 }
@@ -23,6 +23,11 @@ public:
             delete i;
         }
         m_Population.clear();
+        for (auto& i : m_Trials)
+        {
+            delete i;
+        }
+        m_Trials.clear();
     };
 private:
     size_t m_PopulationSize = 0;
@@ -30,7 +35,24 @@ private:
     float m_Cr;
     float m_F;
 
-    void CreateIndividual();
+    // Population is stored by matrices with one row of genes per individual, so mutation and crossover run over
+    // contiguous memory. Individuals of m_Population and m_Trials are only views used to evaluate the rows.
+    size_t m_GenesCount = 0;
+    std::vector<float> m_Genes;
+    std::vector<float> m_TrialGenes;
+    std::vector<float> m_Fitness;
+    std::vector<SSOIndividual*> m_Trials;
+    std::vector<AIndividual*> m_EvaluationBatch;
+    // Bounds of every gene, genes outside association sections have crossover rate below zero and are never changed
+    std::vector<float> m_MinValues;
+    std::vector<float> m_MaxValues;
+    std::vector<float> m_CrossoverRates;
+    // Random numbers of crossover and repair of one individual
+    std::vector<float> m_CrossoverRandoms;
+    std::vector<float> m_RepairRandoms;
+    std::vector<int> m_Indices;
+
+    void InitPopulation();
     void EvolveToNextGeneration();
-    void DifferentialEvolutionStep(SGenotype& donor, const SGenotype& gens1, const SGenotype& gens2, const SGenotype& gens3);
+    void DifferentialEvolutionStep(size_t idx);
 };
@@ -36,11 +36,13 @@ void CGA::RunOptimization()
 
     while (generation < m_GenerationLimit)
     {
+        MigrateIslands(generation);
         EvolveToNextGeneration();
         CSOExperimentUtils::AddExperimentData(generation, m_Population);
         generation++;
     }
 
+    MergeIslandBests();
     auto* best = CSOExperimentUtils::FindBest(m_Population);
     CSOExperimentUtils::LogResultData(*best, m_Problem);
 }
@@ -1,4 +1,5 @@
 #include <algorithm>
+#include <limits>
 #include "CPSO.h"
 #include "../../../../utils/random/CRandom.h"
 #include "../utils/experiment/CSOExperimentUtils.h"
@@ -9,7 +10,7 @@ CPSO::CPSO(std::vector<float>& objectiveWeights, AProblem& evaluator, AInitializ
 {
     configMap->TakeValue("SwarmSize", m_SwarmSize);
     ErrorUtils::LowerThanZeroI("PSO", "SwarmSize", m_SwarmSize);
-    m_Swarm.reserve(m_SwarmSize);
+    m_Population.reserve(m_SwarmSize);
 
     configMap->TakeValue("InertiaWeight", m_InertiaWeight);
     ErrorUtils::OutOfScopeF("PSO", "InertiaWeight", m_InertiaWeight);
@@ -33,17 +34,7 @@ void CPSO::RunOptimization()
     int iteration = 0;
     
     m_BestKnownFitness = std::numeric_limits<float>::max();
-
-    for (size_t i = 0; i < m_SwarmSize; ++i)
-    {
-        SParticle* prt = CreateParticle();
-
-        if (prt->m_Fitness < m_BestKnownFitness)
-        {
-            m_BestKnownFitness = prt->m_Fitness;
-            m_BestKnownPosition = prt->m_BestKnownPosition;
-        }
-    }
+    InitSwarm();
 
     int migrationCounter = 0;
 
@@ -59,120 +50,129 @@ void CPSO::RunOptimization()
             migrationCounter = 0;
         }
 
-        CSOExperimentUtils::AddExperimentData(iteration, m_Swarm);
+        CSOExperimentUtils::AddExperimentData(iteration, m_Population);
         iteration++;
     }
 
-    auto* best = CSOExperimentUtils::FindBest(m_Swarm);
-    CSOExperimentUtils::LogResultData(*best, m_Problem);
+    CSOExperimentUtils::LogResultData(*m_BestKnownIndividual, m_Problem);
 }
 
-void CPSO::UpdatePosition(std::vector<float>& position, std::vector<float>& velocity)
+void CPSO::InitSwarm()
 {
-    std::vector<SEncodingDescriptor> sectionDescription = m_Problem.GetProblemEncoding().m_Encoding[0].m_SectionDescription;
+    SProblemEncoding& problemEncoding = m_Problem.GetProblemEncoding();
+    const std::vector<SEncodingDescriptor>& sectionDescription = problemEncoding.m_Encoding[0].m_SectionDescription;
+    m_GenesCount = sectionDescription.size();
 
-    for (size_t i = 0; i < position.size(); ++i)
+    m_MinValues.resize(m_GenesCount);
+    m_MaxValues.resize(m_GenesCount);
+    m_MaxVelocities.resize(m_GenesCount);
+    for (size_t j = 0; j < m_GenesCount; ++j)
     {
-        float dimension = position[i] + velocity[i];
-        dimension = std::max(dimension, sectionDescription[i].m_MinValue);
-        dimension = std::min(dimension, 0.9999999f * sectionDescription[i].m_MaxValue);
-        position[i] = dimension;
+        m_MinValues[j] = sectionDescription[j].m_MinValue;
+        m_MaxValues[j] = 0.9999999f * sectionDescription[j].m_MaxValue;
+        m_MaxVelocities[j] = (sectionDescription[j].m_MaxValue - sectionDescription[j].m_MinValue) * 0.9999999f;
     }
-}
+    m_CognitiveRandoms.resize(m_GenesCount);
+    m_SocialRandoms.resize(m_GenesCount);
 
-void CPSO::UpdateBests(SParticle* particle)
-{
-    if (particle->m_Fitness < particle->m_BestKnownFitness)
+    // Initial positions come from the initialization, velocities are random within their bounds
+    m_Positions.resize(m_SwarmSize * m_GenesCount);
+    m_Velocities.resize(m_SwarmSize * m_GenesCount);
+    m_EvaluationBatch.clear();
+    for (size_t i = 0; i < m_SwarmSize; ++i)
     {
-        particle->m_BestKnownPosition = particle->m_Genotype.m_FloatGenotype;
-        particle->m_BestKnownFitness = particle->m_Fitness;
-
-        if (particle->m_BestKnownFitness < m_BestKnownFitness)
+        auto* particle = m_Initialization.CreateSOIndividual(problemEncoding);
+        const std::vector<float>& genotype = particle->m_Genotype.m_FloatGenotype;
+        std::copy(genotype.begin(), genotype.end(), m_Positions.begin() + i * m_GenesCount);
+        for (size_t j = 0; j < m_GenesCount; ++j)
         {
-            m_BestKnownPosition = particle->m_BestKnownPosition;
-            m_BestKnownFitness = particle->m_BestKnownFitness;
+            m_Velocities[i * m_GenesCount + j] = CRandom::GetFloat(-m_MaxVelocities[j], m_MaxVelocities[j]);
         }
+
+        m_Population.push_back(particle);
+        m_EvaluationBatch.push_back(particle);
     }
+    m_BestKnownIndividual = new SSOIndividual(*m_Population[0]);
+
+    m_PersonalBestPositions = m_Positions;
+    m_PersonalBestFitness.assign(m_SwarmSize, std::numeric_limits<float>::max());
+    m_BestKnownPosition.resize(m_GenesCount);
+    EvaluateSwarm();
 }
 
-void CPSO::Migrate()
+void CPSO::EvaluateSwarm()
 {
     for (size_t i = 0; i < m_SwarmSize; ++i)
     {
-        for (size_t j = 0; j < m_Swarm[i]->m_Genotype.m_FloatGenotype.size(); ++j)
-        {
-            float dimension = m_Problem.GetProblemEncoding().m_Encoding[0].m_SectionDescription[j].m_MaxValue * 0.9999999f - m_Swarm[i]->m_Genotype.m_FloatGenotype[j];
-            m_Swarm[i]->m_Genotype.m_FloatGenotype[j] = dimension;
-        }
-
-        m_Problem.Evaluate(*m_Swarm[i]);
-        CAggregatedFitness::CountFitness(*m_Swarm[i], m_ObjectiveWeights);
-
-        UpdateBests(m_Swarm[i]);
+        const float* position = m_Positions.data() + i * m_GenesCount;
+        std::copy(position, position + m_GenesCount, m_Population[i]->m_Genotype.m_FloatGenotype.begin());
     }
-}
+    m_Problem.EvaluateBatch(m_EvaluationBatch);
 
-SParticle* CPSO::CreateParticle()
-{
-    SProblemEncoding& problemEncoding = m_Problem.GetProblemEncoding();
-    auto* newPart = m_Initialization.CreateParticle(problemEncoding);
-
-    m_Problem.Evaluate(*newPart);
-    newPart->m_BestKnownPosition = newPart->m_Genotype.m_FloatGenotype;
-    CAggregatedFitness::CountFitness(*newPart, m_ObjectiveWeights);
-    newPart->m_BestKnownFitness = newPart->m_Fitness;
-
-    m_Swarm.push_back(newPart);
+    for (size_t i = 0; i < m_SwarmSize; ++i)
+    {
+        SSOIndividual& particle = *m_Population[i];
+        CAggregatedFitness::CountFitness(particle, m_ObjectiveWeights);
+        if (particle.m_Fitness < m_PersonalBestFitness[i])
+        {
+            const float* position = m_Positions.data() + i * m_GenesCount;
+            std::copy(position, position + m_GenesCount, m_PersonalBestPositions.begin() + i * m_GenesCount);
+            m_PersonalBestFitness[i] = particle.m_Fitness;
 
-    return newPart;
+            if (particle.m_Fitness < m_BestKnownFitness)
+            {
+                std::copy(position, position + m_GenesCount, m_BestKnownPosition.begin());
+                m_BestKnownFitness = particle.m_Fitness;
+                *m_BestKnownIndividual = particle;
+            }
+        }
+    }
 }
 
-void CPSO::InitVelocity(SProblemEncoding& problemEncoding, std::vector<float> *newVelocity) const
+void CPSO::Migrate()
 {
-    for (const SEncodingSection& encodingSection : problemEncoding.m_Encoding)
+    // Particles are reflected to the opposite side of the search space
+    for (size_t i = 0; i < m_SwarmSize; ++i)
     {
-        switch (encodingSection.m_SectionType)
+        float* x = m_Positions.data() + i * m_GenesCount;
+        for (size_t j = 0; j < m_GenesCount; ++j)
         {
-            case EEncodingType::ASSOCIATION:
-            {
-                for (const SEncodingDescriptor& encDesc : encodingSection.m_SectionDescription)
-                {
-                    newVelocity->push_back(CRandom::GetFloat(encDesc.m_MinValue, encDesc.m_MaxValue));
-                }
-                break;
-            }
+            x[j] = std::min(std::max(m_MinValues[j] + m_MaxValues[j] - x[j], m_MinValues[j]), m_MaxValues[j]);
         }
     }
+    EvaluateSwarm();
 }
 
 void CPSO::MoveParticles()
 {
-    std::vector<SEncodingDescriptor> sectionDescription = m_Problem.GetProblemEncoding().m_Encoding[0].m_SectionDescription;
-
+    const float* g = m_BestKnownPosition.data();
+    const float* minValues = m_MinValues.data();
+    const float* maxValues = m_MaxValues.data();
+    const float* maxVelocities = m_MaxVelocities.data();
+    const float* rp = m_CognitiveRandoms.data();
+    const float* rg = m_SocialRandoms.data();
+
+    // Positions of all particles are updated before the swarm is evaluated
     for (size_t i = 0; i < m_SwarmSize; ++i)
     {
-        for (size_t j = 0; j < m_Swarm[i]->m_Velocity.size(); ++j)
+        CRandom::GetFloats(0, 1, m_CognitiveRandoms);
+        CRandom::GetFloats(0, 1, m_SocialRandoms);
+
+        float* x = m_Positions.data() + i * m_GenesCount;
+        float* v = m_Velocities.data() + i * m_GenesCount;
+        const float* p = m_PersonalBestPositions.data() + i * m_GenesCount;
+        for (size_t j = 0; j < m_GenesCount; ++j)
         {
-            float rp = CRandom::GetFloat(0, 1);
-            float p = m_Swarm[i]->m_BestKnownPosition[j];
-            float rg = CRandom::GetFloat(0, 1);
-            float g = m_BestKnownPosition[j];
-            float x = m_Swarm[i]->m_Genotype.m_FloatGenotype[j];
-            float v = m_Swarm[i]->m_Velocity[j];
-
-            float dimension =
-                m_InertiaWeight * m_Swarm[i]->m_Velocity[j]
-                + m_CognitiveCoefficient * rp * (p - x)
-                + m_SocialCoefficient * rg * (g - x);
-
-            m_Swarm[i]->m_Velocity[j] = std::max(dimension, (sectionDescription[j].m_MinValue - sectionDescription[j].m_MaxValue) * 0.9999999f);
-            m_Swarm[i]->m_Velocity[j] = std::min(dimension, (sectionDescription[j].m_MaxValue - sectionDescription[j].m_MinValue) * 0.9999999f);
+            float velocity =
+                m_InertiaWeight * v[j]
+                + m_CognitiveCoefficient * rp[j] * (p[j] - x[j])
+                + m_SocialCoefficient * rg[j] * (g[j] - x[j]);
+            velocity = std::min(std::max(velocity, -maxVelocities[j]), maxVelocities[j]);
+
+            v[j] = velocity;
+            x[j] = std::min(std::max(x[j] + velocity, minValues[j]), maxValues[j]);
         }
-
-        UpdatePosition(m_Swarm[i]->m_Genotype.m_FloatGenotype, m_Swarm[i]->m_Velocity);
-        m_Problem.Evaluate(*m_Swarm[i]);
-        CAggregatedFitness::CountFitness(*m_Swarm[i], m_ObjectiveWeights);
-
-        UpdateBests(m_Swarm[i]);
     }
-}
\ No newline at end of file
+
+    EvaluateSwarm();
+}
@@ -2,7 +2,6 @@
 
 #include "../../../operators/initialization/AInitialization.h"
 #include "../../../configMap/SConfigMap.h"
-#include "../../../individual/SO/SParticle.h"
 #include "../CAggregatedFitness.h"
 #include "../ASOMethod.h"
 
@@ -21,11 +20,13 @@ public:
 
     void Reset()
     {
-        for (auto& i : m_Swarm)
+        for (auto& i : m_Population)
         {
             delete i;
         }
-        m_Swarm.clear();
+        m_Population.clear();
+        delete m_BestKnownIndividual;
+        m_BestKnownIndividual = nullptr;
     };
 private:
     size_t m_IterationLimit = 0;
@@ -34,16 +35,30 @@ private:
     float m_CognitiveCoefficient = 0.0f;
     float m_SocialCoefficient = 0.0f;
 
-    std::vector<SParticle*> m_Swarm;
+    int m_MigrationThreshold = 0;
+
+    // Swarm is stored by matrices with one row of genes per particle, so the update loops run over contiguous memory.
+    // Particles of m_Population are only views used to evaluate the positions.
+    size_t m_GenesCount = 0;
+    std::vector<float> m_Positions;
+    std::vector<float> m_Velocities;
+    std::vector<float> m_PersonalBestPositions;
+    std::vector<float> m_PersonalBestFitness;
+    // Bounds of positions and velocities of every gene
+    std::vector<float> m_MinValues;
+    std::vector<float> m_MaxValues;
+    std::vector<float> m_MaxVelocities;
+    // Random factors of the cognitive and social component of one particle
+    std::vector<float> m_CognitiveRandoms;
+    std::vector<float> m_SocialRandoms;
+
     std::vector<float> m_BestKnownPosition;
     float m_BestKnownFitness = 0.0f;
+    SSOIndividual* m_BestKnownIndividual = nullptr;
+    std::vector<AIndividual*> m_EvaluationBatch;
 
-    int m_MigrationThreshold = 0;
-
-    SParticle* CreateParticle();
+    void InitSwarm();
     void MoveParticles();
-    void UpdatePosition(std::vector<float>& position, std::vector<float>& velocity);
-    void UpdateBests(SParticle* particle);
     void Migrate();
-    void InitVelocity(SProblemEncoding& problemEncoding, std::vector<float> *newVelocity) const;
+    void EvaluateSwarm();
 };
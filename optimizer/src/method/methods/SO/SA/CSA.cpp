@@ -4,7 +4,14 @@
 #include "../../../../utils/random/CRandom.h"
 #include "../utils/experiment/CSOExperimentUtils.h"
 #include "../../../../utils/logger/ErrorUtils.h"
+#include <algorithm>
+#include <atomic>
+#include <climits>
 #include <cmath>
+#include <condition_variable>
+#include <exception>
+#include <mutex>
+#include <thread>
 
 CSA::CSA(std::vector<float>& objectiveWeights, AProblem& evaluator, AInitialization& initialization,
          SConfigMap* configMap)
@@ -18,49 +25,270 @@ CSA::CSA(std::vector<float>& objectiveWeights, AProblem& evaluator, AInitializat
 
     configMap->TakeValue("CoolingRate", m_CoolingRate);
     ErrorUtils::OutOfScopeF("SA", "CoolingRate", m_CoolingRate);
+
+    // Optional, without the keys a single chain is annealed
+    int chainsCount = 1;
+    if (configMap->TakeValue("ChainsCount", chainsCount))
+    {
+        ErrorUtils::LowerThanZeroI("SA", "ChainsCount", chainsCount);
+        m_ChainsCount = std::max(1, chainsCount);
+    }
+    int swapInterval = (int)m_SwapInterval;
+    if (configMap->TakeValue("SwapInterval", swapInterval))
+    {
+        ErrorUtils::LowerThanZeroI("SA", "SwapInterval", swapInterval);
+        m_SwapInterval = std::max(1, swapInterval);
+    }
 }
 
 
 void CSA::RunOptimization()
+{
+    if (m_ChainsCount > 1)
+    {
+        RunParallelTempering();
+    }
+    else
+    {
+        RunAnnealing();
+    }
+}
+
+void CSA::Reset()
+{
+    delete m_CurrentSolution;
+    delete m_NeighborSolution;
+    m_CurrentSolution = nullptr;
+    m_NeighborSolution = nullptr;
+}
+
+void CSA::RunAnnealing()
 {
     double temperature = m_InitialTemperature;
+    size_t iteration = 0;
     
     InitializeSolution();
 
     while (temperature > m_FinalTemperature)
     {
-        Iterate(temperature);
-        CExperimentLogger::AddLine((std::to_string(temperature) + ";" + std::to_string(m_CurrentSolution->m_Fitness)).c_str());
+        Iterate(m_CurrentSolution, m_NeighborSolution, temperature);
+        if (CExperimentLogger::IsDataLogged(iteration))
+        {
+            CExperimentLogger::AddValues(temperature, m_CurrentSolution->m_Fitness);
+        }
         temperature *= m_CoolingRate;
+        ++iteration;
     }
     
     CSOExperimentUtils::LogResultData(*m_CurrentSolution, m_Problem);
 }
 
+void CSA::RunParallelTempering()
+{
+    // Every chain makes as many iterations as the annealing schedule has
+    size_t iterationsCount = 0;
+    for (double temperature = m_InitialTemperature; temperature > m_FinalTemperature; temperature *= m_CoolingRate)
+    {
+        ++iterationsCount;
+    }
+
+    // Geometric ladder of temperatures, the first chain is the coldest one
+    m_Chains.resize(m_ChainsCount);
+    for (size_t k = 0; k < m_ChainsCount; ++k)
+    {
+        SChain& chain = m_Chains[k];
+        chain.m_Temperature = m_FinalTemperature * std::pow(m_InitialTemperature / m_FinalTemperature, double(k) / double(m_ChainsCount - 1));
+        chain.m_Current = CreateEvaluatedSolution();
+        chain.m_Neighbor = new SSOIndividual(*chain.m_Current);
+        chain.m_Best = new SSOIndividual(*chain.m_Current);
+    }
+
+    // Chains run in a pool of workers between exchanges, they reseed the generator of the worker with seeds drawn
+    // by the optimization thread, so results do not depend on the number of workers
+    size_t workersCount = std::min(m_ChainsCount, (size_t)std::max(1u, std::thread::hardware_concurrency()));
+    std::mutex mutex;
+    std::condition_variable segmentStarted;
+    std::condition_variable segmentFinished;
+    size_t segmentIdx = 0;
+    size_t segmentLength = 0;
+    size_t finishedWorkersCount = 0;
+    bool isStopped = false;
+    std::atomic<size_t> nextChainIdx{0};
+    std::vector<std::exception_ptr> errors(workersCount);
+    auto runWorker = [&](size_t workerIdx)
+    {
+        size_t lastSegmentIdx = 0;
+        while (true)
+        {
+            {
+                std::unique_lock<std::mutex> lock(mutex);
+                segmentStarted.wait(lock, [&]() { return isStopped || segmentIdx != lastSegmentIdx; });
+                if (isStopped)
+                {
+                    return;
+                }
+                lastSegmentIdx = segmentIdx;
+            }
+            try
+            {
+                for (size_t k = nextChainIdx++; k < m_Chains.size(); k = nextChainIdx++)
+                {
+                    RunChain(m_Chains[k], segmentLength);
+                }
+            }
+            catch (...)
+            {
+                errors[workerIdx] = std::current_exception();
+                nextChainIdx = m_Chains.size();
+            }
+            {
+                std::lock_guard<std::mutex> lock(mutex);
+                if (++finishedWorkersCount == workersCount)
+                {
+                    segmentFinished.notify_one();
+                }
+            }
+        }
+    };
+
+    std::vector<std::thread> workers;
+    workers.reserve(workersCount);
+    for (size_t w = 0; w < workersCount; ++w)
+    {
+        workers.emplace_back(runWorker, w);
+    }
+
+    for (size_t iteration = 0, exchangeIdx = 0; iteration < iterationsCount; ++exchangeIdx)
+    {
+        for (SChain& chain : m_Chains)
+        {
+            chain.m_Seed = (unsigned int)CRandom::GetInt(0, INT_MAX);
+        }
+        {
+            std::lock_guard<std::mutex> lock(mutex);
+            segmentLength = std::min(m_SwapInterval, iterationsCount - iteration);
+            nextChainIdx = 0;
+            finishedWorkersCount = 0;
+            ++segmentIdx;
+        }
+        segmentStarted.notify_all();
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            segmentFinished.wait(lock, [&]() { return finishedWorkersCount == workersCount; });
+        }
+        if (std::any_of(errors.begin(), errors.end(), [](const std::exception_ptr& error) { return error != nullptr; }))
+        {
+            break;
+        }
+        iteration += segmentLength;
+
+        ExchangeReplicas(exchangeIdx);
+        if (CExperimentLogger::IsDataLogged(exchangeIdx))
+        {
+            CExperimentLogger::AddValues(m_Chains[0].m_Temperature, m_Chains[0].m_Current->m_Fitness);
+        }
+    }
+
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        isStopped = true;
+    }
+    segmentStarted.notify_all();
+    for (std::thread& worker : workers)
+    {
+        worker.join();
+    }
+
+    // Best solution of all chains is the result, it is kept as the current solution until the method is reset
+    SChain* bestChain = &m_Chains[0];
+    for (SChain& chain : m_Chains)
+    {
+        if (CAggregatedFitness::CalculateDelta(*chain.m_Best, *bestChain->m_Best, m_ObjectiveWeights) < 0)
+        {
+            bestChain = &chain;
+        }
+    }
+    Reset();
+    m_CurrentSolution = bestChain->m_Best;
+    bestChain->m_Best = nullptr;
+    for (SChain& chain : m_Chains)
+    {
+        delete chain.m_Current;
+        delete chain.m_Neighbor;
+        delete chain.m_Best;
+    }
+    m_Chains.clear();
+
+    for (const std::exception_ptr& error : errors)
+    {
+        if (error)
+        {
+            std::rethrow_exception(error);
+        }
+    }
+
+    CSOExperimentUtils::LogResultData(*m_CurrentSolution, m_Problem);
+}
+
 void CSA::InitializeSolution()
+{
+    Reset();
+    m_CurrentSolution = CreateEvaluatedSolution();
+    m_NeighborSolution = new SSOIndividual(*m_CurrentSolution);
+}
+
+SSOIndividual* CSA::CreateEvaluatedSolution()
 {
     SProblemEncoding& problemEncoding = m_Problem.GetProblemEncoding();
-    m_CurrentSolution = m_Initialization.CreateSOIndividual(problemEncoding);
-    m_Problem.Evaluate(*m_CurrentSolution);
-    CAggregatedFitness::CountFitness(*m_CurrentSolution, m_ObjectiveWeights);
+    SSOIndividual* solution = m_Initialization.CreateSOIndividual(problemEncoding);
+    m_Problem.Evaluate(*solution);
+    CAggregatedFitness::CountFitness(*solution, m_ObjectiveWeights);
+    return solution;
 }
 
-void CSA::Iterate(double temperature)
+bool CSA::Iterate(SSOIndividual*& currentSolution, SSOIndividual*& neighborSolution, double temperature)
 {
-    SSOIndividual* neighborSolution = m_Initialization.CreateNeighborSolution(m_Problem.GetProblemEncoding(), *m_CurrentSolution);
+    m_Initialization.CreateNeighborSolution(m_Problem.GetProblemEncoding(), *currentSolution, *neighborSolution);
     m_Problem.Evaluate(*neighborSolution);
     CAggregatedFitness::CountFitness(*neighborSolution, m_ObjectiveWeights);
     
-    double delta = CAggregatedFitness::CalculateDelta(*neighborSolution, *m_CurrentSolution, m_ObjectiveWeights);
+    double delta = CAggregatedFitness::CalculateDelta(*neighborSolution, *currentSolution, m_ObjectiveWeights);
 
     if (delta < 0 || (exp(-delta / temperature) > CRandom::GetFloat(0.0f, 1.0f)))
     {
-        delete m_CurrentSolution;
-        m_CurrentSolution = neighborSolution;
+        std::swap(currentSolution, neighborSolution);
+        return true;
     }
-    else
+    return false;
+}
+
+void CSA::RunChain(SChain& chain, size_t iterationsCount)
+{
+    CRandom::SetSeed(chain.m_Seed);
+    for (size_t i = 0; i < iterationsCount; ++i)
+    {
+        if (Iterate(chain.m_Current, chain.m_Neighbor, chain.m_Temperature)
+            && CAggregatedFitness::CalculateDelta(*chain.m_Current, *chain.m_Best, m_ObjectiveWeights) < 0)
+        {
+            *chain.m_Best = *chain.m_Current;
+        }
+    }
+}
+
+void CSA::ExchangeReplicas(size_t exchangeIdx)
+{
+    // Even and odd pairs of neighbouring temperatures take turns, a hotter chain with a better solution
+    // always passes it down the ladder
+    for (size_t k = exchangeIdx % 2; k + 1 < m_Chains.size(); k += 2)
     {
-        delete neighborSolution;
+        SChain& colderChain = m_Chains[k];
+        SChain& hotterChain = m_Chains[k + 1];
+        double delta = CAggregatedFitness::CalculateDelta(*hotterChain.m_Current, *colderChain.m_Current, m_ObjectiveWeights);
+        double inverseTemperaturesDiff = 1.0 / colderChain.m_Temperature - 1.0 / hotterChain.m_Temperature;
+        if (delta < 0 || exp(-delta * inverseTemperaturesDiff) > CRandom::GetFloat(0.0f, 1.0f))
+        {
+            std::swap(colderChain.m_Current, hotterChain.m_Current);
+        }
     }
 }
 
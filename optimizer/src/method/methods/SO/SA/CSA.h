@@ -13,16 +13,36 @@ public:
 
     void RunOptimization();
 
-    void Reset() { delete m_CurrentSolution; }
+    void Reset() override;
 
 private:
-    SSOIndividual* m_CurrentSolution;
+    // Markov chain of parallel tempering, the neighbor is generated in place and swapped with the current solution when accepted
+    struct SChain
+    {
+        SSOIndividual* m_Current = nullptr;
+        SSOIndividual* m_Neighbor = nullptr;
+        SSOIndividual* m_Best = nullptr;
+        double m_Temperature = 0.0;
+        unsigned int m_Seed = 0;
+    };
+
+    SSOIndividual* m_CurrentSolution = nullptr;
+    SSOIndividual* m_NeighborSolution = nullptr;
 
     double m_InitialTemperature;
     double m_FinalTemperature;
     double m_CoolingRate;
 
+    // Parallel tempering runs more than one chain, chains exchange solutions every SwapInterval iterations
+    size_t m_ChainsCount = 1;
+    size_t m_SwapInterval = 10;
+    std::vector<SChain> m_Chains;
+
+    void RunAnnealing();
+    void RunParallelTempering();
     void InitializeSolution();
-    void Iterate(double temperature);
+    SSOIndividual* CreateEvaluatedSolution();
+    bool Iterate(SSOIndividual*& currentSolution, SSOIndividual*& neighborSolution, double temperature);
+    void RunChain(SChain& chain, size_t iterationsCount);
+    void ExchangeReplicas(size_t exchangeIdx);
 };
-
@@ -45,7 +45,10 @@ void CTS::RunOptimization()
             }
         }
         
-        CExperimentLogger::AddLine((std::to_string(delta) + ";" + std::to_string(m_CurrentSolution->m_Fitness)).c_str());
+        if (CExperimentLogger::IsDataLogged(iteration))
+        {
+            CExperimentLogger::AddValues(delta, m_CurrentSolution->m_Fitness);
+        }
     }
 
     CSOExperimentUtils::LogResultData(*m_CurrentSolution, m_Problem);
@@ -89,14 +92,8 @@ bool CTS::IsTabu(const std::shared_ptr<SSOIndividual> candidate)
         if (intSimilarityPercentage > m_SimilarityThreshold) return true;
 
         // Check similarity for m_BoolGenotype
-        int boolSimilarityCount = 0;
-        for (size_t i = 0; i < candidate->m_Genotype.m_BoolGenotype.size(); i++)
-        {
-            if (candidate->m_Genotype.m_BoolGenotype[i] == tabuSolution->m_Genotype.m_BoolGenotype[i])
-            {
-                boolSimilarityCount++;
-            }
-        }
+        size_t boolSimilarityCount = candidate->m_Genotype.m_BoolGenotype.size()
+                                     - candidate->m_Genotype.m_BoolGenotype.HammingDistance(tabuSolution->m_Genotype.m_BoolGenotype);
         float boolSimilarityPercentage = static_cast<float>(boolSimilarityCount) / candidate->m_Genotype.m_BoolGenotype.size();
         if (boolSimilarityPercentage > m_SimilarityThreshold) return true;
     }
@@ -1,11 +1,17 @@
 #include "CSOExperimentUtils.h"
 #include "../../../../../utils/logger/CExperimentLogger.h"
+#include "../../../../individual/CGenotypeCSV.h"
 #include <algorithm>
 #include <string>
 #include <sstream>
 
 void CSOExperimentUtils::AddExperimentData(const int generation, const std::vector<SSOIndividual*>& population)
 {
+    if (!CExperimentLogger::IsDataLogged(generation))
+    {
+        return;
+    }
+
     auto* best = *std::min_element(population.begin(), population.end(),
                                             [](const auto &a, const auto &b)
                                             {
@@ -24,38 +30,7 @@ void CSOExperimentUtils::AddExperimentData(const int generation, const std::vect
     }
     float meanFitness = totalFitness / float(population.size());
 
-    std::string generationData = std::to_string(generation) + ';' +
-                                 std::to_string(best->m_Fitness) + ';' +
-                                 std::to_string(worst->m_Fitness) + ';' +
-                                 std::to_string(meanFitness);
-    CExperimentLogger::AddLine(generationData.c_str());
-}
-
-void CSOExperimentUtils::AddExperimentData(int generation, const std::vector<SParticle *> &swarm)
-{
-    auto* best = *std::min_element(swarm.begin(), swarm.end(),
-                                   [](const auto &a, const auto &b)
-                                   {
-                                       return a->m_Fitness < b->m_Fitness;
-                                   });
-    auto* worst = *std::max_element(swarm.begin(), swarm.end(),
-                                    [](const auto &a, const auto &b)
-                                    {
-                                        return a->m_Fitness < b->m_Fitness;
-                                    });
-
-    float totalFitness = 0.0;
-    for (const auto& individual: swarm)
-    {
-        totalFitness += individual->m_Fitness;
-    }
-    float meanFitness = totalFitness / float(swarm.size());
-
-    std::string generationData = std::to_string(generation) + ';' +
-                                 std::to_string(best->m_Fitness) + ';' +
-                                 std::to_string(worst->m_Fitness) + ';' +
-                                 std::to_string(meanFitness);
-    CExperimentLogger::AddLine(generationData.c_str());
+    CExperimentLogger::AddValues(generation, best->m_Fitness, worst->m_Fitness, meanFitness);
 }
 
 SSOIndividual* CSOExperimentUtils::FindBest(const std::vector<SSOIndividual *> &population)
@@ -67,15 +42,6 @@ SSOIndividual* CSOExperimentUtils::FindBest(const std::vector<SSOIndividual *> &
                       });
 }
 
-SSOIndividual* CSOExperimentUtils::FindBest(const std::vector<SParticle *> &swarm)
-{
-    return *std::min_element(swarm.begin(), swarm.end(),
-                             [](const auto &a, const auto &b)
-                             {
-                                 return a->m_Fitness < b->m_Fitness;
-                             });
-}
-
 void CSOExperimentUtils::LogResultData(SSOIndividual& best, AProblem& problem)
 {
     CExperimentLogger::LogData();
@@ -85,6 +51,10 @@ void CSOExperimentUtils::LogResultData(SSOIndividual& best, AProblem& problem)
 
     //CExperimentLogger::LogResult(header.c_str());
     CExperimentLogger::LogResult(resultString.c_str());
+
+    std::ostringstream genotype;
+    CGenotypeCSV::ToCSV(genotype, best.m_Genotype);
+    CExperimentLogger::LogResult(genotype.str().c_str(), CGenotypeCSV::s_FileName);
     problem.LogSolution(best);
 }
 
@@ -0,0 +1,61 @@
+#include "CSBX.h"
+#include "utils/random/CRandom.h"
+#include <algorithm>
+#include <cmath>
+
+static constexpr float SBX_EPS = 1.0e-7f;
+
+/// <summary>
+/// simulated binary crossover of Deb and Agrawal with bounded genes.
+/// every gene is recombined with probability 0.5 and children genes are swapped with probability 0.5.
+/// </summary>
+void CSBX::Crossover(const SProblemEncoding& problemEncoding, AIndividual &firstParent, AIndividual &secondParent,
+                     AIndividual &firstChild,
+                     AIndividual &secondChild)
+{
+    if (CRandom::GetFloat(0.0f, 1.0f) >= m_CrossoverProbability)
+    {
+        return;
+    }
+
+    const std::vector<SEncodingDescriptor> &genesBounds = problemEncoding.m_Encoding[0].m_SectionDescription;
+    for (size_t g = 0; g < genesBounds.size(); ++g)
+    {
+        float firstValue = firstParent.m_Genotype.m_FloatGenotype[g];
+        float secondValue = secondParent.m_Genotype.m_FloatGenotype[g];
+        if (CRandom::GetFloat(0.0f, 1.0f) >= 0.5f || std::fabs(firstValue - secondValue) <= SBX_EPS)
+        {
+            continue;
+        }
+
+        float lowerValue = std::min(firstValue, secondValue);
+        float upperValue = std::max(firstValue, secondValue);
+        float minValue = genesBounds[g].m_MinValue;
+        float maxValue = genesBounds[g].m_MaxValue;
+        float randomValue = CRandom::GetFloat(0.0f, 1.0f);
+
+        float beta = 1.f + 2.f * (lowerValue - minValue) / (upperValue - lowerValue);
+        float firstChildValue = 0.5f * ((lowerValue + upperValue) - GetSpreadFactor(randomValue, beta) * (upperValue - lowerValue));
+        beta = 1.f + 2.f * (maxValue - upperValue) / (upperValue - lowerValue);
+        float secondChildValue = 0.5f * ((lowerValue + upperValue) + GetSpreadFactor(randomValue, beta) * (upperValue - lowerValue));
+
+        firstChildValue = std::clamp(firstChildValue, minValue, maxValue);
+        secondChildValue = std::clamp(secondChildValue, minValue, maxValue);
+        if (CRandom::GetFloat(0.0f, 1.0f) < 0.5f)
+        {
+            std::swap(firstChildValue, secondChildValue);
+        }
+        firstChild.m_Genotype.m_FloatGenotype[g] = firstChildValue;
+        secondChild.m_Genotype.m_FloatGenotype[g] = secondChildValue;
+    }
+}
+
+float CSBX::GetSpreadFactor(float randomValue, float beta) const
+{
+    float alpha = 2.f - std::pow(beta, -(m_DistributionIndex + 1.f));
+    if (randomValue <= 1.f / alpha)
+    {
+        return std::pow(randomValue * alpha, 1.f / (m_DistributionIndex + 1.f));
+    }
+    return std::pow(1.f / (2.f - randomValue * alpha), 1.f / (m_DistributionIndex + 1.f));
+}
@@ -0,0 +1,25 @@
+#pragma once
+
+#include "../ACrossover.h"
+
+class CSBX : public ACrossover
+{
+public:
+    CSBX(float crossoverProbability, float distributionIndex)
+        : m_CrossoverProbability(crossoverProbability)
+        , m_DistributionIndex(distributionIndex)
+    {};
+    ~CSBX() override = default;
+
+    void Crossover(
+            const SProblemEncoding& problemEncoding,
+            AIndividual &firstParent,
+            AIndividual &secondParent,
+            AIndividual &firstChild,
+            AIndividual &secondChild) override;
+private:
+    float m_CrossoverProbability;
+    float m_DistributionIndex;
+
+    float GetSpreadFactor(float randomValue, float beta) const;
+};
@@ -58,22 +58,19 @@ void CTTP_OS_SX::Crossover(const SProblemEncoding& problemEncoding, AIndividual
             // Knapsack Crossover
             if (CRandom::GetFloat(0, 1) < m_KnapCrProb)
             {
-                size_t point = CRandom::GetInt(0, int(sectionSize));
-
-                for (size_t g = 0; g < sectionSize; ++g)
-                {
-                    if (g < point)
-                    {
-                        firstChild.m_Genotype.m_BoolGenotype[g] = firstParentGenes.m_BoolGenotype[g];
-                        secondChild.m_Genotype.m_BoolGenotype[g] = secondParentGenes.m_BoolGenotype[g];
-                    }
-                    else
-                    {
-                        firstChild.m_Genotype.m_BoolGenotype[g] = secondParentGenes.m_BoolGenotype[g];
-                        secondChild.m_Genotype.m_BoolGenotype[g] = firstParentGenes.m_BoolGenotype[g];
-                    }
-                }
+                KnapsackCrossover(sectionSize, firstParentGenes, secondParentGenes, firstChild.m_Genotype, secondChild.m_Genotype);
             }
         }
     }
 }
+
+void CTTP_OS_SX::KnapsackCrossover(size_t sectionSize, const SGenotype &firstParentGenes, const SGenotype &secondParentGenes,
+                                   SGenotype &firstChildGenes, SGenotype &secondChildGenes)
+{
+    size_t point = CRandom::GetInt(0, int(sectionSize));
+
+    firstChildGenes.m_BoolGenotype.CopyRange(firstParentGenes.m_BoolGenotype, 0, point);
+    firstChildGenes.m_BoolGenotype.CopyRange(secondParentGenes.m_BoolGenotype, point, sectionSize);
+    secondChildGenes.m_BoolGenotype.CopyRange(secondParentGenes.m_BoolGenotype, 0, point);
+    secondChildGenes.m_BoolGenotype.CopyRange(firstParentGenes.m_BoolGenotype, point, sectionSize);
+}
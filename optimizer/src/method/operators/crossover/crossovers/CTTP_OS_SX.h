@@ -15,6 +15,11 @@ public:
             AIndividual &secondParent,
             AIndividual &firstChild,
             AIndividual &secondChild) override;
+protected:
+    // Single point crossover of the items, whole words of the packed bits are copied
+    virtual void KnapsackCrossover(size_t sectionSize, const SGenotype &firstParentGenes, const SGenotype &secondParentGenes,
+                                   SGenotype &firstChildGenes, SGenotype &secondChildGenes);
+
 private:
     float m_RouteCrProb;
     float m_KnapCrProb;
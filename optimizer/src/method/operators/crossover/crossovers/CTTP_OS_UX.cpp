@@ -0,0 +1,19 @@
+#include "CTTP_OS_UX.h"
+#include "../../../../utils/random/CRandom.h"
+
+void CTTP_OS_UX::KnapsackCrossover(size_t sectionSize, const SGenotype &firstParentGenes, const SGenotype &secondParentGenes,
+                                   SGenotype &firstChildGenes, SGenotype &secondChildGenes)
+{
+    const std::vector<uint64_t> &firstParentWords = firstParentGenes.m_BoolGenotype.GetWords();
+    const std::vector<uint64_t> &secondParentWords = secondParentGenes.m_BoolGenotype.GetWords();
+    std::vector<uint64_t> &firstChildWords = firstChildGenes.m_BoolGenotype.GetWords();
+    std::vector<uint64_t> &secondChildWords = secondChildGenes.m_BoolGenotype.GetWords();
+
+    // Bits past the section size are zero in both parents, so they stay zero in the children
+    for (size_t w = 0; w < CBitset::GetWordsCount(sectionSize); ++w)
+    {
+        uint64_t mask = CRandom::GetBits();
+        firstChildWords[w] = (firstParentWords[w] & ~mask) | (secondParentWords[w] & mask);
+        secondChildWords[w] = (secondParentWords[w] & ~mask) | (firstParentWords[w] & mask);
+    }
+}
@@ -0,0 +1,16 @@
+#pragma once
+
+#include "CTTP_OS_SX.h"
+
+// Same route crossover as TTP_OX_SX, items are exchanged by uniform crossover with a random mask per word of packed bits
+class CTTP_OS_UX : public CTTP_OS_SX
+{
+public:
+    explicit CTTP_OS_UX(float routeCrProb, float knapCrProb) : CTTP_OS_SX(routeCrProb, knapCrProb)
+    {};
+    ~CTTP_OS_UX() override = default;
+
+protected:
+    void KnapsackCrossover(size_t sectionSize, const SGenotype &firstParentGenes, const SGenotype &secondParentGenes,
+                           SGenotype &firstChildGenes, SGenotype &secondChildGenes) override;
+};
@@ -5,7 +5,6 @@
 #include "../../individual/MO/SMOIndividual.h"
 #include "../../individual/SGenotype.h"
 #include "../../individual/SO/SSOIndividual.h"
-#include "../../individual/SO/SParticle.h"
 #include "../../../problem/problems/ECVRPTW/CECVRPTW.h"
 
 class AInitialization
@@ -17,5 +16,6 @@ public:
     virtual SSOIndividual* CreateSOIndividual(SProblemEncoding &encoding, SGenotype& genotype) = 0;
     virtual SMOIndividual* CreateMOIndividual(SProblemEncoding &encoding) = 0;
     virtual SSOIndividual* CreateNeighborSolution(SProblemEncoding &encoding, const SSOIndividual &baseSolution) = 0;
-    virtual SParticle* CreateParticle(SProblemEncoding &encoding) = 0;
+    // Same as above, but the neighbor is written into an existing individual, so its vectors are reused
+    virtual void CreateNeighborSolution(SProblemEncoding &encoding, const SSOIndividual &baseSolution, SSOIndividual &neighborSolution) = 0;
 };
@@ -14,7 +14,7 @@ public:
     SSOIndividual* CreateSOIndividual(SProblemEncoding& encoding, SGenotype& genotype) override;
     SMOIndividual* CreateMOIndividual(SProblemEncoding& encoding) override;
     SSOIndividual* CreateNeighborSolution(SProblemEncoding& encoding, const SSOIndividual& baseSolution) override;
-    SParticle* CreateParticle(SProblemEncoding& encoding) override;
+    void CreateNeighborSolution(SProblemEncoding& encoding, const SSOIndividual& baseSolution, SSOIndividual& neighborSolution) override;
 private:
     void InitGenotype(SProblemEncoding& encoding, SGenotype& genotype) const;
     CECVRPTW& m_Problem;
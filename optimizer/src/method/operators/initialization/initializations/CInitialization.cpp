@@ -31,20 +31,17 @@ SMOIndividual* CInitialization::CreateMOIndividual(SProblemEncoding &encoding)
     return new SMOIndividual(genotype, emptyEvaluation, emptyNormalizedEvaluation);
 }
 
-SParticle* CInitialization::CreateParticle(SProblemEncoding &encoding)
+SSOIndividual* CInitialization::CreateNeighborSolution(SProblemEncoding &encoding, const SSOIndividual &baseSolution)
 {
-    SGenotype genotype;
-    InitGenotype(encoding, genotype);
-    std::vector<float> emptyEvaluation(encoding.m_objectivesNumber, 0);
-    std::vector<float> emptyNormalizedEvaluation(encoding.m_objectivesNumber, 0);
-    std::vector<float> velocity;
+    auto* newSolution = new SSOIndividual(baseSolution);
+    CreateNeighborSolution(encoding, baseSolution, *newSolution);
 
-    return new SParticle(genotype, emptyEvaluation, emptyNormalizedEvaluation, velocity);
+    return newSolution;
 }
 
-SSOIndividual* CInitialization::CreateNeighborSolution(SProblemEncoding &encoding, const SSOIndividual &baseSolution)
+void CInitialization::CreateNeighborSolution(SProblemEncoding &encoding, const SSOIndividual &baseSolution, SSOIndividual &neighborSolution)
 {
-    auto* newSolution = new SSOIndividual(baseSolution);
+    neighborSolution = baseSolution;
 
     // Iterate through each encoding section of the problem
     for (auto &section: encoding.m_Encoding)
@@ -56,7 +53,7 @@ SSOIndividual* CInitialization::CreateNeighborSolution(SProblemEncoding &encodin
                 int randomIndex = CRandom::GetInt(0, section.m_SectionDescription.size());
                 float minVal = section.m_SectionDescription[randomIndex].m_MinValue;
                 float maxVal = section.m_SectionDescription[randomIndex].m_MaxValue;
-                newSolution->m_Genotype.m_FloatGenotype[randomIndex] = CRandom::GetFloat(minVal, maxVal);
+                neighborSolution.m_Genotype.m_FloatGenotype[randomIndex] = CRandom::GetFloat(minVal, maxVal);
                 break;
             }
             case EEncodingType::PERMUTATION:
@@ -64,19 +61,17 @@ SSOIndividual* CInitialization::CreateNeighborSolution(SProblemEncoding &encodin
                 int index1 = CRandom::GetInt(0, section.m_SectionDescription.size());
                 int index2 = CRandom::GetInt(0, section.m_SectionDescription.size());
 
-                std::swap(newSolution->m_Genotype.m_IntGenotype[index1], newSolution->m_Genotype.m_IntGenotype[index2]);
+                std::swap(neighborSolution.m_Genotype.m_IntGenotype[index1], neighborSolution.m_Genotype.m_IntGenotype[index2]);
                 break;
             }
             case EEncodingType::BINARY:
             {
                 int randomIndex = CRandom::GetInt(0, section.m_SectionDescription.size());
-                newSolution->m_Genotype.m_BoolGenotype[randomIndex] = !newSolution->m_Genotype.m_BoolGenotype[randomIndex];
+                neighborSolution.m_Genotype.m_BoolGenotype.Flip(randomIndex);
                 break;
             }
         }
     }
-
-    return newSolution;
 }
 
 void CInitialization::InitGenotype(SProblemEncoding &encoding, SGenotype &genotype) const
@@ -0,0 +1,228 @@
+#include <algorithm>
+#include <filesystem>
+#include <fstream>
+#include <iostream>
+#include <numeric>
+#include <set>
+#include <sstream>
+#include <stdexcept>
+#include "CWarmStartInitialization.h"
+#include "../../../AMethod.h"
+#include "../../../individual/CGenotypeCSV.h"
+#include "../../../../problem/problems/ECVRPTW/CECVRPTWTemplate.h"
+#include "../../../../utils/random/CRandom.h"
+
+CWarmStartInitialization::CWarmStartInitialization(AInitialization* baseInitialization, SProblemEncoding& encoding,
+                                                   const std::string& sources, size_t maxCount)
+        : m_BaseInitialization(baseInitialization)
+        , m_MaxCount(maxCount)
+{
+    // Runs of the same instance often end in the same solutions, every genotype is kept once
+    std::set<std::string> knownLines;
+    size_t rejectedCount = 0;
+    std::stringstream sourcesStream(sources);
+    std::string source;
+    while (std::getline(sourcesStream, source, ','))
+    {
+        source.erase(0, source.find_first_not_of(' '));
+        source.erase(source.find_last_not_of(' ') + 1);
+        if (source.empty())
+        {
+            continue;
+        }
+        if (!std::filesystem::exists(source))
+        {
+            throw std::runtime_error("Warm start source does not exist: " + source);
+        }
+
+        if (std::filesystem::is_directory(source))
+        {
+            // Files are sorted, so the loaded genotypes do not depend on the order of directory entries
+            std::vector<std::string> paths;
+            for (const auto& entry: std::filesystem::recursive_directory_iterator(source))
+            {
+                if (entry.is_regular_file() && entry.path().filename() == CGenotypeCSV::s_FileName)
+                {
+                    paths.push_back(entry.path().string());
+                }
+            }
+            std::sort(paths.begin(), paths.end());
+            for (const std::string& path: paths)
+            {
+                LoadGenotypes(path, encoding, knownLines, rejectedCount);
+            }
+        }
+        else
+        {
+            LoadGenotypes(source, encoding, knownLines, rejectedCount);
+        }
+    }
+
+    std::cout << "Warm start: " + std::to_string(m_Genotypes.size()) + " genotypes loaded, "
+                 + std::to_string(rejectedCount) + " rejected\n" << std::flush;
+}
+
+void CWarmStartInitialization::LoadGenotypes(const std::string& path, const SProblemEncoding& encoding,
+                                             std::set<std::string>& knownLines, size_t& rejectedCount)
+{
+    std::ifstream readFileStream(path);
+    if (!readFileStream.is_open())
+    {
+        throw std::runtime_error("Unable to open warm start file: " + path);
+    }
+
+    std::string line;
+    SGenotype genotype;
+    while (std::getline(readFileStream, line))
+    {
+        line.erase(std::remove(line.begin(), line.end(), '\r'), line.end());
+        if (line.empty() || !knownLines.insert(line).second)
+        {
+            continue;
+        }
+        if (CGenotypeCSV::FromCSV(line, genotype) && IsValid(genotype, encoding))
+        {
+            m_Genotypes.push_back(genotype);
+        }
+        else
+        {
+            ++rejectedCount;
+        }
+    }
+}
+
+bool CWarmStartInitialization::IsValid(const SGenotype& genotype, const SProblemEncoding& encoding)
+{
+    size_t floatIdx = 0;
+    size_t intIdx = 0;
+    size_t boolIdx = 0;
+    std::vector<bool> isUsed;
+    for (const SEncodingSection& encodingSection: encoding.m_Encoding)
+    {
+        const std::vector<SEncodingDescriptor>& sectionDesc = encodingSection.m_SectionDescription;
+        switch (encodingSection.m_SectionType)
+        {
+            case EEncodingType::ASSOCIATION:
+            {
+                if (floatIdx + sectionDesc.size() > genotype.m_FloatGenotype.size())
+                {
+                    return false;
+                }
+                for (const SEncodingDescriptor& encDesc: sectionDesc)
+                {
+                    float gene = genotype.m_FloatGenotype[floatIdx++];
+                    if (!(gene >= encDesc.m_MinValue && gene <= encDesc.m_MaxValue))
+                    {
+                        return false;
+                    }
+                }
+                break;
+            }
+            case EEncodingType::PERMUTATION:
+            {
+                // Every value of the section range is used at most once. A section longer than its range holds routes
+                // (ECVRPTW), the remaining genes are vehicle delimiters and customers removed by the operators may be
+                // missing, otherwise the section holds each of its values once.
+                const int minValue = int(sectionDesc[0].m_MinValue);
+                const int maxValue = int(sectionDesc[0].m_MaxValue);
+                const size_t rangeSize = size_t(maxValue - minValue + 1);
+                const bool isRoute = rangeSize < sectionDesc.size();
+                size_t sectionSize = sectionDesc.size();
+                if (isRoute)
+                {
+                    sectionSize = std::min(sectionSize, genotype.m_IntGenotype.size() - intIdx);
+                }
+                else if (intIdx + sectionSize > genotype.m_IntGenotype.size())
+                {
+                    return false;
+                }
+                isUsed.assign(rangeSize, false);
+                size_t delimitersCount = 0;
+                for (size_t i = 0; i < sectionSize; ++i)
+                {
+                    int gene = genotype.m_IntGenotype[intIdx++];
+                    if (isRoute && gene == VEHICLE_DELIMITER)
+                    {
+                        ++delimitersCount;
+                        continue;
+                    }
+                    if (gene < minValue || gene > maxValue || isUsed[gene - minValue])
+                    {
+                        return false;
+                    }
+                    isUsed[gene - minValue] = true;
+                }
+                if (delimitersCount > sectionDesc.size() - rangeSize)
+                {
+                    return false;
+                }
+                break;
+            }
+            case EEncodingType::BINARY:
+            {
+                boolIdx += sectionDesc.size();
+                break;
+            }
+        }
+    }
+    return floatIdx == genotype.m_FloatGenotype.size() && intIdx == genotype.m_IntGenotype.size()
+           && boolIdx == genotype.m_BoolGenotype.size();
+}
+
+const SGenotype* CWarmStartInitialization::TakeGenotype()
+{
+    if (m_Run != AMethod::m_ExperimentRunCounter)
+    {
+        m_Run = AMethod::m_ExperimentRunCounter;
+        m_Order.resize(m_Genotypes.size());
+        std::iota(m_Order.begin(), m_Order.end(), 0);
+        CRandom::Shuffle(0, int(m_Order.size()), m_Order);
+        m_TakenCount = 0;
+    }
+    if (m_TakenCount >= std::min(m_MaxCount, m_Genotypes.size()))
+    {
+        return nullptr;
+    }
+    return &m_Genotypes[m_Order[m_TakenCount++]];
+}
+
+SSOIndividual* CWarmStartInitialization::CreateSOIndividual(SProblemEncoding& encoding)
+{
+    const SGenotype* warmGenotype = TakeGenotype();
+    if (warmGenotype == nullptr)
+    {
+        return m_BaseInitialization->CreateSOIndividual(encoding);
+    }
+    SGenotype genotype(*warmGenotype);
+    return m_BaseInitialization->CreateSOIndividual(encoding, genotype);
+}
+
+SSOIndividual* CWarmStartInitialization::CreateSOIndividual(SProblemEncoding& encoding, SGenotype& genotype)
+{
+    return m_BaseInitialization->CreateSOIndividual(encoding, genotype);
+}
+
+SMOIndividual* CWarmStartInitialization::CreateMOIndividual(SProblemEncoding& encoding)
+{
+    const SGenotype* warmGenotype = TakeGenotype();
+    if (warmGenotype == nullptr)
+    {
+        return m_BaseInitialization->CreateMOIndividual(encoding);
+    }
+    SGenotype genotype(*warmGenotype);
+    std::vector<float> emptyEvaluation(encoding.m_objectivesNumber, 0);
+    std::vector<float> emptyNormalizedEvaluation(encoding.m_objectivesNumber, 0);
+
+    return new SMOIndividual(genotype, emptyEvaluation, emptyNormalizedEvaluation);
+}
+
+SSOIndividual* CWarmStartInitialization::CreateNeighborSolution(SProblemEncoding& encoding, const SSOIndividual& baseSolution)
+{
+    return m_BaseInitialization->CreateNeighborSolution(encoding, baseSolution);
+}
+
+void CWarmStartInitialization::CreateNeighborSolution(SProblemEncoding& encoding, const SSOIndividual& baseSolution,
+                                                      SSOIndividual& neighborSolution)
+{
+    m_BaseInitialization->CreateNeighborSolution(encoding, baseSolution, neighborSolution);
+}
@@ -0,0 +1,39 @@
+#pragma once
+
+#include <memory>
+#include <set>
+#include <string>
+#include <vector>
+#include "../AInitialization.h"
+
+// Seeds initial individuals with genotypes of earlier runs (genotypes.csv files of their run directories), the rest
+// is created by the base initialization. Genotypes not matching the problem encoding are rejected when loaded.
+class CWarmStartInitialization : public AInitialization
+{
+public:
+    // Sources are run directories, result directories searched recursively or genotypes files, separated by ','
+    CWarmStartInitialization(AInitialization* baseInitialization, SProblemEncoding& encoding, const std::string& sources,
+                             size_t maxCount);
+    ~CWarmStartInitialization() override = default;
+
+    SSOIndividual* CreateSOIndividual(SProblemEncoding& encoding) override;
+    SSOIndividual* CreateSOIndividual(SProblemEncoding& encoding, SGenotype& genotype) override;
+    SMOIndividual* CreateMOIndividual(SProblemEncoding& encoding) override;
+    SSOIndividual* CreateNeighborSolution(SProblemEncoding& encoding, const SSOIndividual& baseSolution) override;
+    void CreateNeighborSolution(SProblemEncoding& encoding, const SSOIndividual& baseSolution, SSOIndividual& neighborSolution) override;
+
+private:
+    void LoadGenotypes(const std::string& path, const SProblemEncoding& encoding, std::set<std::string>& knownLines,
+                       size_t& rejectedCount);
+    static bool IsValid(const SGenotype& genotype, const SProblemEncoding& encoding);
+    const SGenotype* TakeGenotype();
+
+    std::unique_ptr<AInitialization> m_BaseInitialization;
+    std::vector<SGenotype> m_Genotypes;
+    size_t m_MaxCount;
+
+    // Every run takes genotypes in its own random order, from the beginning
+    std::vector<int> m_Order;
+    size_t m_TakenCount = 0;
+    int m_Run = -1;
+};
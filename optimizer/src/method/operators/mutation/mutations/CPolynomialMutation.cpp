@@ -0,0 +1,38 @@
+#include "CPolynomialMutation.h"
+#include "utils/random/CRandom.h"
+#include <algorithm>
+#include <cmath>
+
+// Bounded polynomial mutation of Deb, every gene is mutated with the mutation probability
+void CPolynomialMutation::Mutate(SProblemEncoding& problemEncoding, AIndividual &child)
+{
+    const float mutationPower = 1.f / (m_DistributionIndex + 1.f);
+    const std::vector<SEncodingDescriptor> &genesBounds = problemEncoding.m_Encoding[0].m_SectionDescription;
+    for (size_t g = 0; g < genesBounds.size(); ++g)
+    {
+        if (CRandom::GetFloat(0, 1) >= m_MutationProbability)
+        {
+            continue;
+        }
+
+        float minValue = genesBounds[g].m_MinValue;
+        float maxValue = genesBounds[g].m_MaxValue;
+        float value = child.m_Genotype.m_FloatGenotype[g];
+        float randomValue = CRandom::GetFloat(0, 1);
+
+        float deltaQ;
+        if (randomValue < 0.5f)
+        {
+            float xy = 1.f - (value - minValue) / (maxValue - minValue);
+            float val = 2.f * randomValue + (1.f - 2.f * randomValue) * std::pow(xy, m_DistributionIndex + 1.f);
+            deltaQ = std::pow(val, mutationPower) - 1.f;
+        }
+        else
+        {
+            float xy = 1.f - (maxValue - value) / (maxValue - minValue);
+            float val = 2.f * (1.f - randomValue) + 2.f * (randomValue - 0.5f) * std::pow(xy, m_DistributionIndex + 1.f);
+            deltaQ = 1.f - std::pow(val, mutationPower);
+        }
+        child.m_Genotype.m_FloatGenotype[g] = std::clamp(value + deltaQ * (maxValue - minValue), minValue, maxValue);
+    }
+}
@@ -0,0 +1,19 @@
+#pragma once
+
+#include "../AMutation.h"
+#include "../../../../problem/SProblemEncoding.h"
+
+class CPolynomialMutation : public AMutation
+{
+public:
+    CPolynomialMutation(float mutationProbability, float distributionIndex)
+        : m_MutationProbability(mutationProbability)
+        , m_DistributionIndex(distributionIndex)
+    {};
+    ~CPolynomialMutation() override = default;
+
+    void Mutate(SProblemEncoding& problemEncoding, AIndividual &child) override;
+private:
+    float m_MutationProbability;
+    float m_DistributionIndex;
+};
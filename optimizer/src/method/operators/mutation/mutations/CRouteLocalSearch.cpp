@@ -0,0 +1,285 @@
+#include <algorithm>
+#include "CRouteLocalSearch.h"
+#include "utils/random/CRandom.h"
+
+CRouteLocalSearch::CRouteLocalSearch(AMutation* baseMutation, const std::vector<std::vector<float>>& distances,
+                                     float probability, size_t neighboursCount, size_t budget)
+    : m_BaseMutation(baseMutation)
+    , m_Distances(distances)
+    , m_Probability(probability)
+    , m_Budget(budget)
+{
+    const size_t citiesCount = m_Distances.size();
+    neighboursCount = std::min(neighboursCount, citiesCount > 0 ? citiesCount - 1 : 0);
+    m_Neighbours.resize(citiesCount);
+    std::vector<int> cities;
+    for (size_t city = 0; city < citiesCount; ++city)
+    {
+        cities.clear();
+        for (size_t other = 0; other < citiesCount; ++other)
+        {
+            if (other != city)
+            {
+                cities.push_back(int(other));
+            }
+        }
+        const std::vector<float>& row = m_Distances[city];
+        std::partial_sort(cities.begin(), cities.begin() + neighboursCount, cities.end(), [&row](int a, int b)
+        {
+            return row[a] < row[b] || (row[a] == row[b] && a < b);
+        });
+        m_Neighbours[city].assign(cities.begin(), cities.begin() + neighboursCount);
+    }
+}
+
+void CRouteLocalSearch::Mutate(SProblemEncoding& problemEncoding, AIndividual& child)
+{
+    m_BaseMutation->Mutate(problemEncoding, child);
+    if (m_Probability < 1.f && CRandom::GetFloat(0, 1) >= m_Probability)
+    {
+        return;
+    }
+    Improve(child.m_Genotype.m_IntGenotype);
+}
+
+void CRouteLocalSearch::Improve(std::vector<int>& route)
+{
+    const size_t citiesCount = route.size();
+    if (citiesCount < 5)
+    {
+        return;
+    }
+    m_Route = &route;
+    m_Positions.resize(citiesCount);
+    UpdatePositions(0, citiesCount);
+
+    m_Queue.clear();
+    m_QueueHead = 0;
+    m_IsQueued.assign(citiesCount, 0);
+    for (int city: route)
+    {
+        Push(city);
+    }
+
+    m_EvaluatedCount = 0;
+    while (m_QueueHead < m_Queue.size() && !IsBudgetExhausted())
+    {
+        int city = m_Queue[m_QueueHead++];
+        m_IsQueued[city] = 0;
+        if (TryTwoOpt(city) || TryOrOpt(city))
+        {
+            Push(city);
+        }
+    }
+    m_Route = nullptr;
+}
+
+bool CRouteLocalSearch::TryTwoOpt(int city)
+{
+    const size_t position = m_Positions[city];
+
+    // Edges (city, next) and (neighbour, its next) become (city, neighbour) and (next, next of neighbour)
+    const int next = Next(position);
+    const double nextDistance = Distance(city, next);
+    for (int neighbour: m_Neighbours[city])
+    {
+        const double gain = nextDistance - Distance(city, neighbour);
+        if (gain <= s_MinGain || IsBudgetExhausted())
+        {
+            break;
+        }
+        ++m_EvaluatedCount;
+        const size_t neighbourPosition = m_Positions[neighbour];
+        const int neighbourNext = Next(neighbourPosition);
+        if (neighbour == next || neighbourNext == city)
+        {
+            continue;
+        }
+        if (Distance(next, neighbourNext) - Distance(neighbour, neighbourNext) - gain < -s_MinGain)
+        {
+            ApplyTwoOpt(position, neighbourPosition);
+            Push(next);
+            Push(neighbour);
+            Push(neighbourNext);
+            return true;
+        }
+    }
+
+    // Edges (previous, city) and (previous of neighbour, neighbour) become (previous, previous of neighbour)
+    // and (city, neighbour)
+    const size_t citiesCount = m_Route->size();
+    const int previous = Previous(position);
+    const double previousDistance = Distance(previous, city);
+    for (int neighbour: m_Neighbours[city])
+    {
+        const double gain = previousDistance - Distance(city, neighbour);
+        if (gain <= s_MinGain || IsBudgetExhausted())
+        {
+            break;
+        }
+        ++m_EvaluatedCount;
+        const size_t neighbourPosition = m_Positions[neighbour];
+        const int neighbourPrevious = Previous(neighbourPosition);
+        if (neighbour == previous || neighbourPrevious == city)
+        {
+            continue;
+        }
+        if (Distance(previous, neighbourPrevious) - Distance(neighbourPrevious, neighbour) - gain < -s_MinGain)
+        {
+            ApplyTwoOpt((position + citiesCount - 1) % citiesCount, (neighbourPosition + citiesCount - 1) % citiesCount);
+            Push(previous);
+            Push(neighbour);
+            Push(neighbourPrevious);
+            return true;
+        }
+    }
+    return false;
+}
+
+bool CRouteLocalSearch::TryOrOpt(int city)
+{
+    const std::vector<int>& route = *m_Route;
+    const size_t citiesCount = route.size();
+    const size_t position = m_Positions[city];
+    if (position == 0)
+    {
+        return false;
+    }
+
+    // Segments starting at the city are moved between a neighbour of one of their ends and the city before
+    // or after that neighbour, the end joins the neighbour
+    for (size_t length = 1; length <= s_MaxSegmentLength && position + length <= citiesCount; ++length)
+    {
+        const size_t lastPosition = position + length - 1;
+        const int first = city;
+        const int last = route[lastPosition];
+        const int previous = route[position - 1];
+        const int next = Next(lastPosition);
+        const double removalGain = Distance(previous, first) + Distance(last, next) - Distance(previous, next);
+        if (removalGain <= s_MinGain)
+        {
+            continue;
+        }
+
+        for (int end: { first, last })
+        {
+            if (length == 1 && end == last)
+            {
+                break;
+            }
+            const int otherEnd = end == first ? last : first;
+            for (int neighbour: m_Neighbours[end])
+            {
+                if (Distance(end, neighbour) >= removalGain - s_MinGain || IsBudgetExhausted())
+                {
+                    break;
+                }
+                const size_t neighbourPosition = m_Positions[neighbour];
+                if (neighbourPosition >= position && neighbourPosition <= lastPosition)
+                {
+                    continue;
+                }
+                for (bool isAfter: { true, false })
+                {
+                    ++m_EvaluatedCount;
+                    // Segment is inserted into the edge starting at the target position
+                    const size_t target = isAfter ? neighbourPosition : (neighbourPosition + citiesCount - 1) % citiesCount;
+                    const size_t targetNext = (target + 1) % citiesCount;
+                    if ((target >= position && target <= lastPosition) || (targetNext >= position && targetNext <= lastPosition))
+                    {
+                        continue;
+                    }
+                    const int from = route[target];
+                    const int to = route[targetNext];
+                    const double insertionCost = isAfter
+                        ? Distance(neighbour, end) + Distance(otherEnd, to) - Distance(neighbour, to)
+                        : Distance(from, otherEnd) + Distance(end, neighbour) - Distance(from, neighbour);
+                    if (insertionCost - removalGain < -s_MinGain)
+                    {
+                        // Reversed segment starts with its last city
+                        const bool isReversed = isAfter ? end == last : end == first;
+                        ApplyOrOpt(position, length, target, isReversed);
+                        Push(previous);
+                        Push(next);
+                        Push(last);
+                        Push(from);
+                        Push(to);
+                        return true;
+                    }
+                }
+            }
+        }
+    }
+    return false;
+}
+
+int CRouteLocalSearch::Next(size_t position) const
+{
+    const std::vector<int>& route = *m_Route;
+    return route[position + 1 < route.size() ? position + 1 : 0];
+}
+
+int CRouteLocalSearch::Previous(size_t position) const
+{
+    const std::vector<int>& route = *m_Route;
+    return route[position > 0 ? position - 1 : route.size() - 1];
+}
+
+void CRouteLocalSearch::ApplyTwoOpt(size_t first, size_t second)
+{
+    if (first > second)
+    {
+        std::swap(first, second);
+    }
+    // Cities between the edges are reversed, the first city of the route is never among them
+    std::reverse(m_Route->begin() + first + 1, m_Route->begin() + second + 1);
+    UpdatePositions(first + 1, second + 1);
+}
+
+void CRouteLocalSearch::ApplyOrOpt(size_t position, size_t length, size_t target, bool reversed)
+{
+    std::vector<int>& route = *m_Route;
+    size_t segmentBegin;
+    if (target > position)
+    {
+        std::rotate(route.begin() + position, route.begin() + position + length, route.begin() + target + 1);
+        segmentBegin = target + 1 - length;
+        UpdatePositions(position, target + 1);
+    }
+    else
+    {
+        std::rotate(route.begin() + target + 1, route.begin() + position, route.begin() + position + length);
+        segmentBegin = target + 1;
+        UpdatePositions(target + 1, position + length);
+    }
+    if (reversed)
+    {
+        std::reverse(route.begin() + segmentBegin, route.begin() + segmentBegin + length);
+        UpdatePositions(segmentBegin, segmentBegin + length);
+    }
+}
+
+void CRouteLocalSearch::UpdatePositions(size_t begin, size_t end)
+{
+    const std::vector<int>& route = *m_Route;
+    for (size_t i = begin; i < end; ++i)
+    {
+        m_Positions[route[i]] = i;
+    }
+}
+
+void CRouteLocalSearch::Push(int city)
+{
+    if (m_IsQueued[city])
+    {
+        return;
+    }
+    // Processed part of the queue is dropped once it is empty
+    if (m_QueueHead == m_Queue.size())
+    {
+        m_Queue.clear();
+        m_QueueHead = 0;
+    }
+    m_IsQueued[city] = 1;
+    m_Queue.push_back(city);
+}
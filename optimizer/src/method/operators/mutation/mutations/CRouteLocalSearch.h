@@ -0,0 +1,58 @@
+#pragma once
+
+#include <memory>
+#include <vector>
+#include "../AMutation.h"
+
+// Memetic local search of the route (TSP tour, TTP tour, CVRP giant tour) applied after the base mutation.
+// 2-opt and Or-opt moves (segments of up to 3 cities, also reversed) are tried only towards the nearest neighbours
+// of a city, each move is evaluated by the change of the distance in O(1). Cities are processed from a queue,
+// a city leaves it (its don't-look bit is set) when no improving move starts at it and returns when one of its edges
+// changes. The first city of the route is never moved and the route keeps its direction, so TTP items are picked
+// and CVRP loads are delivered in the same order outside the changed segments. The individual is evaluated by
+// the problem afterwards, as usual.
+class CRouteLocalSearch : public AMutation
+{
+public:
+    // Budget is the number of moves evaluated per individual, 0 searches until no move improves the route
+    CRouteLocalSearch(AMutation* baseMutation, const std::vector<std::vector<float>>& distances, float probability,
+                      size_t neighboursCount, size_t budget);
+    ~CRouteLocalSearch() override = default;
+
+    void Mutate(SProblemEncoding& problemEncoding, AIndividual& child) override;
+
+private:
+    static constexpr size_t s_MaxSegmentLength = 3;
+    static constexpr double s_MinGain = 1e-6;
+
+    std::unique_ptr<AMutation> m_BaseMutation;
+    const std::vector<std::vector<float>>& m_Distances;
+    float m_Probability;
+    size_t m_Budget;
+    // Nearest cities of every city ordered by distance
+    std::vector<std::vector<int>> m_Neighbours;
+
+    // State of the route being improved
+    std::vector<int>* m_Route = nullptr;
+    std::vector<size_t> m_Positions;
+    std::vector<int> m_Queue;
+    size_t m_QueueHead = 0;
+    std::vector<char> m_IsQueued;
+    size_t m_EvaluatedCount = 0;
+
+    void Improve(std::vector<int>& route);
+    bool TryTwoOpt(int city);
+    bool TryOrOpt(int city);
+
+    double Distance(int from, int to) const { return m_Distances[from][to]; }
+    int Next(size_t position) const;
+    int Previous(size_t position) const;
+    bool IsBudgetExhausted() const { return m_Budget > 0 && m_EvaluatedCount >= m_Budget; }
+
+    // Replaces edges starting at the positions with edges between their first and between their second cities
+    void ApplyTwoOpt(size_t first, size_t second);
+    // Moves the segment of the length from the position between the city at the target position and its successor
+    void ApplyOrOpt(size_t position, size_t length, size_t target, bool reversed);
+    void UpdatePositions(size_t begin, size_t end);
+    void Push(int city);
+};
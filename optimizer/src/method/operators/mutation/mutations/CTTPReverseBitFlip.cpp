@@ -0,0 +1,16 @@
+#include "CTTPReverseBitFlip.h"
+#include "utils/random/CRandom.h"
+
+void CTTPReverseBitFlip::MutateKnapsack(CBitset &items)
+{
+    if (m_FlipMutProb <= 0.f)
+    {
+        return;
+    }
+
+    // Gaps between flipped items are geometric, so only the flipped items draw a random number
+    for (size_t idx = CRandom::GetGeometric(m_FlipMutProb); idx < items.size(); idx += CRandom::GetGeometric(m_FlipMutProb) + 1)
+    {
+        items.Flip(idx);
+    }
+}
@@ -0,0 +1,15 @@
+#pragma once
+
+#include "CTTPReverseFlip.h"
+
+// Same route mutation as TTP_Reverse_Flip, every item is flipped independently with the flip probability
+class CTTPReverseBitFlip : public CTTPReverseFlip
+{
+public:
+    explicit CTTPReverseBitFlip(float reverseMutProb, float flipMutProb) : CTTPReverseFlip(reverseMutProb, flipMutProb)
+    {};
+    ~CTTPReverseBitFlip() override = default;
+
+protected:
+    void MutateKnapsack(CBitset &items) override;
+};
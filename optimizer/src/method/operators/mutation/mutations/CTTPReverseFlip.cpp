@@ -22,9 +22,17 @@ void CTTPReverseFlip::Mutate(SProblemEncoding& problemEncoding, AIndividual &chi
         }
     }
     // Knapsack Mutation
-    if (child.m_Genotype.m_BoolGenotype.size() != 0 && CRandom::GetFloat(0, 1) < m_FlipMutProb)
+    if (child.m_Genotype.m_BoolGenotype.size() != 0)
     {
-        int randItemIdx = CRandom::GetInt(0, int(child.m_Genotype.m_BoolGenotype.size()));
-        child.m_Genotype.m_BoolGenotype[randItemIdx] = !child.m_Genotype.m_BoolGenotype[randItemIdx];
+        MutateKnapsack(child.m_Genotype.m_BoolGenotype);
+    }
+}
+
+void CTTPReverseFlip::MutateKnapsack(CBitset &items)
+{
+    if (CRandom::GetFloat(0, 1) < m_FlipMutProb)
+    {
+        int randItemIdx = CRandom::GetInt(0, int(items.size()));
+        items.Flip(randItemIdx);
     }
 }
@@ -11,7 +11,10 @@ public:
     ~CTTPReverseFlip() override = default;
 
     void Mutate(SProblemEncoding& problemEncoding, AIndividual &child) override;
-private:
+protected:
+    // Flips a single random item with the flip probability
+    virtual void MutateKnapsack(CBitset &items);
+
     float m_ReverseMutProb;
     float m_FlipMutProb;
 };
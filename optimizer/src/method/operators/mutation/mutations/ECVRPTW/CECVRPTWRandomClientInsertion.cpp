@@ -2,6 +2,9 @@
 #include "problem/problems/ECVRPTW/CECVRPTW.h"
 #include "utils/random/CRandom.h"
 
+thread_local CECVRPTWRoutes CECVRPTWRandomClientInsertion::m_Routes;
+thread_local std::vector<int> CECVRPTWRandomClientInsertion::m_MissingCustomers;
+
 CECVRPTWRandomClientInsertion::CECVRPTWRandomClientInsertion(CECVRPTW& problemDefinition)
     : m_ProblemDefinition(problemDefinition)
 {}
@@ -9,20 +12,14 @@ CECVRPTWRandomClientInsertion::CECVRPTWRandomClientInsertion(CECVRPTW& problemDe
 void CECVRPTWRandomClientInsertion::Mutate(SProblemEncoding& problemEncoding, AIndividual& child)
 {
 	auto& genotype = child.m_Genotype.m_IntGenotype;
-    auto genotypeCopy = genotype;
-	std::sort(genotypeCopy.begin(), genotypeCopy.end());
-	auto& problemTemplate = m_ProblemDefinition.GetECVRPTWTemplate();
-	auto& allCustomers = problemTemplate.GetCustomers();
-
-    std::vector<int> missingCustomers;
-    std::set_difference(allCustomers.begin(), allCustomers.end(),
-                        genotypeCopy.begin(), genotypeCopy.end(),
-                        std::inserter(missingCustomers, missingCustomers.begin()));
-    CRandom::Shuffle(0, missingCustomers.size(), missingCustomers);
+	// Solution follows every insertion, so gaps are checked against the schedule of the current routes
+	m_Routes.Load(m_ProblemDefinition.GetECVRPTWTemplate(), genotype, &m_ProblemDefinition.BuildSolution(genotype));
+	m_Routes.GetMissingCustomers(m_MissingCustomers);
+    CRandom::Shuffle(0, m_MissingCustomers.size(), m_MissingCustomers);
 
-	for (int i = 0; i < missingCustomers.size(); i++)
+	for (int customerIdx : m_MissingCustomers)
     {
-		int customerIdx = CRandom::GetInt(0, child.m_Genotype.m_IntGenotype.size() + 1);
-		child.m_Genotype.m_IntGenotype.emplace(child.m_Genotype.m_IntGenotype.begin() + customerIdx, missingCustomers[i]);
+		m_Routes.InsertAtRandomFeasiblePosition(customerIdx);
 	}
+	m_Routes.Store(genotype);
 }
\ No newline at end of file
@@ -3,6 +3,7 @@
 #include <algorithm>
 #include <chrono>
 #include "method/operators/mutation/AMutation.h"
+#include "problem/problems/ECVRPTW/CECVRPTWRoutes.h"
 
 class CECVRPTW;
 
@@ -14,4 +15,7 @@ public:
 
 private:
     CECVRPTW& m_ProblemDefinition; // TODO - should be const
+    // Scratch buffers are per thread, so one operator can serve parallel ALNS tasks
+    static thread_local CECVRPTWRoutes m_Routes;
+    static thread_local std::vector<int> m_MissingCustomers;
 };
\ No newline at end of file
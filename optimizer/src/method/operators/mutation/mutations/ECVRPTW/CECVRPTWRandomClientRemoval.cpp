@@ -2,6 +2,8 @@
 #include "problem/problems/ECVRPTW/CECVRPTW.h"
 #include "utils/random/CRandom.h"
 
+thread_local CECVRPTWRoutes CECVRPTWRandomClientRemoval::m_Routes;
+
 CECVRPTWRandomClientRemoval::CECVRPTWRandomClientRemoval(CECVRPTW& problemDefinition)
     : m_ProblemDefinition(problemDefinition)
 {}
@@ -9,16 +11,10 @@ CECVRPTWRandomClientRemoval::CECVRPTWRandomClientRemoval(CECVRPTW& problemDefini
 void CECVRPTWRandomClientRemoval::Mutate(SProblemEncoding& problemEncoding, AIndividual& child)
 {
 	int customersToRemove = CRandom::GetInt(1, problemEncoding.m_Encoding[0].m_SectionDescription.size() - m_ProblemDefinition.GetECVRPTWTemplate().GetVehicleCount() - 1);
+	m_Routes.Load(m_ProblemDefinition.GetECVRPTWTemplate(), child.m_Genotype.m_IntGenotype);
 	for (int i = 0; i < customersToRemove; i++)
     {
-		int customerIdx = CRandom::GetInt(0, child.m_Genotype.m_IntGenotype.size());
-		if (child.m_Genotype.m_IntGenotype[customerIdx] == VEHICLE_DELIMITER)
-        {
-			i--;
-		}
-		else
-        {
-			child.m_Genotype.m_IntGenotype.erase(child.m_Genotype.m_IntGenotype.begin() + customerIdx);
-		}
+		m_Routes.Remove(m_Routes.GetRandomCustomer());
 	}
+	m_Routes.Store(child.m_Genotype.m_IntGenotype);
 }
\ No newline at end of file
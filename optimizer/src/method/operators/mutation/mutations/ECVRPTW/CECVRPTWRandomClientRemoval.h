@@ -2,6 +2,7 @@
 
 #include <algorithm>
 #include "method/operators/mutation/AMutation.h"
+#include "problem/problems/ECVRPTW/CECVRPTWRoutes.h"
 
 class CECVRPTW;
 
@@ -13,4 +14,6 @@ public:
 
 private:
     CECVRPTW& m_ProblemDefinition; // TODO - should be const
+    // Scratch buffers are per thread, so one operator can serve parallel ALNS tasks
+    static thread_local CECVRPTWRoutes m_Routes;
 };
\ No newline at end of file
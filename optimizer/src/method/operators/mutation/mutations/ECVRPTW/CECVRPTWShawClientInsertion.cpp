@@ -2,9 +2,8 @@
 #include "problem/problems/ECVRPTW/CECVRPTW.h"
 #include "utils/random/CRandom.h"
 
-#define DEMANDWEIGHT 0.1
-#define TIMEWINDOWWEIGHT 0.6
-#define DISTANCEWEIGHT 0.3
+thread_local CECVRPTWRoutes CECVRPTWShawClientInsertion::m_Routes;
+thread_local std::vector<int> CECVRPTWShawClientInsertion::m_MissingCustomers;
 
 CECVRPTWShawClientInsertion::CECVRPTWShawClientInsertion(CECVRPTW& problemDefinition)
     : m_ProblemDefinition(problemDefinition)
@@ -13,38 +12,23 @@ CECVRPTWShawClientInsertion::CECVRPTWShawClientInsertion(CECVRPTW& problemDefini
 void CECVRPTWShawClientInsertion::Mutate(SProblemEncoding& problemEncoding, AIndividual& child)
 {
 	auto& genotype = child.m_Genotype.m_IntGenotype;
-    auto genotypeCopy = genotype;
-	std::sort(genotypeCopy.begin(), genotypeCopy.end());
-	auto& problemTemplate = m_ProblemDefinition.GetECVRPTWTemplate();
-	auto& cities = problemTemplate.GetCities();
-	auto& distanceMatrix = problemTemplate.GetDistInfoMtx();
-	auto& allCustomers = problemTemplate.GetCustomers();
+	m_Routes.Load(m_ProblemDefinition.GetECVRPTWTemplate(), genotype, &m_ProblemDefinition.BuildSolution(genotype));
+	m_Routes.GetMissingCustomers(m_MissingCustomers);
+    CRandom::Shuffle(0, m_MissingCustomers.size(), m_MissingCustomers);
 
-    std::vector<int> missingCustomers;
-    std::set_difference(allCustomers.begin(), allCustomers.end(),
-                        genotypeCopy.begin(), genotypeCopy.end(),
-                        std::inserter(missingCustomers, missingCustomers.begin()));
-    CRandom::Shuffle(0, missingCustomers.size(), missingCustomers);
-
-	for (int i = 0; i < missingCustomers.size(); i++)
+	// Every missing customer goes in front of the most related customer already in routes, preferably one which
+	// keeps the routes within time windows. Solution follows every insertion, so its schedule stays current.
+	for (int customerIdx : m_MissingCustomers)
     {
-		auto& customerToCompare = cities[missingCustomers[i]];
-		float minDistance = std::numeric_limits<float>::max();
-		size_t customerWithMinDistanceIdx = -1;
-		for (int j = 0; j < genotype.size(); j++)
+		size_t relatedIdx;
+		if (m_Routes.FindMostRelatedFeasible(customerIdx, relatedIdx))
+        {
+			m_Routes.InsertBefore(customerIdx, relatedIdx);
+		}
+		else
         {
-			if (genotype[j] != VEHICLE_DELIMITER)
-            {
-				float distanceDemand = DEMANDWEIGHT * abs(cities[genotype[j]].m_Demand - customerToCompare.m_Demand);
-				float distanceTimeWindow = TIMEWINDOWWEIGHT * abs(cities[genotype[j]].m_ReadyTime - customerToCompare.m_ReadyTime);
-				float distanceDistance = DISTANCEWEIGHT * distanceMatrix[missingCustomers[i]][genotype[j]].m_Distance;
-				if (distanceDemand + distanceTimeWindow + distanceDistance < minDistance)
-                {
-					customerWithMinDistanceIdx = j;
-					minDistance = distanceDemand + distanceTimeWindow + distanceDistance;
-				}
-			}
+			m_Routes.InsertAtFront(customerIdx);
 		}
-		genotype.insert(genotype.begin() + customerWithMinDistanceIdx, missingCustomers[i]);
 	}
+	m_Routes.Store(genotype);
 }
\ No newline at end of file
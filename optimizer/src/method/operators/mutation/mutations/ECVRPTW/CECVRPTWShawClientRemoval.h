@@ -2,6 +2,7 @@
 
 #include <algorithm>
 #include "method/operators/mutation/AMutation.h"
+#include "problem/problems/ECVRPTW/CECVRPTWRoutes.h"
 
 class CECVRPTW;
 
@@ -13,5 +14,7 @@ public:
 
 private:
     CECVRPTW& m_ProblemDefinition; // TODO - should be const
-	std::vector<int> m_CustomerIndexes;
+    // Scratch buffers are per thread, so one operator can serve parallel ALNS tasks
+    static thread_local CECVRPTWRoutes m_Routes;
+    static thread_local std::vector<size_t> m_CustomerIndexes;
 };
\ No newline at end of file
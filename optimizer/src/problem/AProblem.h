@@ -11,6 +11,14 @@ public:
 
     virtual SProblemEncoding &GetProblemEncoding() = 0;
     virtual void Evaluate(AIndividual& individual) = 0;
+    // Evaluates several individuals at once, problems with cheap objectives override it with a vectorized pass
+    virtual void EvaluateBatch(const std::vector<AIndividual*>& individuals)
+    {
+        for (AIndividual* individual : individuals)
+        {
+            Evaluate(*individual);
+        }
+    }
     virtual void LogSolution(AIndividual& individual) = 0;
     virtual void LogAdditionalData() = 0;
 };
@@ -0,0 +1,142 @@
+#include "ABenchmarkProblem.h"
+#include "utils/dataStructures/CCSV.h"
+#include "utils/logger/CExperimentLogger.h"
+#include <algorithm>
+#include <sstream>
+
+ABenchmarkProblem::ABenchmarkProblem(size_t genesCount, size_t objectivesCount)
+    : m_GenesCount(genesCount)
+    , m_ObjectivesCount(objectivesCount)
+{
+}
+
+void ABenchmarkProblem::Initialize(const std::vector<SEncodingDescriptor>& genesBounds)
+{
+    m_ProblemEncoding = SProblemEncoding{
+            (int)m_ObjectivesCount,
+            {SEncodingSection{genesBounds, EEncodingType::ASSOCIATION}},
+            {}
+    };
+
+    GenerateTrueParetoFront(m_TrueParetoFront);
+
+    // Ideal and nadir point of the true front
+    m_MinObjectiveValues = m_TrueParetoFront[0];
+    m_MaxObjectiveValues = m_TrueParetoFront[0];
+    for (const std::vector<float>& point : m_TrueParetoFront)
+    {
+        for (size_t o = 0; o < m_ObjectivesCount; ++o)
+        {
+            m_MinObjectiveValues[o] = std::min(m_MinObjectiveValues[o], point[o]);
+            m_MaxObjectiveValues[o] = std::max(m_MaxObjectiveValues[o], point[o]);
+        }
+    }
+}
+
+void ABenchmarkProblem::Evaluate(AIndividual& individual)
+{
+    // Single solution stored by dimension is the genotype itself
+    individual.m_Evaluation.resize(m_ObjectivesCount);
+    EvaluateObjectives(individual.m_Genotype.m_FloatGenotype.data(), 1, individual.m_Evaluation.data());
+    Normalize(individual);
+}
+
+void ABenchmarkProblem::EvaluateBatch(const std::vector<AIndividual*>& individuals)
+{
+    const size_t count = individuals.size();
+    m_BatchGenes.resize(m_GenesCount * count);
+    m_BatchObjectives.resize(m_ObjectivesCount * count);
+
+    for (size_t i = 0; i < count; ++i)
+    {
+        const std::vector<float>& genotype = individuals[i]->m_Genotype.m_FloatGenotype;
+        for (size_t d = 0; d < m_GenesCount; ++d)
+        {
+            m_BatchGenes[d * count + i] = genotype[d];
+        }
+    }
+
+    EvaluateObjectives(m_BatchGenes.data(), count, m_BatchObjectives.data());
+
+    for (size_t i = 0; i < count; ++i)
+    {
+        AIndividual& individual = *individuals[i];
+        individual.m_Evaluation.resize(m_ObjectivesCount);
+        for (size_t o = 0; o < m_ObjectivesCount; ++o)
+        {
+            individual.m_Evaluation[o] = m_BatchObjectives[o * count + i];
+        }
+        Normalize(individual);
+    }
+}
+
+void ABenchmarkProblem::LogAdditionalData()
+{
+    std::ostringstream frontData;
+    CCSV<float>::ToCSV(frontData, m_TrueParetoFront);
+    CExperimentLogger::LogResult(frontData.str().c_str(), "true_front.csv");
+}
+
+void ABenchmarkProblem::EvaluateSolutions(const std::vector<std::vector<float>>& solutions,
+                                          std::vector<std::vector<float>>& evaluations) const
+{
+    const size_t count = solutions.size();
+    std::vector<float> genes(m_GenesCount * count);
+    std::vector<float> objectives(m_ObjectivesCount * count);
+    for (size_t i = 0; i < count; ++i)
+    {
+        for (size_t d = 0; d < m_GenesCount; ++d)
+        {
+            genes[d * count + i] = solutions[i][d];
+        }
+    }
+
+    EvaluateObjectives(genes.data(), count, objectives.data());
+
+    evaluations.assign(count, std::vector<float>(m_ObjectivesCount));
+    for (size_t i = 0; i < count; ++i)
+    {
+        for (size_t o = 0; o < m_ObjectivesCount; ++o)
+        {
+            evaluations[i][o] = objectives[o * count + i];
+        }
+    }
+}
+
+void ABenchmarkProblem::FilterNonDominated(std::vector<std::vector<float>>& points)
+{
+    // Sorted points can be dominated only by points before them, duplicates are adjacent
+    std::sort(points.begin(), points.end());
+    points.erase(std::unique(points.begin(), points.end()), points.end());
+
+    std::vector<std::vector<float>> nonDominated;
+    for (const std::vector<float>& point : points)
+    {
+        bool isDominated = std::any_of(nonDominated.begin(), nonDominated.end(), [&point](const std::vector<float>& other)
+        {
+            for (size_t o = 0; o < point.size(); ++o)
+            {
+                if (point[o] < other[o])
+                {
+                    return false;
+                }
+            }
+            return true;
+        });
+        if (!isDominated)
+        {
+            nonDominated.push_back(point);
+        }
+    }
+    points.swap(nonDominated);
+}
+
+void ABenchmarkProblem::Normalize(AIndividual& individual) const
+{
+    individual.m_NormalizedEvaluation.resize(m_ObjectivesCount);
+    for (size_t o = 0; o < m_ObjectivesCount; ++o)
+    {
+        float range = m_MaxObjectiveValues[o] - m_MinObjectiveValues[o];
+        individual.m_NormalizedEvaluation[o] = (individual.m_Evaluation[o] - m_MinObjectiveValues[o]) / (range > 0.f ? range : 1.f);
+    }
+}
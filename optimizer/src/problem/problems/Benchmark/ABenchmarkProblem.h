@@ -0,0 +1,49 @@
+#pragma once
+
+#include "../../AProblem.h"
+#include <vector>
+
+// Continuous multi-objective benchmark problem (ZDT, DTLZ) defined on the float genotype. A batch of individuals is
+// evaluated in one pass with genes stored by dimension, so loops over individuals are vectorized by the compiler.
+class ABenchmarkProblem : public AProblem
+{
+public:
+    ABenchmarkProblem(size_t genesCount, size_t objectivesCount);
+    ~ABenchmarkProblem() override = default;
+
+    SProblemEncoding& GetProblemEncoding() override { return m_ProblemEncoding; }
+
+    void Evaluate(AIndividual& individual) override;
+    void EvaluateBatch(const std::vector<AIndividual*>& individuals) override;
+    void LogSolution(AIndividual& individual) override {};
+    // Writes the analytic Pareto front to true_front.csv, paretoAnalyzer uses it as the reference front
+    void LogAdditionalData() override;
+
+    const std::vector<std::vector<float>>& GetTrueParetoFront() const { return m_TrueParetoFront; }
+
+protected:
+    static constexpr size_t s_TrueFrontPointsCount = 1000;
+
+    // Gene d of solution i is genes[d * count + i], objective o of solution i is written to objectives[o * count + i]
+    virtual void EvaluateObjectives(const float* genes, size_t count, float* objectives) const = 0;
+    virtual void GenerateTrueParetoFront(std::vector<std::vector<float>>& front) const = 0;
+
+    // Derived constructors call it once the problem is fully defined, objectives are normalized by the true front
+    void Initialize(const std::vector<SEncodingDescriptor>& genesBounds);
+    void EvaluateSolutions(const std::vector<std::vector<float>>& solutions, std::vector<std::vector<float>>& evaluations) const;
+    static void FilterNonDominated(std::vector<std::vector<float>>& points);
+
+    size_t m_GenesCount;
+    size_t m_ObjectivesCount;
+
+private:
+    void Normalize(AIndividual& individual) const;
+
+    SProblemEncoding m_ProblemEncoding;
+    std::vector<std::vector<float>> m_TrueParetoFront;
+    std::vector<float> m_MinObjectiveValues;
+    std::vector<float> m_MaxObjectiveValues;
+
+    std::vector<float> m_BatchGenes;
+    std::vector<float> m_BatchObjectives;
+};
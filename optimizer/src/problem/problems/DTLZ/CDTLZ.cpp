@@ -0,0 +1,261 @@
+#include "CDTLZ.h"
+#include "method/methods/MO/utils/DasDennis/CDasDennis.h"
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+#include <string>
+
+static constexpr float PI = 3.14159265358979f;
+
+CDTLZ::CDTLZ(int function, size_t objCount, size_t dimCount)
+    : ABenchmarkProblem(dimCount, objCount)
+    , m_Function(function)
+{
+    if (m_Function < 1 || m_Function > 7)
+    {
+        throw std::runtime_error("DTLZ function " + std::to_string(m_Function) + " not supported");
+    }
+    if (m_ObjectivesCount < 2 || m_GenesCount < m_ObjectivesCount)
+    {
+        throw std::runtime_error("DTLZ requires at least 2 objectives and no less dimensions than objectives");
+    }
+
+    Initialize(std::vector<SEncodingDescriptor>(m_GenesCount, SEncodingDescriptor{0.f, 1.f}));
+}
+
+float CDTLZ::GetAngle(size_t d, float x, float g) const
+{
+    switch (m_Function)
+    {
+        case 4:
+            return std::pow(x, s_DTLZ4Alpha) * PI / 2.f;
+        case 5:
+        case 6:
+            return d == 0 ? x * PI / 2.f : PI / (4.f * (1.f + g)) * (1.f + 2.f * g * x);
+        default:
+            return x * PI / 2.f;
+    }
+}
+
+void CDTLZ::EvaluateObjectives(const float* genes, size_t count, float* objectives) const
+{
+    const size_t positionCount = m_ObjectivesCount - 1;
+    const float distanceCount = float(m_GenesCount - positionCount);
+
+    // Distance function g is accumulated in the last objective, one gene of all solutions at a time
+    float* g = objectives + positionCount * count;
+    std::fill(g, g + count, 0.f);
+    for (size_t d = positionCount; d < m_GenesCount; ++d)
+    {
+        const float* x = genes + d * count;
+        switch (m_Function)
+        {
+            case 1:
+            case 3:
+                for (size_t i = 0; i < count; ++i)
+                {
+                    g[i] += (x[i] - 0.5f) * (x[i] - 0.5f) - std::cos(20.f * PI * (x[i] - 0.5f));
+                }
+                break;
+            case 6:
+                for (size_t i = 0; i < count; ++i)
+                {
+                    g[i] += std::pow(x[i], 0.1f);
+                }
+                break;
+            case 7:
+                for (size_t i = 0; i < count; ++i)
+                {
+                    g[i] += x[i];
+                }
+                break;
+            default:
+                for (size_t i = 0; i < count; ++i)
+                {
+                    g[i] += (x[i] - 0.5f) * (x[i] - 0.5f);
+                }
+                break;
+        }
+    }
+    if (m_Function == 1 || m_Function == 3)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            g[i] = 100.f * (distanceCount + g[i]);
+        }
+    }
+    else if (m_Function == 7)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            g[i] = 1.f + 9.f * g[i] / distanceCount;
+        }
+    }
+
+    if (m_Function == 7)
+    {
+        // Last objective is calculated from the others, which are the position genes
+        float* fLast = g;
+        for (size_t i = 0; i < count; ++i)
+        {
+            float h = float(m_ObjectivesCount);
+            for (size_t o = 0; o < positionCount; ++o)
+            {
+                float f = genes[o * count + i];
+                objectives[o * count + i] = f;
+                h -= f / (1.f + g[i]) * (1.f + std::sin(3.f * PI * f));
+            }
+            fLast[i] = (1.f + g[i]) * h;
+        }
+        return;
+    }
+
+    // Objectives are calculated in order, so g in the last objective is overwritten at the end
+    for (size_t o = 0; o < m_ObjectivesCount; ++o)
+    {
+        float* f = objectives + o * count;
+        const size_t cosCount = positionCount - o;
+        if (m_Function == 1)
+        {
+            for (size_t i = 0; i < count; ++i)
+            {
+                float value = 0.5f * (1.f + g[i]);
+                for (size_t d = 0; d < cosCount; ++d)
+                {
+                    value *= genes[d * count + i];
+                }
+                if (o > 0)
+                {
+                    value *= 1.f - genes[cosCount * count + i];
+                }
+                f[i] = value;
+            }
+        }
+        else
+        {
+            for (size_t i = 0; i < count; ++i)
+            {
+                float value = 1.f + g[i];
+                for (size_t d = 0; d < cosCount; ++d)
+                {
+                    value *= std::cos(GetAngle(d, genes[d * count + i], g[i]));
+                }
+                if (o > 0)
+                {
+                    value *= std::sin(GetAngle(cosCount, genes[cosCount * count + i], g[i]));
+                }
+                f[i] = value;
+            }
+        }
+    }
+}
+
+void CDTLZ::GenerateTrueParetoFront(std::vector<std::vector<float>>& front) const
+{
+    if (m_Function <= 4)
+    {
+        GenerateSimplexFront(front);
+    }
+    else
+    {
+        GenerateSampledFront(front);
+    }
+}
+
+void CDTLZ::GenerateSimplexFront(std::vector<std::vector<float>>& front) const
+{
+    // Largest number of partitions for which the lattice does not exceed the number of front points
+    auto latticeSize = [this](size_t partitions)
+    {
+        size_t size = 1;
+        for (size_t k = 1; k < m_ObjectivesCount; ++k)
+        {
+            size = size * (partitions + k) / k;
+        }
+        return size;
+    };
+    size_t partitions = 1;
+    while (latticeSize(partitions + 1) <= s_TrueFrontPointsCount)
+    {
+        ++partitions;
+    }
+
+    DasDennis dasDennis(partitions, m_ObjectivesCount);
+    dasDennis.GeneratePoints();
+    front = dasDennis.GetPoints();
+
+    // DTLZ1 front is the simplex with objectives summing to 0.5, DTLZ2-4 fronts are the unit sphere
+    for (std::vector<float>& point : front)
+    {
+        float norm = 0.f;
+        for (float& value : point)
+        {
+            value = std::max(value, 0.f);
+            norm += value * value;
+        }
+        norm = std::sqrt(norm);
+        for (float& value : point)
+        {
+            value = m_Function == 1 ? 0.5f * value : value / norm;
+        }
+    }
+}
+
+void CDTLZ::GenerateSampledFront(std::vector<std::vector<float>>& front) const
+{
+    const size_t positionCount = m_ObjectivesCount - 1;
+    // Pareto optimal solutions have distance genes with g equal to 0 (DTLZ5, DTLZ6) or 1 (DTLZ7)
+    const float distanceValue = m_Function == 5 ? 0.5f : 0.f;
+
+    std::vector<std::vector<float>> solutions;
+    if (m_Function == 7)
+    {
+        // Disconnected front, position genes are sampled on a grid and dominated points are removed
+        size_t samplesPerGene = 2;
+        while (std::pow(float(samplesPerGene + 1), float(positionCount)) <= 4.f * s_TrueFrontPointsCount)
+        {
+            ++samplesPerGene;
+        }
+
+        std::vector<size_t> sampleIdx(positionCount, 0);
+        while (sampleIdx.back() < samplesPerGene)
+        {
+            std::vector<float> solution(m_GenesCount, distanceValue);
+            for (size_t d = 0; d < positionCount; ++d)
+            {
+                solution[d] = float(sampleIdx[d]) / float(samplesPerGene - 1);
+            }
+            solutions.push_back(solution);
+
+            for (size_t d = 0; d < positionCount; ++d)
+            {
+                if (++sampleIdx[d] < samplesPerGene || d == positionCount - 1)
+                {
+                    break;
+                }
+                sampleIdx[d] = 0;
+            }
+        }
+    }
+    else
+    {
+        // Degenerated front is a curve given by the first gene, other angles are fixed when g is 0
+        for (size_t s = 0; s < s_TrueFrontPointsCount; ++s)
+        {
+            std::vector<float> solution(m_GenesCount, distanceValue);
+            solution[0] = float(s) / float(s_TrueFrontPointsCount - 1);
+            solutions.push_back(solution);
+        }
+    }
+
+    EvaluateSolutions(solutions, front);
+    // Zero objectives come out of cosine of right angle as small negative values
+    for (std::vector<float>& point : front)
+    {
+        for (float& value : point)
+        {
+            value = std::max(value, 0.f);
+        }
+    }
+    FilterNonDominated(front);
+}
@@ -0,0 +1,25 @@
+#pragma once
+
+#include "../Benchmark/ABenchmarkProblem.h"
+
+// DTLZ1-7 problems of Deb, Thiele, Laumanns and Zitzler scalable in the number of objectives
+class CDTLZ : public ABenchmarkProblem
+{
+public:
+    CDTLZ(int function, size_t objCount, size_t dimCount);
+    ~CDTLZ() override = default;
+
+protected:
+    void EvaluateObjectives(const float* genes, size_t count, float* objectives) const override;
+    void GenerateTrueParetoFront(std::vector<std::vector<float>>& front) const override;
+
+private:
+    static constexpr float s_DTLZ4Alpha = 100.f;
+
+    // Angle of position gene d of DTLZ2-6 for its value x and distance function g of the solution
+    float GetAngle(size_t d, float x, float g) const;
+    void GenerateSimplexFront(std::vector<std::vector<float>>& front) const;
+    void GenerateSampledFront(std::vector<std::vector<float>>& front) const;
+
+    int m_Function;
+};
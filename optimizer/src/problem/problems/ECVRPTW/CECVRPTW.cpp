@@ -1,9 +1,10 @@
 #include "CECVRPTW.h"
 #include "../../../utils/logger/CExperimentLogger.h"
-#include "CECVRPTWSolution.h"
 #include <iostream>
 #include <sstream>
 
+thread_local std::unique_ptr<CECVRPTWSolution> CECVRPTW::m_Workspace;
+
 CECVRPTW::CECVRPTW(CECVRPTWTemplate& ecvrptwBase)
     : m_ECVRPTWTemplate(ecvrptwBase)
 {
@@ -22,15 +23,27 @@ CECVRPTW::CECVRPTW(CECVRPTWTemplate& ecvrptwBase)
 
 std::vector<int> CECVRPTW::GetRealPath(AIndividual& individual)
 {
-    CECVRPTWSolution solution(m_ECVRPTWTemplate);
-    solution.BuildSolution(individual.m_Genotype.m_IntGenotype);
-    return solution.GetSolution();
+    return BuildSolution(individual).GetSolution();
+}
+
+const CECVRPTWSolution& CECVRPTW::BuildSolution(const AIndividual& individual)
+{
+    return BuildSolution(individual.m_Genotype.m_IntGenotype);
+}
+
+CECVRPTWSolution& CECVRPTW::BuildSolution(const std::vector<int>& genotype)
+{
+    if (m_Workspace == nullptr || &m_Workspace->GetTemplate() != &m_ECVRPTWTemplate)
+    {
+        m_Workspace = std::make_unique<CECVRPTWSolution>(m_ECVRPTWTemplate);
+    }
+    m_Workspace->BuildSolution(genotype);
+    return *m_Workspace;
 }
 
 void CECVRPTW::Evaluate(AIndividual& individual) 
 {
-    CECVRPTWSolution solution(m_ECVRPTWTemplate);
-    solution.BuildSolution(individual.m_Genotype.m_IntGenotype);
+    const CECVRPTWSolution& solution = BuildSolution(individual);
 
     individual.m_Evaluation[0] = solution.GetTotalDistance();
     individual.m_Evaluation[1] = solution.GetTotalDuration();
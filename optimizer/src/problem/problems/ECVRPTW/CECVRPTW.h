@@ -1,9 +1,11 @@
 #pragma once
 
 #include "CECVRPTWTemplate.h"
+#include "CECVRPTWSolution.h"
 #include "../../AProblem.h"
 #include "method/individual/SGenotype.h"
 #include <iterator>
+#include <memory>
 
 class CECVRPTW : public AProblem
 {
@@ -19,6 +21,10 @@ public:
 
     CECVRPTWTemplate& GetECVRPTWTemplate() { return m_ECVRPTWTemplate; }
     std::vector<int> GetRealPath(AIndividual& individual);
+    // Builds routes of the individual in the reusable workspace, result is valid until the next build
+    const CECVRPTWSolution& BuildSolution(const AIndividual& individual);
+    // The same for a genotype, the caller may change the built solution in place
+    CECVRPTWSolution& BuildSolution(const std::vector<int>& genotype);
 
 protected:
     std::vector<size_t> m_UpperBounds;
@@ -28,5 +34,8 @@ protected:
     std::vector<float> m_MinObjectiveValues;
 
 private:
+    // Every thread builds solutions in its own workspace, so parallel ALNS tasks can evaluate the same problem
+    static thread_local std::unique_ptr<CECVRPTWSolution> m_Workspace;
+
     void CreateProblemEncoding();
 };
@@ -0,0 +1,195 @@
+#include "CECVRPTWRoutes.h"
+#include "CECVRPTWTemplate.h"
+#include "CECVRPTWSolution.h"
+#include "utils/random/CRandom.h"
+#include <algorithm>
+#include <stdexcept>
+#include <string>
+
+void CECVRPTWRoutes::Load(const CECVRPTWTemplate& problemTemplate, const std::vector<int>& genotype, CECVRPTWSolution* solution)
+{
+    m_ECVRPTWTemplate = &problemTemplate;
+    m_Solution = solution;
+    size_t citiesCount = m_ECVRPTWTemplate->GetCitiesSize();
+    m_Head = citiesCount + std::count(genotype.begin(), genotype.end(), VEHICLE_DELIMITER);
+    m_Next.assign(m_Head + 1, m_Head);
+    m_Prev.assign(m_Head + 1, m_Head);
+    m_Delimiters.clear();
+    m_Customers.clear();
+    m_CustomerSlot.assign(citiesCount, s_Missing);
+
+    size_t lastNodeIdx = m_Head;
+    for (int gene : genotype)
+    {
+        size_t nodeIdx;
+        if (gene == VEHICLE_DELIMITER)
+        {
+            nodeIdx = citiesCount + m_Delimiters.size();
+            m_Delimiters.push_back(nodeIdx);
+        }
+        else
+        {
+            nodeIdx = gene;
+            if (m_CustomerSlot[nodeIdx] != s_Missing)
+            {
+                throw std::runtime_error("Customer " + std::to_string(gene) + " appears more than once in genotype");
+            }
+            m_CustomerSlot[nodeIdx] = m_Customers.size();
+            m_Customers.push_back(nodeIdx);
+        }
+        Link(lastNodeIdx, nodeIdx);
+        lastNodeIdx = nodeIdx;
+    }
+    Link(lastNodeIdx, m_Head);
+}
+
+void CECVRPTWRoutes::Store(std::vector<int>& genotype) const
+{
+    size_t citiesCount = m_ECVRPTWTemplate->GetCitiesSize();
+    genotype.clear();
+    for (size_t nodeIdx = m_Next[m_Head]; nodeIdx != m_Head; nodeIdx = m_Next[nodeIdx])
+    {
+        genotype.push_back(nodeIdx < citiesCount ? (int)nodeIdx : VEHICLE_DELIMITER);
+    }
+}
+
+size_t CECVRPTWRoutes::GetRandomCustomer() const
+{
+    return m_Customers[CRandom::GetInt(0, m_Customers.size())];
+}
+
+void CECVRPTWRoutes::GetMissingCustomers(std::vector<int>& missingCustomers) const
+{
+    missingCustomers.clear();
+    for (size_t customerIdx : m_ECVRPTWTemplate->GetCustomers())
+    {
+        if (!Contains(customerIdx))
+        {
+            missingCustomers.push_back(customerIdx);
+        }
+    }
+}
+
+bool CECVRPTWRoutes::FindMostRelated(size_t customerIdx, size_t& relatedIdx) const
+{
+    for (size_t otherIdx : m_ECVRPTWTemplate->GetRelatedCustomers(customerIdx))
+    {
+        if (Contains(otherIdx))
+        {
+            relatedIdx = otherIdx;
+            return true;
+        }
+    }
+    return false;
+}
+
+bool CECVRPTWRoutes::FindMostRelatedFeasible(size_t customerIdx, size_t& relatedIdx) const
+{
+    for (size_t otherIdx : m_ECVRPTWTemplate->GetRelatedCustomers(customerIdx))
+    {
+        if (Contains(otherIdx) && m_Solution->CanInsertWithinTimeWindows(m_Solution->GetPosition(otherIdx), customerIdx))
+        {
+            relatedIdx = otherIdx;
+            return true;
+        }
+    }
+    return FindMostRelated(customerIdx, relatedIdx);
+}
+
+void CECVRPTWRoutes::Remove(size_t customerIdx)
+{
+    Link(m_Prev[customerIdx], m_Next[customerIdx]);
+
+    size_t slot = m_CustomerSlot[customerIdx];
+    m_Customers[slot] = m_Customers.back();
+    m_CustomerSlot[m_Customers[slot]] = slot;
+    m_Customers.pop_back();
+    m_CustomerSlot[customerIdx] = s_Missing;
+
+    if (m_Solution != nullptr)
+    {
+        m_Solution->RemoveCustomer(customerIdx);
+    }
+}
+
+void CECVRPTWRoutes::InsertBefore(size_t customerIdx, size_t nextCustomerIdx)
+{
+    InsertBeforeNode(customerIdx, nextCustomerIdx);
+}
+
+void CECVRPTWRoutes::InsertBeforeNode(size_t customerIdx, size_t nextNodeIdx)
+{
+    if (m_Solution != nullptr)
+    {
+        m_Solution->InsertCustomer(GetSolutionPosition(nextNodeIdx), customerIdx);
+    }
+    Link(m_Prev[nextNodeIdx], customerIdx);
+    Link(customerIdx, nextNodeIdx);
+
+    m_CustomerSlot[customerIdx] = m_Customers.size();
+    m_Customers.push_back(customerIdx);
+}
+
+void CECVRPTWRoutes::InsertAtRandomPosition(size_t customerIdx)
+{
+    size_t customersCount = m_Customers.size();
+    size_t position = CRandom::GetInt(0, customersCount + m_Delimiters.size() + 1);
+    if (position < customersCount)
+    {
+        InsertBefore(customerIdx, m_Customers[position]);
+    }
+    else if (position < customersCount + m_Delimiters.size())
+    {
+        InsertBeforeNode(customerIdx, m_Delimiters[position - customersCount]);
+    }
+    else
+    {
+        InsertBeforeNode(customerIdx, m_Head);
+    }
+}
+
+void CECVRPTWRoutes::InsertAtRandomFeasiblePosition(size_t customerIdx)
+{
+    m_FeasibleNodes.clear();
+    for (size_t nodeIdx : m_Customers)
+    {
+        if (m_Solution->CanInsertWithinTimeWindows(GetSolutionPosition(nodeIdx), customerIdx))
+        {
+            m_FeasibleNodes.push_back(nodeIdx);
+        }
+    }
+    for (size_t nodeIdx = m_ECVRPTWTemplate->GetCitiesSize(); nodeIdx <= m_Head; ++nodeIdx)
+    {
+        if (m_Solution->CanInsertWithinTimeWindows(GetSolutionPosition(nodeIdx), customerIdx))
+        {
+            m_FeasibleNodes.push_back(nodeIdx);
+        }
+    }
+
+    if (m_FeasibleNodes.empty())
+    {
+        InsertAtRandomPosition(customerIdx);
+    }
+    else
+    {
+        InsertBeforeNode(customerIdx, m_FeasibleNodes[CRandom::GetInt(0, m_FeasibleNodes.size())]);
+    }
+}
+
+void CECVRPTWRoutes::InsertAtFront(size_t customerIdx)
+{
+    InsertBeforeNode(customerIdx, m_Next[m_Head]);
+}
+
+size_t CECVRPTWRoutes::GetSolutionPosition(size_t nodeIdx) const
+{
+    size_t citiesCount = m_ECVRPTWTemplate->GetCitiesSize();
+    // Delimiters and the list head close routes of consecutive cars
+    return nodeIdx < citiesCount ? m_Solution->GetPosition(nodeIdx) : m_Solution->GetRouteEndPosition(nodeIdx - citiesCount);
+}
+
+void CECVRPTWRoutes::Link(size_t nodeIdx, size_t nextNodeIdx)
+{
+    m_Next[nodeIdx] = nextNodeIdx;
+    m_Prev[nextNodeIdx] = nodeIdx;
+}
@@ -0,0 +1,63 @@
+#pragma once
+
+#include <vector>
+#include <cstddef>
+
+class CECVRPTWTemplate;
+class CECVRPTWSolution;
+
+// Routes of a genotype kept as a doubly linked list of customers and vehicle delimiters. Customers can be removed
+// and inserted in O(1), so ALNS destroy/repair operators do not shift the flat genotype for every moved customer.
+// List is built from the genotype and written back only once per operator.
+// When loaded with the solution built from the genotype, every insertion and removal is applied to the solution too,
+// which keeps its schedule valid for time window checks.
+class CECVRPTWRoutes
+{
+public:
+    void Load(const CECVRPTWTemplate& problemTemplate, const std::vector<int>& genotype, CECVRPTWSolution* solution = nullptr);
+    void Store(std::vector<int>& genotype) const;
+
+    [[nodiscard]] size_t GetCustomersCount() const { return m_Customers.size(); }
+    [[nodiscard]] bool Contains(size_t customerIdx) const { return m_CustomerSlot[customerIdx] != s_Missing; }
+    [[nodiscard]] size_t GetRandomCustomer() const;
+    // Customers of the instance which are not in routes, in order of the instance customers
+    void GetMissingCustomers(std::vector<int>& missingCustomers) const;
+    // Finds the most related customer present in routes using the precomputed relatedness list
+    bool FindMostRelated(size_t customerIdx, size_t& relatedIdx) const;
+    // Prefers the most related customer in front of which the customer keeps the routes within time windows,
+    // requires routes loaded with the solution
+    bool FindMostRelatedFeasible(size_t customerIdx, size_t& relatedIdx) const;
+
+    void Remove(size_t customerIdx);
+    void InsertBefore(size_t customerIdx, size_t nextCustomerIdx);
+    // Every gap between genes, including both ends of the genotype, is chosen with equal probability
+    void InsertAtRandomPosition(size_t customerIdx);
+    // Chooses only among gaps which keep the routes within time windows, any gap if there is no such one,
+    // requires routes loaded with the solution
+    void InsertAtRandomFeasiblePosition(size_t customerIdx);
+    // Inserts in front of the first gene, used when there is no customer to relate to
+    void InsertAtFront(size_t customerIdx);
+
+private:
+    static constexpr size_t s_Missing = (size_t)-1;
+
+    void InsertBeforeNode(size_t customerIdx, size_t nextNodeIdx);
+    void Link(size_t nodeIdx, size_t nextNodeIdx);
+    // Position in the built solution of the city visited after a customer inserted in front of the node
+    size_t GetSolutionPosition(size_t nodeIdx) const;
+
+    const CECVRPTWTemplate* m_ECVRPTWTemplate = nullptr;
+    CECVRPTWSolution* m_Solution = nullptr;
+
+    // Nodes are city indexes of customers, followed by vehicle delimiters and the list head
+    size_t m_Head = 0;
+    std::vector<size_t> m_Next;
+    std::vector<size_t> m_Prev;
+    std::vector<size_t> m_Delimiters;
+
+    // Present customers with their position in the vector, for O(1) random choice and removal
+    std::vector<size_t> m_Customers;
+    std::vector<size_t> m_CustomerSlot;
+
+    std::vector<size_t> m_FeasibleNodes;
+};
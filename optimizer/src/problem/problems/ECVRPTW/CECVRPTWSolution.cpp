@@ -1,5 +1,9 @@
 #include "CECVRPTWSolution.h"
 #include "problem/problems/ECVRPTW/CECVRPTWTemplate.h"
+#include <algorithm>
+#include <climits>
+#include <cstdint>
+#include <memory>
 #include <numeric>
 #include <stdexcept>
 
@@ -32,6 +36,7 @@ void CECVRPTWSolution::BuildSolution(const std::vector<int>& initialAssignment)
         if (nextCityIdx == VEHICLE_DELIMITER)
         {
             currentCar++;
+            m_Visits.emplace_back();
             continue;
         }
 
@@ -44,12 +49,15 @@ void CECVRPTWSolution::BuildSolution(const std::vector<int>& initialAssignment)
             else
             {
                 // We assume, we can safely reach the recharge station, as we always check beforehand
+                float fuelDeficit = GetFuelDeficit(currentCar, nextCityIdx);
                 MoveCarToRechargeStationTowardsCity(currentCar, nextCityIdx);
+                m_Visits.back().m_FuelDeficit = fuelDeficit;
             }
         }
         else
         {
             size_t depotIdx = m_ECVRPTWTemplate.GetNearestDepotIdx(m_CurrentPosition[currentCar]);
+            int loadDeficit = cities[nextCityIdx].m_Demand - m_CurrentLoad[currentCar];
             if (CanSafelyReach(currentCar, depotIdx))
             {
                 // We assume, that we can safely reach any city (including recharge station) from the depot
@@ -58,10 +66,282 @@ void CECVRPTWSolution::BuildSolution(const std::vector<int>& initialAssignment)
             else
             {
                 // There is a chance, we will not reach the depot at the moment but must reach recharge station
+                float fuelDeficit = GetFuelDeficit(currentCar, depotIdx);
                 MoveCarToRechargeStationTowardsCity(currentCar, depotIdx);
+                m_Visits.back().m_FuelDeficit = fuelDeficit;
             }
+            m_Visits.back().m_LoadDeficit = loadDeficit;
         }
     }
+
+    // Last iteration moves the last car back to the first depot, which is not a visit of the solution
+    m_Visits.resize(m_Solution.size());
+    CalculateSlacks();
+}
+
+bool CECVRPTWSolution::CanInsertWithinTimeWindows(size_t solutionIdx, size_t customerIdx) const
+{
+    // Only gaps between cities of the genotype keep their place, visits of stations and depots depend on the car state
+    if (solutionIdx == 0 || solutionIdx >= m_Solution.size() || IsDetour(solutionIdx - 1) || IsDetour(solutionIdx))
+    {
+        return false;
+    }
+
+    auto& distMtx = m_ECVRPTWTemplate.GetDistInfoMtx();
+    auto& cities = m_ECVRPTWTemplate.GetCities();
+    const SVisitECVRPTW& prevVisit = m_Visits[solutionIdx - 1];
+    const SVisitECVRPTW& nextVisit = m_Visits[solutionIdx];
+    size_t prevCityIdx = m_Solution[solutionIdx - 1];
+    size_t nextCityIdx = m_Solution[solutionIdx];
+    const SCityECVRPTW& customer = cities[customerIdx];
+
+    // Load and fuel have to be enough for the customer and for every later decision until the car reloads or refuels
+    if (customer.m_Demand > prevVisit.m_Load || customer.m_Demand > nextVisit.m_LoadSlack)
+    {
+        return false;
+    }
+    // Time windows reject most gaps, so they are checked before fuel, first by the delay without any wait
+    float arrival = prevVisit.m_Departure + distMtx[prevCityIdx][customerIdx].m_TravelTime;
+    if (arrival + customer.m_ServiceTime + distMtx[customerIdx][nextCityIdx].m_TravelTime - nextVisit.m_Arrival > nextVisit.m_SegmentMaxDelay)
+    {
+        return false;
+    }
+    float dayLength = m_ECVRPTWTemplate.GetMaxDueTime();
+    float timeOfDay = std::fmod(arrival, dayLength);
+    if (timeOfDay > customer.m_DueTime)
+    {
+        return false;
+    }
+    float departure = arrival + std::max(0.f, customer.m_ReadyTime - timeOfDay) + customer.m_ServiceTime;
+    float delay = departure + distMtx[customerIdx][nextCityIdx].m_TravelTime - nextVisit.m_Arrival;
+    if (delay > nextVisit.m_SegmentMaxDelay)
+    {
+        return false;
+    }
+
+    float fuelToCustomer = distMtx[prevCityIdx][customerIdx].m_FuelConsumption;
+    float fuelToNext = distMtx[customerIdx][nextCityIdx].m_FuelConsumption;
+    size_t customerChargingIdx = m_ECVRPTWTemplate.GetNearestChargingStationIdx(customerIdx);
+    size_t nextChargingIdx = m_ECVRPTWTemplate.GetNearestChargingStationIdx(nextCityIdx);
+    if (prevVisit.m_TankCapacity < fuelToCustomer + distMtx[customerIdx][customerChargingIdx].m_FuelConsumption
+        || prevVisit.m_TankCapacity - fuelToCustomer < fuelToNext + distMtx[nextCityIdx][nextChargingIdx].m_FuelConsumption)
+    {
+        return false;
+    }
+    float extraFuel = fuelToCustomer + fuelToNext - distMtx[prevCityIdx][nextCityIdx].m_FuelConsumption;
+    if (solutionIdx + 1 < m_Solution.size() && m_Solution[solutionIdx + 1] != VEHICLE_DELIMITER
+        && extraFuel > m_Visits[solutionIdx + 1].m_FuelSlack)
+    {
+        return false;
+    }
+    if (nextVisit.m_NextRefuelIdx >= m_Solution.size())
+    {
+        return true;
+    }
+
+    // Waits absorb the delay until the next refueling, which takes longer by the extra fuel
+    float refuelDelay = std::max(0.f, delay - nextVisit.m_SegmentWait) + extraFuel / m_ECVRPTWTemplate.GetRefuelingRate();
+    return refuelDelay <= m_Visits[nextVisit.m_NextRefuelIdx].m_MaxDelay;
+}
+
+bool CECVRPTWSolution::CanRemoveWithinTimeWindows(size_t solutionIdx) const
+{
+    auto& cities = m_ECVRPTWTemplate.GetCities();
+    if (solutionIdx == 0 || solutionIdx + 1 >= m_Solution.size() || m_Solution[solutionIdx] == VEHICLE_DELIMITER
+        || cities[m_Solution[solutionIdx]].m_Type != ENodeType::Customer
+        || IsDetour(solutionIdx - 1) || IsDetour(solutionIdx + 1))
+    {
+        return false;
+    }
+
+    // Saved load and fuel must not make the next station or depot visits unnecessary
+    auto& distMtx = m_ECVRPTWTemplate.GetDistInfoMtx();
+    size_t prevCityIdx = m_Solution[solutionIdx - 1];
+    size_t cityIdx = m_Solution[solutionIdx];
+    size_t nextCityIdx = m_Solution[solutionIdx + 1];
+    const SVisitECVRPTW& nextVisit = m_Visits[solutionIdx + 1];
+    if (cities[cityIdx].m_Demand >= nextVisit.m_LoadDeficitSlack)
+    {
+        return false;
+    }
+    float savedFuel = distMtx[prevCityIdx][cityIdx].m_FuelConsumption + distMtx[cityIdx][nextCityIdx].m_FuelConsumption
+        - distMtx[prevCityIdx][nextCityIdx].m_FuelConsumption;
+    if (nextVisit.m_NextRefuelIdx < m_Solution.size() && savedFuel >= m_Visits[nextVisit.m_NextRefuelIdx].m_FuelDeficit)
+    {
+        return false;
+    }
+
+    // Later arrivals are advanced at most by the saved time and the shorter refueling
+    float advance = nextVisit.m_Arrival - m_Visits[solutionIdx - 1].m_Departure - distMtx[prevCityIdx][nextCityIdx].m_TravelTime;
+    if (nextVisit.m_NextRefuelIdx < m_Solution.size())
+    {
+        advance += savedFuel / m_ECVRPTWTemplate.GetRefuelingRate();
+    }
+    return nextVisit.m_MaxDelay >= 0 && advance <= nextVisit.m_MinTimeOfDay;
+}
+
+void CECVRPTWSolution::InsertCustomer(size_t solutionIdx, size_t customerIdx)
+{
+    size_t carIdx = GetCarIdx(solutionIdx);
+    size_t routeStart = carIdx == 0 ? 0 : m_RouteEndPositions[carIdx - 1] + 2;
+    size_t routeEnd = m_RouteEndPositions[carIdx];
+    m_RouteGenotype.clear();
+    for (size_t i = routeStart + 1; i <= routeEnd; ++i)
+    {
+        if (i == solutionIdx)
+        {
+            m_RouteGenotype.push_back((int)customerIdx);
+        }
+        if (i < routeEnd && !IsDetour(i))
+        {
+            m_RouteGenotype.push_back(m_Solution[i]);
+        }
+    }
+    RebuildRoute(carIdx);
+}
+
+void CECVRPTWSolution::RemoveCustomer(size_t customerIdx)
+{
+    size_t solutionIdx = m_Positions[customerIdx];
+    size_t carIdx = GetCarIdx(solutionIdx);
+    size_t routeStart = carIdx == 0 ? 0 : m_RouteEndPositions[carIdx - 1] + 2;
+    m_RouteGenotype.clear();
+    for (size_t i = routeStart + 1; i < m_RouteEndPositions[carIdx]; ++i)
+    {
+        if (i != solutionIdx && !IsDetour(i))
+        {
+            m_RouteGenotype.push_back(m_Solution[i]);
+        }
+    }
+    m_Positions[customerIdx] = SIZE_MAX;
+    RebuildRoute(carIdx);
+}
+
+size_t CECVRPTWSolution::GetCarIdx(size_t solutionIdx) const
+{
+    return std::lower_bound(m_RouteEndPositions.begin(), m_RouteEndPositions.end(), solutionIdx) - m_RouteEndPositions.begin();
+}
+
+void CECVRPTWSolution::RebuildRoute(size_t carIdx)
+{
+    // Every car starts in the same state, so the route is built alone as the first or, behind an empty route, as the
+    // second route, which also keeps the depot service at its start
+    if (carIdx > 0)
+    {
+        m_RouteGenotype.insert(m_RouteGenotype.begin(), VEHICLE_DELIMITER);
+    }
+    if (!m_RouteWorkspace)
+    {
+        m_RouteWorkspace = std::make_unique<CECVRPTWSolution>(m_ECVRPTWTemplate);
+    }
+    CECVRPTWSolution& workspace = *m_RouteWorkspace;
+    workspace.BuildSolution(m_RouteGenotype);
+    size_t builtStart = carIdx == 0 ? 0 : workspace.m_RouteEndPositions[0] + 2;
+    size_t builtEnd = workspace.m_RouteEndPositions.back();
+
+    // Splice the route into the solution and shift indices of the later routes
+    size_t routeStart = carIdx == 0 ? 0 : m_RouteEndPositions[carIdx - 1] + 2;
+    size_t routeEnd = m_RouteEndPositions[carIdx];
+    size_t newRouteEnd = routeStart + builtEnd - builtStart;
+    if (newRouteEnd > routeEnd)
+    {
+        m_Solution.insert(m_Solution.begin() + routeEnd + 1, newRouteEnd - routeEnd, DEPOT_CITY_ID);
+        m_Visits.insert(m_Visits.begin() + routeEnd + 1, newRouteEnd - routeEnd, SVisitECVRPTW{});
+    }
+    else if (newRouteEnd < routeEnd)
+    {
+        m_Solution.erase(m_Solution.begin() + newRouteEnd + 1, m_Solution.begin() + routeEnd + 1);
+        m_Visits.erase(m_Visits.begin() + newRouteEnd + 1, m_Visits.begin() + routeEnd + 1);
+    }
+    std::copy(workspace.m_Solution.begin() + builtStart, workspace.m_Solution.begin() + builtEnd + 1, m_Solution.begin() + routeStart);
+    std::copy(workspace.m_Visits.begin() + builtStart, workspace.m_Visits.begin() + builtEnd + 1, m_Visits.begin() + routeStart);
+
+    auto& cities = m_ECVRPTWTemplate.GetCities();
+    size_t shiftedEnd = newRouteEnd == routeEnd ? newRouteEnd + 1 : m_Solution.size();
+    for (size_t i = routeStart; i < shiftedEnd; ++i)
+    {
+        if (m_Solution[i] == VEHICLE_DELIMITER)
+        {
+            continue;
+        }
+        size_t& nextRefuelIdx = m_Visits[i].m_NextRefuelIdx;
+        if (nextRefuelIdx != SIZE_MAX)
+        {
+            nextRefuelIdx = i <= newRouteEnd ? nextRefuelIdx - builtStart + routeStart : nextRefuelIdx - routeEnd + newRouteEnd;
+        }
+        if (cities[m_Solution[i]].m_Type == ENodeType::Customer)
+        {
+            m_Positions[m_Solution[i]] = i;
+        }
+    }
+    for (size_t i = carIdx + 1; i < m_RouteEndPositions.size(); ++i)
+    {
+        m_RouteEndPositions[i] = m_RouteEndPositions[i] - routeEnd + newRouteEnd;
+    }
+    m_RouteEndPositions[carIdx] = newRouteEnd;
+}
+
+bool CECVRPTWSolution::IsDetour(size_t solutionIdx) const
+{
+    return m_Solution[solutionIdx] == VEHICLE_DELIMITER || m_Visits[solutionIdx].m_Refuels;
+}
+
+void CECVRPTWSolution::CalculateSlacks()
+{
+    auto& cities = m_ECVRPTWTemplate.GetCities();
+    float dayLength = m_ECVRPTWTemplate.GetMaxDueTime();
+
+    // A delay is absorbed by the wait on the city, unless a later customer already misses its time window
+    auto passDelay = [](float wait, float maxDelay)
+    {
+        return maxDelay < 0 ? maxDelay : wait + maxDelay;
+    };
+
+    m_Positions.assign(cities.size(), SIZE_MAX);
+    m_RouteEndPositions.clear();
+    const SVisitECVRPTW* nextVisit = nullptr;
+    for (size_t i = m_Solution.size(); i-- > 0;)
+    {
+        if (m_Solution[i] == VEHICLE_DELIMITER)
+        {
+            nextVisit = nullptr;
+            continue;
+        }
+        if (nextVisit == nullptr)
+        {
+            m_RouteEndPositions.push_back(i);
+        }
+
+        SVisitECVRPTW& visit = m_Visits[i];
+        const SCityECVRPTW& city = cities[m_Solution[i]];
+        float dueSlack = FLT_MAX;
+        float timeOfDay = FLT_MAX;
+        if (city.m_Type == ENodeType::Customer)
+        {
+            m_Positions[m_Solution[i]] = i;
+            timeOfDay = std::fmod(visit.m_Arrival, dayLength);
+            dueSlack = city.m_DueTime - timeOfDay;
+        }
+
+        bool segmentEnds = nextVisit == nullptr || nextVisit->m_Refuels;
+        visit.m_MaxDelay = std::min(dueSlack, passDelay(visit.m_Wait, nextVisit == nullptr ? FLT_MAX : nextVisit->m_MaxDelay));
+        visit.m_MinTimeOfDay = std::min(timeOfDay, nextVisit == nullptr ? FLT_MAX : nextVisit->m_MinTimeOfDay);
+        visit.m_SegmentMaxDelay = std::min(dueSlack, passDelay(visit.m_Wait, segmentEnds ? FLT_MAX : nextVisit->m_SegmentMaxDelay));
+        visit.m_SegmentWait = visit.m_Wait + (segmentEnds ? 0.f : nextVisit->m_SegmentWait);
+        if (nextVisit == nullptr)
+        {
+            visit.m_NextRefuelIdx = SIZE_MAX;
+        }
+        else
+        {
+            visit.m_NextRefuelIdx = nextVisit->m_Refuels ? i + 1 : nextVisit->m_NextRefuelIdx;
+        }
+        visit.m_FuelSlack = visit.m_Refuels || nextVisit == nullptr ? visit.m_FuelMargin : std::min(visit.m_FuelMargin, nextVisit->m_FuelSlack);
+        visit.m_LoadSlack = visit.m_Reloads ? INT_MAX : std::min(visit.m_Load, nextVisit == nullptr ? INT_MAX : nextVisit->m_LoadSlack);
+        visit.m_LoadDeficitSlack = visit.m_Reloads || nextVisit == nullptr ? visit.m_LoadDeficit : std::min(visit.m_LoadDeficit, nextVisit->m_LoadDeficitSlack);
+        nextVisit = &visit;
+    }
+    std::reverse(m_RouteEndPositions.begin(), m_RouteEndPositions.end());
 }
 
 bool CECVRPTWSolution::CanSatisfyDemand(size_t carIdx, size_t cityIdx) const
@@ -77,27 +357,50 @@ bool CECVRPTWSolution::CanSafelyReach(size_t carIdx, size_t cityIdx) const
     return m_CurrentTankCapacity[carIdx] >= (fuelToTarget + fuelFromTargetToNearestCharging);
 }
 
+float CECVRPTWSolution::GetFuelDeficit(size_t carIdx, size_t cityIdx) const
+{
+    float fuelToTarget = m_ECVRPTWTemplate.GetRequiredFuel(m_CurrentPosition[carIdx], cityIdx);
+    size_t nearestChargingToCityIdx = m_ECVRPTWTemplate.GetNearestChargingStationIdx(cityIdx);
+    return fuelToTarget + m_ECVRPTWTemplate.GetRequiredFuel(cityIdx, nearestChargingToCityIdx) - m_CurrentTankCapacity[carIdx];
+}
+
 void CECVRPTWSolution::PrepareData(const std::vector<int>& initialAssignment)
 {
     size_t vehicleCount = m_ECVRPTWTemplate.GetVehicleCount();
-    m_CurrentLoad = std::vector<int>(vehicleCount, m_ECVRPTWTemplate.GetCapacity());
-    m_CurrentPosition = std::vector<size_t>(vehicleCount, DEPOT_CITY_ID);
-    m_Distance = std::vector<float>(vehicleCount, 0.f);
-    m_CurrentTankCapacity = std::vector<float>(vehicleCount, m_ECVRPTWTemplate.GetTankCapcity());
-    m_CurrentTime = std::vector<float>(vehicleCount, 0.f);
-
-    m_Solution = initialAssignment;
-    m_Solution.emplace(m_Solution.begin(), DEPOT_CITY_ID);
-    m_Solution.emplace(m_Solution.end(), DEPOT_CITY_ID);
-    for (size_t i = 0; i < m_Solution.size(); ++i)
+    m_CurrentLoad.assign(vehicleCount, m_ECVRPTWTemplate.GetCapacity());
+    m_CurrentPosition.assign(vehicleCount, DEPOT_CITY_ID);
+    m_Distance.assign(vehicleCount, 0.f);
+    m_CurrentTankCapacity.assign(vehicleCount, m_ECVRPTWTemplate.GetTankCapcity());
+    m_CurrentTime.assign(vehicleCount, 0.f);
+
+    m_Visits.clear();
+    m_Visits.push_back(SVisitECVRPTW{0.f, 0.f, 0.f, m_CurrentTankCapacity[0], m_CurrentLoad[0], FLT_MAX, false, false, FLT_MAX, INT_MAX});
+
+    // Every route starts and ends in the depot
+    m_Solution.clear();
+    m_Solution.push_back(DEPOT_CITY_ID);
+    for (int gene : initialAssignment)
     {
-        if (m_Solution[i] == VEHICLE_DELIMITER)
+        if (gene == VEHICLE_DELIMITER)
+        {
+            m_Solution.push_back(DEPOT_CITY_ID);
+            m_Solution.push_back(VEHICLE_DELIMITER);
+            m_Solution.push_back(DEPOT_CITY_ID);
+        }
+        else
         {
-            m_Solution.emplace(m_Solution.begin() + i, DEPOT_CITY_ID);
-            m_Solution.emplace(m_Solution.begin() + i + 2, DEPOT_CITY_ID);
-            i += 2;
+            m_Solution.push_back(gene);
         }
     }
+    m_Solution.push_back(DEPOT_CITY_ID);
+}
+
+void CECVRPTWSolution::RecordVisit(size_t carIdx, float arrival, float wait, float fuelMargin, bool refuels, bool reloads)
+{
+    m_Visits.push_back(SVisitECVRPTW{
+        arrival, wait, m_CurrentTime[carIdx], m_CurrentTankCapacity[carIdx], m_CurrentLoad[carIdx], fuelMargin, refuels, reloads,
+        FLT_MAX, INT_MAX
+    });
 }
 
 float CECVRPTWSolution::CalculateRefuelTime(float tankCapacity, float currentTankCapacity)
@@ -109,11 +412,14 @@ void CECVRPTWSolution::MoveCarToDepoLoadAndRecharge(size_t carIdx, size_t depotI
 {
     auto& distMtx = m_ECVRPTWTemplate.GetDistInfoMtx();
     size_t& currentCityIdx = m_CurrentPosition[carIdx];
+    float fuelMargin = m_CurrentTankCapacity[carIdx] - distMtx[currentCityIdx][depotIdx].m_FuelConsumption
+        - m_ECVRPTWTemplate.GetRequiredFuel(depotIdx, m_ECVRPTWTemplate.GetNearestChargingStationIdx(depotIdx));
 
     //To depot
     m_Distance[carIdx] += distMtx[currentCityIdx][depotIdx].m_Distance;
     m_CurrentTime[carIdx] += distMtx[currentCityIdx][depotIdx].m_TravelTime;
     m_CurrentTankCapacity[carIdx] -= distMtx[currentCityIdx][depotIdx].m_FuelConsumption;
+    float arrival = m_CurrentTime[carIdx];
 
     //Depot refuel
     m_CurrentTime[carIdx] += CalculateRefuelTime(m_ECVRPTWTemplate.GetTankCapcity(), m_CurrentTankCapacity[carIdx]);
@@ -125,6 +431,7 @@ void CECVRPTWSolution::MoveCarToDepoLoadAndRecharge(size_t carIdx, size_t depotI
     //Add depot visit to solution
     m_Solution.emplace(m_Solution.begin() + (int)m_CurrentSolutionIdx + 1, depotIdx);
     currentCityIdx = depotIdx;
+    RecordVisit(carIdx, arrival, 0.f, fuelMargin, true, true);
 }
 
 void CECVRPTWSolution::MoveCarToDepoLoadRechargeAndThenToCity(size_t carIdx, size_t depotIdx, size_t nextCityIdx)
@@ -167,15 +474,20 @@ void CECVRPTWSolution::MoveCarToNextCity(size_t carIdx, size_t nextCityIdx)
     auto& cities = m_ECVRPTWTemplate.GetCities();
 
     size_t& currentCityIdx = m_CurrentPosition[carIdx];
+    float fuelMargin = m_CurrentTankCapacity[carIdx] - distMtx[currentCityIdx][nextCityIdx].m_FuelConsumption
+        - m_ECVRPTWTemplate.GetRequiredFuel(nextCityIdx, m_ECVRPTWTemplate.GetNearestChargingStationIdx(nextCityIdx));
     m_Distance[carIdx] += distMtx[currentCityIdx][nextCityIdx].m_Distance;
     m_CurrentTime[carIdx] += distMtx[currentCityIdx][nextCityIdx].m_TravelTime;
     m_CurrentTankCapacity[carIdx] -= distMtx[currentCityIdx][nextCityIdx].m_FuelConsumption;
     m_CurrentLoad[carIdx] -= cities[nextCityIdx].m_Demand;
+    float arrival = m_CurrentTime[carIdx];
 
     HandleTimeOnCity(carIdx, nextCityIdx);
+    float wait = m_CurrentTime[carIdx] - arrival;
 
     m_CurrentTime[carIdx] += cities[nextCityIdx].m_ServiceTime;
     currentCityIdx = nextCityIdx;
+    RecordVisit(carIdx, arrival, wait, fuelMargin, false, false);
 }
 
 void CECVRPTWSolution::HandleTimeOnCity(size_t carIdx, size_t nextCityIdx)
@@ -183,13 +495,14 @@ void CECVRPTWSolution::HandleTimeOnCity(size_t carIdx, size_t nextCityIdx)
     auto& cities = m_ECVRPTWTemplate.GetCities();
     auto dayLength = m_ECVRPTWTemplate.GetMaxDueTime();
 
-    if (std::fmod(m_CurrentTime[carIdx], dayLength) < cities[nextCityIdx].m_ReadyTime)
+    float timeOfDay = std::fmod(m_CurrentTime[carIdx], dayLength);
+    if (timeOfDay < cities[nextCityIdx].m_ReadyTime)
     {
-        m_CurrentTime[carIdx] += cities[nextCityIdx].m_ReadyTime - std::fmod(m_CurrentTime[carIdx], dayLength);
+        m_CurrentTime[carIdx] += cities[nextCityIdx].m_ReadyTime - timeOfDay;
     }
-    else if (std::fmod(m_CurrentTime[carIdx], dayLength) > cities[nextCityIdx].m_DueTime)
+    else if (timeOfDay > cities[nextCityIdx].m_DueTime)
     {
-        float timeToEndOfDay = dayLength - std::fmod(m_CurrentTime[carIdx], dayLength);
+        float timeToEndOfDay = dayLength - timeOfDay;
         m_CurrentTime[carIdx] += timeToEndOfDay;
         m_CurrentTime[carIdx] += cities[nextCityIdx].m_ReadyTime;
     }
@@ -203,22 +516,19 @@ void CECVRPTWSolution::MoveCarToNearestRechargeStation(size_t carIdx)
 
 void CECVRPTWSolution::MoveCarToRechargeStationTowardsCity(size_t carIdx, size_t nextCityIdx)
 {
-    auto& chargingStations = m_ECVRPTWTemplate.GetChargingStations();
+    auto& chargingStations = m_ECVRPTWTemplate.GetChargingStationsByDistance(nextCityIdx);
     auto& distMtx = m_ECVRPTWTemplate.GetDistInfoMtx();
     size_t currentCityIdx = m_CurrentPosition[carIdx];
 
     // this is simple approach but works as expected - get nearest to target, reachable station
-    float bestDist = FLT_MAX;
     size_t bestStationIdx = distMtx.size();
     float currentFuel = m_CurrentTankCapacity[carIdx];
     for (size_t stationIdx : chargingStations)
     {
-        float d = distMtx[stationIdx][nextCityIdx].m_Distance;
-        float f = distMtx[currentCityIdx][stationIdx].m_FuelConsumption;
-        if (d < bestDist && f <= currentFuel)
+        if (distMtx[currentCityIdx][stationIdx].m_FuelConsumption <= currentFuel)
         {
-            bestDist = d;
             bestStationIdx = stationIdx;
+            break;
         }
     }
 
@@ -235,8 +545,10 @@ void CECVRPTWSolution::MoveCarToRechargeStation(size_t carIdx, size_t stationIdx
     auto& distMtx = m_ECVRPTWTemplate.GetDistInfoMtx();
 
     size_t& currentCityIdx = m_CurrentPosition[carIdx];
+    float fuelMargin = m_CurrentTankCapacity[carIdx] - distMtx[currentCityIdx][stationIdx].m_FuelConsumption;
     m_Distance[carIdx] += distMtx[currentCityIdx][stationIdx].m_Distance;
     m_CurrentTime[carIdx] += distMtx[currentCityIdx][stationIdx].m_TravelTime;
+    float arrival = m_CurrentTime[carIdx];
     m_CurrentTime[carIdx] += CalculateRefuelTime(m_ECVRPTWTemplate.GetTankCapcity(), m_CurrentTankCapacity[carIdx]);
     m_CurrentTankCapacity[carIdx] = m_ECVRPTWTemplate.GetTankCapcity();
     m_Solution.emplace(m_Solution.begin() + (int)m_CurrentSolutionIdx + 1, stationIdx);
@@ -245,4 +557,5 @@ void CECVRPTWSolution::MoveCarToRechargeStation(size_t carIdx, size_t stationIdx
     {
         m_CurrentLoad[carIdx] = m_ECVRPTWTemplate.GetCapacity();
     }
+    RecordVisit(carIdx, arrival, 0.f, fuelMargin, true, currentCityIdx == DEPOT_CITY_ID);
 }
\ No newline at end of file
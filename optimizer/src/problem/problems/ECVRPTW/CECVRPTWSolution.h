@@ -2,9 +2,45 @@
 
 #include <vector>
 #include <cstddef>
+#include <memory>
 
 class CECVRPTWTemplate;
 
+// Visit of a city in the built solution. Forward data is recorded while the solution is built, backward slacks are
+// calculated afterwards per route and are used to check insertions and removals without building the solution again.
+struct SVisitECVRPTW
+{
+    float m_Arrival;
+    float m_Wait;
+    float m_Departure;
+    float m_TankCapacity;
+    int m_Load;
+    // Fuel left above the reserve required when the car moved to this city
+    float m_FuelMargin;
+    bool m_Refuels;
+    bool m_Reloads;
+    // Fuel and load missing when the car had to visit this station or depot instead of the city it headed to
+    float m_FuelDeficit;
+    int m_LoadDeficit;
+
+    // Maximal delay of the arrival which keeps this and the later customers of the route within time windows
+    float m_MaxDelay;
+    // Earliest time of day of arrival at this or later customers of the route, later arrivals can be advanced by
+    // that much and still fall on the same day
+    float m_MinTimeOfDay;
+    // The same slack and the sum of waits, limited to the cities before the next refueling
+    float m_SegmentMaxDelay;
+    float m_SegmentWait;
+    size_t m_NextRefuelIdx;
+    // Fuel and load which can be spent in front of this city without changing later decisions of the route
+    float m_FuelSlack;
+    int m_LoadSlack;
+    // Lowest load deficit of station and depot visits until the next reload
+    int m_LoadDeficitSlack;
+};
+
+// Builds vehicle routes from the genotype. Object is meant to be reused between evaluations, so its buffers
+// keep their capacity and are only reset when the next solution is built.
 class CECVRPTWSolution
 {
 public:
@@ -15,12 +51,39 @@ public:
 
     void BuildSolution(const std::vector<int>& initialAssignment);
     [[nodiscard]] const std::vector<int>& GetSolution() const { return m_Solution; }
+    [[nodiscard]] const CECVRPTWTemplate& GetTemplate() const { return m_ECVRPTWTemplate; }
+    [[nodiscard]] const std::vector<SVisitECVRPTW>& GetVisits() const { return m_Visits; }
+
+    // Positions in the built solution of a customer, past the end for customers not in routes, and of the depot
+    // closing the route of a car
+    [[nodiscard]] size_t GetPosition(size_t customerIdx) const { return m_Positions[customerIdx]; }
+    [[nodiscard]] size_t GetRouteEndPosition(size_t carIdx) const { return m_RouteEndPositions[carIdx]; }
+    // O(1) check whether the customer can be visited in front of the city at the position, so that neither this nor
+    // any later customer of the route misses its time window or is moved to another day, and the route needs no
+    // additional depot or station visit.
+    // Insertions in front of a customer already missing its time window are rejected.
+    [[nodiscard]] bool CanInsertWithinTimeWindows(size_t solutionIdx, size_t customerIdx) const;
+    // O(1) check whether removing the customer at the position keeps the rest of its route within time windows and
+    // needs no change of later station and depot visits. Such removal never delays later visits, so it is rejected
+    // when a later customer already misses its time window or an arrival could move to the previous day.
+    [[nodiscard]] bool CanRemoveWithinTimeWindows(size_t solutionIdx) const;
+
+    // Insert the customer in front of the city at the position or remove it, building again only its route.
+    // Total distance and duration are left as they were built.
+    void InsertCustomer(size_t solutionIdx, size_t customerIdx);
+    void RemoveCustomer(size_t customerIdx);
 
 private:
 
     void PrepareData(const std::vector<int>& initialAssignment);
+    void RecordVisit(size_t carIdx, float arrival, float wait, float fuelMargin, bool refuels, bool reloads);
+    void CalculateSlacks();
+    [[nodiscard]] size_t GetCarIdx(size_t solutionIdx) const;
+    void RebuildRoute(size_t carIdx);
+    [[nodiscard]] bool IsDetour(size_t solutionIdx) const;
     [[nodiscard]] bool CanSatisfyDemand(size_t carIdx, size_t cityIdx) const;
     [[nodiscard]] bool CanSafelyReach(size_t carIdx, size_t cityIdx) const;
+    [[nodiscard]] float GetFuelDeficit(size_t carIdx, size_t cityIdx) const;
     float CalculateRefuelTime(float tankCapacity, float currentTankCapacity);
     void MoveCarToDepoLoadAndRecharge(size_t carIdx, size_t depotIdx);
     void MoveCarToDepoLoadRechargeAndThenToCity(size_t carIdx, size_t depotIdx, size_t nextCityIdx);
@@ -40,5 +103,13 @@ private:
 
     std::vector<int> m_Solution;
     size_t m_CurrentSolutionIdx;
+
+    std::vector<SVisitECVRPTW> m_Visits;
+    std::vector<size_t> m_Positions;
+    std::vector<size_t> m_RouteEndPositions;
+
+    // Route genes and solution used to build a single route again
+    std::vector<int> m_RouteGenotype;
+    std::unique_ptr<CECVRPTWSolution> m_RouteWorkspace;
 };
 
@@ -36,6 +36,10 @@ void CECVRPTWTemplate::Clear()
     m_CustomerIndexes.clear();
 	m_DistanceInfoMatrix.clear();
 	m_MinDistanceVec.clear();
+	m_NearestDepotIdx.clear();
+	m_NearestChargingStationIdx.clear();
+	m_ChargingStationsByDistance.clear();
+	m_RelatedCustomers.clear();
 }
 
 void CECVRPTWTemplate::SetData(std::vector<SCityECVRPTW>& cities
@@ -119,64 +123,41 @@ float CECVRPTWTemplate::GetRequiredFuel(size_t cityIdx, size_t nextCityIdx) cons
     return m_DistanceInfoMatrix[cityIdx][nextCityIdx].m_FuelConsumption;
 }
 
-size_t CECVRPTWTemplate::GetNearestDepotIdx(size_t cityIdx) const
+size_t CECVRPTWTemplate::FindNearestIdx(size_t cityIdx, const std::vector<size_t>& candidates) const
 {
-    // TODO - cache
-
     float minDist = FLT_MAX;
     size_t chosenIdx;
     auto& distMtx = GetDistInfoMtx();
-    auto& depotIndexes = GetDepots();
     auto& cities = GetCities();
 
-    for (const auto idx : depotIndexes)
+    for (const auto idx : candidates)
     {
-        int depotIndex;
+        int candidateIndex;
         for (int i = 0; i < cities.size(); i++)
         {
             if (cities[i].m_ID == idx)
             {
-                depotIndex = i;
+                candidateIndex = i;
                 break;
             }
         }
-        if (distMtx[cityIdx][depotIndex].m_Distance < minDist)
+        if (distMtx[cityIdx][candidateIndex].m_Distance < minDist)
         {
-            chosenIdx = depotIndex;
-            minDist = distMtx[cityIdx][depotIndex].m_Distance;
+            chosenIdx = candidateIndex;
+            minDist = distMtx[cityIdx][candidateIndex].m_Distance;
         }
     }
     return chosenIdx;
 }
 
-size_t CECVRPTWTemplate::GetNearestChargingStationIdx(size_t cityIdx) const
+float CECVRPTWTemplate::GetRelatedness(size_t cityIdx, size_t otherCityIdx) const
 {
-    // TODO - cache
-    
-    float minDist = FLT_MAX;
-    size_t chosenIdx;
-    auto& distMtx = GetDistInfoMtx();
-    auto& depotIndexes = GetChargingStations();
-    auto& cities = GetCities();
-
-    for (const auto idx : depotIndexes)
-    {
-        int depotIndex;
-        for (int i = 0; i < cities.size(); i++)
-        {
-            if (cities[i].m_ID == idx)
-            {
-                depotIndex = i;
-                break;
-            }
-        }
-        if (distMtx[cityIdx][depotIndex].m_Distance < minDist)
-        {
-            chosenIdx = depotIndex;
-            minDist = distMtx[cityIdx][depotIndex].m_Distance;
-        }
-    }
-    return chosenIdx;
+    const SCityECVRPTW& city = m_Cities[cityIdx];
+    const SCityECVRPTW& otherCity = m_Cities[otherCityIdx];
+    // Lower value means more related customers
+    return SHAW_DEMAND_WEIGHT * (float)std::abs(city.m_Demand - otherCity.m_Demand)
+        + SHAW_TIME_WINDOW_WEIGHT * std::fabs(city.m_ReadyTime - otherCity.m_ReadyTime)
+        + SHAW_DISTANCE_WEIGHT * m_DistanceInfoMatrix[cityIdx][otherCityIdx].m_Distance;
 }
 
 bool CECVRPTWTemplate::Validate() const
@@ -239,4 +220,156 @@ void CECVRPTWTemplate::CalculateContextData()
 		}
 		m_MinDistanceVec[i] = minDist;
 	}
+
+	CalculateStationTables();
+	CalculateRelatedCustomers();
+}
+
+void CECVRPTWTemplate::CalculateStationTables()
+{
+	size_t dim = m_Cities.size();
+	m_NearestDepotIdx = std::vector<size_t>(dim, DEPOT_CITY_ID);
+	m_NearestChargingStationIdx = std::vector<size_t>(dim, DEPOT_CITY_ID);
+	m_ChargingStationsByDistance = std::vector<std::vector<size_t>>(dim, m_ChargingStationIndexes);
+	for (size_t i = 0; i < dim; ++i)
+	{
+		m_NearestDepotIdx[i] = FindNearestIdx(i, m_DepotIndexes);
+		m_NearestChargingStationIdx[i] = FindNearestIdx(i, m_ChargingStationIndexes);
+
+		// Stable sort keeps the first of equally distant stations in front, as the linear scan did
+		auto& stations = m_ChargingStationsByDistance[i];
+		std::stable_sort(stations.begin(), stations.end(), [this, i](size_t a, size_t b)
+		{
+			return m_DistanceInfoMatrix[a][i].m_Distance < m_DistanceInfoMatrix[b][i].m_Distance;
+		});
+	}
+}
+
+void CECVRPTWTemplate::CalculateRelatedCustomers()
+{
+	m_RelatedCustomers = std::vector<std::vector<size_t>>(m_Cities.size());
+	for (size_t customerIdx : m_CustomerIndexes)
+	{
+		auto& related = m_RelatedCustomers[customerIdx];
+		related.reserve(m_CustomerIndexes.size() - 1);
+		for (size_t otherIdx : m_CustomerIndexes)
+		{
+			if (otherIdx != customerIdx)
+			{
+				related.push_back(otherIdx);
+			}
+		}
+		std::stable_sort(related.begin(), related.end(), [this, customerIdx](size_t a, size_t b)
+		{
+			return GetRelatedness(customerIdx, a) < GetRelatedness(customerIdx, b);
+		});
+	}
+}
+
+void CECVRPTWTemplate::WriteCache(CBinaryWriter &writer) const
+{
+    writer.Write<uint64_t>(m_Cities.size());
+    for (const SCityECVRPTW &city: m_Cities)
+    {
+        writer.Write(city.m_ID);
+        writer.WriteString(city.m_StrID);
+        writer.Write(city.m_Type);
+        writer.Write(city.m_PosX);
+        writer.Write(city.m_PosY);
+        writer.Write(city.m_Demand);
+        writer.Write(city.m_ReadyTime);
+        writer.Write(city.m_DueTime);
+        writer.Write(city.m_ServiceTime);
+    }
+    writer.WriteVector(m_DepotIndexes);
+    writer.WriteVector(m_ChargingStationIndexes);
+    writer.WriteVector(m_CustomerIndexes);
+    writer.Write(m_Capacity);
+    writer.Write(m_TankCapacity);
+    writer.Write(m_FuelConsumptionRate);
+    writer.Write(m_RefuelingRate);
+    writer.Write(m_AverageVelocity);
+    writer.Write(m_VehicleCount);
+
+    for (const std::vector<SDistanceInfo> &distRow: m_DistanceInfoMatrix)
+    {
+        writer.WriteVector(distRow);
+    }
+    writer.WriteVector(m_MinDistanceVec);
+    writer.WriteVector(m_NearestDepotIdx);
+    writer.WriteVector(m_NearestChargingStationIdx);
+    for (const std::vector<size_t> &stations: m_ChargingStationsByDistance)
+    {
+        writer.WriteVector(stations);
+    }
+    for (const std::vector<size_t> &related: m_RelatedCustomers)
+    {
+        writer.WriteVector(related);
+    }
+}
+
+bool CECVRPTWTemplate::ReadCache(CBinaryReader &reader)
+{
+    Clear();
+
+    uint64_t citiesCount = 0;
+    if (!reader.Read(citiesCount))
+    {
+        return false;
+    }
+    m_Cities.reserve(citiesCount);
+    for (uint64_t i = 0; i < citiesCount; ++i)
+    {
+        int id = 0, demand = 0;
+        std::string strId;
+        ENodeType type = ENodeType::Customer;
+        float x = 0.f, y = 0.f, readyTime = 0.f, dueTime = 0.f, serviceTime = 0.f;
+        if (!reader.Read(id) || !reader.ReadString(strId) || !reader.Read(type) || !reader.Read(x) ||
+            !reader.Read(y) || !reader.Read(demand) || !reader.Read(readyTime) || !reader.Read(dueTime) ||
+            !reader.Read(serviceTime))
+        {
+            return false;
+        }
+        m_Cities.emplace_back(id, strId, type, x, y, demand, readyTime, dueTime, serviceTime);
+    }
+
+    if (!reader.ReadVector(m_DepotIndexes) || !reader.ReadVector(m_ChargingStationIndexes) ||
+        !reader.ReadVector(m_CustomerIndexes) || !reader.Read(m_Capacity) || !reader.Read(m_TankCapacity) ||
+        !reader.Read(m_FuelConsumptionRate) || !reader.Read(m_RefuelingRate) || !reader.Read(m_AverageVelocity) ||
+        !reader.Read(m_VehicleCount))
+    {
+        return false;
+    }
+
+    m_DistanceInfoMatrix.resize(citiesCount);
+    for (std::vector<SDistanceInfo> &distRow: m_DistanceInfoMatrix)
+    {
+        if (!reader.ReadVector(distRow) || distRow.size() != citiesCount)
+        {
+            return false;
+        }
+    }
+    if (!reader.ReadVector(m_MinDistanceVec) || !reader.ReadVector(m_NearestDepotIdx) ||
+        !reader.ReadVector(m_NearestChargingStationIdx))
+    {
+        return false;
+    }
+    m_ChargingStationsByDistance.resize(citiesCount);
+    for (std::vector<size_t> &stations: m_ChargingStationsByDistance)
+    {
+        if (!reader.ReadVector(stations))
+        {
+            return false;
+        }
+    }
+    m_RelatedCustomers.resize(citiesCount);
+    for (std::vector<size_t> &related: m_RelatedCustomers)
+    {
+        if (!reader.ReadVector(related))
+        {
+            return false;
+        }
+    }
+
+    return reader.IsAtEnd();
 }
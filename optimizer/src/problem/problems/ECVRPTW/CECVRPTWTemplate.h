@@ -7,10 +7,16 @@
 #include <cfloat>
 #include <cstdint>
 #include "ENodeType.h"
+#include "../../../utils/instanceCache/CBinaryStream.h"
 
 constexpr int VEHICLE_DELIMITER = INT32_MAX;
 constexpr int DEPOT_CITY_ID = 0;
 
+// Weights of Shaw relatedness between two customers
+constexpr float SHAW_DEMAND_WEIGHT = 0.1f;
+constexpr float SHAW_TIME_WINDOW_WEIGHT = 0.6f;
+constexpr float SHAW_DISTANCE_WEIGHT = 0.3f;
+
 struct SCityECVRPTW
 {
     SCityECVRPTW(const int& id
@@ -79,13 +85,25 @@ public:
     float GetMaxDueTime() const { return m_Cities[0].m_DueTime; }
 
     float GetRequiredFuel(size_t cityIdx, size_t nextCityIdx) const;
-    size_t GetNearestDepotIdx(size_t cityIdx) const;
-    size_t GetNearestChargingStationIdx(size_t cityIdx) const;
+    size_t GetNearestDepotIdx(size_t cityIdx) const { return m_NearestDepotIdx[cityIdx]; }
+    size_t GetNearestChargingStationIdx(size_t cityIdx) const { return m_NearestChargingStationIdx[cityIdx]; }
+    // Charging stations ordered by distance to the city, ties keep the order of the instance file
+    const std::vector<size_t>& GetChargingStationsByDistance(size_t cityIdx) const { return m_ChargingStationsByDistance[cityIdx]; }
+    // Other customers ordered from the most related to the customer, empty for depots and charging stations
+    const std::vector<size_t>& GetRelatedCustomers(size_t cityIdx) const { return m_RelatedCustomers[cityIdx]; }
+    float GetRelatedness(size_t cityIdx, size_t otherCityIdx) const;
 
     bool Validate() const;
 
+    // Serializes file and context data, reading it back skips parsing and context calculation
+    void WriteCache(CBinaryWriter &writer) const;
+    bool ReadCache(CBinaryReader &reader);
+
 private:
     void CalculateContextData();
+    void CalculateStationTables();
+    void CalculateRelatedCustomers();
+    size_t FindNearestIdx(size_t cityIdx, const std::vector<size_t>& candidates) const;
 
     std::string m_FileName;
 
@@ -104,4 +122,8 @@ private:
     // Context data
     std::vector<std::vector<SDistanceInfo>> m_DistanceInfoMatrix;
     std::vector<float> m_MinDistanceVec;
+    std::vector<size_t> m_NearestDepotIdx;
+    std::vector<size_t> m_NearestChargingStationIdx;
+    std::vector<std::vector<size_t>> m_ChargingStationsByDistance;
+    std::vector<std::vector<size_t>> m_RelatedCustomers;
 };
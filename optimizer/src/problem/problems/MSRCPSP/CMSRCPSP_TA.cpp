@@ -1,6 +1,9 @@
 #include "CMSRCPSP_TA.h"
 #include "../../../utils/logger/CExperimentLogger.h"
 
+thread_local std::unique_ptr<CScheduler> CMSRCPSP_TA::m_Workspace;
+thread_local const CMSRCPSP_TA* CMSRCPSP_TA::m_WorkspaceOwner = nullptr;
+
 CMSRCPSP_TA::CMSRCPSP_TA(CScheduler& scheduler, size_t objCount)
     : m_Scheduler(scheduler)
     , m_ObjCount(objCount)
@@ -29,24 +32,35 @@ SProblemEncoding &CMSRCPSP_TA::GetProblemEncoding()
     return m_ProblemEncoding;
 }
 
+CScheduler& CMSRCPSP_TA::GetWorkspace()
+{
+    if (m_Workspace == nullptr || m_WorkspaceOwner != this)
+    {
+        m_Workspace = std::make_unique<CScheduler>(m_Scheduler);
+        m_WorkspaceOwner = this;
+    }
+    return *m_Workspace;
+}
+
 void CMSRCPSP_TA::Evaluate(AIndividual& individual)
 {
-    m_Scheduler.Reset();
+    CScheduler& scheduler = GetWorkspace();
+    scheduler.Reset();
     for (size_t i = 0; i < individual.m_Genotype.m_FloatGenotype.size(); ++i)
     {
         TResourceID selectedResourceId = m_CapableResources[i][(size_t)individual.m_Genotype.m_FloatGenotype[i]];
-        m_Scheduler.Assign(i, selectedResourceId);
+        scheduler.Assign(i, selectedResourceId);
     }
 
-    m_Scheduler.BuildTimestamps_TA();
+    scheduler.BuildTimestamps_TA();
 
     individual.m_Evaluation =
             {
-                    m_Scheduler.EvaluateDuration(),
-                    m_Scheduler.EvaluateCost(),
-                    m_Scheduler.EvaluateAvgCashFlowDev(),
-                    m_Scheduler.EvaluateSkillOveruse(),
-                    m_Scheduler.EvaluateAvgUseOfResTime()
+                    scheduler.EvaluateDuration(),
+                    scheduler.EvaluateCost(),
+                    scheduler.EvaluateAvgCashFlowDev(),
+                    scheduler.EvaluateSkillOveruse(),
+                    scheduler.EvaluateAvgUseOfResTime()
             };
 
     // Normalize
@@ -59,7 +73,7 @@ void CMSRCPSP_TA::Evaluate(AIndividual& individual)
 void CMSRCPSP_TA::LogSolution(AIndividual& individual)
 {
     Evaluate(individual);
-    CExperimentLogger::WriteSchedulerToFile(m_Scheduler, individual);
+    CExperimentLogger::WriteSchedulerToFile(GetWorkspace(), individual);
 }
 
 float CMSRCPSP_TA::FindBestGeneValueCostWise(size_t geneIdx) const
@@ -1,5 +1,6 @@
 #pragma once
 
+#include <memory>
 #include "CResource.h"
 #include "CScheduler.h"
 #include "../../AProblem.h"
@@ -32,4 +33,9 @@ private:
     std::vector<float> m_MinObjectiveValues;
 
     CScheduler m_Scheduler;
+
+    // Every thread schedules in its own copy of the scheduler, so parallel SA chains can evaluate the same problem
+    CScheduler& GetWorkspace();
+    static thread_local std::unique_ptr<CScheduler> m_Workspace;
+    static thread_local const CMSRCPSP_TA* m_WorkspaceOwner;
 };
\ No newline at end of file
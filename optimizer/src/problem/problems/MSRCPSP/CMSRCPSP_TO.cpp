@@ -1,6 +1,9 @@
 #include "CMSRCPSP_TO.h"
 #include "../../../utils/logger/CExperimentLogger.h"
 
+thread_local std::unique_ptr<CScheduler> CMSRCPSP_TO::m_Workspace;
+thread_local const CMSRCPSP_TO* CMSRCPSP_TO::m_WorkspaceOwner = nullptr;
+
 CMSRCPSP_TO::CMSRCPSP_TO(CScheduler& scheduler, size_t objCount)
         : m_Scheduler(scheduler)
         , m_ObjCount(objCount)
@@ -30,19 +33,30 @@ SProblemEncoding& CMSRCPSP_TO::GetProblemEncoding()
     return m_ProblemEncoding;
 }
 
+CScheduler& CMSRCPSP_TO::GetWorkspace()
+{
+    if (m_Workspace == nullptr || m_WorkspaceOwner != this)
+    {
+        m_Workspace = std::make_unique<CScheduler>(m_Scheduler);
+        m_WorkspaceOwner = this;
+    }
+    return *m_Workspace;
+}
+
 void CMSRCPSP_TO::Evaluate(AIndividual& individual)
 {
-    m_Scheduler.Reset();
-    m_Scheduler.BuildTimestamps_TO(individual.m_Genotype.m_IntGenotype);
+    CScheduler& scheduler = GetWorkspace();
+    scheduler.Reset();
+    scheduler.BuildTimestamps_TO(individual.m_Genotype.m_IntGenotype);
 
     // We assume this is 5 dim problem
     individual.m_Evaluation =
     {
-            m_Scheduler.EvaluateDuration(),
-            m_Scheduler.EvaluateCost(),
-            m_Scheduler.EvaluateAvgCashFlowDev(),
-            m_Scheduler.EvaluateSkillOveruse(),
-            m_Scheduler.EvaluateAvgUseOfResTime()
+            scheduler.EvaluateDuration(),
+            scheduler.EvaluateCost(),
+            scheduler.EvaluateAvgCashFlowDev(),
+            scheduler.EvaluateSkillOveruse(),
+            scheduler.EvaluateAvgUseOfResTime()
     };
 
     // Normalize
@@ -55,7 +69,7 @@ void CMSRCPSP_TO::Evaluate(AIndividual& individual)
 void CMSRCPSP_TO::LogSolution(AIndividual& individual)
 {
     Evaluate(individual);
-    CExperimentLogger::WriteSchedulerToFile(m_Scheduler, individual);
+    CExperimentLogger::WriteSchedulerToFile(GetWorkspace(), individual);
 }
 
 void CMSRCPSP_TO::CreateProblemEncoding()
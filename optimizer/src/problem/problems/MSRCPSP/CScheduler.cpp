@@ -165,6 +165,70 @@ void CScheduler::Clear()
     m_Resources.clear();
 }
 
+void CScheduler::WriteCache(CBinaryWriter &writer) const
+{
+    writer.WriteString(m_InstanceName);
+    writer.Write<uint64_t>(m_Resources.size());
+    for (const CResource &resource: m_Resources)
+    {
+        writer.Write(resource.GetResourceID());
+        writer.Write(resource.GetSalary());
+        writer.WriteVector(resource.GetSkills());
+    }
+    writer.Write<uint64_t>(m_Tasks.size());
+    for (const CTask &task: m_Tasks)
+    {
+        writer.Write(task.GetTaskID());
+        writer.WriteVector(task.GetRequiredSkills());
+        writer.Write(task.GetDuration());
+        writer.WriteVector(task.GetPredecessors());
+        writer.Write(task.GetHasSuccessors());
+    }
+}
+
+bool CScheduler::ReadCache(CBinaryReader &reader)
+{
+    Clear();
+
+    uint64_t resourcesCount = 0;
+    if (!reader.ReadString(m_InstanceName) || !reader.Read(resourcesCount))
+    {
+        return false;
+    }
+    std::vector<SSkill> skills;
+    for (uint64_t i = 0; i < resourcesCount; ++i)
+    {
+        TResourceID id = 0;
+        float salary = 0.f;
+        if (!reader.Read(id) || !reader.Read(salary) || !reader.ReadVector(skills))
+        {
+            return false;
+        }
+        m_Resources.emplace_back(id, salary, skills);
+    }
+
+    uint64_t tasksCount = 0;
+    if (!reader.Read(tasksCount))
+    {
+        return false;
+    }
+    std::vector<TTaskID> predecessors;
+    for (uint64_t i = 0; i < tasksCount; ++i)
+    {
+        TTaskID id = 0;
+        TTime duration = 0;
+        bool hasSuccessors = false;
+        if (!reader.Read(id) || !reader.ReadVector(skills) || !reader.Read(duration) ||
+            !reader.ReadVector(predecessors) || !reader.Read(hasSuccessors))
+        {
+            return false;
+        }
+        m_Tasks.emplace_back(id, skills, duration, predecessors);
+        m_Tasks.back().SetHasSuccessors(hasSuccessors);
+    }
+    return reader.IsAtEnd();
+}
+
 void CScheduler::Reset()
 {
     for (CTask &task: m_Tasks)
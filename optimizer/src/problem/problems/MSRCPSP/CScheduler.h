@@ -3,6 +3,7 @@
 #include <string>
 #include <stack>
 #include "CTask.h"
+#include "../../../utils/instanceCache/CBinaryStream.h"
 #include "method/individual/AIndividual.h"
 
 class CScheduler
@@ -35,6 +36,10 @@ public:
     void Clear();
     void Reset();
 
+    // Instance cache support, stores file data of tasks and resources so they do not have to be parsed again
+    void WriteCache(CBinaryWriter &writer) const;
+    bool ReadCache(CBinaryReader &reader);
+
     float EvaluateDuration();
     float EvaluateCost();
     float EvaluateAvgCashFlowDev();
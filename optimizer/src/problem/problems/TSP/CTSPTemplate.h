@@ -1,6 +1,7 @@
 #include <vector>
 #include <cmath>
 #include "CCity.h"
+#include "../../../utils/instanceCache/CBinaryStream.h"
 
 class CTSPTemplate {
 public:
@@ -51,4 +52,44 @@ public:
         
         m_MaxDistance *= m_Cities.size();
     }
+
+    // Instance cache support, stores cities and distance matrix so they do not have to be parsed and calculated again
+    void WriteCache(CBinaryWriter &writer) const {
+        writer.Write<uint64_t>(m_Cities.size());
+        for (const CCity &city : m_Cities) {
+            writer.Write(city.m_ID);
+            writer.Write(city.m_PosX);
+            writer.Write(city.m_PosY);
+        }
+        for (const auto &distRow : m_DistanceMatrix) {
+            writer.WriteVector(distRow);
+        }
+    }
+
+    bool ReadCache(CBinaryReader &reader) {
+        m_Cities.clear();
+        m_DistanceMatrix.clear();
+
+        uint64_t citiesCount = 0;
+        if (!reader.Read(citiesCount)) {
+            return false;
+        }
+        m_Cities.reserve(citiesCount);
+        for (uint64_t i = 0; i < citiesCount; ++i) {
+            int id = 0;
+            float x = 0.f, y = 0.f;
+            if (!reader.Read(id) || !reader.Read(x) || !reader.Read(y)) {
+                return false;
+            }
+            m_Cities.emplace_back(id, x, y);
+        }
+
+        m_DistanceMatrix.resize(citiesCount);
+        for (auto &distRow : m_DistanceMatrix) {
+            if (!reader.ReadVector(distRow) || distRow.size() != citiesCount) {
+                return false;
+            }
+        }
+        return reader.IsAtEnd();
+    }
 };
\ No newline at end of file
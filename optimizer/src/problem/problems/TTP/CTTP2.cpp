@@ -35,7 +35,14 @@ void CTTP2::Evaluate(AIndividual& individual)
 
     size_t itemsSize = m_TTPTemplate.GetItemsSize();
     size_t citiesSize = m_TTPTemplate.GetCitiesSize();
-    std::vector<bool> selection(itemsSize, false);
+    CBitset &genotypeItems = individual.m_Genotype.m_BoolGenotype;
+#if TTP_SAVE_FIXED_GENES
+    // Items which do not fit are zeroed in the genotype, so it is the selection itself
+    const CBitset &selection = genotypeItems;
+#else
+    thread_local CBitset selection;
+    selection.assign(itemsSize, false);
+#endif
     int currWeight = 0;
 
     // // Left to Right - different fixing heuristic
@@ -61,16 +68,18 @@ void CTTP2::Evaluate(AIndividual& individual)
         {
             size_t itemIdx = itemsRatio[i];
             int w = items[itemIdx].m_Weight;
-            if (individual.m_Genotype.m_BoolGenotype[itemIdx] > 0 && currWeight + w <= capacity)
+            if (genotypeItems[itemIdx] && currWeight + w <= capacity)
             {
                 currWeight += w;
-                selection[itemIdx] = true;
+#if !TTP_SAVE_FIXED_GENES
+                selection.Set(itemIdx, true);
+#endif
             }
 #if TTP_SAVE_FIXED_GENES
-            else
+            else if (genotypeItems[itemIdx])
             {
                 // Save back the zeroed item
-                individual.m_Genotype.m_BoolGenotype[itemIdx] = 0;
+                genotypeItems.Set(itemIdx, false);
             }
 #endif
             ++i;
@@ -110,7 +119,8 @@ void CTTP2::Evaluate(AIndividual& individual)
                     (float) -currentProfit // invert the profit (min -> optimum)
             };
 
-    // Normalize
+    // Normalize, TTP1 individuals have a single normalized value, so the vector is resized for both objectives
+    individual.m_NormalizedEvaluation.resize(2);
     for (int i = 0; i < 2; i++)
     {
         individual.m_NormalizedEvaluation[i] = (individual.m_Evaluation[i] - m_MinObjectiveValues[i]) / (m_MaxObjectiveValues[i] - m_MinObjectiveValues[i]);
@@ -104,18 +104,10 @@ float CTTPTemplate::CalculateMaxDistance() const
 
 float CTTPTemplate::CalculateMinDistance() const
 {
+    // Sum of minimum distances from every city, already calculated in context data
     float dist = 0.f;
-    size_t dim = m_DistanceMatrix.size();
-    for (size_t i = 0; i < dim; ++i)
+    for (float minDist: m_MinDistanceVec)
     {
-        float minDist = FLT_MAX;
-        for (size_t j = 0; j < dim; ++j)
-        {
-            if (i != j)
-            {
-                minDist = fminf(minDist, m_DistanceMatrix[i][j]);
-            }
-        }
         dist += minDist;
     }
     return dist;
@@ -191,3 +183,104 @@ void CTTPTemplate::CalculateContextData()
         m_ProfitRatioSortedItems.push_back(itemRatio.second);
     }
 }
+
+void CTTPTemplate::WriteCache(CBinaryWriter &writer) const
+{
+    writer.Write<uint64_t>(m_Cities.size());
+    for (const SCity &city: m_Cities)
+    {
+        writer.Write(city.m_ID);
+        writer.Write(city.m_PosX);
+        writer.Write(city.m_PosY);
+    }
+    writer.Write<uint64_t>(m_Items.size());
+    for (const SItem &item: m_Items)
+    {
+        writer.Write(item.m_ID);
+        writer.Write(item.m_Profit);
+        writer.Write(item.m_Weight);
+        writer.Write(item.m_NodeId);
+    }
+    writer.Write(m_Capacity);
+    writer.Write(m_MinSpeed);
+    writer.Write(m_MaxSpeed);
+    writer.Write(m_RentingRatio);
+
+    writer.WriteVector(m_ProfitRatioSortedItems);
+    for (const std::vector<float> &distRow: m_DistanceMatrix)
+    {
+        writer.WriteVector(distRow);
+    }
+    writer.WriteVector(m_MinDistanceVec);
+    for (const std::vector<size_t> &cityItems: m_CityItems)
+    {
+        writer.WriteVector(cityItems);
+    }
+}
+
+bool CTTPTemplate::ReadCache(CBinaryReader &reader)
+{
+    Clear();
+
+    uint64_t citiesCount = 0;
+    if (!reader.Read(citiesCount))
+    {
+        return false;
+    }
+    m_Cities.reserve(citiesCount);
+    for (uint64_t i = 0; i < citiesCount; ++i)
+    {
+        int id = 0;
+        float x = 0.f, y = 0.f;
+        if (!reader.Read(id) || !reader.Read(x) || !reader.Read(y))
+        {
+            return false;
+        }
+        m_Cities.emplace_back(id, x, y);
+    }
+
+    uint64_t itemsCount = 0;
+    if (!reader.Read(itemsCount))
+    {
+        return false;
+    }
+    m_Items.reserve(itemsCount);
+    for (uint64_t i = 0; i < itemsCount; ++i)
+    {
+        int id = 0, profit = 0, weight = 0, nodeId = 0;
+        if (!reader.Read(id) || !reader.Read(profit) || !reader.Read(weight) || !reader.Read(nodeId))
+        {
+            return false;
+        }
+        m_Items.emplace_back(id, profit, weight, nodeId);
+    }
+
+    if (!reader.Read(m_Capacity) || !reader.Read(m_MinSpeed) || !reader.Read(m_MaxSpeed) ||
+        !reader.Read(m_RentingRatio) || !reader.ReadVector(m_ProfitRatioSortedItems))
+    {
+        return false;
+    }
+
+    m_DistanceMatrix.resize(citiesCount);
+    for (std::vector<float> &distRow: m_DistanceMatrix)
+    {
+        if (!reader.ReadVector(distRow) || distRow.size() != citiesCount)
+        {
+            return false;
+        }
+    }
+    if (!reader.ReadVector(m_MinDistanceVec))
+    {
+        return false;
+    }
+    m_CityItems.resize(citiesCount);
+    for (std::vector<size_t> &cityItems: m_CityItems)
+    {
+        if (!reader.ReadVector(cityItems))
+        {
+            return false;
+        }
+    }
+
+    return reader.IsAtEnd();
+}
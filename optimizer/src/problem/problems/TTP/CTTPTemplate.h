@@ -4,6 +4,7 @@
 #include <vector>
 #include <algorithm>
 #include <cmath>
+#include "../../../utils/instanceCache/CBinaryStream.h"
 
 #define USE_EOK 0
 
@@ -79,6 +80,10 @@ public:
     float GetMinTravelTime() const;
     float GetMinProfit() const;
 
+    // Instance cache support, stores file and context data so they do not have to be parsed and calculated again
+    void WriteCache(CBinaryWriter &writer) const;
+    bool ReadCache(CBinaryReader &reader);
+
 private:
 
     float CalculateMaxDistance() const;
@@ -0,0 +1,175 @@
+#include "CZDT.h"
+#include <cmath>
+#include <stdexcept>
+#include <string>
+
+static constexpr float PI = 3.14159265358979f;
+
+CZDT::CZDT(int function, size_t dimCount)
+    : ABenchmarkProblem(GetGenesCount(function, dimCount), 2)
+    , m_Function(function)
+    , m_DimCount(dimCount)
+{
+    std::vector<SEncodingDescriptor> genesBounds(m_GenesCount, SEncodingDescriptor{0.f, 1.f});
+    if (m_Function == 4)
+    {
+        std::fill(genesBounds.begin() + 1, genesBounds.end(), SEncodingDescriptor{-5.f, 5.f});
+    }
+    Initialize(genesBounds);
+}
+
+size_t CZDT::GetGenesCount(int function, size_t dimCount)
+{
+    // Parameters are validated here, as the genes count is needed before the base problem is constructed
+    if (function < 1 || function > 6)
+    {
+        throw std::runtime_error("ZDT function " + std::to_string(function) + " not supported");
+    }
+    if (dimCount < 2)
+    {
+        throw std::runtime_error("ZDT requires at least 2 dimensions");
+    }
+    if (function == 5)
+    {
+        return s_ZDT5FirstBitsCount + s_ZDT5BitsCount * (dimCount - 1);
+    }
+    return dimCount;
+}
+
+void CZDT::EvaluateObjectives(const float* genes, size_t count, float* objectives) const
+{
+    float* f1 = objectives;
+    float* f2 = objectives + count;
+    if (m_Function == 5)
+    {
+        EvaluateZDT5(genes, count, f1, f2);
+        return;
+    }
+
+    const float* x1 = genes;
+    if (m_Function == 6)
+    {
+        for (size_t i = 0; i < count; ++i)
+        {
+            f1[i] = 1.f - std::exp(-4.f * x1[i]) * std::pow(std::sin(6.f * PI * x1[i]), 6.f);
+        }
+    }
+    else
+    {
+        std::copy(x1, x1 + count, f1);
+    }
+
+    // Sum over the remaining genes is accumulated in f2, one gene of all solutions at a time
+    std::fill(f2, f2 + count, 0.f);
+    for (size_t d = 1; d < m_DimCount; ++d)
+    {
+        const float* x = genes + d * count;
+        if (m_Function == 4)
+        {
+            for (size_t i = 0; i < count; ++i)
+            {
+                f2[i] += x[i] * x[i] - 10.f * std::cos(4.f * PI * x[i]);
+            }
+        }
+        else
+        {
+            for (size_t i = 0; i < count; ++i)
+            {
+                f2[i] += x[i];
+            }
+        }
+    }
+
+    const float tailCount = float(m_DimCount - 1);
+    for (size_t i = 0; i < count; ++i)
+    {
+        float g;
+        switch (m_Function)
+        {
+            case 4:
+                g = 1.f + 10.f * tailCount + f2[i];
+                break;
+            case 6:
+                g = 1.f + 9.f * std::pow(f2[i] / tailCount, 0.25f);
+                break;
+            default:
+                g = 1.f + 9.f * f2[i] / tailCount;
+                break;
+        }
+
+        float ratio = f1[i] / g;
+        float h;
+        switch (m_Function)
+        {
+            case 2:
+            case 6:
+                h = 1.f - ratio * ratio;
+                break;
+            case 3:
+                h = 1.f - std::sqrt(ratio) - ratio * std::sin(10.f * PI * f1[i]);
+                break;
+            default:
+                h = 1.f - std::sqrt(ratio);
+                break;
+        }
+        f2[i] = g * h;
+    }
+}
+
+void CZDT::EvaluateZDT5(const float* genes, size_t count, float* f1, float* f2) const
+{
+    std::fill(f1, f1 + count, 1.f);
+    for (size_t b = 0; b < s_ZDT5FirstBitsCount; ++b)
+    {
+        const float* x = genes + b * count;
+        for (size_t i = 0; i < count; ++i)
+        {
+            f1[i] += x[i] >= 0.5f ? 1.f : 0.f;
+        }
+    }
+
+    for (size_t i = 0; i < count; ++i)
+    {
+        float g = 0.f;
+        for (size_t d = 1; d < m_DimCount; ++d)
+        {
+            const size_t firstBit = s_ZDT5FirstBitsCount + (d - 1) * s_ZDT5BitsCount;
+            size_t unitation = 0;
+            for (size_t b = firstBit; b < firstBit + s_ZDT5BitsCount; ++b)
+            {
+                unitation += genes[b * count + i] >= 0.5f ? 1 : 0;
+            }
+            g += unitation < s_ZDT5BitsCount ? 2.f + float(unitation) : 1.f;
+        }
+        f2[i] = g / f1[i];
+    }
+}
+
+void CZDT::GenerateTrueParetoFront(std::vector<std::vector<float>>& front) const
+{
+    std::vector<std::vector<float>> solutions;
+    if (m_Function == 5)
+    {
+        // Every unitation of the first variable with all other bits set
+        for (size_t u = 0; u <= s_ZDT5FirstBitsCount; ++u)
+        {
+            std::vector<float> solution(m_GenesCount, 1.f);
+            std::fill(solution.begin() + u, solution.begin() + s_ZDT5FirstBitsCount, 0.f);
+            solutions.push_back(solution);
+        }
+    }
+    else
+    {
+        // Pareto optimal solutions have all genes except the first one at 0, disconnected ZDT3 front is sampled denser
+        const size_t samplesCount = m_Function == 3 ? 5 * s_TrueFrontPointsCount : s_TrueFrontPointsCount;
+        for (size_t s = 0; s < samplesCount; ++s)
+        {
+            std::vector<float> solution(m_GenesCount, 0.f);
+            solution[0] = float(s) / float(samplesCount - 1);
+            solutions.push_back(solution);
+        }
+    }
+
+    EvaluateSolutions(solutions, front);
+    FilterNonDominated(front);
+}
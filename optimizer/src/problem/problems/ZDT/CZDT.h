@@ -0,0 +1,28 @@
+#pragma once
+
+#include "../Benchmark/ABenchmarkProblem.h"
+
+// ZDT1-6 bi-objective problems of Zitzler, Deb and Thiele. ZDT5 is binary, its bits are float genes rounded at 0.5,
+// so the same operators can be used for all functions.
+class CZDT : public ABenchmarkProblem
+{
+public:
+    CZDT(int function, size_t dimCount);
+    ~CZDT() override = default;
+
+    // Throws for unsupported function or less than 2 dimensions
+    static size_t GetGenesCount(int function, size_t dimCount);
+
+protected:
+    void EvaluateObjectives(const float* genes, size_t count, float* objectives) const override;
+    void GenerateTrueParetoFront(std::vector<std::vector<float>>& front) const override;
+
+private:
+    static constexpr size_t s_ZDT5FirstBitsCount = 30;
+    static constexpr size_t s_ZDT5BitsCount = 5;
+
+    void EvaluateZDT5(const float* genes, size_t count, float* f1, float* f2) const;
+
+    int m_Function;
+    size_t m_DimCount;
+};
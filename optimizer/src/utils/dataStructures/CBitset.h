@@ -0,0 +1,157 @@
+#pragma once
+
+#include <bitset>
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+// Bits packed into 64-bit words, used for binary sections of the genotype instead of std::vector<bool>,
+// so crossover, copying and comparisons work on whole words. Bits past the size are always zero.
+class CBitset
+{
+public:
+    using value_type = bool;
+    static constexpr size_t s_WordBits = 64;
+
+    CBitset() = default;
+    explicit CBitset(size_t size, bool value = false)
+    {
+        assign(size, value);
+    }
+
+    size_t size() const { return m_Size; }
+    bool empty() const { return m_Size == 0; }
+
+    void clear()
+    {
+        m_Words.clear();
+        m_Size = 0;
+    }
+
+    void assign(size_t size, bool value)
+    {
+        m_Size = size;
+        m_Words.assign(GetWordsCount(size), value ? ~uint64_t(0) : 0);
+        ClearPadding();
+    }
+
+    // Replaces content with words of the given size, e.g. read from a message
+    void assign(size_t size, const std::vector<uint64_t> &words)
+    {
+        m_Size = size;
+        m_Words.assign(words.begin(), words.begin() + GetWordsCount(size));
+        ClearPadding();
+    }
+
+    void resize(size_t size, bool value = false)
+    {
+        size_t oldSize = m_Size;
+        m_Size = size;
+        m_Words.resize(GetWordsCount(size), 0);
+        if (value)
+        {
+            for (size_t i = oldSize; i < size; ++i)
+            {
+                Set(i, true);
+            }
+        }
+        ClearPadding();
+    }
+
+    void push_back(bool value)
+    {
+        if (m_Size % s_WordBits == 0)
+        {
+            m_Words.push_back(0);
+        }
+        Set(m_Size++, value);
+    }
+
+    bool operator[](size_t idx) const
+    {
+        return (m_Words[idx / s_WordBits] >> (idx % s_WordBits)) & 1;
+    }
+
+    void Set(size_t idx, bool value)
+    {
+        uint64_t bit = uint64_t(1) << (idx % s_WordBits);
+        uint64_t &word = m_Words[idx / s_WordBits];
+        word = value ? word | bit : word & ~bit;
+    }
+
+    void Flip(size_t idx)
+    {
+        m_Words[idx / s_WordBits] ^= uint64_t(1) << (idx % s_WordBits);
+    }
+
+    // Copies bits [begin, end) of the source of the same size, whole words at a time
+    void CopyRange(const CBitset &source, size_t begin, size_t end)
+    {
+        if (begin >= end)
+        {
+            return;
+        }
+        size_t firstWord = begin / s_WordBits;
+        size_t lastWord = (end - 1) / s_WordBits;
+        for (size_t w = firstWord; w <= lastWord; ++w)
+        {
+            uint64_t mask = ~uint64_t(0);
+            if (w == firstWord)
+            {
+                mask &= ~uint64_t(0) << (begin % s_WordBits);
+            }
+            if (w == lastWord && end % s_WordBits != 0)
+            {
+                mask &= ~uint64_t(0) >> (s_WordBits - end % s_WordBits);
+            }
+            m_Words[w] = (m_Words[w] & ~mask) | (source.m_Words[w] & mask);
+        }
+    }
+
+    size_t Count() const
+    {
+        size_t count = 0;
+        for (uint64_t word: m_Words)
+        {
+            count += std::bitset<s_WordBits>(word).count();
+        }
+        return count;
+    }
+
+    // Number of differing bits between bitsets of the same size
+    size_t HammingDistance(const CBitset &other) const
+    {
+        size_t distance = 0;
+        for (size_t w = 0; w < m_Words.size(); ++w)
+        {
+            distance += std::bitset<s_WordBits>(m_Words[w] ^ other.m_Words[w]).count();
+        }
+        return distance;
+    }
+
+    const std::vector<uint64_t> &GetWords() const { return m_Words; }
+    // Operators combining words directly must keep the bits past the size zeroed
+    std::vector<uint64_t> &GetWords() { return m_Words; }
+
+    static size_t GetWordsCount(size_t size)
+    {
+        return (size + s_WordBits - 1) / s_WordBits;
+    }
+
+    bool operator==(const CBitset &other) const
+    {
+        return m_Size == other.m_Size && m_Words == other.m_Words;
+    }
+
+private:
+    void ClearPadding()
+    {
+        if (m_Size % s_WordBits != 0)
+        {
+            m_Words.back() &= ~uint64_t(0) >> (s_WordBits - m_Size % s_WordBits);
+        }
+    }
+
+    std::vector<uint64_t> m_Words;
+    size_t m_Size = 0;
+};
@@ -0,0 +1,112 @@
+#pragma once
+
+#include <cstdint>
+#include <cstring>
+#include <string>
+#include <vector>
+#include <type_traits>
+
+// Sequential writer of trivially copyable values and vectors into a byte buffer
+class CBinaryWriter
+{
+public:
+    template<typename T>
+    void Write(const T &value)
+    {
+        static_assert(std::is_trivially_copyable<T>::value, "Only trivially copyable values can be written");
+        const char *bytes = reinterpret_cast<const char *>(&value);
+        m_Buffer.insert(m_Buffer.end(), bytes, bytes + sizeof(T));
+    }
+
+    template<typename T>
+    void WriteVector(const std::vector<T> &values)
+    {
+        static_assert(std::is_trivially_copyable<T>::value, "Only trivially copyable values can be written");
+        Write<uint64_t>(values.size());
+        const char *bytes = reinterpret_cast<const char *>(values.data());
+        m_Buffer.insert(m_Buffer.end(), bytes, bytes + values.size() * sizeof(T));
+    }
+
+    void WriteString(const std::string &value)
+    {
+        Write<uint64_t>(value.size());
+        m_Buffer.insert(m_Buffer.end(), value.begin(), value.end());
+    }
+
+    const std::vector<char> &GetBuffer() const
+    { return m_Buffer; }
+
+private:
+    std::vector<char> m_Buffer;
+};
+
+// Sequential reader over a memory region written by CBinaryWriter, every read is bounds checked
+class CBinaryReader
+{
+public:
+    CBinaryReader() = default;
+
+    CBinaryReader(const char *data, size_t size) : m_Data(data), m_Size(size)
+    {};
+
+    template<typename T>
+    bool Read(T &value)
+    {
+        static_assert(std::is_trivially_copyable<T>::value, "Only trivially copyable values can be read");
+        if (m_Size - m_Position < sizeof(T))
+        {
+            return false;
+        }
+        memcpy(&value, m_Data + m_Position, sizeof(T));
+        m_Position += sizeof(T);
+        return true;
+    }
+
+    template<typename T>
+    bool ReadVector(std::vector<T> &values)
+    {
+        static_assert(std::is_trivially_copyable<T>::value, "Only trivially copyable values can be read");
+        uint64_t count = 0;
+        if (!Read(count) || count > (m_Size - m_Position) / sizeof(T))
+        {
+            return false;
+        }
+        values.resize(count);
+        memcpy(values.data(), m_Data + m_Position, count * sizeof(T));
+        m_Position += count * sizeof(T);
+        return true;
+    }
+
+    // Copies count values straight into the destination, used to fill preallocated rows
+    template<typename T>
+    bool ReadArray(T *values, size_t count)
+    {
+        if (count > (m_Size - m_Position) / sizeof(T))
+        {
+            return false;
+        }
+        memcpy(values, m_Data + m_Position, count * sizeof(T));
+        m_Position += count * sizeof(T);
+        return true;
+    }
+
+    bool ReadString(std::string &value)
+    {
+        uint64_t length = 0;
+        if (!Read(length) || length > m_Size - m_Position)
+        {
+            return false;
+        }
+        value.assign(m_Data + m_Position, length);
+        m_Position += length;
+        return true;
+    }
+
+    bool IsAtEnd() const
+    { return m_Position == m_Size; }
+
+private:
+    const char *m_Data = nullptr;
+    size_t m_Size = 0;
+    size_t m_Position = 0;
+};
@@ -0,0 +1,144 @@
+#include "CInstanceCache.h"
+#include <cstdlib>
+#include <cstring>
+#include <filesystem>
+#include <fstream>
+#include <iostream>
+#include <random>
+
+static const char s_Magic[8] = {'I', 'M', 'O', 'P', 'S', 'E', 'I', 'C'};
+static const char *s_CacheDirVariable = "IMOPSE_INSTANCE_CACHE_DIR";
+static const char *s_CacheDisabledValue = "off";
+
+const uint32_t CInstanceCache::s_Version = 1;
+
+CInstanceCache::CInstanceCache(const std::string &problemKind, const char *problemDefinitionPath)
+{
+    const char *cacheDirValue = std::getenv(s_CacheDirVariable);
+    if (cacheDirValue == nullptr || cacheDirValue[0] == '\0' || strcmp(cacheDirValue, s_CacheDisabledValue) == 0)
+    {
+        return;
+    }
+
+    bool hashed = false;
+    m_SourceHash = HashFile(problemDefinitionPath, hashed);
+    if (!hashed)
+    {
+        return;
+    }
+
+    char hashString[17];
+    snprintf(hashString, sizeof(hashString), "%016llx", (unsigned long long)m_SourceHash);
+    std::string fileName = problemKind + "_" + std::filesystem::path(problemDefinitionPath).stem().string() + "_" +
+                           hashString + ".bin";
+    m_CacheFilePath = (std::filesystem::path(cacheDirValue) / fileName).string();
+    m_Enabled = true;
+}
+
+bool CInstanceCache::Read(CBinaryReader &reader)
+{
+    if (!m_Enabled)
+    {
+        return false;
+    }
+    std::ifstream cacheFile(m_CacheFilePath, std::ios::binary | std::ios::ate);
+    if (!cacheFile.is_open())
+    {
+        return false;
+    }
+    m_Data.resize((size_t)cacheFile.tellg());
+    cacheFile.seekg(0);
+    if (!cacheFile.read(m_Data.data(), (std::streamsize)m_Data.size()))
+    {
+        return false;
+    }
+
+    CBinaryReader headerReader(m_Data.data(), m_Data.size());
+    char magic[sizeof(s_Magic)];
+    uint32_t version = 0;
+    uint64_t sourceHash = 0;
+    uint64_t payloadSize = 0;
+    if (!headerReader.ReadArray(magic, sizeof(magic)) || memcmp(magic, s_Magic, sizeof(s_Magic)) != 0 ||
+        !headerReader.Read(version) || version != s_Version ||
+        !headerReader.Read(sourceHash) || sourceHash != m_SourceHash ||
+        !headerReader.Read(payloadSize))
+    {
+        return false;
+    }
+
+    const size_t headerSize = sizeof(s_Magic) + sizeof(version) + sizeof(sourceHash) + sizeof(payloadSize);
+    if (payloadSize != m_Data.size() - headerSize)
+    {
+        return false;
+    }
+
+    std::cout << "Instance cache: loaded " + m_CacheFilePath + "\n" << std::flush;
+    reader = CBinaryReader(m_Data.data() + headerSize, payloadSize);
+    return true;
+}
+
+void CInstanceCache::Write(const CBinaryWriter &writer) const
+{
+    if (!m_Enabled)
+    {
+        return;
+    }
+
+    std::error_code errorCode;
+    std::filesystem::path cachePath(m_CacheFilePath);
+    std::filesystem::create_directories(cachePath.parent_path(), errorCode);
+
+    // Write to a unique temporary file and rename, so concurrent runs never see a partial cache
+    std::filesystem::path tempPath = cachePath;
+    tempPath += "." + std::to_string(std::random_device{}()) + ".tmp";
+    {
+        std::ofstream outFile(tempPath, std::ios::binary);
+        if (!outFile.is_open())
+        {
+            std::cerr << "Unable to write instance cache: " << tempPath.string() << std::endl;
+            return;
+        }
+
+        const std::vector<char> &payload = writer.GetBuffer();
+        const uint64_t payloadSize = payload.size();
+        outFile.write(s_Magic, sizeof(s_Magic));
+        outFile.write(reinterpret_cast<const char *>(&s_Version), sizeof(s_Version));
+        outFile.write(reinterpret_cast<const char *>(&m_SourceHash), sizeof(m_SourceHash));
+        outFile.write(reinterpret_cast<const char *>(&payloadSize), sizeof(payloadSize));
+        outFile.write(payload.data(), (std::streamsize)payload.size());
+        if (!outFile.good())
+        {
+            outFile.close();
+            std::filesystem::remove(tempPath, errorCode);
+            std::cerr << "Unable to write instance cache: " << tempPath.string() << std::endl;
+            return;
+        }
+    }
+
+    std::filesystem::rename(tempPath, cachePath, errorCode);
+    if (errorCode)
+    {
+        std::filesystem::remove(tempPath, errorCode);
+        return;
+    }
+    std::cout << "Instance cache: stored " + m_CacheFilePath + "\n" << std::flush;
+}
+
+uint64_t CInstanceCache::HashFile(const char *filePath, bool &success)
+{
+    // FNV-1a, stable across platforms and runs
+    uint64_t hash = 14695981039346656037ULL;
+    std::ifstream sourceFile(filePath, std::ios::binary);
+    success = sourceFile.is_open();
+    char buffer[1 << 16];
+    while (success && sourceFile)
+    {
+        sourceFile.read(buffer, sizeof(buffer));
+        for (std::streamsize i = 0; i < sourceFile.gcount(); ++i)
+        {
+            hash ^= (unsigned char)buffer[i];
+            hash *= 1099511628211ULL;
+        }
+    }
+    return hash;
+}
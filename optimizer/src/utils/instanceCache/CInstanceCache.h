@@ -0,0 +1,33 @@
+#pragma once
+
+#include <cstdint>
+#include <string>
+#include <vector>
+#include "CBinaryStream.h"
+
+// Binary cache of parsed problem instances together with their precomputed context data.
+// Cache file is keyed by the problem kind and content hash of the instance file, so any edit of the instance
+// invalidates it. Caching is enabled only when IMOPSE_INSTANCE_CACHE_DIR names the directory of cache files
+// ("off" or an empty value keeps it disabled). The cache file is read into one buffer and templates copy
+// their data out of it, so loading skips text parsing and context calculation, not copying.
+class CInstanceCache
+{
+public:
+    // Bump whenever layout of any cached template changes
+    static const uint32_t s_Version;
+
+    CInstanceCache(const std::string &problemKind, const char *problemDefinitionPath);
+
+    // Reads the cache file and positions reader at the template data, returns false if there is no valid cache
+    bool Read(CBinaryReader &reader);
+    // Stores template data written by writer, failures are only reported, parsing result stays valid
+    void Write(const CBinaryWriter &writer) const;
+
+private:
+    bool m_Enabled = false;
+    std::string m_CacheFilePath;
+    uint64_t m_SourceHash = 0;
+    std::vector<char> m_Data;
+
+    static uint64_t HashFile(const char *filePath, bool &success);
+};
@@ -0,0 +1,146 @@
+#include <cstdio>
+#include <cstring>
+#include <iostream>
+#include <utility>
+#include "CAsyncFileWriter.h"
+
+// Longest "%f" formatted double has 309 integer digits, sign, point and 6 decimals
+static const size_t s_MaxFormattedValueSize = 320;
+
+CAsyncFileWriter::CAsyncFileWriter(std::string filePath, size_t blockSize)
+        : m_FilePath(std::move(filePath))
+        , m_BlockSize(blockSize)
+{
+    m_FrontBuffer.reserve(m_BlockSize + s_MaxFormattedValueSize);
+    m_BackBuffer.reserve(m_BlockSize + s_MaxFormattedValueSize);
+}
+
+CAsyncFileWriter::~CAsyncFileWriter()
+{
+    Close();
+}
+
+void CAsyncFileWriter::Append(const char *text)
+{
+    Append(text, strlen(text));
+}
+
+void CAsyncFileWriter::Append(char character)
+{
+    m_FrontBuffer.push_back(character);
+    if (m_FrontBuffer.size() >= m_BlockSize)
+    {
+        Flush();
+    }
+}
+
+void CAsyncFileWriter::AppendValue(int value)
+{
+    char formatted[s_MaxFormattedValueSize];
+    int length = snprintf(formatted, sizeof(formatted), "%d", value);
+    Append(formatted, length);
+}
+
+void CAsyncFileWriter::AppendValue(size_t value)
+{
+    char formatted[s_MaxFormattedValueSize];
+    int length = snprintf(formatted, sizeof(formatted), "%zu", value);
+    Append(formatted, length);
+}
+
+void CAsyncFileWriter::AppendValue(double value)
+{
+    char formatted[s_MaxFormattedValueSize];
+    int length = snprintf(formatted, sizeof(formatted), "%f", value);
+    Append(formatted, length);
+}
+
+void CAsyncFileWriter::AppendValue(const char *value)
+{
+    Append(value);
+}
+
+void CAsyncFileWriter::Append(const char *text, size_t length)
+{
+    m_FrontBuffer.append(text, length);
+    if (m_FrontBuffer.size() >= m_BlockSize)
+    {
+        Flush();
+    }
+}
+
+void CAsyncFileWriter::Flush()
+{
+    std::unique_lock<std::mutex> lock(m_Mutex);
+    // Previous block has to be written first, its buffer is reused for the next one
+    m_Condition.wait(lock, [this]() { return !m_IsBackBufferPending; });
+    std::swap(m_FrontBuffer, m_BackBuffer);
+    m_IsBackBufferPending = true;
+
+    // Thread is started with the first block, so processes forked before any logging do not inherit it
+    if (!m_WriterThread.joinable())
+    {
+        m_WriterThread = std::thread(&CAsyncFileWriter::WriteBlocks, this);
+    }
+    m_Condition.notify_all();
+}
+
+void CAsyncFileWriter::Close()
+{
+    if (!m_FrontBuffer.empty())
+    {
+        Flush();
+    }
+    if (!m_WriterThread.joinable())
+    {
+        return;
+    }
+
+    {
+        std::lock_guard<std::mutex> lock(m_Mutex);
+        m_IsClosing = true;
+    }
+    m_Condition.notify_all();
+    m_WriterThread.join();
+    m_IsClosing = false;
+}
+
+void CAsyncFileWriter::WriteBlocks()
+{
+    std::unique_lock<std::mutex> lock(m_Mutex);
+    while (true)
+    {
+        m_Condition.wait(lock, [this]() { return m_IsBackBufferPending || m_IsClosing; });
+        if (!m_IsBackBufferPending)
+        {
+            break;
+        }
+
+        lock.unlock();
+        WriteBlock();
+        lock.lock();
+
+        m_IsBackBufferPending = false;
+        m_Condition.notify_all();
+    }
+    m_File.close();
+}
+
+void CAsyncFileWriter::WriteBlock()
+{
+    if (!m_File.is_open())
+    {
+        m_File.open(m_FilePath, std::ofstream::out | std::ofstream::app | std::ofstream::binary);
+        if (!m_File.is_open())
+        {
+            std::cerr << "Unable to open file: " << m_FilePath << std::endl;
+        }
+    }
+
+    if (m_File.is_open())
+    {
+        m_File.write(m_BackBuffer.data(), (std::streamsize)m_BackBuffer.size());
+        m_File.flush();
+    }
+    m_BackBuffer.clear();
+}
@@ -0,0 +1,52 @@
+#pragma once
+
+#include <condition_variable>
+#include <cstddef>
+#include <fstream>
+#include <mutex>
+#include <string>
+#include <thread>
+
+// Appends text to a file from a background thread. Text is collected in one of two preallocated buffers,
+// a full buffer is handed to the writer thread and written with a single flush while the other one is filled.
+class CAsyncFileWriter
+{
+public:
+    CAsyncFileWriter(std::string filePath, size_t blockSize);
+    CAsyncFileWriter(const CAsyncFileWriter &other) = delete;
+    CAsyncFileWriter &operator=(const CAsyncFileWriter &other) = delete;
+    ~CAsyncFileWriter();
+
+    void Append(const char *text);
+    void Append(char character);
+    // Values are formatted the same way as by std::to_string
+    void AppendValue(int value);
+    void AppendValue(size_t value);
+    void AppendValue(double value);
+    void AppendValue(const char *value);
+
+    // Hands buffered text to the writer thread, the file is created even if nothing was appended
+    void Flush();
+    // Writes all buffered text and waits until the file is closed
+    void Close();
+
+private:
+    std::string m_FilePath;
+    size_t m_BlockSize;
+
+    // Filled by the logging thread
+    std::string m_FrontBuffer;
+    // Written by the writer thread while m_IsBackBufferPending is set
+    std::string m_BackBuffer;
+    bool m_IsBackBufferPending = false;
+    bool m_IsClosing = false;
+
+    std::mutex m_Mutex;
+    std::condition_variable m_Condition;
+    std::thread m_WriterThread;
+    std::ofstream m_File;
+
+    void Append(const char *text, size_t length);
+    void WriteBlocks();
+    void WriteBlock();
+};
@@ -3,15 +3,28 @@
 #include <iostream>
 #include "CExperimentLogger.h"
 #include "../../method/AMethod.h"
+#include "ErrorUtils.h"
 #include <string>
 #include <algorithm>
 #include <filesystem>
+#include <sstream>
 
 char* CExperimentLogger::m_OutputDirPath = nullptr;
-std::vector<std::string> CExperimentLogger::m_Data;
-std::string CExperimentLogger::m_OutputDataPathPrefix;
-int CExperimentLogger::m_LastProgressLogged;
-size_t CExperimentLogger::m_BufferSize = 10000;
+thread_local std::string CExperimentLogger::m_OutputDataPathPrefix;
+bool CExperimentLogger::m_IsMuted = false;
+thread_local int CExperimentLogger::m_LastProgressLogged;
+const std::string CExperimentLogger::s_DataLogIntervalKey = "DataLogInterval";
+const size_t CExperimentLogger::s_DataBlockSize = 1 << 20;
+thread_local std::unique_ptr<CAsyncFileWriter> CExperimentLogger::m_DataWriter;
+thread_local size_t CExperimentLogger::m_DataLogInterval = 1;
+
+void CExperimentLogger::Configure(SConfigMap* configMap)
+{
+    int dataLogInterval = 1;
+    configMap->TakeValue(s_DataLogIntervalKey, dataLogInterval);
+    ErrorUtils::LowerThanZeroI("ExperimentLogger", s_DataLogIntervalKey, dataLogInterval);
+    m_DataLogInterval = dataLogInterval;
+}
 
 void CExperimentLogger::CreateOutputDataPrefix() {
     // Create the base output directory if it doesn't exist
@@ -34,33 +47,48 @@ void CExperimentLogger::CreateOutputDataPrefix() {
     if (inFile) {
         throw std::runtime_error("Results file already exists: " + runDirPath.string() + "/results.csv, no experiment files created or overwritten");
     }
+
+    m_DataWriter = std::make_unique<CAsyncFileWriter>(m_OutputDataPathPrefix + "/data.csv", s_DataBlockSize);
 }
 
-void CExperimentLogger::AddLine(const char* line)
+void CExperimentLogger::FinishRun()
 {
-    m_Data.emplace_back(line);
-    if (m_Data.size() >= m_BufferSize)
+    if (m_DataWriter)
     {
-        LogData();
+        m_DataWriter->Close();
     }
 }
 
-void CExperimentLogger::LogData()
+CAsyncFileWriter& CExperimentLogger::GetDataWriter()
 {
-    std::ofstream outFile;
-    std::string outputDataPath = m_OutputDataPathPrefix + "/data.csv";
-    outFile.open(outputDataPath, std::ofstream::out | std::ofstream::app); // Open in append mode
-    if (!outFile.is_open())
+    if (!m_DataWriter)
     {
-        std::cerr << "Unable to open file: " << outputDataPath << std::endl;
+        m_DataWriter = std::make_unique<CAsyncFileWriter>(m_OutputDataPathPrefix + "/data.csv", s_DataBlockSize);
     }
+    return *m_DataWriter;
+}
 
-    for (const auto& line: m_Data)
+void CExperimentLogger::AddLine(const char* line)
+{
+    if (m_IsMuted)
     {
-        outFile << line << std::endl;
+        return;
     }
-    outFile.close();
-    m_Data.clear();
+
+    CAsyncFileWriter& dataWriter = GetDataWriter();
+    dataWriter.Append(line);
+    dataWriter.Append('\n');
+}
+
+void CExperimentLogger::LogData()
+{
+    if (m_IsMuted)
+    {
+        return;
+    }
+
+    // Lines are written by the background thread of the writer, one flush per block
+    GetDataWriter().Flush();
 }
 
 void CExperimentLogger::LogResult(const char* result)
@@ -70,6 +98,11 @@ void CExperimentLogger::LogResult(const char* result)
 
 void CExperimentLogger::LogResult(const char* result, const char* fileName)
 {
+    if (m_IsMuted)
+    {
+        return;
+    }
+
     std::ofstream outFile;
     std::filesystem::path runDirPath = std::filesystem::path(m_OutputDataPathPrefix) / fileName;
     OpenFileForWriting(runDirPath.string().c_str(), outFile);
@@ -80,12 +113,29 @@ void CExperimentLogger::LogResult(const char* result, const char* fileName)
 
 void CExperimentLogger::LogProgress(const float progress)
 {
+    if (m_IsMuted)
+    {
+        return;
+    }
+
     if (m_LastProgressLogged != (int)(progress * 100)) {
-        std::cout << (int)(progress * 100) << std::endl;
+        // Single write, so progress of parallel runs does not mix within a line
+        std::cout << std::to_string((int)(progress * 100)) + "\n" << std::flush;
         m_LastProgressLogged = (int)(progress * 100);
     }
 }
 
+void CExperimentLogger::LogRunInfo(const SProgramParams& programParams, int seed, long long wallTimeMs)
+{
+    std::ostringstream oss;
+    oss << "MethodConfig;" << std::filesystem::absolute(programParams.m_MethodConfigPath).string() << std::endl;
+    oss << "ProblemName;" << programParams.m_ProblemName << std::endl;
+    oss << "ProblemInstance;" << std::filesystem::absolute(programParams.m_ProblemInstancePath).string() << std::endl;
+    oss << "Seed;" << seed << std::endl;
+    oss << "WallTimeMs;" << wallTimeMs << std::endl;
+    LogResult(oss.str().c_str(), "run_info.csv");
+}
+
 void CExperimentLogger::OpenFileForWriting(const char* filePath, std::ofstream& outFile)
 {
     std::ifstream inFile(filePath);
@@ -98,6 +148,11 @@ void CExperimentLogger::OpenFileForWriting(const char* filePath, std::ofstream&
 
 bool CExperimentLogger::WriteSchedulerToFile(const CScheduler& schedule, const AIndividual& solution)
 {
+    if (m_IsMuted)
+    {
+        return false;
+    }
+
     // TODO - generic logger should not contain Scheduler logic
     char archive_filename[256];
     std::string outputDataPath = m_OutputDataPathPrefix + "/best_solution.sol";
@@ -1,26 +1,74 @@
 #pragma once
 
 #include <vector>
+#include <memory>
 #include "../../problem/problems/MSRCPSP/CScheduler.h"
 #include "../../method/individual/AIndividual.h"
+#include "../../method/configMap/SConfigMap.h"
 #include <string>
+#include "../../SProgramParams.h"
+#include "CAsyncFileWriter.h"
+
+// Set to 0 to compile out per generation (iteration) data logging to data.csv
+#ifndef LOG_EXPERIMENT_DATA
+#define LOG_EXPERIMENT_DATA 1
+#endif
 
 class CExperimentLogger
 {
 public:
     static char* m_OutputDirPath;
-    static std::string m_OutputDataPathPrefix;
+    // Logging state of the run executed by the current thread
+    static thread_local std::string m_OutputDataPathPrefix;
+    // Set in processes whose results are logged by another process, e.g. secondary islands
+    static bool m_IsMuted;
 
+    // Reads optional DataLogInterval, data of every k-th generation (iteration) is logged, 0 disables it
+    static void Configure(SConfigMap* configMap);
     static void CreateOutputDataPrefix();
+    // Writes all buffered data of the current run
+    static void FinishRun();
+
+#if LOG_EXPERIMENT_DATA
+    static bool IsDataLogged(size_t step)
+    {
+        return !m_IsMuted && m_DataLogInterval > 0 && step % m_DataLogInterval == 0;
+    }
+#else
+    static constexpr bool IsDataLogged(size_t step)
+    {
+        return false;
+    }
+#endif
+
     static void AddLine(const char* line);
+    // Adds line of semicolon separated values without building intermediate strings
+    template<typename TFirst, typename... TValues>
+    static void AddValues(TFirst first, TValues... values)
+    {
+        if (m_IsMuted)
+        {
+            return;
+        }
+
+        CAsyncFileWriter& dataWriter = GetDataWriter();
+        dataWriter.AppendValue(first);
+        ((dataWriter.Append(';'), dataWriter.AppendValue(values)), ...);
+        dataWriter.Append('\n');
+    }
     static void LogData();
     static void LogResult(const char* result);
     static void LogResult(const char* result, const char* fileName);
     static void LogProgress(const float progress);
+    static void LogRunInfo(const SProgramParams& programParams, int seed, long long wallTimeMs);
     static bool WriteSchedulerToFile(const CScheduler& schedule, const AIndividual& solution);
 private:
-    static size_t m_BufferSize;
-    static std::vector<std::string> m_Data;
-    static int m_LastProgressLogged;
+    static const std::string s_DataLogIntervalKey;
+    static const size_t s_DataBlockSize;
+
+    static thread_local std::unique_ptr<CAsyncFileWriter> m_DataWriter;
+    static thread_local size_t m_DataLogInterval;
+    static thread_local int m_LastProgressLogged;
+    static CAsyncFileWriter& GetDataWriter();
     static void OpenFileForWriting(const char* filePath, std::ofstream& outFile);
 };
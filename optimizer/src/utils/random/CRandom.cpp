@@ -1,7 +1,7 @@
 #include <algorithm>
 #include "CRandom.h"
 
-std::mt19937 CRandom::rng{std::random_device{}()};
+thread_local std::mt19937 CRandom::rng{std::random_device{}()};
 
 void CRandom::SetSeed(unsigned int seed)
 {
@@ -25,6 +25,27 @@ float CRandom::GetFloat(float min, float max)
     return dist(rng);
 }
 
+void CRandom::GetFloats(float min, float max, std::vector<float> &values)
+{
+    std::uniform_real_distribution<float> dist(min, max);
+    for (float &value: values)
+    {
+        value = dist(rng);
+    }
+}
+
+uint64_t CRandom::GetBits()
+{
+    uint64_t highBits = rng();
+    return (highBits << 32) | rng();
+}
+
+size_t CRandom::GetGeometric(float probability)
+{
+    std::geometric_distribution<size_t> dist(probability);
+    return dist(rng);
+}
+
 void CRandom::Shuffle(int start, int end, std::vector<int> &vector)
 {
     std::shuffle(vector.begin() + start, vector.begin() + end, rng);
@@ -2,6 +2,8 @@
 
 #include <random>
 #include <iterator>
+#include <vector>
+#include <cstdint>
 
 class CRandom
 {
@@ -11,8 +13,15 @@ public:
     static int GetInt(int min, int max);
     static int GetWeightedInt(const std::vector<float>& weights);
     static float GetFloat(float min, float max);
+    // Fills the whole vector at once, so update loops using the numbers are free of generator calls
+    static void GetFloats(float min, float max, std::vector<float> &values);
+    // 64 uniformly random bits, e.g. a mask for uniform crossover of packed bits
+    static uint64_t GetBits();
+    // Number of failed trials before the first success of trials with the given probability
+    static size_t GetGeometric(float probability);
     static void Shuffle(int start, int end, std::vector<int> &vector);
 
 private:
-    static std::mt19937 rng;
+    // Every thread has its own generator, so parallel runs are reproducible per seed
+    static thread_local std::mt19937 rng;
 };
\ No newline at end of file
@@ -0,0 +1,309 @@
+#include <algorithm>
+#include <cmath>
+#include <iostream>
+#include <random>
+#include <string>
+#include <vector>
+#include "factories/problem/ECVRPTW/CECVRPTWFactory.h"
+#include "problem/problems/ECVRPTW/CECVRPTW.h"
+
+// Compares O(1) insertion and removal checks of CECVRPTWSolution, and insertions and removals which build only the
+// changed route again, with building the changed solution from scratch.
+// Usage: ECVRPTWSolutionTest [instance...], instances default to a few ECVRPTW instances of the configurations
+
+namespace
+{
+    // Genotype gap in front of which a customer inserted at the position of the built solution goes
+    size_t GetGenotypeGap(const CECVRPTWSolution& solution, size_t solutionIdx, const std::vector<int>& genotype)
+    {
+        size_t carIdx = std::count(solution.GetSolution().begin(), solution.GetSolution().begin() + solutionIdx, VEHICLE_DELIMITER);
+        int cityIdx = solution.GetSolution()[solutionIdx];
+        if (solution.GetTemplate().GetCities()[cityIdx].m_Type == ENodeType::Customer)
+        {
+            return std::find(genotype.begin(), genotype.end(), cityIdx) - genotype.begin();
+        }
+        // Route end, in front of the delimiter of the car or at the end of the genotype
+        size_t gap = 0;
+        for (size_t delimiters = 0; gap < genotype.size(); ++gap)
+        {
+            if (genotype[gap] == VEHICLE_DELIMITER && delimiters++ == carIdx)
+            {
+                break;
+            }
+        }
+        return gap;
+    }
+
+    // Genotype of routes with customers in random order, or inserted one by one at random positions accepted by the
+    // insertion check, which gives routes mostly within time windows
+    std::vector<int> CreateGenotype(CECVRPTWTemplate& problemTemplate, bool checkInsertions, std::mt19937& rng)
+    {
+        std::vector<int> customers(problemTemplate.GetCustomers().begin(), problemTemplate.GetCustomers().end());
+        std::shuffle(customers.begin(), customers.end(), rng);
+        std::vector<int> genotype(problemTemplate.GetVehicleCount() - 1, VEHICLE_DELIMITER);
+        CECVRPTWSolution solution(problemTemplate);
+        std::vector<size_t> positions;
+        for (int customerIdx : customers)
+        {
+            size_t gap = rng() % (genotype.size() + 1);
+            if (checkInsertions)
+            {
+                solution.BuildSolution(genotype);
+                positions.clear();
+                for (size_t solutionIdx = 1; solutionIdx < solution.GetSolution().size(); ++solutionIdx)
+                {
+                    if (solution.CanInsertWithinTimeWindows(solutionIdx, customerIdx))
+                    {
+                        positions.push_back(solutionIdx);
+                    }
+                }
+                if (!positions.empty())
+                {
+                    gap = GetGenotypeGap(solution, positions[rng() % positions.size()], genotype);
+                }
+            }
+            genotype.insert(genotype.begin() + gap, customerIdx);
+        }
+        return genotype;
+    }
+
+    // Whether the customers of the route starting at the position are served within their time windows
+    bool IsWithinTimeWindows(const CECVRPTWSolution& solution, size_t solutionIdx)
+    {
+        auto& cities = solution.GetTemplate().GetCities();
+        float dayLength = solution.GetTemplate().GetMaxDueTime();
+        auto& path = solution.GetSolution();
+        for (size_t i = solutionIdx; i < path.size() && path[i] != VEHICLE_DELIMITER; ++i)
+        {
+            const SCityECVRPTW& city = cities[path[i]];
+            if (city.m_Type == ENodeType::Customer && std::fmod(solution.GetVisits()[i].m_Arrival, dayLength) > city.m_DueTime)
+            {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    // Whether the customers of the route after the position arrive on the same day after a customer was inserted there
+    bool IsServedOnSameDays(const CECVRPTWSolution& solution, const CECVRPTWSolution& changedSolution, size_t solutionIdx)
+    {
+        auto& cities = solution.GetTemplate().GetCities();
+        float dayLength = solution.GetTemplate().GetMaxDueTime();
+        auto& path = solution.GetSolution();
+        for (size_t i = solutionIdx; i < path.size() && path[i] != VEHICLE_DELIMITER; ++i)
+        {
+            if (cities[path[i]].m_Type == ENodeType::Customer
+                && std::floor(solution.GetVisits()[i].m_Arrival / dayLength) != std::floor(changedSolution.GetVisits()[i + 1].m_Arrival / dayLength))
+            {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    // Whether a solution changed in place matches the solution built from the changed genotype, including slacks
+    bool IsSameSolution(const CECVRPTWSolution& solution, const CECVRPTWSolution& builtSolution)
+    {
+        if (solution.GetSolution() != builtSolution.GetSolution())
+        {
+            return false;
+        }
+        auto& path = solution.GetSolution();
+        size_t carsCount = std::count(path.begin(), path.end(), VEHICLE_DELIMITER) + 1;
+        for (size_t carIdx = 0; carIdx < carsCount; ++carIdx)
+        {
+            if (solution.GetRouteEndPosition(carIdx) != builtSolution.GetRouteEndPosition(carIdx))
+            {
+                return false;
+            }
+        }
+        for (int customerIdx : solution.GetTemplate().GetCustomers())
+        {
+            if (std::min(solution.GetPosition(customerIdx), path.size()) != std::min(builtSolution.GetPosition(customerIdx), path.size()))
+            {
+                return false;
+            }
+        }
+        for (size_t i = 0; i < path.size(); ++i)
+        {
+            const SVisitECVRPTW& visit = solution.GetVisits()[i];
+            const SVisitECVRPTW& builtVisit = builtSolution.GetVisits()[i];
+            if (path[i] != VEHICLE_DELIMITER && (visit.m_Arrival != builtVisit.m_Arrival || visit.m_Departure != builtVisit.m_Departure
+                || visit.m_TankCapacity != builtVisit.m_TankCapacity || visit.m_Load != builtVisit.m_Load
+                || visit.m_MaxDelay != builtVisit.m_MaxDelay || visit.m_SegmentMaxDelay != builtVisit.m_SegmentMaxDelay
+                || visit.m_NextRefuelIdx != builtVisit.m_NextRefuelIdx || visit.m_FuelSlack != builtVisit.m_FuelSlack
+                || visit.m_LoadSlack != builtVisit.m_LoadSlack || visit.m_LoadDeficitSlack != builtVisit.m_LoadDeficitSlack))
+            {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    struct SCounts
+    {
+        size_t m_Insertions = 0;
+        size_t m_FeasibleInsertions = 0;
+        size_t m_Removals = 0;
+        size_t m_FeasibleRemovals = 0;
+        size_t m_Errors = 0;
+    };
+
+    void CheckInsertions(CECVRPTWTemplate& problemTemplate, const std::vector<int>& genotype, int customerIdx, SCounts& counts)
+    {
+        CECVRPTWSolution solution(problemTemplate);
+        CECVRPTWSolution changedSolution(problemTemplate);
+        CECVRPTWSolution incrementalSolution(problemTemplate);
+        solution.BuildSolution(genotype);
+        auto& path = solution.GetSolution();
+        for (size_t solutionIdx = 1; solutionIdx < path.size(); ++solutionIdx)
+        {
+            bool canInsert = solution.CanInsertWithinTimeWindows(solutionIdx, customerIdx);
+            ++counts.m_Insertions;
+            counts.m_FeasibleInsertions += canInsert;
+            bool isNextToDetour = solution.GetVisits()[solutionIdx - 1].m_Refuels || solution.GetVisits()[solutionIdx].m_Refuels;
+            if (canInsert && isNextToDetour)
+            {
+                std::cout << "Insertion next to a station or depot visit accepted at " << solutionIdx << "\n";
+                ++counts.m_Errors;
+            }
+            // Routes insert only in front of customers and route ends
+            if (path[solutionIdx - 1] == VEHICLE_DELIMITER || path[solutionIdx] == VEHICLE_DELIMITER || solution.GetVisits()[solutionIdx].m_Refuels)
+            {
+                continue;
+            }
+
+            std::vector<int> changedGenotype = genotype;
+            changedGenotype.insert(changedGenotype.begin() + GetGenotypeGap(solution, solutionIdx, genotype), customerIdx);
+            changedSolution.BuildSolution(changedGenotype);
+
+            incrementalSolution.BuildSolution(genotype);
+            incrementalSolution.InsertCustomer(solutionIdx, customerIdx);
+            if (!IsSameSolution(incrementalSolution, changedSolution))
+            {
+                std::cout << "Insertion of " << customerIdx << " at " << solutionIdx << " differs from building the solution\n";
+                ++counts.m_Errors;
+            }
+            if (isNextToDetour)
+            {
+                continue;
+            }
+
+            std::vector<int> expectedPath = path;
+            expectedPath.insert(expectedPath.begin() + solutionIdx, customerIdx);
+            // Routes already missing a time window are rejected, even if the delay moves the late arrival to the next day
+            bool isFeasible = changedSolution.GetSolution() == expectedPath && IsWithinTimeWindows(solution, solutionIdx)
+                && IsWithinTimeWindows(changedSolution, solutionIdx) && IsServedOnSameDays(solution, changedSolution, solutionIdx);
+            if (canInsert != isFeasible)
+            {
+                std::cout << "Insertion of " << customerIdx << " at " << solutionIdx << " checked as " << canInsert
+                    << ", building the solution gives " << isFeasible << "\n";
+                ++counts.m_Errors;
+            }
+        }
+    }
+
+    void CheckRemovals(CECVRPTWTemplate& problemTemplate, const std::vector<int>& genotype, SCounts& counts)
+    {
+        CECVRPTWSolution solution(problemTemplate);
+        CECVRPTWSolution changedSolution(problemTemplate);
+        CECVRPTWSolution incrementalSolution(problemTemplate);
+        solution.BuildSolution(genotype);
+        auto& path = solution.GetSolution();
+        for (int customerIdx : problemTemplate.GetCustomers())
+        {
+            size_t solutionIdx = solution.GetPosition(customerIdx);
+            if (solutionIdx >= path.size())
+            {
+                continue;
+            }
+
+            std::vector<int> changedGenotype = genotype;
+            changedGenotype.erase(std::find(changedGenotype.begin(), changedGenotype.end(), customerIdx));
+            changedSolution.BuildSolution(changedGenotype);
+
+            incrementalSolution.BuildSolution(genotype);
+            incrementalSolution.RemoveCustomer(customerIdx);
+            if (!IsSameSolution(incrementalSolution, changedSolution))
+            {
+                std::cout << "Removal of " << customerIdx << " differs from building the solution\n";
+                ++counts.m_Errors;
+            }
+            if (!solution.CanRemoveWithinTimeWindows(solutionIdx))
+            {
+                continue;
+            }
+            ++counts.m_Removals;
+
+            // Removal is accepted only when the later customers of the route stay within time windows
+            size_t nextIdx = solutionIdx + 1;
+            while (nextIdx < path.size() && path[nextIdx] != VEHICLE_DELIMITER
+                   && problemTemplate.GetCities()[path[nextIdx]].m_Type != ENodeType::Customer)
+            {
+                ++nextIdx;
+            }
+            bool isFeasible = nextIdx >= path.size() || path[nextIdx] == VEHICLE_DELIMITER
+                || IsWithinTimeWindows(changedSolution, changedSolution.GetPosition(path[nextIdx]));
+            counts.m_FeasibleRemovals += isFeasible;
+            if (!isFeasible)
+            {
+                std::cout << "Removal of " << customerIdx << " accepted, but later customers miss time windows\n";
+                ++counts.m_Errors;
+            }
+        }
+    }
+}
+
+int main(int argc, char* argv[])
+{
+    std::vector<std::string> instances;
+    for (int i = 1; i < argc; ++i)
+    {
+        instances.emplace_back(argv[i]);
+    }
+    if (instances.empty())
+    {
+        for (const char* name : {"c101_21.txt", "c103C15.txt", "c201_21.txt", "r102C15.txt", "r201_21.txt", "rc201_21.txt"})
+        {
+            instances.push_back(std::string(IMOPSE_CONFIGURATIONS_DIR) + "/problems/ECVRPTW/" + name);
+        }
+    }
+
+    size_t errors = 0;
+    for (const std::string& instance : instances)
+    {
+        CECVRPTW* problem = CECVRPTWFactory::CreateECVRPTW(instance.c_str());
+        CECVRPTWTemplate& problemTemplate = problem->GetECVRPTWTemplate();
+        std::mt19937 rng(0);
+        SCounts counts;
+        for (int genotypeIdx = 0; genotypeIdx < 100; ++genotypeIdx)
+        {
+            std::vector<int> genotype = CreateGenotype(problemTemplate, genotypeIdx % 2 == 0, rng);
+            CheckRemovals(problemTemplate, genotype, counts);
+
+            // Removed customers are inserted back at every position of the routes
+            for (int removedIdx = 0; removedIdx < 3; ++removedIdx)
+            {
+                auto customerIt = std::find_if(genotype.begin() + rng() % genotype.size(), genotype.end(), [](int gene)
+                {
+                    return gene != VEHICLE_DELIMITER;
+                });
+                if (customerIt == genotype.end())
+                {
+                    continue;
+                }
+                int customerIdx = *customerIt;
+                genotype.erase(customerIt);
+                CheckInsertions(problemTemplate, genotype, customerIdx, counts);
+            }
+        }
+        std::cout << instance << ": " << counts.m_FeasibleInsertions << " of " << counts.m_Insertions
+            << " insertions and " << counts.m_FeasibleRemovals << " of " << counts.m_Removals
+            << " accepted removals within time windows, " << counts.m_Errors << " errors\n";
+        errors += counts.m_Errors;
+
+        delete problem;
+        CECVRPTWFactory::DeleteObjects();
+    }
+    return errors == 0 ? 0 : 1;
+}
@@ -1,9 +1,6 @@
 #include "ParetoFront.h"
-#include "ParetoMetrics.h"
+#include "ParetoIndex.h"
 #include <cmath>
-#include <algorithm>
-
-static constexpr float EPS_ACCURACY = 0.000001f;
 
 ParetoFront ParetoFront::Merge(const ParetoFront& otherParetoFront)
 {
@@ -16,36 +13,23 @@ ParetoFront ParetoFront::Merge(const ParetoFront& otherParetoFront)
 	newSolutions.reserve(solutions.size() + otherSolutions.size());
 
 	// First, add our solutions which are not dominated, we assume there are no duplicates among them
-	for (size_t i = 0; i < solutions.size(); ++i)
+	const ParetoIndex otherIndex(otherSolutions);
+	for (const std::vector<float>& solution : solutions)
 	{
-		size_t j = 0;
-		bool isDominated = false;
-		while (!isDominated && j < otherParetoFront.solutions.size())
+		if (!otherIndex.IsDominated(solution))
 		{
-			isDominated = IsDominatedBy(solutions[i], otherSolutions[j]);
-			++j;
-		}
-		if (!isDominated)
-		{
-			newSolutions.push_back(solutions[i]);
+			newSolutions.push_back(solution);
 		}
 	}
 
 	// Now, add other solutions which are not dominated, we assume there are no duplicates among them but have to check with those we already added
-	// Check against non-dominated solutions found so far
-	size_t newSolutionsFromFirstPareto = newSolutions.size();
-	for (size_t i = 0; i < otherSolutions.size(); ++i)
+	// Check against non-dominated solutions found so far (index covers only solutions from the first Pareto)
+	const ParetoIndex firstParetoIndex(newSolutions);
+	for (const std::vector<float>& otherSolution : otherSolutions)
 	{
-		size_t j = 0;
-		bool isDominatedOrDup = false;
-		while (!isDominatedOrDup && j < newSolutionsFromFirstPareto)
+		if (!firstParetoIndex.IsDominatedOrDuplicate(otherSolution))
 		{
-			isDominatedOrDup = IsDominatedByOrDuplicate(otherSolutions[i], newSolutions[j]);
-			++j;
-		}
-		if (!isDominatedOrDup)
-		{
-			newSolutions.push_back(otherSolutions[i]);
+			newSolutions.push_back(otherSolution);
 		}
 	}
 
@@ -55,19 +39,11 @@ ParetoFront ParetoFront::Merge(const ParetoFront& otherParetoFront)
 size_t ParetoFront::GetNumberOfNonDominatedBy(const ParetoFront& otherParetoFront) const
 {
 	size_t nonDominated = 0;
-    auto otherSolutions = otherParetoFront.solutions;
-    otherSolutions.erase(std::remove_if(otherSolutions.begin(), otherSolutions.end(),
-                                       [](const std::vector<float>& sol) { return sol.empty(); }), otherSolutions.end());
-	for (size_t i = 0; i < solutions.size(); ++i)
+	// Empty solutions of other front are skipped by the index
+	const ParetoIndex otherIndex(otherParetoFront.solutions);
+	for (const std::vector<float>& solution : solutions)
 	{
-		size_t j = 0;
-		bool isDominated = false;
-		while (!isDominated && j < otherSolutions.size())
-		{
-			isDominated = IsDominatedBy(solutions[i], otherSolutions[j]);
-			++j;
-		}
-		if (!isDominated)
+		if (!otherIndex.IsDominated(solution))
 		{
 			++nonDominated;
 		}
@@ -3,6 +3,8 @@
 #include <map>
 #include <string>
 
+static constexpr float EPS_ACCURACY = 0.000001f;
+
 struct ParetoFront
 {
 	std::vector<std::vector<float>> solutions;
@@ -0,0 +1,367 @@
+#include "ParetoIndex.h"
+#include "ParetoFront.h"
+#include <algorithm>
+#include <cmath>
+#include <float.h>
+
+float CalcDist2(const std::vector<float>& vec1, const std::vector<float>& vec2)
+{
+	// We assume they are equal sizes
+	size_t s = vec1.size();
+	float dist2 = 0.f;
+	float tempDiff = 0.f;
+	for (size_t i = 0; i < s; ++i)
+	{
+		tempDiff = vec2[i] - vec1[i];
+		dist2 += (tempDiff * tempDiff);
+	}
+	return dist2;
+}
+
+float CalcDist2Plus(const std::vector<float>& vec1, const std::vector<float>& vec2)
+{
+	// We assume they are equal sizes
+	size_t s = vec1.size();
+	float dist2 = 0.f;
+	float tempDiff = 0.f;
+	for (size_t i = 0; i < s; ++i)
+	{
+		tempDiff = fmaxf(0.f, vec2[i] - vec1[i]);
+		dist2 += (tempDiff * tempDiff);
+	}
+	return dist2;
+}
+
+float CalcDistNonEuclidean(const std::vector<float>& vec1, const std::vector<float>& vec2)
+{
+	// We assume they are equal sizes
+	size_t s = vec1.size();
+	float dist = 0.f;
+	for (size_t i = 0; i < s; ++i)
+	{
+		dist += fabsf(vec2[i] - vec1[i]);
+	}
+	return dist;
+}
+
+static float CalcDistance(EDistanceType distanceType, const std::vector<float>& reference, const std::vector<float>& point)
+{
+	switch (distanceType)
+	{
+	case EDistanceType::Euclidean2Plus:
+		return CalcDist2Plus(reference, point);
+	case EDistanceType::NonEuclidean:
+		return CalcDistNonEuclidean(reference, point);
+	case EDistanceType::Euclidean2:
+	default:
+		return CalcDist2(reference, point);
+	}
+}
+
+ParetoIndex::ParetoIndex(const std::vector<std::vector<float>>& solutions)
+	: m_Solutions(solutions)
+	, m_SolutionsCount(solutions.size())
+{
+	m_Order.reserve(m_SolutionsCount);
+	for (size_t i = 0; i < m_SolutionsCount; ++i)
+	{
+		// Empty solutions are never considered as neighbours nor dominating ones
+		if (!solutions[i].empty())
+		{
+			m_Dimensions = m_Order.empty() ? solutions[i].size() : std::min(m_Dimensions, solutions[i].size());
+			m_Order.push_back(i);
+		}
+	}
+
+	m_SplitDims.resize(m_Order.size(), 0);
+	m_BoxMin.resize(m_Order.size() * m_Dimensions, 0.f);
+	Build(0, m_Order.size());
+
+	if (m_Dimensions == 2)
+	{
+		BuildSweep();
+	}
+}
+
+void ParetoIndex::Build(size_t begin, size_t end)
+{
+	if (end - begin <= LEAF_SIZE)
+	{
+		return;
+	}
+
+	// Find bounding box of the subtree and split by the widest dimension
+	const size_t mid = begin + (end - begin) / 2;
+	float* boxMin = &m_BoxMin[mid * m_Dimensions];
+	std::vector<float> boxMax(m_Dimensions);
+	for (size_t d = 0; d < m_Dimensions; ++d)
+	{
+		boxMin[d] = boxMax[d] = m_Solutions[m_Order[begin]][d];
+	}
+	for (size_t i = begin + 1; i < end; ++i)
+	{
+		const std::vector<float>& sol = m_Solutions[m_Order[i]];
+		for (size_t d = 0; d < m_Dimensions; ++d)
+		{
+			boxMin[d] = fminf(boxMin[d], sol[d]);
+			boxMax[d] = fmaxf(boxMax[d], sol[d]);
+		}
+	}
+
+	size_t splitDim = 0;
+	for (size_t d = 1; d < m_Dimensions; ++d)
+	{
+		if (boxMax[d] - boxMin[d] > boxMax[splitDim] - boxMin[splitDim])
+		{
+			splitDim = d;
+		}
+	}
+
+	const auto& solutions = m_Solutions;
+	std::nth_element(m_Order.begin() + begin, m_Order.begin() + mid, m_Order.begin() + end, [&solutions, splitDim](size_t lhv, size_t rhv) -> bool
+	{
+		return solutions[lhv][splitDim] < solutions[rhv][splitDim];
+	});
+	m_SplitDims[mid] = splitDim;
+
+	Build(begin, mid);
+	Build(mid + 1, end);
+}
+
+void ParetoIndex::BuildSweep()
+{
+	std::vector<size_t> sortedOrder(m_Order);
+	const auto& solutions = m_Solutions;
+	std::sort(sortedOrder.begin(), sortedOrder.end(), [&solutions](size_t lhv, size_t rhv) -> bool
+	{
+		return solutions[lhv][0] < solutions[rhv][0];
+	});
+
+	const size_t pointsCount = sortedOrder.size();
+	m_SweepObj0.resize(pointsCount);
+	m_SweepObj0Eps.resize(pointsCount);
+	m_SweepPrefixMinObj1.resize(pointsCount);
+	m_SweepPrefixMinObj1Eps.resize(pointsCount);
+	for (size_t i = 0; i < pointsCount; ++i)
+	{
+		const std::vector<float>& sol = m_Solutions[sortedOrder[i]];
+		// Values with accuracy are stored exactly as computed by IsDominatedBy, so comparisons give the same answers
+		const float obj1Eps = sol[1] + EPS_ACCURACY;
+		m_SweepObj0[i] = sol[0];
+		m_SweepObj0Eps[i] = sol[0] + EPS_ACCURACY;
+		m_SweepPrefixMinObj1[i] = i > 0 ? fminf(m_SweepPrefixMinObj1[i - 1], sol[1]) : sol[1];
+		m_SweepPrefixMinObj1Eps[i] = i > 0 ? fminf(m_SweepPrefixMinObj1Eps[i - 1], obj1Eps) : obj1Eps;
+	}
+	m_UseSweep = true;
+}
+
+bool ParetoIndex::IsSearchable(const std::vector<float>& point) const
+{
+	return !m_Order.empty() && point.size() == m_Dimensions;
+}
+
+float ParetoIndex::FindMinDistance(const std::vector<float>& reference, EDistanceType distanceType) const
+{
+	float minDistance = FLT_MAX;
+	if (IsSearchable(reference))
+	{
+		SearchNearest(0, m_Order.size(), reference, distanceType, minDistance);
+	}
+	else
+	{
+		for (size_t idx : m_Order)
+		{
+			minDistance = fminf(minDistance, CalcDistance(distanceType, reference, m_Solutions[idx]));
+		}
+	}
+	return minDistance;
+}
+
+void ParetoIndex::SearchNearest(size_t begin, size_t end, const std::vector<float>& reference, EDistanceType distanceType, float& minDistance) const
+{
+	if (end - begin <= LEAF_SIZE)
+	{
+		for (size_t i = begin; i < end; ++i)
+		{
+			float tempDistance = CalcDistance(distanceType, reference, m_Solutions[m_Order[i]]);
+			if (tempDistance < minDistance)
+			{
+				minDistance = tempDistance;
+			}
+		}
+		return;
+	}
+
+	const size_t mid = begin + (end - begin) / 2;
+	const size_t splitDim = m_SplitDims[mid];
+	const std::vector<float>& pivot = m_Solutions[m_Order[mid]];
+	float tempDistance = CalcDistance(distanceType, reference, pivot);
+	if (tempDistance < minDistance)
+	{
+		minDistance = tempDistance;
+	}
+
+	// Difference in split dimension is a lower bound of the distance to every point on the far side,
+	// computed the same way as in distance functions, so pruning never skips a closer point
+	const float splitDiff = pivot[splitDim] - reference[splitDim];
+	const bool isFarRight = splitDiff > 0.f;
+	float farBound = 0.f;
+	switch (distanceType)
+	{
+	case EDistanceType::Euclidean2:
+		farBound = splitDiff * splitDiff;
+		break;
+	case EDistanceType::Euclidean2Plus:
+		// Points on the left side may be better in split dimension, which does not add to the distance
+		farBound = isFarRight ? splitDiff * splitDiff : 0.f;
+		break;
+	case EDistanceType::NonEuclidean:
+		farBound = fabsf(splitDiff);
+		break;
+	}
+
+	if (isFarRight)
+	{
+		SearchNearest(begin, mid, reference, distanceType, minDistance);
+		if (farBound < minDistance)
+		{
+			SearchNearest(mid + 1, end, reference, distanceType, minDistance);
+		}
+	}
+	else
+	{
+		SearchNearest(mid + 1, end, reference, distanceType, minDistance);
+		if (farBound < minDistance)
+		{
+			SearchNearest(begin, mid, reference, distanceType, minDistance);
+		}
+	}
+}
+
+bool ParetoIndex::IsDominated(const std::vector<float>& solution) const
+{
+	if (m_UseSweep && IsSearchable(solution))
+	{
+		return IsDominatedSweep(solution, false);
+	}
+	if (IsSearchable(solution))
+	{
+		return SearchDominating(0, m_Order.size(), solution, false);
+	}
+
+	// Empty solution is never dominated
+	if (solution.empty())
+	{
+		return false;
+	}
+	for (size_t idx : m_Order)
+	{
+		if (IsDominatedBy(solution, m_Solutions[idx]))
+		{
+			return true;
+		}
+	}
+	return false;
+}
+
+bool ParetoIndex::IsDominatedOrDuplicate(const std::vector<float>& solution) const
+{
+	if (m_UseSweep && IsSearchable(solution))
+	{
+		return IsDominatedSweep(solution, true);
+	}
+	if (IsSearchable(solution))
+	{
+		return SearchDominating(0, m_Order.size(), solution, true);
+	}
+
+	// Empty solution is treated as duplicate of any other
+	if (solution.empty())
+	{
+		return m_SolutionsCount > 0;
+	}
+	for (size_t idx : m_Order)
+	{
+		if (IsDominatedByOrDuplicate(solution, m_Solutions[idx]))
+		{
+			return true;
+		}
+	}
+	return false;
+}
+
+bool ParetoIndex::SearchDominating(size_t begin, size_t end, const std::vector<float>& solution, bool withDuplicates) const
+{
+	if (end - begin <= LEAF_SIZE)
+	{
+		for (size_t i = begin; i < end; ++i)
+		{
+			const std::vector<float>& other = m_Solutions[m_Order[i]];
+			if (withDuplicates ? IsDominatedByOrDuplicate(solution, other) : IsDominatedBy(solution, other))
+			{
+				return true;
+			}
+		}
+		return false;
+	}
+
+	const size_t mid = begin + (end - begin) / 2;
+	const float* boxMin = &m_BoxMin[mid * m_Dimensions];
+
+	// Every point of the subtree is worse in some dimension
+	for (size_t d = 0; d < m_Dimensions; ++d)
+	{
+		if (solution[d] + EPS_ACCURACY < boxMin[d])
+		{
+			return false;
+		}
+	}
+
+	// No point of the subtree can be better in any dimension
+	if (!withDuplicates)
+	{
+		bool canBeBetter = false;
+		for (size_t d = 0; d < m_Dimensions && !canBeBetter; ++d)
+		{
+			canBeBetter = boxMin[d] + EPS_ACCURACY < solution[d];
+		}
+		if (!canBeBetter)
+		{
+			return false;
+		}
+	}
+
+	const std::vector<float>& pivot = m_Solutions[m_Order[mid]];
+	if (withDuplicates ? IsDominatedByOrDuplicate(solution, pivot) : IsDominatedBy(solution, pivot))
+	{
+		return true;
+	}
+
+	return SearchDominating(begin, mid, solution, withDuplicates) || SearchDominating(mid + 1, end, solution, withDuplicates);
+}
+
+bool ParetoIndex::IsDominatedSweep(const std::vector<float>& solution, bool withDuplicates) const
+{
+	// Other solution dominates (or duplicates) when it is not worse by more than accuracy in both objectives.
+	// For domination it also has to be better by more than accuracy in at least one objective,
+	// which already implies it is not worse in that objective.
+	const float obj0Eps = solution[0] + EPS_ACCURACY;
+	const float obj1Eps = solution[1] + EPS_ACCURACY;
+
+	// Solutions not worse in first objective
+	const size_t notWorseCount = std::upper_bound(m_SweepObj0.begin(), m_SweepObj0.end(), obj0Eps) - m_SweepObj0.begin();
+	if (withDuplicates)
+	{
+		return notWorseCount > 0 && m_SweepPrefixMinObj1[notWorseCount - 1] <= obj1Eps;
+	}
+
+	// Not worse in first objective and better in second objective
+	if (notWorseCount > 0 && m_SweepPrefixMinObj1Eps[notWorseCount - 1] < solution[1])
+	{
+		return true;
+	}
+
+	// Better in first objective and not worse in second objective
+	const size_t betterCount = std::lower_bound(m_SweepObj0Eps.begin(), m_SweepObj0Eps.end(), solution[0]) - m_SweepObj0Eps.begin();
+	return betterCount > 0 && m_SweepPrefixMinObj1[betterCount - 1] <= obj1Eps;
+}
@@ -0,0 +1,61 @@
+#pragma once
+#include <vector>
+#include <cstddef>
+
+enum class EDistanceType
+{
+	Euclidean2,		// Squared euclidean distance (GD, IGD)
+	Euclidean2Plus,	// Squared euclidean distance counting only worse objectives (IGD+)
+	NonEuclidean	// Sum of absolute differences (IGD from the article)
+};
+
+float CalcDist2(const std::vector<float>& vec1, const std::vector<float>& vec2);
+float CalcDist2Plus(const std::vector<float>& vec1, const std::vector<float>& vec2);
+float CalcDistNonEuclidean(const std::vector<float>& vec1, const std::vector<float>& vec2);
+
+// k-d tree built over solutions of a front, answers nearest neighbour and dominance queries
+// without scanning the whole front. Queries return exactly the same values as a brute force scan.
+// Index keeps a reference to the solutions container, which has to outlive it and must not be modified
+// (appending is allowed, appended solutions are not indexed).
+class ParetoIndex
+{
+public:
+
+	explicit ParetoIndex(const std::vector<std::vector<float>>& solutions);
+
+	// Minimal distance from reference to any indexed solution, FLT_MAX if index is empty
+	float FindMinDistance(const std::vector<float>& reference, EDistanceType distanceType) const;
+	// Is solution dominated by any indexed solution
+	bool IsDominated(const std::vector<float>& solution) const;
+	// Is solution dominated by or duplicate of any indexed solution
+	bool IsDominatedOrDuplicate(const std::vector<float>& solution) const;
+
+private:
+
+	static constexpr size_t LEAF_SIZE = 8;
+
+	const std::vector<std::vector<float>>& m_Solutions;
+	// Number of solutions in container at build time (including empty ones)
+	size_t m_SolutionsCount = 0;
+	size_t m_Dimensions = 0;
+	// Indices of non-empty solutions, ordered as implicit tree (node is middle element of its range)
+	std::vector<size_t> m_Order;
+	// Split dimension for every node, indexed by node position in m_Order
+	std::vector<size_t> m_SplitDims;
+	// Bounding box minimum of node subtree, m_Dimensions values for every node position in m_Order
+	std::vector<float> m_BoxMin;
+
+	// Two-objective fronts, sorted by first objective, used for dominance queries in O(log n)
+	bool m_UseSweep = false;
+	std::vector<float> m_SweepObj0;
+	std::vector<float> m_SweepObj0Eps;
+	std::vector<float> m_SweepPrefixMinObj1;
+	std::vector<float> m_SweepPrefixMinObj1Eps;
+
+	void Build(size_t begin, size_t end);
+	void BuildSweep();
+	void SearchNearest(size_t begin, size_t end, const std::vector<float>& reference, EDistanceType distanceType, float& minDistance) const;
+	bool SearchDominating(size_t begin, size_t end, const std::vector<float>& solution, bool withDuplicates) const;
+	bool IsDominatedSweep(const std::vector<float>& solution, bool withDuplicates) const;
+	bool IsSearchable(const std::vector<float>& point) const;
+};
@@ -1,4 +1,5 @@
 #include "ParetoMetrics.h"
+#include "ParetoIndex.h"
 #include <algorithm>
 #include <cmath>
 #include <float.h>
@@ -124,46 +125,6 @@ ParetoMetrics ParetoMatricsEvaluator::EvaluateParetoFront_IGD(const ParetoFront&
 	return paretoMetrics;
 }
 
-float CalcDist2(const std::vector<float>& vec1, const std::vector<float>& vec2)
-{
-	// We assume they are equal sizes
-	size_t s = vec1.size();
-	float dist2 = 0.f;
-	float tempDiff = 0.f;
-	for (size_t i = 0; i < s; ++i)
-	{
-		tempDiff = vec2[i] - vec1[i];
-		dist2 += (tempDiff * tempDiff);
-	}
-	return dist2;
-}
-
-float CalcDist2Plus(const std::vector<float>& vec1, const std::vector<float>& vec2)
-{
-	// We assume they are equal sizes
-	size_t s = vec1.size();
-	float dist2 = 0.f;
-	float tempDiff = 0.f;
-	for (size_t i = 0; i < s; ++i)
-	{
-		tempDiff = fmaxf(0.f, vec2[i] - vec1[i]);
-		dist2 += (tempDiff * tempDiff);
-	}
-	return dist2;
-}
-
-float CalcDistNonEuclidean(const std::vector<float>& vec1, const std::vector<float>& vec2)
-{
-	// We assume they are equal sizes
-	size_t s = vec1.size();
-	float dist = 0.f;
-	for (size_t i = 0; i < s; ++i)
-	{
-		dist += fabsf(vec2[i] - vec1[i]);
-	}
-	return dist;
-}
-
 // Calculate Hyper-volume using values as they are (either absolute or normalized), using the reference point
 float ParetoMatricsEvaluator::CalcHV(const ParetoFront& paretoFrontToEvaluate, const std::vector<float>& refPoint) const
 {
@@ -195,29 +156,15 @@ float ParetoMatricsEvaluator::CalcGenerationalDistance(const ParetoFront& refere
 {
 	float distSum = 0.f;
 	const auto& referenceSolutions = referenceParetoFront.solutions;
-	auto otherSolutions = paretoFrontToEvaluate.solutions;
-    otherSolutions.erase(std::remove_if(otherSolutions.begin(), otherSolutions.end(),
-                                       [](const std::vector<float>& sol) { return sol.empty(); }), otherSolutions.end());
-	const size_t otherSolSize = otherSolutions.size();
-	float minDist2 = FLT_MAX;
-	float tempDist2 = FLT_MAX;
+	// Empty solutions of evaluated front are skipped by the index
+	const ParetoIndex otherIndex(paretoFrontToEvaluate.solutions);
 
 	for (size_t i = 0; i < referenceSolutions.size(); ++i)
 	{
 		// Find closest point to true point
-		minDist2 = FLT_MAX;
-		for (size_t j = 0; j < otherSolSize; ++j)
-		{
-			tempDist2 = CalcDist2(referenceSolutions[i], otherSolutions[j]);
-			if (tempDist2 < minDist2)
-			{
-				minDist2 = tempDist2;
-			}
-		}
-
 		// Do not calculate sqrtf like normally, use dist2 and normalize at the end -> as described in equation
 		//distSum += sqrtf(minDist2);
-		distSum += minDist2;
+		distSum += otherIndex.FindMinDistance(referenceSolutions[i], EDistanceType::Euclidean2);
 	}
 
 	return sqrtf(distSum) / referenceSolutions.size();
@@ -227,26 +174,13 @@ float ParetoMatricsEvaluator::CalcGenerationalDistancePlus(const ParetoFront& re
 {
 	float distSum = 0.f;
 	const auto& referenceSolutions = referenceParetoFront.solutions;
-	const auto& otherSolutions = paretoFrontToEvaluate.solutions;
-	const size_t otherSolSize = otherSolutions.size();
-	float minDist2 = FLT_MAX;
-	float tempDist2 = FLT_MAX;
+	const ParetoIndex otherIndex(paretoFrontToEvaluate.solutions);
 
 	for (size_t i = 0; i < referenceSolutions.size(); ++i)
 	{
 		// Find closest point to true point
-		minDist2 = FLT_MAX;
-		for (size_t j = 0; j < otherSolSize; ++j)
-		{
-			tempDist2 = CalcDist2Plus(referenceSolutions[i], otherSolutions[j]);
-			if (tempDist2 < minDist2)
-			{
-				minDist2 = tempDist2;
-			}
-		}
-
 		// Do not calculate sqrtf like normally, use dist2 -> as described in equation
-		distSum += minDist2;
+		distSum += otherIndex.FindMinDistance(referenceSolutions[i], EDistanceType::Euclidean2Plus);
 	}
 
 	// Do not calculate sqrt as in the equation
@@ -258,24 +192,13 @@ float ParetoMatricsEvaluator::CalcGenerationalDistanceNonEuclidean(const ParetoF
 {
 	float distSum = 0.f;
 	const auto& referenceSolutions = referenceParetoFront.solutions;
-	const auto& otherSolutions = paretoFrontToEvaluate.solutions;
-	const size_t otherSolSize = otherSolutions.size();
+	const ParetoIndex otherIndex(paretoFrontToEvaluate.solutions);
 	float minDist = FLT_MAX;
-	float tempDist = FLT_MAX;
 
 	for (size_t i = 0; i < referenceSolutions.size(); ++i)
 	{
 		// Find closest point to true point
-		minDist = FLT_MAX;
-		for (size_t j = 0; j < otherSolSize; ++j)
-		{
-			tempDist = CalcDistNonEuclidean(referenceSolutions[i], otherSolutions[j]);
-			if (tempDist < minDist)
-			{
-				minDist = tempDist;
-			}
-		}
-
+		minDist = otherIndex.FindMinDistance(referenceSolutions[i], EDistanceType::NonEuclidean);
 		distSum += (minDist * minDist);
 	}
 
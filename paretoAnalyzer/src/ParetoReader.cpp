@@ -162,4 +162,20 @@ void ParetoReader::ReadParetoFromCSV(const char* directoryPath, const std::strin
 	}
 
 	readFileStream.close();
+}
+
+bool ParetoReader::ReadTrueParetoFront(const char* directoryPath, ParetoFront& trueParetoFront, const char* instanceName)
+{
+	const std::filesystem::path resultsPath(directoryPath);
+
+	for (const auto& runDirEntry : std::filesystem::directory_iterator(resultsPath / instanceName))
+	{
+		if (std::filesystem::exists(runDirEntry.path() / "true_front.csv"))
+		{
+			ReadParetoFromCSV(runDirEntry.path().string().c_str(), "true_front", trueParetoFront);
+			return !trueParetoFront.solutions.empty();
+		}
+	}
+
+	return false;
 }
\ No newline at end of file
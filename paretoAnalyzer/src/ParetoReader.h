@@ -10,4 +10,6 @@ public:
 	void ReadNTGA2Paretos(const char* filePath, ConfigResults& configResults);
 
 	void ReadParetoFromCSV(const char* directoryPath, const std::string& fileName, ParetoFront& paretoToRead);
+	// Reads the analytic front written by benchmark problems to run directories, returns false if there is none
+	bool ReadTrueParetoFront(const char* directoryPath, ParetoFront& trueParetoFront, const char* instanceName);
 };
\ No newline at end of file
@@ -69,6 +69,14 @@ int main(int argc, char* argv[]) {
     }
     paretoWriter.WriteParetoToCSV(outputDir,  "true_pareto_front_approximation", trueParetoFront);
 
+    // Benchmark problems write their analytic front, it replaces the approximation for exact metrics
+    ParetoFront analyticParetoFront;
+    if (paretoReader.ReadTrueParetoFront(configsToAnalyze[0]->configPath.c_str(), analyticParetoFront, instanceName))
+    {
+        std::cout << "Analytic true Pareto front used" << std::endl;
+        trueParetoFront = analyticParetoFront;
+    }
+
     size_t trueParetoFrontSize = trueParetoFront.solutions.size();
     std::cout << "TPFS:" << trueParetoFrontSize << std::endl;
 
@@ -0,0 +1,179 @@
+import os
+import re
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+
+# Streaming aggregation of single-objective convergence curves (data.csv of run_N directories).
+# Every run is read in chunks by a worker process; the main process keeps only running sums over all
+# generations and run values at an evenly spaced grid of generations (used for median and quantile bands),
+# so memory does not grow with runs x generations.
+
+RUN_DIR_PATTERN = re.compile(r'^run_(\d+)$')
+
+DEFAULT_CHUNK_SIZE = 100000
+DEFAULT_GRID_SIZE = 2000
+
+
+def find_run_files(path, number_of_runs=None):
+    run_dirs = []
+    for entry in os.scandir(path):
+        match = RUN_DIR_PATTERN.match(entry.name)
+        if match and entry.is_dir():
+            run_dirs.append((int(match.group(1)), entry.path))
+    run_dirs.sort()
+    if number_of_runs is not None:
+        run_dirs = run_dirs[:number_of_runs]
+    files = [os.path.join(run_dir, 'data.csv') for _, run_dir in run_dirs]
+    return [file for file in files if os.path.exists(file)]
+
+
+def count_lines(file_path):
+    lines = 0
+    last_byte = b'\n'
+    with open(file_path, mode='rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            lines += block.count(b'\n')
+            last_byte = block[-1:]
+    return lines + (0 if last_byte == b'\n' else 1)
+
+
+def read_series(file_path, column=1, chunk_size=DEFAULT_CHUNK_SIZE, max_rows=None):
+    chunks = []
+    reader = pd.read_csv(file_path, delimiter=';', header=None, usecols=[column], nrows=max_rows,
+                         chunksize=chunk_size, dtype=np.float64)
+    for chunk in reader:
+        chunks.append(chunk.iloc[:, 0].to_numpy())
+    return np.concatenate(chunks) if chunks else np.empty(0)
+
+
+def lttb(x, y, threshold):
+    """Largest-Triangle-Three-Buckets downsampling, returns indices of kept points."""
+    length = len(x)
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+
+    indices = np.zeros(threshold, dtype=np.int64)
+    bucket_size = (length - 2) / (threshold - 2)
+    selected = 0
+    for i in range(threshold - 2):
+        bucket_start = int(i * bucket_size) + 1
+        bucket_end = int((i + 1) * bucket_size) + 1
+        next_start = bucket_end
+        next_end = min(int((i + 2) * bucket_size) + 1, length)
+        next_x = x[next_start:next_end].mean()
+        next_y = y[next_start:next_end].mean()
+
+        areas = np.abs((x[selected] - next_x) * (y[bucket_start:bucket_end] - y[selected]) -
+                       (x[selected] - x[bucket_start:bucket_end]) * (next_y - y[selected]))
+        selected = bucket_start + int(np.argmax(areas))
+        indices[i + 1] = selected
+    indices[-1] = length - 1
+    return indices
+
+
+class ConvergenceAggregate:
+    def __init__(self, generations, grid_step, runs_count):
+        self.generations = generations
+        self.grid_step = grid_step
+        self.grid = np.arange(0, generations, grid_step)
+        self.runs = 0
+        self.sums = np.zeros(generations)
+        self.best_sums = np.zeros(generations)
+        self.counts = np.zeros(generations, dtype=np.int64)
+        # Values of every run at grid generations, NaN where run is shorter
+        self.grid_values = np.full((runs_count, len(self.grid)), np.nan)
+        self.grid_best = np.full((runs_count, len(self.grid)), np.nan)
+
+    def add(self, values):
+        length = min(len(values), self.generations)
+        values = values[:length]
+        best_so_far = np.minimum.accumulate(values)
+        self.sums[:length] += values
+        self.best_sums[:length] += best_so_far
+        self.counts[:length] += 1
+
+        grid_length = (length + self.grid_step - 1) // self.grid_step
+        self.grid_values[self.runs, :grid_length] = values[::self.grid_step]
+        self.grid_best[self.runs, :grid_length] = best_so_far[::self.grid_step]
+        self.runs += 1
+
+    def mean(self):
+        return self.sums / np.maximum(self.counts, 1)
+
+    def best_so_far_mean(self):
+        return self.best_sums / np.maximum(self.counts, 1)
+
+    def quantiles(self, quantiles, best_so_far=False):
+        values = self.grid_best if best_so_far else self.grid_values
+        return np.nanquantile(values[:self.runs], quantiles, axis=0)
+
+    def median(self):
+        return self.quantiles(0.5)
+
+
+def aggregate_runs(files, column=1, max_rows=None, grid_size=DEFAULT_GRID_SIZE, workers=None,
+                   chunk_size=DEFAULT_CHUNK_SIZE):
+    if not files:
+        return None
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        generations = max(executor.map(count_lines, files))
+        if max_rows is not None:
+            generations = min(generations, max_rows)
+        aggregate = ConvergenceAggregate(generations, max(1, -(-generations // grid_size)), len(files))
+
+        # Keep only a few runs in flight, so finished series do not pile up in memory
+        max_pending = 2 * (workers or os.cpu_count() or 1)
+        pending = deque()
+        for file in files:
+            pending.append(executor.submit(read_series, file, column, chunk_size, max_rows))
+            if len(pending) >= max_pending:
+                aggregate.add(pending.popleft().result())
+        while pending:
+            aggregate.add(pending.popleft().result())
+
+    return aggregate
+
+
+def write_aggregate(aggregate, output_path, quantiles=(0.25, 0.75)):
+    quantile_values = aggregate.quantiles(list(quantiles))
+    data = {
+        'generation': aggregate.grid,
+        'runs': aggregate.counts[aggregate.grid],
+        'mean': aggregate.mean()[aggregate.grid],
+        'median': aggregate.median(),
+        'best_so_far_mean': aggregate.best_so_far_mean()[aggregate.grid],
+    }
+    for q, values in zip(quantiles, quantile_values):
+        data[f'q{q:g}'] = values
+    pd.DataFrame(data).to_csv(output_path, sep=';', index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Aggregate convergence curves of single-objective runs')
+    parser.add_argument('paths', nargs='+', help='Results directories containing run_N subdirectories')
+    parser.add_argument('-o', '--output', help='Output CSV path, used only for a single results directory')
+    parser.add_argument('--runs', type=int, help='Use only the first N runs')
+    parser.add_argument('--column', type=int, default=1, help='data.csv column holding fitness')
+    parser.add_argument('--max-rows', type=int, help='Use only the first N rows of every run')
+    parser.add_argument('--grid-size', type=int, default=DEFAULT_GRID_SIZE)
+    parser.add_argument('--workers', type=int)
+    args = parser.parse_args()
+
+    for path in args.paths:
+        aggregate = aggregate_runs(find_run_files(path, args.runs), args.column, args.max_rows, args.grid_size,
+                                   args.workers)
+        if aggregate is None:
+            print(f'No data.csv files found in {path}')
+            continue
+        output_path = args.output if args.output and len(args.paths) == 1 else \
+            os.path.join(path, 'convergence_aggregate.csv')
+        write_aggregate(aggregate, output_path)
+        print(f'{path}: {aggregate.runs} runs, {aggregate.generations} generations -> {output_path}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,430 @@
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import struct
+import hashlib
+import argparse
+import tempfile
+import threading
+import subprocess
+import socketserver
+from collections import deque
+from dataclasses import dataclass
+
+# Coordinator/worker runner for experiment grids spread over several machines.
+# The coordinator owns the grid of (method config, problem name, instance, seed) jobs and stores results in the
+# <output>/<method>/<instance>/run_N layout read by paretoAnalyzer. Workers connect over plain TCP, run imopse locally
+# and send back the run directory. Config and instance files are sent by content hash and cached by workers, so
+# machines do not need a shared file system. Jobs of lost workers are put back into the queue.
+#
+# Every message is a frame: 4-byte JSON header length, 8-byte binary payload length, JSON header, payload.
+
+FRAME_HEADER = struct.Struct('>IQ')
+MAX_HEADER_SIZE = 1 << 20
+
+DEFAULT_PORT = 5757
+HEARTBEAT_INTERVAL = 10.0
+WORKER_TIMEOUT = 3 * HEARTBEAT_INTERVAL
+WAIT_INTERVAL = 1.0
+RECONNECT_INTERVAL = 5.0
+DEFAULT_MAX_ATTEMPTS = 3
+OUTPUT_TAIL_SIZE = 2000
+
+
+def send_message(sock, message, payload=b''):
+    header = json.dumps(message).encode('utf-8')
+    sock.sendall(FRAME_HEADER.pack(len(header), len(payload)) + header)
+    if payload:
+        sock.sendall(payload)
+
+
+def receive_exact(sock, size):
+    chunks = []
+    while size > 0:
+        chunk = sock.recv(min(size, 1 << 20))
+        if not chunk:
+            raise ConnectionError('Connection closed')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def receive_message(sock):
+    header_size, payload_size = FRAME_HEADER.unpack(receive_exact(sock, FRAME_HEADER.size))
+    if header_size > MAX_HEADER_SIZE:
+        raise ValueError(f'Message header too large: {header_size} bytes')
+    message = json.loads(receive_exact(sock, header_size).decode('utf-8'))
+    payload = receive_exact(sock, payload_size) if payload_size else b''
+    return message, payload
+
+
+def pack_files(paths):
+    files = []
+    payload = bytearray()
+    for path in paths:
+        with open(path, mode='rb') as file:
+            content = file.read()
+        files.append([os.path.basename(path), len(content)])
+        payload += content
+    return files, bytes(payload)
+
+
+def unpack_files(files, payload):
+    offset = 0
+    for name, size in files:
+        yield os.path.basename(name), payload[offset:offset + size]
+        offset += size
+
+
+def hash_file(path):
+    digest = hashlib.sha1()
+    with open(path, mode='rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@dataclass
+class Job:
+    id: int
+    method: str
+    config: str
+    problem: str
+    instance: str
+    seed: int
+    run_index: int
+    attempts: int = 0
+
+    @property
+    def instance_name(self):
+        return os.path.splitext(os.path.basename(self.instance))[0]
+
+    def run_dir(self, output_root):
+        return os.path.join(output_root, self.method, self.instance_name, f'run_{self.run_index}')
+
+    def describe(self):
+        return f'{self.method} {self.instance_name} run_{self.run_index}'
+
+
+def load_grid(grid_path):
+    """Expands grid file into jobs, paths in the grid are relative to the grid file.
+
+    {"experiments": [{"method": "NTGA2", "config": "...cfg", "problem": "MSRCPSP_TA2",
+                      "instances": ["...def"], "runs": 10, "seed": 0}]}
+
+    Seeds of consecutive runs are incremented by one, like in the optimizer. Explicit "seeds" list may be given instead
+    of "runs" and "seed".
+    """
+    with open(grid_path, mode='r') as grid_file:
+        grid = json.load(grid_file)
+    grid_dir = os.path.dirname(os.path.abspath(grid_path))
+
+    def resolve(path):
+        return os.path.normpath(os.path.join(grid_dir, path))
+
+    jobs = []
+    for experiment in grid['experiments']:
+        config = resolve(experiment['config'])
+        method = experiment.get('method') or os.path.splitext(os.path.basename(config))[0]
+        seeds = experiment.get('seeds')
+        if seeds is None:
+            seed = experiment.get('seed', 0)
+            seeds = [seed + i for i in range(experiment.get('runs', 1))]
+        for instance in experiment['instances']:
+            for run_index, seed in enumerate(seeds):
+                jobs.append(Job(len(jobs), method, config, experiment['problem'], resolve(instance), seed, run_index))
+    return jobs
+
+
+class JobBoard:
+    def __init__(self, jobs, output_root, max_attempts):
+        self.output_root = output_root
+        self.max_attempts = max_attempts
+        self.total = len(jobs)
+        self.done = 0
+        self.failed = []
+        self.leased = {}
+        self.lock = threading.Condition()
+        self.file_hashes = {}
+
+        # Runs already stored by a previous coordinator are not run again
+        self.pending = deque()
+        for job in jobs:
+            if os.path.exists(os.path.join(job.run_dir(output_root), 'results.csv')):
+                self.done += 1
+            else:
+                self.pending.append(job)
+
+    def is_finished(self):
+        with self.lock:
+            return not self.pending and not self.leased
+
+    def wait_finished(self):
+        with self.lock:
+            while self.pending or self.leased:
+                self.lock.wait()
+
+    def take(self, worker):
+        with self.lock:
+            if not self.pending:
+                return None
+            job = self.pending.popleft()
+            self.leased[job.id] = (job, worker)
+            return job
+
+    def release(self, job, reason):
+        with self.lock:
+            if self.leased.pop(job.id, None) is None:
+                return
+            self.pending.appendleft(job)
+            self.lock.notify_all()
+        print(f'Re-queued {job.describe()}: {reason}')
+
+    def complete(self, job, worker, result, payload):
+        run_dir = job.run_dir(self.output_root)
+        files = dict(unpack_files(result.get('files', []), payload))
+        if 'results.csv' not in files:
+            self.__fail_attempt(job, worker, result)
+            return
+
+        # Store into a temporary directory first, so interrupted transfers never look like finished runs
+        os.makedirs(os.path.dirname(run_dir), exist_ok=True)
+        temp_dir = tempfile.mkdtemp(prefix=os.path.basename(run_dir) + '.', dir=os.path.dirname(run_dir))
+        for name, content in files.items():
+            with open(os.path.join(temp_dir, name), mode='wb') as file:
+                file.write(content)
+        with open(os.path.join(temp_dir, 'run_info.csv'), mode='w', newline='') as info_file:
+            info_file.write(f'MethodConfig;{job.config}\n')
+            info_file.write(f'ProblemName;{job.problem}\n')
+            info_file.write(f'ProblemInstance;{job.instance}\n')
+            info_file.write(f'Seed;{job.seed}\n')
+            info_file.write(f'WallTimeMs;{result.get("wall_time_ms", 0)}\n')
+            info_file.write(f'Worker;{worker}\n')
+        if os.path.exists(run_dir):
+            shutil.rmtree(run_dir)
+        os.replace(temp_dir, run_dir)
+
+        with self.lock:
+            self.leased.pop(job.id, None)
+            self.done += 1
+            done = self.done
+            self.lock.notify_all()
+        print(f'[{done}/{self.total}] {job.describe()} from {worker} in {result.get("wall_time_ms", 0)} ms')
+
+    def __fail_attempt(self, job, worker, result):
+        job.attempts += 1
+        print(f'{job.describe()} failed on {worker} with exit code {result.get("returncode")}:\n'
+              f'{result.get("output", "")}')
+        if job.attempts < self.max_attempts:
+            self.release(job, f'attempt {job.attempts} of {self.max_attempts} failed')
+            return
+        with self.lock:
+            self.leased.pop(job.id, None)
+            self.failed.append(job)
+            self.lock.notify_all()
+
+    def file_hash(self, path):
+        with self.lock:
+            if path not in self.file_hashes:
+                self.file_hashes[path] = hash_file(path)
+            return self.file_hashes[path]
+
+    def file_path(self, file_hash):
+        with self.lock:
+            for path, known_hash in self.file_hashes.items():
+                if known_hash == file_hash:
+                    return path
+        return None
+
+
+class CoordinatorHandler(socketserver.BaseRequestHandler):
+    def handle(self):
+        board = self.server.board
+        sock = self.request
+        sock.settimeout(WORKER_TIMEOUT)
+        worker = f'{self.client_address[0]}:{self.client_address[1]}'
+        job = None
+        reason = 'disconnected'
+        try:
+            while True:
+                message, payload = receive_message(sock)
+                message_type = message.get('type')
+                if message_type == 'hello':
+                    worker = f'{message.get("name", worker)}@{self.client_address[0]}'
+                elif message_type == 'request':
+                    job = board.take(worker)
+                    if job is not None:
+                        send_message(sock, {'type': 'job', 'id': job.id, 'problem': job.problem, 'seed': job.seed,
+                                            'config_name': os.path.basename(job.config),
+                                            'config_hash': board.file_hash(job.config),
+                                            'instance_name': os.path.basename(job.instance),
+                                            'instance_hash': board.file_hash(job.instance)})
+                    elif board.is_finished():
+                        send_message(sock, {'type': 'done'})
+                        return
+                    else:
+                        send_message(sock, {'type': 'wait', 'seconds': WAIT_INTERVAL})
+                elif message_type == 'fetch':
+                    path = board.file_path(message['hash'])
+                    if path is None:
+                        raise ValueError(f'Unknown file requested: {message["hash"]}')
+                    with open(path, mode='rb') as file:
+                        send_message(sock, {'type': 'file', 'hash': message['hash']}, file.read())
+                elif message_type == 'heartbeat':
+                    pass
+                elif message_type == 'result' and job is not None and message.get('id') == job.id:
+                    board.complete(job, worker, message, payload)
+                    job = None
+                    send_message(sock, {'type': 'ack'})
+                else:
+                    raise ValueError(f'Unexpected message: {message_type}')
+        except (OSError, ConnectionError, ValueError) as e:
+            reason = f'lost ({e})'
+        finally:
+            if job is not None:
+                board.release(job, f'worker {worker} {reason}')
+
+
+class CoordinatorServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, board):
+        super().__init__(address, CoordinatorHandler)
+        self.board = board
+
+
+def run_coordinator(grid_path, output_root, host, port, max_attempts):
+    board = JobBoard(load_grid(grid_path), os.path.abspath(output_root), max_attempts)
+    print(f'{board.total} jobs, {board.done} already stored, listening on {host}:{port}')
+    with CoordinatorServer((host, port), board) as server:
+        server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+        server_thread.start()
+        board.wait_finished()
+        # Let connected workers ask once more and receive 'done'
+        time.sleep(2 * WAIT_INTERVAL)
+        server.shutdown()
+
+    for job in board.failed:
+        print(f'Failed after {job.attempts} attempts: {job.describe()} (seed {job.seed})')
+    return 1 if board.failed else 0
+
+
+class Worker:
+    def __init__(self, host, port, executable, work_dir, name):
+        self.host = host
+        self.port = port
+        self.executable = os.path.abspath(executable)
+        self.work_dir = os.path.abspath(work_dir)
+        self.files_dir = os.path.join(self.work_dir, 'files')
+        self.name = name
+        os.makedirs(self.files_dir, exist_ok=True)
+
+    def run_slot(self, slot):
+        while True:
+            try:
+                with socket.create_connection((self.host, self.port)) as sock:
+                    send_message(sock, {'type': 'hello', 'name': f'{self.name}/{slot}'})
+                    if self.__serve(sock):
+                        return
+            except (OSError, ConnectionError) as e:
+                print(f'Slot {slot}: connection to {self.host}:{self.port} failed ({e}), retrying')
+            time.sleep(RECONNECT_INTERVAL)
+
+    def __serve(self, sock):
+        while True:
+            send_message(sock, {'type': 'request'})
+            message, _ = receive_message(sock)
+            if message['type'] == 'done':
+                return True
+            if message['type'] == 'wait':
+                time.sleep(message.get('seconds', WAIT_INTERVAL))
+                continue
+
+            config_path = self.__ensure_file(sock, message['config_hash'], message['config_name'])
+            instance_path = self.__ensure_file(sock, message['instance_hash'], message['instance_name'])
+            result, payload = self.__run_job(sock, message, config_path, instance_path)
+            send_message(sock, result, payload)
+            receive_message(sock)
+
+    def __ensure_file(self, sock, file_hash, name):
+        path = os.path.join(self.files_dir, file_hash, name)
+        if os.path.exists(path):
+            return path
+        send_message(sock, {'type': 'fetch', 'hash': file_hash})
+        _, content = receive_message(sock)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Other slots may fetch the same file at the same time, rename keeps the cached file complete
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), delete=False) as file:
+            file.write(content)
+        os.replace(file.name, path)
+        return path
+
+    def __run_job(self, sock, job, config_path, instance_path):
+        output_dir = tempfile.mkdtemp(prefix='job_', dir=self.work_dir)
+        try:
+            start = time.monotonic()
+            process = subprocess.Popen([self.executable, config_path, job['problem'], instance_path, output_dir, '1',
+                                        str(job['seed'])],
+                                       stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            while True:
+                try:
+                    output, _ = process.communicate(timeout=HEARTBEAT_INTERVAL)
+                    break
+                except subprocess.TimeoutExpired:
+                    send_message(sock, {'type': 'heartbeat'})
+            wall_time_ms = int((time.monotonic() - start) * 1000)
+
+            # Files of the run are accepted by presence of results.csv, the exit code is only reported
+            run_dir = os.path.join(output_dir, 'run_0')
+            paths = []
+            if os.path.isdir(run_dir):
+                paths = [entry.path for entry in os.scandir(run_dir) if entry.is_file() and entry.name != 'run_info.csv']
+            files, payload = pack_files(paths)
+            return {'type': 'result', 'id': job['id'], 'returncode': process.returncode, 'wall_time_ms': wall_time_ms,
+                    'output': output.decode(errors='replace')[-OUTPUT_TAIL_SIZE:], 'files': files}, payload
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+
+def run_worker(host, port, executable, work_dir, slots, name):
+    worker = Worker(host, port, executable, work_dir, name)
+    threads = [threading.Thread(target=worker.run_slot, args=(slot,)) for slot in range(slots)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Distribute iMOPSE experiment grids over worker machines')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    coordinator = subparsers.add_parser('coordinator', help='Serve jobs of a grid file and store results')
+    coordinator.add_argument('grid', help='JSON grid file')
+    coordinator.add_argument('-o', '--output', required=True, help='Results root, runs go to <method>/<instance>/run_N')
+    coordinator.add_argument('--host', default='0.0.0.0')
+    coordinator.add_argument('--port', type=int, default=DEFAULT_PORT)
+    coordinator.add_argument('--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+                             help='Runs without results are retried this many times, lost workers do not count')
+
+    worker = subparsers.add_parser('worker', help='Run jobs received from a coordinator')
+    worker.add_argument('host', help='Coordinator host')
+    worker.add_argument('--port', type=int, default=DEFAULT_PORT)
+    worker.add_argument('-e', '--executable', required=True, help='Path to imopse executable')
+    worker.add_argument('--slots', type=int, default=os.cpu_count() or 1, help='Number of concurrent runs')
+    worker.add_argument('--work-dir', default=os.path.join(tempfile.gettempdir(), 'imopse_worker'))
+    worker.add_argument('--name', default=socket.gethostname())
+
+    args = parser.parse_args()
+    if args.command == 'coordinator':
+        return run_coordinator(args.grid, args.output, args.host, args.port, args.max_attempts)
+    return run_worker(args.host, args.port, args.executable, args.work_dir, args.slots, args.name)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
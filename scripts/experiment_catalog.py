@@ -0,0 +1,357 @@
+import os
+import re
+import sys
+import csv
+import array
+import hashlib
+import sqlite3
+import argparse
+from dataclasses import dataclass
+
+# Catalog of optimizer run directories (<method>/<instance>/run_N) stored in a local SQLite index.
+# Run directories are ingested once; later ingests only re-read runs whose result files changed.
+# Run metadata is taken from run_info.csv written by the optimizer, with a fallback to the directory layout
+# (and DemoApp info.txt) for runs produced by older versions.
+
+RUN_DIR_PATTERN = re.compile(r'^run_(\d+)$')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    run_dir TEXT UNIQUE NOT NULL,
+    method TEXT,
+    instance TEXT,
+    run_index INTEGER,
+    problem_name TEXT,
+    config_path TEXT,
+    config_hash TEXT,
+    instance_path TEXT,
+    seed INTEGER,
+    wall_time_ms INTEGER,
+    front_size INTEGER,
+    objectives INTEGER,
+    front TEXT,
+    results_mtime REAL,
+    data_mtime REAL,
+    data_size INTEGER,
+    data_lines INTEGER,
+    data_offsets BLOB
+);
+CREATE INDEX IF NOT EXISTS runs_method_instance ON runs (method, instance);
+CREATE INDEX IF NOT EXISTS runs_problem ON runs (problem_name, instance);
+CREATE INDEX IF NOT EXISTS runs_config_hash ON runs (config_hash);
+'''
+
+QUERY_KEYS = ['method', 'instance', 'problem_name', 'config_hash', 'config_path', 'seed', 'run_index']
+
+
+@dataclass
+class Run:
+    id: int
+    run_dir: str
+    method: str
+    instance: str
+    run_index: int
+    problem_name: str
+    config_path: str
+    config_hash: str
+    instance_path: str
+    seed: int
+    wall_time_ms: int
+    front_size: int
+    objectives: int
+
+
+RUN_COLUMNS = ', '.join(Run.__dataclass_fields__.keys())
+
+
+def hash_file(path):
+    try:
+        with open(path, mode='rb') as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def read_run_info(run_dir):
+    info = {}
+    try:
+        with open(os.path.join(run_dir, 'run_info.csv'), mode='r') as info_file:
+            for row in csv.reader(info_file, delimiter=';'):
+                if len(row) >= 2:
+                    info[row[0]] = row[1]
+    except OSError:
+        pass
+    return info
+
+
+def read_demo_app_info(experiment_dir):
+    # DemoApp stores method config and instance file names one level above run directories
+    try:
+        with open(os.path.join(experiment_dir, 'info.txt'), mode='r') as info_file:
+            lines = [line.strip() for line in info_file.readlines()]
+        return lines[0], lines[1]
+    except (OSError, IndexError):
+        return None, None
+
+
+def index_lines(path):
+    # Byte offsets of every line start, stored as 64-bit integers
+    offsets = array.array('q')
+    offset = 0
+    with open(path, mode='rb') as file:
+        for line in file:
+            offsets.append(offset)
+            offset += len(line)
+    return offsets
+
+
+def read_front(path):
+    with open(path, mode='r') as results_file:
+        front = results_file.read()
+    rows = [line for line in front.splitlines() if line.strip()]
+    objectives = len(rows[0].split(';')) if rows else 0
+    return front, len(rows), objectives
+
+
+def stat_or_none(path):
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
+
+class ExperimentCatalog:
+    def __init__(self, database_path):
+        self.connection = sqlite3.connect(database_path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def ingest(self, root_dir):
+        """Scans root_dir for run_N directories and indexes new or changed ones. Returns (indexed, skipped)."""
+        known = {row[0]: (row[1], row[2]) for row in
+                 self.connection.execute('SELECT run_dir, results_mtime, data_mtime FROM runs')}
+        config_hashes = {}
+        indexed = 0
+        skipped = 0
+
+        with self.connection:
+            for run_dir in self.__find_run_dirs(os.path.abspath(root_dir)):
+                results_stat = stat_or_none(os.path.join(run_dir, 'results.csv'))
+                if results_stat is None:
+                    # Run not finished yet
+                    continue
+                data_stat = stat_or_none(os.path.join(run_dir, 'data.csv'))
+                data_mtime = data_stat.st_mtime if data_stat else None
+                if known.get(run_dir) == (results_stat.st_mtime, data_mtime):
+                    skipped += 1
+                    continue
+
+                self.__ingest_run(run_dir, results_stat, data_stat, config_hashes)
+                indexed += 1
+
+        return indexed, skipped
+
+    def __find_run_dirs(self, root_dir):
+        stack = [root_dir]
+        while stack:
+            current_dir = stack.pop()
+            try:
+                entries = list(os.scandir(current_dir))
+            except OSError:
+                continue
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=True):
+                    continue
+                if RUN_DIR_PATTERN.match(entry.name):
+                    # Run directories hold only result files, no need to descend
+                    yield entry.path
+                else:
+                    stack.append(entry.path)
+
+    def __ingest_run(self, run_dir, results_stat, data_stat, config_hashes):
+        experiment_dir = os.path.dirname(run_dir)
+        info = read_run_info(run_dir)
+
+        config_path = info.get('MethodConfig')
+        instance_path = info.get('ProblemInstance')
+        if config_path is None and instance_path is None:
+            config_path, instance_path = read_demo_app_info(experiment_dir)
+
+        if instance_path:
+            instance = os.path.splitext(os.path.basename(instance_path))[0]
+            method = os.path.basename(experiment_dir)
+            if method == instance:
+                method = os.path.basename(os.path.dirname(experiment_dir))
+        else:
+            # Standard layout expected by paretoAnalyzer: <method>/<instance>/run_N
+            instance = os.path.basename(experiment_dir)
+            method = os.path.basename(os.path.dirname(experiment_dir))
+
+        config_hash = None
+        if config_path:
+            if config_path not in config_hashes:
+                config_hashes[config_path] = hash_file(config_path)
+            config_hash = config_hashes[config_path]
+
+        front, front_size, objectives = read_front(os.path.join(run_dir, 'results.csv'))
+
+        data_offsets = None
+        data_lines = None
+        if data_stat is not None:
+            offsets = index_lines(os.path.join(run_dir, 'data.csv'))
+            data_offsets = offsets.tobytes()
+            data_lines = len(offsets)
+
+        seed = info.get('Seed')
+        wall_time_ms = info.get('WallTimeMs')
+        self.connection.execute('''
+            INSERT INTO runs (run_dir, method, instance, run_index, problem_name, config_path, config_hash,
+                instance_path, seed, wall_time_ms, front_size, objectives, front, results_mtime, data_mtime,
+                data_size, data_lines, data_offsets)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(run_dir) DO UPDATE SET
+                method=excluded.method, instance=excluded.instance, run_index=excluded.run_index,
+                problem_name=excluded.problem_name, config_path=excluded.config_path,
+                config_hash=excluded.config_hash, instance_path=excluded.instance_path, seed=excluded.seed,
+                wall_time_ms=excluded.wall_time_ms, front_size=excluded.front_size,
+                objectives=excluded.objectives, front=excluded.front, results_mtime=excluded.results_mtime,
+                data_mtime=excluded.data_mtime, data_size=excluded.data_size, data_lines=excluded.data_lines,
+                data_offsets=excluded.data_offsets
+            ''', (run_dir, method, instance, int(RUN_DIR_PATTERN.match(os.path.basename(run_dir)).group(1)),
+                  info.get('ProblemName'), config_path, config_hash, instance_path,
+                  int(seed) if seed is not None else None,
+                  int(wall_time_ms) if wall_time_ms is not None else None,
+                  front_size, objectives, front, results_stat.st_mtime,
+                  data_stat.st_mtime if data_stat else None, data_stat.st_size if data_stat else None,
+                  data_lines, data_offsets))
+
+    def runs(self, **filters):
+        """Returns runs matching all given keys (method, instance, problem_name, config_hash, config_path, seed, run_index)."""
+        conditions = []
+        values = []
+        for key, value in filters.items():
+            if key not in QUERY_KEYS:
+                raise ValueError(f'Unknown query key: {key}')
+            if value is not None:
+                conditions.append(f'{key} = ?')
+                values.append(value)
+        where = (' WHERE ' + ' AND '.join(conditions)) if conditions else ''
+        query = f'SELECT {RUN_COLUMNS} FROM runs{where} ORDER BY method, instance, run_index'
+        return [Run(*row) for row in self.connection.execute(query, values)]
+
+    def front(self, run):
+        """Returns Pareto front (or best result) of the run as list of float lists, without touching the run directory."""
+        row = self.connection.execute('SELECT front FROM runs WHERE id = ?', (run.id,)).fetchone()
+        return [[float(value) for value in line.split(';') if value != '']
+                for line in row[0].splitlines() if line.strip()]
+
+    def fronts(self, **filters):
+        return [(run, self.front(run)) for run in self.runs(**filters)]
+
+    def convergence(self, run, start=0, stop=None, step=1):
+        """Returns rows of data.csv in range [start, stop) with given step, seeking directly to indexed lines."""
+        row = self.connection.execute('SELECT data_offsets FROM runs WHERE id = ?', (run.id,)).fetchone()
+        if row is None or row[0] is None:
+            return []
+        offsets = array.array('q')
+        offsets.frombytes(row[0])
+        line_numbers = range(len(offsets))[start:stop:step]
+
+        series = []
+        with open(os.path.join(run.run_dir, 'data.csv'), mode='rb') as data_file:
+            if step == 1:
+                # Contiguous range, single seek and sequential read
+                if len(line_numbers) > 0:
+                    data_file.seek(offsets[line_numbers[0]])
+                    for _ in line_numbers:
+                        series.append(self.__parse_row(data_file.readline()))
+            else:
+                for line_number in line_numbers:
+                    data_file.seek(offsets[line_number])
+                    series.append(self.__parse_row(data_file.readline()))
+        return series
+
+    def convergences(self, start=0, stop=None, step=1, **filters):
+        return [(run, self.convergence(run, start, stop, step)) for run in self.runs(**filters)]
+
+    @staticmethod
+    def __parse_row(line):
+        values = line.decode().rstrip('\r\n').split(';')
+        try:
+            return [float(value) for value in values if value != '']
+        except ValueError:
+            return values
+
+
+def add_filter_arguments(parser):
+    parser.add_argument('--method')
+    parser.add_argument('--instance')
+    parser.add_argument('--problem-name', dest='problem_name')
+    parser.add_argument('--config-hash', dest='config_hash')
+    parser.add_argument('--config-path', dest='config_path')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--run-index', dest='run_index', type=int)
+
+
+def filters_from_args(args):
+    return {key: getattr(args, key) for key in QUERY_KEYS}
+
+
+def write_rows(rows, output):
+    writer = csv.writer(output, delimiter=';', lineterminator='\n')
+    for row in rows:
+        writer.writerow(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Index iMOPSE run directories and query them')
+    parser.add_argument('database', help='Path to the SQLite catalog file')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest_parser = subparsers.add_parser('ingest', help='Index new or changed run directories')
+    ingest_parser.add_argument('roots', nargs='+', help='Result directories to scan')
+
+    list_parser = subparsers.add_parser('list', help='List indexed runs')
+    add_filter_arguments(list_parser)
+
+    front_parser = subparsers.add_parser('front', help='Print fronts of matching runs')
+    add_filter_arguments(front_parser)
+
+    series_parser = subparsers.add_parser('series', help='Print convergence series (data.csv rows) of matching runs')
+    add_filter_arguments(series_parser)
+    series_parser.add_argument('--start', type=int, default=0)
+    series_parser.add_argument('--stop', type=int)
+    series_parser.add_argument('--step', type=int, default=1)
+
+    args = parser.parse_args()
+
+    with ExperimentCatalog(args.database) as catalog:
+        if args.command == 'ingest':
+            for root in args.roots:
+                indexed, skipped = catalog.ingest(root)
+                print(f'{root}: indexed {indexed}, unchanged {skipped}')
+        elif args.command == 'list':
+            print(RUN_COLUMNS.replace(', ', ';'))
+            write_rows(([getattr(run, key) for key in Run.__dataclass_fields__] for run in
+                        catalog.runs(**filters_from_args(args))), sys.stdout)
+        elif args.command == 'front':
+            for run, front in catalog.fronts(**filters_from_args(args)):
+                print(f'# {run.run_dir}')
+                write_rows(front, sys.stdout)
+        elif args.command == 'series':
+            for run, series in catalog.convergences(args.start, args.stop, args.step, **filters_from_args(args)):
+                print(f'# {run.run_dir}')
+                write_rows(series, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
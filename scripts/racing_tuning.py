@@ -0,0 +1,627 @@
+import os
+import sys
+import json
+import math
+import random
+import shutil
+import argparse
+import itertools
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+# Racing tuner of method parameters (F-Race). Configurations are generated from a parameter space over keys of a
+# method .cfg file, by a Taguchi orthogonal array, random sampling or the full grid. All alive configurations are run
+# on a batch of (instance, seed) blocks, the runs of a batch in parallel. After every batch the configurations are
+# ranked on each block by HV, IGD or best fitness and compared by the Friedman test; the ones significantly worse
+# than the best are dropped and not run on further blocks.
+#
+# Runs are stored in the <output>/<config>/<instance>/run_N layout read by paretoAnalyzer, fronts are also copied to
+# <output>/taguchi as <instance>_config<N>_run<N>_archive.csv files read by ParetoReader::ReadTaguchiParetos.
+# Runs already stored are not run again, so an interrupted race can be continued.
+
+DEFAULT_LEVELS = 3
+HV_REFERENCE = 1.1
+RESULTS_FILE = 'results.csv'
+RACE_FILE = 'race.csv'
+OUTPUT_TAIL_SIZE = 2000
+
+
+@dataclass
+class Parameter:
+    key: str
+    values: list = None
+    min: float = None
+    max: float = None
+    type: str = 'float'
+    levels: int = DEFAULT_LEVELS
+    format: str = '{}'
+
+    def level_values(self):
+        if self.values is not None:
+            return [str(value) for value in self.values]
+        # Ranges are split into evenly spaced levels for orthogonal arrays and grids
+        levels = []
+        for i in range(self.levels):
+            value = self.min + (self.max - self.min) * i / max(self.levels - 1, 1)
+            level = self.__format(value)
+            if level not in levels:
+                levels.append(level)
+        return levels
+
+    def sample(self, rng):
+        if self.values is not None:
+            return str(rng.choice(self.values))
+        return self.__format(rng.uniform(self.min, self.max))
+
+    def __format(self, value):
+        if self.type == 'int':
+            return self.format.format(int(round(value)))
+        return self.format.format(round(value, 6))
+
+
+@dataclass
+class Configuration:
+    id: int
+    values: dict
+    path: str = None
+    eliminated_after: int = None
+
+    @property
+    def name(self):
+        return f'config{self.id}'
+
+
+def load_space(space_path):
+    """Reads the tuning space, paths in the file are relative to it.
+
+    {"config": "...cfg", "problem": "ZDT", "instances": ["...def"], "runs": 10, "seed": 0,
+     "parameters": {"PopulationSize": [50, 100, 200],
+                    "Mutation": {"min": 0.001, "max": 0.05, "format": "RandomBit {}"},
+                    "RankedTournament": {"min": 2, "max": 8, "type": "int", "levels": 4}}}
+
+    Parameters are lists of values or ranges, split into "levels" values for orthogonal arrays and grids. Values are
+    written after the key in place of the line of the base config, "format" gives the rest of the line for values of
+    keys with more tokens. Explicit "seeds" list may be given instead of "runs" and "seed".
+    """
+    with open(space_path, mode='r') as space_file:
+        space = json.load(space_file)
+    space_dir = os.path.dirname(os.path.abspath(space_path))
+
+    def resolve(path):
+        return os.path.normpath(os.path.join(space_dir, path))
+
+    parameters = []
+    for key, description in space['parameters'].items():
+        if isinstance(description, list):
+            parameters.append(Parameter(key, values=description))
+        else:
+            parameters.append(Parameter(key, **description))
+
+    seeds = space.get('seeds')
+    if seeds is None:
+        seed = space.get('seed', 0)
+        seeds = [seed + i for i in range(space.get('runs', 1))]
+    return resolve(space['config']), space['problem'], [resolve(path) for path in space['instances']], seeds, parameters
+
+
+def prime_factors(number):
+    """Prime powers whose product is the number, as (prime, exponent) pairs."""
+    factors = []
+    prime = 2
+    while number > 1:
+        exponent = 0
+        while number % prime == 0:
+            number //= prime
+            exponent += 1
+        if exponent:
+            factors.append((prime, exponent))
+        prime += 1
+    return factors
+
+
+def galois_field(prime, exponent):
+    """Addition and multiplication tables of GF(prime^exponent).
+
+    Elements are integers whose base prime digits are coefficients of polynomials, multiplication is done modulo
+    the first monic polynomial of the given degree that leaves no zero divisors, i.e. an irreducible one.
+    """
+    size = prime ** exponent
+
+    def digits(value):
+        return [(value // prime ** i) % prime for i in range(exponent)]
+
+    def number(coefficients):
+        return sum(c * prime ** i for i, c in enumerate(coefficients))
+
+    add = [[number([(a + b) % prime for a, b in zip(digits(x), digits(y))]) for y in range(size)] for x in range(size)]
+    for modulus in range(size):
+        lower = digits(modulus)
+
+        def multiply(x, y):
+            product = [0] * (2 * exponent - 1)
+            for i, a in enumerate(digits(x)):
+                for j, b in enumerate(digits(y)):
+                    product[i + j] = (product[i + j] + a * b) % prime
+            for degree in range(2 * exponent - 2, exponent - 1, -1):
+                coefficient, product[degree] = product[degree], 0
+                for i, c in enumerate(lower):
+                    product[degree - exponent + i] = (product[degree - exponent + i] - coefficient * c) % prime
+            return number(product[:exponent])
+
+        multiplication = [[multiply(x, y) for y in range(size)] for x in range(size)]
+        if all(multiplication[x][y] for x in range(1, size) for y in range(1, size)):
+            return add, multiplication
+    raise ValueError(f'No irreducible polynomial of degree {exponent} over GF({prime})')
+
+
+def field_array(prime, levels_counts):
+    """Rows of a strength 2 orthogonal array with a column per levels count, all counts being powers of the prime.
+
+    The array has q^k rows for the smallest power q of the prime not lower than any count. Columns are linear
+    combinations of k base columns over GF(q) with the first non-zero coefficient equal to one, so every two of
+    them are independent and hold each pair of field elements equally often. A column of a count lower than q
+    keeps the lowest base prime digits of the elements, which maps q / count elements to each of its levels and
+    keeps the pairs balanced.
+    """
+    size, exponent = prime, 1
+    while size < max(levels_counts):
+        size, exponent = size * prime, exponent + 1
+    add, multiplication = galois_field(prime, exponent)
+    k = 1
+    while (size ** k - 1) // (size - 1) < len(levels_counts):
+        k += 1
+
+    columns = [coefficients for coefficients in itertools.product(range(size), repeat=k)
+               if next((c for c in coefficients if c), 0) == 1][:len(levels_counts)]
+    rows = []
+    for digits in itertools.product(range(size), repeat=k):
+        row = []
+        for column, count in zip(columns, levels_counts):
+            value = 0
+            for c, d in zip(column, digits):
+                value = add[value][multiplication[c][d]]
+            row.append(value % count)
+        rows.append(row)
+    return rows
+
+
+def orthogonal_array(levels_counts):
+    """Rows of level indices of a strength 2 orthogonal array (Taguchi L-array) with a column per factor.
+
+    Every levels count is split into prime powers. The prime power parts of each prime get columns of an array
+    over a Galois field (see field_array) and the rows of these arrays are combined in every way, so parts of
+    different primes are independent. The level of a factor is the mixed radix number of its parts, e.g. 4+4+3
+    levels give 16 * 3 rows and 6 levels are a column of 2 and a column of 3 levels. Every pair of factors holds
+    every pair of their levels equally often, rows may repeat when factors have fewer levels than the field.
+    """
+    parts = {}
+    factor_parts = []
+    for count in levels_counts:
+        factor_part = []
+        for prime, exponent in prime_factors(count):
+            parts.setdefault(prime, []).append(prime ** exponent)
+            factor_part.append((prime, len(parts[prime]) - 1, prime ** exponent))
+        factor_parts.append(factor_part)
+
+    arrays = {prime: field_array(prime, counts) for prime, counts in parts.items()}
+    rows = []
+    for combination in itertools.product(*arrays.values()):
+        array_rows = dict(zip(arrays.keys(), combination))
+        row = []
+        for factor_part in factor_parts:
+            level = 0
+            for prime, column, count in factor_part:
+                level = level * count + array_rows[prime][column]
+            row.append(level)
+        rows.append(tuple(row))
+    return rows
+
+
+def pairwise_balanced(rows, levels_counts):
+    """Whether every factor uses its levels and every pair of factors uses each pair of their levels equally often."""
+    for column, count in enumerate(levels_counts):
+        used = [0] * count
+        for row in rows:
+            used[row[column]] += 1
+        if min(used) != max(used):
+            return False
+    for a, b in itertools.combinations(range(len(levels_counts)), 2):
+        used = [[0] * levels_counts[b] for _ in range(levels_counts[a])]
+        for row in rows:
+            used[row[a]][row[b]] += 1
+        if min(map(min, used)) != max(map(max, used)):
+            return False
+    return True
+
+
+def taguchi_indices(levels_counts, samples):
+    """Level indices of the configurations of the Taguchi design, None when the grid or random design is used.
+
+    Repeated rows of the orthogonal array are dropped. If that breaks the balance of levels pairs, the full grid is
+    used when it has at most samples configurations and the random design of samples configurations otherwise.
+    """
+    grid_size = math.prod(levels_counts)
+    indices = list(dict.fromkeys(orthogonal_array(levels_counts)))
+    if len(indices) >= grid_size:
+        print('Orthogonal array is not smaller than the full grid, the grid is used')
+        return None, 'grid'
+    if pairwise_balanced(indices, levels_counts):
+        return indices, 'taguchi'
+    design = 'grid' if grid_size <= samples else 'random'
+    print(f'No orthogonal array without repeated configurations has balanced levels pairs, the {design} design is used')
+    return None, design
+
+
+def generate_configurations(parameters, design, samples, rng):
+    levels = [parameter.level_values() for parameter in parameters]
+    indices = None
+    if design == 'taguchi':
+        indices, design = taguchi_indices([len(l) for l in levels], samples)
+    if indices is not None:
+        rows = [[level[i] for level, i in zip(levels, row)] for row in indices]
+    elif design == 'grid':
+        rows = [list(row) for row in itertools.product(*levels)]
+    else:
+        rows = [[parameter.sample(rng) for parameter in parameters] for _ in range(samples)]
+    return [Configuration(i, {parameter.key: value for parameter, value in zip(parameters, row)})
+            for i, row in enumerate(rows)]
+
+
+def write_config(base_path, configuration, path):
+    with open(base_path, mode='r') as base_file:
+        lines = base_file.read().splitlines()
+    values = dict(configuration.values)
+    for i, line in enumerate(lines):
+        tokens = line.split()
+        if tokens and tokens[0] in values:
+            lines[i] = f'{tokens[0]} {values.pop(tokens[0])}'
+    lines += [f'{key} {value}' for key, value in values.items()]
+    with open(path, mode='w', newline='') as config_file:
+        config_file.write('\n'.join(lines) + '\n')
+    configuration.path = path
+
+
+def instance_name(instance):
+    return os.path.splitext(os.path.basename(instance))[0]
+
+
+def run_dir(output_root, configuration, instance, run_index):
+    return os.path.join(output_root, configuration.name, instance_name(instance), f'run_{run_index}')
+
+
+def run_optimizer(executable, configuration, problem, instance, seed, target_dir):
+    if os.path.exists(os.path.join(target_dir, RESULTS_FILE)):
+        return True
+    # The optimizer writes run_0 of a fresh directory, it is moved in place only when finished
+    output_dir = target_dir + '.tmp'
+    shutil.rmtree(output_dir, ignore_errors=True)
+    result = subprocess.run([executable, configuration.path, problem, instance, output_dir, '1', str(seed), '1'],
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    finished = os.path.join(output_dir, 'run_0')
+    if not os.path.exists(os.path.join(finished, RESULTS_FILE)):
+        print(f'{configuration.name} {instance_name(instance)} seed {seed} failed with exit code {result.returncode}:\n'
+              f'{result.stdout.decode(errors="replace")[-OUTPUT_TAIL_SIZE:]}')
+        shutil.rmtree(output_dir, ignore_errors=True)
+        return False
+    shutil.rmtree(target_dir, ignore_errors=True)
+    os.replace(finished, target_dir)
+    shutil.rmtree(output_dir, ignore_errors=True)
+    return True
+
+
+def read_front(path):
+    with open(path, mode='r') as results_file:
+        return [[float(value) for value in line.split(';') if value != '']
+                for line in results_file.read().splitlines() if line.strip()]
+
+
+def dominates(a, b):
+    return all(x <= y for x, y in zip(a, b)) and any(x < y for x, y in zip(a, b))
+
+
+def non_dominated(points):
+    unique = [list(point) for point in set(tuple(point) for point in points)]
+    return [p for p in unique if not any(dominates(q, p) for q in unique)]
+
+
+def hypervolume(points, reference):
+    """Volume dominated by minimized points and bounded by the reference point, by slicing the last objective."""
+    points = non_dominated([p for p in points if all(v < r for v, r in zip(p, reference))])
+    if not points:
+        return 0.0
+    if len(reference) == 1:
+        return reference[0] - min(p[0] for p in points)
+    if len(reference) == 2:
+        volume = 0.0
+        upper = reference[1]
+        for p in sorted(points, key=lambda p: p[0]):
+            volume += (reference[0] - p[0]) * (upper - p[1])
+            upper = p[1]
+        return volume
+
+    points.sort(key=lambda p: p[-1])
+    volume = 0.0
+    for i, point in enumerate(points):
+        upper = points[i + 1][-1] if i + 1 < len(points) else reference[-1]
+        if upper > point[-1]:
+            volume += (upper - point[-1]) * hypervolume([p[:-1] for p in points[:i + 1]], reference[:-1])
+    return volume
+
+
+def igd(front, reference_front):
+    return sum(min(math.dist(r, p) for p in front) for r in reference_front) / len(reference_front)
+
+
+def score_block(fronts, metric):
+    """Scores fronts of configurations on one block, lower is better. Failed runs score infinity.
+
+    HV and IGD are calculated on objectives normalized by the ideal and nadir points of all fronts of the block,
+    IGD against their non-dominated union.
+    """
+    scores = {config_id: math.inf for config_id in fronts}
+    valid = {config_id: front for config_id, front in fronts.items() if front}
+    if not valid:
+        return scores
+    if metric == 'fitness':
+        scores.update({config_id: front[0][0] for config_id, front in valid.items()})
+        return scores
+
+    union = [point for front in valid.values() for point in front]
+    ideal = [min(values) for values in zip(*union)]
+    nadir = [max(values) for values in zip(*union)]
+    ranges = [(high - low) or 1.0 for low, high in zip(ideal, nadir)]
+
+    def normalize(front):
+        return [[(v - low) / r for v, low, r in zip(point, ideal, ranges)] for point in front]
+
+    if metric == 'hv':
+        reference = [HV_REFERENCE] * len(ideal)
+        scores.update({config_id: -hypervolume(normalize(front), reference) for config_id, front in valid.items()})
+    else:
+        reference_front = normalize(non_dominated(union))
+        scores.update({config_id: igd(normalize(front), reference_front) for config_id, front in valid.items()})
+    return scores
+
+
+def regularized_gamma_q(a, x):
+    """Upper regularized incomplete gamma function, by series or continued fraction."""
+    if x <= 0:
+        return 1.0
+    log_prefix = a * math.log(x) - x - math.lgamma(a)
+    if x < a + 1:
+        term = total = 1.0 / a
+        n = a
+        while abs(term) > abs(total) * 1e-15:
+            n += 1
+            term *= x / n
+            total += term
+        return 1.0 - total * math.exp(log_prefix)
+    b = x + 1 - a
+    c = 1.0 / 1e-300
+    d = 1.0 / b
+    h = d
+    for i in range(1, 1000):
+        an = -i * (i - a)
+        b += 2
+        d = an * d + b
+        d = 1e-300 if abs(d) < 1e-300 else d
+        c = b + an / c
+        c = 1e-300 if abs(c) < 1e-300 else c
+        d = 1.0 / d
+        delta = d * c
+        h *= delta
+        if abs(delta - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h
+
+
+def regularized_beta(x, a, b):
+    """Regularized incomplete beta function, by continued fraction."""
+    if x <= 0:
+        return 0.0
+    if x >= 1:
+        return 1.0
+    if x > (a + 1) / (a + b + 2):
+        return 1.0 - regularized_beta(1 - x, b, a)
+    log_prefix = math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b) + a * math.log(x) + b * math.log(1 - x)
+    c = 1.0
+    d = 1.0 - (a + b) * x / (a + 1)
+    d = 1.0 / (1e-300 if abs(d) < 1e-300 else d)
+    h = d
+    for m in range(1, 1000):
+        for an in (m * (b - m) * x / ((a + 2 * m - 1) * (a + 2 * m)),
+                   -(a + m) * (a + b + m) * x / ((a + 2 * m) * (a + 2 * m + 1))):
+            d = 1.0 + an * d
+            d = 1.0 / (1e-300 if abs(d) < 1e-300 else d)
+            c = 1.0 + an / c
+            c = 1e-300 if abs(c) < 1e-300 else c
+            h *= d * c
+        if abs(d * c - 1) < 1e-15:
+            break
+    return math.exp(log_prefix) * h / a
+
+
+def chi2_sf(x, df):
+    return regularized_gamma_q(df / 2, x / 2)
+
+
+def t_ppf(q, df):
+    def cdf(t):
+        tail = 0.5 * regularized_beta(df / (df + t * t), df / 2, 0.5)
+        return 1 - tail if t > 0 else tail
+
+    low, high = -1e3, 1e3
+    for _ in range(200):
+        middle = (low + high) / 2
+        if cdf(middle) < q:
+            low = middle
+        else:
+            high = middle
+    return (low + high) / 2
+
+
+def average_ranks(values):
+    order = sorted(range(len(values)), key=lambda i: values[i])
+    ranks = [0.0] * len(values)
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[order[k]] = (i + j) / 2 + 1
+        i = j + 1
+    return ranks
+
+
+def friedman_survivors(blocks, alpha):
+    """Indices of configurations not significantly worse than the best one, blocks are rows of scores of them.
+
+    Friedman test on ranks within blocks, followed by the Conover post-hoc comparison with the best rank sum.
+    """
+    m = len(blocks)
+    k = len(blocks[0])
+    ranks = [average_ranks(row) for row in blocks]
+    rank_sums = [sum(row[j] for row in ranks) for j in range(k)]
+    a = sum(r * r for row in ranks for r in row)
+    c = m * k * (k + 1) ** 2 / 4
+    if a - c <= 0:
+        return list(range(k))
+    statistic = (k - 1) * sum((s - m * (k + 1) / 2) ** 2 for s in rank_sums) / (a - c)
+    if chi2_sf(statistic, k - 1) >= alpha:
+        return list(range(k))
+
+    df = (m - 1) * (k - 1)
+    critical = t_ppf(1 - alpha / 2, df) * math.sqrt(2 * m * (a - c) / df * max(1 - statistic / (m * (k - 1)), 0))
+    best = min(rank_sums)
+    return [j for j in range(k) if rank_sums[j] - best <= critical]
+
+
+class Race:
+    def __init__(self, executable, output_root, base_config, problem, instances, seeds, configurations, metric,
+                 jobs):
+        self.executable = os.path.abspath(executable)
+        self.output_root = os.path.abspath(output_root)
+        self.problem = problem
+        self.metric = metric
+        self.jobs = jobs
+        self.configurations = configurations
+        self.alive = list(configurations)
+        # Blocks go over all instances before the next seed, so early tests see every instance
+        self.blocks = [(instance, run_index, seed) for run_index, seed in enumerate(seeds) for instance in instances]
+        self.scores = {}
+        self.runs = 0
+
+        configs_dir = os.path.join(self.output_root, 'configs')
+        os.makedirs(configs_dir, exist_ok=True)
+        os.makedirs(os.path.join(self.output_root, 'taguchi'), exist_ok=True)
+        for configuration in configurations:
+            write_config(base_config, configuration, os.path.join(configs_dir, configuration.name + '.cfg'))
+
+    def run(self, batch, min_blocks, alpha, max_runs):
+        for start in range(0, len(self.blocks), batch):
+            blocks = range(start, min(start + batch, len(self.blocks)))
+            if max_runs is not None and self.runs + len(self.alive) * len(blocks) > max_runs:
+                print(f'Budget of {max_runs} runs reached')
+                break
+            self.__run_batch(blocks)
+
+            done = blocks.stop
+            if done >= min_blocks and len(self.alive) > 1:
+                rows = [[self.scores[(configuration.id, b)] for configuration in self.alive] for b in range(done)]
+                survivors = friedman_survivors(rows, alpha)
+                for i, configuration in enumerate(self.alive):
+                    if i not in survivors:
+                        configuration.eliminated_after = done
+                self.alive = [self.alive[i] for i in survivors]
+            print(f'Blocks {done}/{len(self.blocks)}, runs {self.runs}, '
+                  f'alive {len(self.alive)}/{len(self.configurations)}: '
+                  f'{" ".join(configuration.name for configuration in self.alive)}')
+            if len(self.alive) == 1:
+                break
+
+    def __run_batch(self, blocks):
+        tasks = [(configuration, b) for b in blocks for configuration in self.alive]
+        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
+            finished = list(executor.map(lambda task: self.__run_task(*task), tasks))
+        self.runs += len(tasks)
+
+        for b in blocks:
+            instance, run_index, _ = self.blocks[b]
+            fronts = {}
+            for (configuration, task_block), success in zip(tasks, finished):
+                if task_block == b:
+                    path = os.path.join(run_dir(self.output_root, configuration, instance, run_index), RESULTS_FILE)
+                    fronts[configuration.id] = read_front(path) if success else []
+            for config_id, score in score_block(fronts, self.metric).items():
+                self.scores[(config_id, b)] = score
+
+    def __run_task(self, configuration, b):
+        instance, run_index, seed = self.blocks[b]
+        target_dir = run_dir(self.output_root, configuration, instance, run_index)
+        os.makedirs(os.path.dirname(target_dir), exist_ok=True)
+        if not run_optimizer(self.executable, configuration, self.problem, instance, seed, target_dir):
+            return False
+        shutil.copyfile(os.path.join(target_dir, RESULTS_FILE),
+                        os.path.join(self.output_root, 'taguchi',
+                                     f'{instance_name(instance)}_{configuration.name}_run{run_index}_archive.csv'))
+        return True
+
+    def write_summary(self):
+        # Mean ranks among configurations run on the same blocks
+        rank_sums = {}
+        for b in range(len(self.blocks)):
+            ids = [c.id for c in self.configurations if (c.id, b) in self.scores]
+            for config_id, rank in zip(ids, average_ranks([self.scores[(config_id, b)] for config_id in ids])):
+                rank_sums.setdefault(config_id, []).append(rank)
+        mean_ranks = {config_id: sum(ranks) / len(ranks) for config_id, ranks in rank_sums.items()}
+
+        keys = list(self.configurations[0].values.keys())
+        ordered = sorted(self.configurations, key=lambda c: (c.eliminated_after is not None,
+                                                             -(c.eliminated_after or 0), mean_ranks.get(c.id, math.inf)))
+        with open(os.path.join(self.output_root, RACE_FILE), mode='w', newline='') as race_file:
+            race_file.write(';'.join(['Config', 'Status', 'Blocks', 'MeanRank'] + keys) + '\n')
+            for c in ordered:
+                blocks = sum(1 for b in range(len(self.blocks)) if (c.id, b) in self.scores)
+                status = 'alive' if c.eliminated_after is None else f'eliminated after {c.eliminated_after}'
+                race_file.write(';'.join([c.name, status, str(blocks), f'{mean_ranks.get(c.id, math.nan):.3f}'] +
+                                         [c.values[key] for key in keys]) + '\n')
+
+        for c in ordered[:len(self.alive)]:
+            print(f'{c.name} ({c.path}): ' + ', '.join(f'{key} {value}' for key, value in c.values.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tune method parameters of iMOPSE by racing configurations')
+    parser.add_argument('space', help='JSON tuning space file')
+    parser.add_argument('-e', '--executable', required=True, help='Path to imopse executable')
+    parser.add_argument('-o', '--output', required=True, help='Results root, runs go to <config>/<instance>/run_N')
+    parser.add_argument('--design', choices=['taguchi', 'random', 'grid'], default='taguchi',
+                        help='How configurations are generated from the space')
+    parser.add_argument('--samples', type=int, default=20, help='Number of configurations of random design')
+    parser.add_argument('--metric', choices=['hv', 'igd', 'fitness'], default='hv',
+                        help='Quality of a run, fitness is the best result of single-objective methods')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1, help='Number of concurrent runs')
+    parser.add_argument('--batch', type=int, help='Blocks (instance, seed) run between tests, instances count by default')
+    parser.add_argument('--min-blocks', type=int, help='Blocks run before the first test, at least 5 by default')
+    parser.add_argument('--alpha', type=float, default=0.05, help='Significance level of the tests')
+    parser.add_argument('--max-runs', type=int, help='Budget of optimizer runs')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of random design')
+    args = parser.parse_args()
+
+    base_config, problem, instances, seeds, parameters = load_space(args.space)
+    configurations = generate_configurations(parameters, args.design, args.samples, random.Random(args.seed))
+    batch = args.batch or len(instances)
+    min_blocks = args.min_blocks or max(5, len(instances))
+    print(f'{len(configurations)} configurations, {len(instances) * len(seeds)} blocks')
+
+    race = Race(args.executable, args.output, base_config, problem, instances, seeds, configurations, args.metric,
+                args.jobs)
+    race.run(batch, min_blocks, args.alpha, args.max_runs)
+    race.write_summary()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,35 +1,41 @@
-import os
-import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
+from convergence_aggregation import find_run_files, aggregate_runs, lttb
 
 # List of paths to results directories to create plots for
 paths = ['../optimizer/experiments/GA'] # Input paths
 
-number_of_runs = 1 # Input number of runs
+number_of_runs = None # Input number of runs, None uses all run_N directories
 
-def create_mean_values(path):
-    all_runs_data = []
+max_plot_points = 1000 # Long series are downsampled (LTTB) to this number of points before plotting
 
-    for i in range(number_of_runs):
-        file_path = os.path.join(path, f'run_{i}', 'data.csv')
+quantile_band = (0.25, 0.75) # Quantiles drawn as a band around the median
 
-        if os.path.exists(file_path):
-            data = pd.read_csv(file_path, delimiter=';', header=None, nrows=350)
+def create_aggregate(path):
+    return aggregate_runs(find_run_files(path, number_of_runs))
 
-            y = data.iloc[:, 1]
-
-            all_runs_data.append(y)
-
-    mean_values = pd.concat(all_runs_data, axis=1).mean(axis=1)
-
-    return mean_values
+def plot_downsampled(x, y, **kwargs):
+    indices = lttb(x, y, max_plot_points)
+    return plt.plot(x[indices], y[indices], **kwargs)[0]
 
 plt.figure()
 
 for path in paths:
-    mean_values = create_mean_values(path)
-    x_index = range(len(mean_values))
-    plt.plot(x_index, mean_values, label=path)
+    aggregate = create_aggregate(path)
+    if aggregate is None:
+        print(f'No data.csv files found in {path}')
+        continue
+
+    generations = np.arange(aggregate.generations, dtype=float)
+    grid = aggregate.grid.astype(float)
+
+    mean_line = plot_downsampled(generations, aggregate.mean(), label=f'{path} mean')
+    plot_downsampled(grid, aggregate.median(), label=f'{path} median', color=mean_line.get_color(), linestyle='--')
+    lower, upper = aggregate.quantiles(list(quantile_band))
+    plt.fill_between(grid, lower, upper, color=mean_line.get_color(), alpha=0.2,
+                     label=f'{path} q{quantile_band[0]:g}-q{quantile_band[1]:g}')
+    plot_downsampled(generations, aggregate.best_so_far_mean(), label=f'{path} best so far',
+                     color=mean_line.get_color(), linestyle=':')
 
 plt.xlabel('Iterations')
 plt.ylabel('Fitness')
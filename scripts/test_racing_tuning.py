@@ -0,0 +1,60 @@
+import math
+import itertools
+
+import pytest
+
+from racing_tuning import orthogonal_array, pairwise_balanced, taguchi_indices
+
+LEVELS_MIXES = [
+    [2, 2, 2],
+    [3, 3, 3, 3],
+    [2, 3, 3, 3],
+    [4, 4],
+    [2, 4],
+    [4, 4, 4, 4, 4],
+    [4, 4, 4, 4, 3],
+    [8, 8, 2, 4],
+    [5, 5, 2],
+    [6, 3, 2],
+    [9, 3, 3, 3],
+    [1, 3, 3],
+]
+
+
+def level_pairs(rows, a, b):
+    used = {}
+    for row in rows:
+        used[row[a], row[b]] = used.get((row[a], row[b]), 0) + 1
+    return used
+
+
+@pytest.mark.parametrize('levels_counts', LEVELS_MIXES)
+def test_every_pair_of_columns_covers_all_level_pairs_equally(levels_counts):
+    rows = orthogonal_array(levels_counts)
+    for a, b in itertools.combinations(range(len(levels_counts)), 2):
+        used = level_pairs(rows, a, b)
+        assert len(used) == levels_counts[a] * levels_counts[b]
+        assert len(set(used.values())) == 1
+
+
+@pytest.mark.parametrize('levels_counts', LEVELS_MIXES)
+def test_taguchi_design_is_balanced_and_not_larger_than_grid(levels_counts):
+    indices, design = taguchi_indices(levels_counts, 20)
+    if design == 'taguchi':
+        assert len(set(indices)) == len(indices) < math.prod(levels_counts)
+        assert pairwise_balanced(indices, levels_counts)
+    else:
+        assert design == 'grid' and indices is None
+
+
+def test_pairwise_balance_detects_aliased_columns():
+    diagonal = [(level, level) for level in range(4)]
+    assert not pairwise_balanced(diagonal, [4, 4])
+    assert pairwise_balanced(list(itertools.product(range(4), range(4))), [4, 4])
+
+
+def test_unbalanced_array_falls_back(monkeypatch):
+    import racing_tuning
+    monkeypatch.setattr(racing_tuning, 'orthogonal_array', lambda counts: [(0, 0), (1, 1), (0, 1)])
+    assert taguchi_indices([2, 2, 2], 20) == (None, 'grid')
+    assert taguchi_indices([2, 2, 2], 4) == (None, 'random')
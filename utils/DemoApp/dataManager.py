@@ -0,0 +1,73 @@
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+
+CACHESIZE = 16
+
+#Parsed files keyed by path, each entry remembers file mtime and size to detect changes
+__cache = OrderedDict()
+__cacheLock = threading.Lock()
+
+def __FileKey(path: str):
+   stat = os.stat(path)
+   return stat.st_mtime_ns, stat.st_size
+
+def __Cached(kind: str, path: str, load):
+   path = os.path.abspath(path)
+   fileKey = __FileKey(path)
+   with __cacheLock:
+      entry = __cache.get((kind, path))
+      if entry is not None and entry[0] == fileKey:
+         __cache.move_to_end((kind, path))
+         return entry[1]
+
+   value = load(path)
+
+   with __cacheLock:
+      __cache[(kind, path)] = (fileKey, value)
+      __cache.move_to_end((kind, path))
+      while len(__cache) > CACHESIZE:
+         __cache.popitem(last=False)
+   return value
+
+class LineIndex():
+   def __init__(self, path: str) -> None:
+      self.Path: str = path
+      offsets = []
+      offset = 0
+      with open(path, mode='rb') as file:
+         for line in file:
+            offsets.append(offset)
+            offset += len(line)
+      self.Offsets = np.array(offsets, dtype=np.int64)
+
+   def __len__(self):
+      return len(self.Offsets)
+
+   def ReadLine(self, index: int) -> bytes:
+      with open(self.Path, mode='rb') as file:
+         file.seek(self.Offsets[index])
+         return file.readline().rstrip(b'\r\n')
+
+def GetLineIndex(path: str) -> LineIndex:
+   return __Cached('lineIndex', path, LineIndex)
+
+def ReadIntRow(path: str, index: int):
+   #Seek directly to the row instead of reading the whole file
+   line = GetLineIndex(path).ReadLine(index)
+   return np.array([int(value) for value in line.split(b';') if value.strip()], dtype=np.int32)
+
+def __LoadFloatCsv(path: str):
+   return np.loadtxt(path, delimiter=';', dtype=np.float32, ndmin=2)
+
+def ReadFloatCsv(path: str):
+   return __Cached('floatCsv', path, __LoadFloatCsv)
+
+def __LoadPoints(path: str):
+   pointsRead = np.loadtxt(path, delimiter=';', dtype=str, ndmin=2)
+   return pointsRead[:, :-1].astype(np.int32), pointsRead
+
+def ReadPoints(path: str):
+   #Returns point coordinates and raw rows (last column is point type)
+   return __Cached('points', path, __LoadPoints)
@@ -4,6 +4,8 @@ import typing as type
 import asyncio.subprocess
 import infoManager as im
 
+IMOPSEPATH = "./resources/imopse.exe"
+
 def RunIMOPSE(loop: asyncio.BaseEventLoop
    , methodConfigFileName
    , problemInstanceFileName
@@ -12,7 +14,8 @@ def RunIMOPSE(loop: asyncio.BaseEventLoop
    , runCount
    , onProgressUpdated: type.Callable[[int], None]
    , onError: type.Callable[[int, str], None]
-   , onSuccess: type.Callable[[], None]):  
+   , onSuccess: type.Callable[[], None]
+   , executablePath: str = IMOPSEPATH):
    terminateEvent = t.Event()
    task = loop.create_task(Runner().Run(methodConfigFileName
       , problemInstanceFileName
@@ -22,7 +25,8 @@ def RunIMOPSE(loop: asyncio.BaseEventLoop
       , onProgressUpdated
       , onError
       , onSuccess
-      , terminateEvent))
+      , terminateEvent
+      , executablePath))
    return task, terminateEvent
 
 class Runner():
@@ -39,7 +43,8 @@ class Runner():
       , onProgressUpdated: type.Callable[[int], None]
       , onError: type.Callable[[int, str], None]
       , onSuccess: type.Callable[[], None]
-      , terminateEvent: t.Event):
+      , terminateEvent: t.Event
+      , executablePath: str = IMOPSEPATH):
       await self.__RunIMOPSE(methodConfigFileName
          , problemInstanceFileName
          , problemName
@@ -48,7 +53,8 @@ class Runner():
          , onProgressUpdated
          , onError
          , onSuccess
-         , terminateEvent)
+         , terminateEvent
+         , executablePath)
 
    async def __readLine(self, process: asyncio.subprocess.Process, onProgressUpdated: type.Callable[[int], None]):
       while process.returncode is None:
@@ -81,9 +87,10 @@ class Runner():
       , onProgressUpdated: type.Callable[[int], None]
       , onError: type.Callable[[int, str], None]
       , onSuccess: type.Callable[[], None]
-      , terminateEvent: t.Event):
+      , terminateEvent: t.Event
+      , executablePath: str):
       print("Starting impose")
-      process = await asyncio.create_subprocess_exec("./resources/imopse.exe"
+      process = await asyncio.create_subprocess_exec(executablePath
          , *[methodConfigFileName
             , problemName
             , problemInstanceFileName
@@ -0,0 +1,167 @@
+import os
+import asyncio
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List
+from iMOPSERunner import RunIMOPSE
+from paretoRunner import RunPareto
+
+class JobStatus():
+   QUEUED = "Queued"
+   RUNNING = "Running"
+   ANALYZING = "Analyzing"
+   DONE = "Done"
+   FAILED = "Failed"
+   CANCELLED = "Cancelled"
+
+class Job():
+   def __init__(self
+      , methodConfigFileName: str
+      , problemInstanceFileName: str
+      , problemName: str
+      , outputDirectory: str
+      , runCount: str) -> None:
+      self.MethodConfigFileName = methodConfigFileName
+      self.ProblemInstanceFileName = problemInstanceFileName
+      self.ProblemName = problemName
+      self.OutputDirectory = outputDirectory
+      self.RunCount = runCount
+      self.Status = JobStatus.QUEUED
+      self.Progress = 0
+      self.Error = None
+      #Called on the event loop thread whenever status or progress changes
+      self.OnChanged: Callable[[Job], None] = None
+      self.task = None
+      self.terminateEvent = None
+      self.succeeded = False
+      self.cancelled = False
+
+   def IsActive(self):
+      return self.Status in (JobStatus.QUEUED, JobStatus.RUNNING, JobStatus.ANALYZING)
+
+   def SetStatus(self, status: str, error: str = None):
+      self.Status = status
+      if error is not None:
+         self.Error = error
+      self.__Changed()
+
+   def SetProgress(self, progress: int):
+      self.Progress = progress
+      self.__Changed()
+
+   def __Changed(self):
+      if self.OnChanged is not None:
+         self.OnChanged(self)
+
+class JobManager():
+   def __init__(self
+      , loop: asyncio.BaseEventLoop
+      , maxRunningJobs: int = None
+      , onSucceeded: Callable[[Job], None] = None) -> None:
+      self.loop = loop
+      #Every job holds one slot from optimizer start until its pareto analysis is finished
+      self.MaxRunningJobs = maxRunningJobs or os.cpu_count() or 1
+      self.Jobs: List[Job] = []
+      self.onSucceeded = onSucceeded
+      self.queue = deque()
+      self.running = set()
+      self.executor = None
+
+   def Submit(self, job: Job):
+      self.Jobs.append(job)
+      self.queue.append(job)
+      job.SetStatus(JobStatus.QUEUED)
+      self.__StartQueued()
+      return job
+
+   def Cancel(self, job: Job):
+      if not job.IsActive():
+         return
+      job.cancelled = True
+      if job in self.queue:
+         self.queue.remove(job)
+         job.SetStatus(JobStatus.CANCELLED)
+      elif job.Status == JobStatus.RUNNING and job.terminateEvent is not None:
+         job.terminateEvent.set()
+      elif job.task is not None:
+         #Analysis already running in a worker process is left to finish, its result is ignored
+         job.task.cancel()
+
+   def SetMaxRunningJobs(self, maxRunningJobs: int):
+      self.MaxRunningJobs = max(1, maxRunningJobs)
+      self.__StartQueued()
+
+   def IsOutputDirectoryUsed(self, outputDirectory: str):
+      outputDirectory = os.path.abspath(outputDirectory)
+      return any(job.IsActive() and os.path.abspath(job.OutputDirectory) == outputDirectory for job in self.Jobs)
+
+   def RemoveFinished(self):
+      finished = [job for job in self.Jobs if not job.IsActive()]
+      self.Jobs = [job for job in self.Jobs if job.IsActive()]
+      return finished
+
+   def Shutdown(self):
+      for job in list(self.Jobs):
+         self.Cancel(job)
+      if self.executor is not None:
+         self.executor.shutdown(wait=False, cancel_futures=True)
+         self.executor = None
+
+   def __GetExecutor(self):
+      if self.executor is None:
+         self.executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+      return self.executor
+
+   def __StartQueued(self):
+      while self.queue and len(self.running) < self.MaxRunningJobs:
+         job = self.queue.popleft()
+         self.running.add(job)
+         job.task = self.loop.create_task(self.__RunJob(job))
+
+   def __OnError(self, job: Job, exitCode: int, error):
+      if isinstance(error, bytes):
+         error = error.decode(errors='replace')
+      job.Error = "Exit code {}: {}".format(exitCode, str(error).strip())
+
+   def __OnSuccess(self, job: Job):
+      job.succeeded = True
+
+   async def __RunJob(self, job: Job):
+      try:
+         job.SetProgress(0)
+         job.SetStatus(JobStatus.RUNNING)
+         task, job.terminateEvent = RunIMOPSE(self.loop
+            , job.MethodConfigFileName
+            , job.ProblemInstanceFileName
+            , job.ProblemName
+            , job.OutputDirectory
+            , job.RunCount
+            , job.SetProgress
+            , lambda exitCode, error: self.__OnError(job, exitCode, error)
+            , lambda: self.__OnSuccess(job)
+         )
+         await task
+
+         if job.cancelled:
+            job.SetStatus(JobStatus.CANCELLED)
+            return
+         if not job.succeeded:
+            job.SetStatus(JobStatus.FAILED, job.Error or "Optimization failed")
+            return
+
+         #Pareto analysis and merging of results is done in a worker process, so UI stays responsive
+         job.SetStatus(JobStatus.ANALYZING)
+         success = await self.loop.run_in_executor(self.__GetExecutor(), RunPareto, job.OutputDirectory)
+         if not success:
+            job.SetStatus(JobStatus.FAILED, "Pareto analysis failed")
+            return
+         job.SetStatus(JobStatus.DONE)
+         if self.onSucceeded is not None:
+            self.onSucceeded(job)
+      except asyncio.CancelledError:
+         job.SetStatus(JobStatus.CANCELLED)
+      except Exception as e:
+         job.SetStatus(JobStatus.FAILED, str(e))
+      finally:
+         self.running.discard(job)
+         self.__StartQueued()
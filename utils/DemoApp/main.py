@@ -1,8 +1,10 @@
 from setupWindow import *
 import asyncio
 
-loop = asyncio.new_event_loop()
+#Guard is needed, job manager starts worker processes which import main module on spawn platforms
+if __name__ == '__main__':
+   loop = asyncio.new_event_loop()
 
-window = SetupWindow(loop)
+   window = SetupWindow(loop)
 
-loop.run_forever()
\ No newline at end of file
+   loop.run_forever()
\ No newline at end of file
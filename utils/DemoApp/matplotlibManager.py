@@ -1,9 +1,9 @@
 from matplotlib.backend_bases import PickEvent
 import matplotlib.pyplot as plt
-import csv
 import asyncio
 import os.path
 import numpy as np
+import dataManager as dm
 
 FIGSIZE = 8
 VEHICLESEPERATOR=2147483647
@@ -36,20 +36,10 @@ class MatplotlibManager():
 
    def DrawParetoFront(self):
       #Read parreto front data
-      with open(os.path.join(self.OutputDirectory, 'results.csv')) as resultsCsv:
-         reader = csv.reader(resultsCsv, delimiter=';')
-         data = []
-         for row in reader:
-            data.append(np.array(row).astype(np.float32))
-         self.npData = np.array(data)
+      self.npData = dm.ReadFloatCsv(os.path.join(self.OutputDirectory, 'results.csv'))
       
       #Read true parreto front data
-      with open(os.path.join(self.OutputDirectory, 'true_pareto_front_approximation.csv')) as trueParretoCsv:
-         reader = csv.reader(trueParretoCsv, delimiter=';')
-         trueData = []
-         for row in reader:
-            trueData.append(np.array(row).astype(np.float32))
-         trueData = np.array(trueData)
+      trueData = dm.ReadFloatCsv(os.path.join(self.OutputDirectory, 'true_pareto_front_approximation.csv'))
 
       #Read quality data
       with open(os.path.join(self.OutputDirectory, 'quality.txt')) as qualityTxt:
@@ -142,23 +132,10 @@ class MatplotlibManager():
       return np.array(colors), np.array(size)
 
    def __DrawGenotype(self, index: int):
-      #Read Data
-      with open(os.path.join(self.OutputDirectory, 'data.csv')) as dataCsv:
-         reader = csv.reader(dataCsv, delimiter=';')
-         rows = []
-         for row in reader:
-            rows.append(row)
-         row = rows[index]
+      #Read Data, only picked row is read from data.csv
+      row = dm.ReadIntRow(os.path.join(self.OutputDirectory, 'data.csv'), index)
       #Read points
-      with open(os.path.join(self.OutputDirectory, 'points.csv')) as pointsCsv:
-         reader = csv.reader(pointsCsv, delimiter=';')
-         pointsRead = []
-         for point in reader:
-            pointsRead.append(point)
-         pointsRead = np.array(pointsRead)
-      #Convert points and row to int
-      points = np.array(pointsRead[:, :-1]).astype(np.int32)
-      row = np.array(row).astype(np.int32)
+      points, pointsRead = dm.ReadPoints(os.path.join(self.OutputDirectory, 'points.csv'))
 
       #Create plot
       fig, ax = plt.subplots()
@@ -4,15 +4,17 @@ from typing import *
 import csv
 import shutil
 
+PARETOANALYZERPATH = "./resources/paretoAnalyzer.exe"
+
 def __CreateFiles(outputDirectory):
-   os.mkdir(os.path.join(outputDirectory, "config"))
+   os.makedirs(os.path.join(outputDirectory, "config"), exist_ok=True)
    with open(os.path.join(outputDirectory, "config", "config.txt"), mode='w') as configFile:
       configFile.write(outputDirectory)
 
-def RunPareto(outputDirectory):
+def RunPareto(outputDirectory, executablePath: str = PARETOANALYZERPATH):
    print("Starting pareto analyzer")
    __CreateFiles(outputDirectory)
-   process = proc.Popen(["./resources/paretoAnalyzer.exe"
+   process = proc.Popen([executablePath
          , os.path.join(outputDirectory, "config", "config.txt")
          , ""
          , outputDirectory
@@ -1,23 +1,48 @@
 from tkinter import *
 from tkinter import filedialog as fd
 from tkinter import ttk
-from iMOPSERunner import RunIMOPSE
-from paretoRunner import RunPareto
 from matplotlibManager import RunDrawParetoFront
+from jobManager import Job, JobManager
+import os
 import asyncio
 import infoManager as im
 
+class JobRow():
+   def __init__(self, parent: Frame, row: int, job: Job, onCancel) -> None:
+      self.status = StringVar()
+      self.progress = IntVar()
+      self.nameLabel = Label(parent, text=os.path.basename(job.MethodConfigFileName) + " / " + os.path.basename(job.ProblemInstanceFileName), anchor='w')
+      self.nameLabel.grid(row=row, column=0, sticky='ew')
+      self.statusLabel = Label(parent, textvariable=self.status, anchor='w')
+      self.statusLabel.grid(row=row, column=1, sticky='ew', padx=5)
+      self.progressbar = ttk.Progressbar(parent, variable=self.progress, length=120)
+      self.progressbar.grid(row=row, column=2, sticky='ew')
+      self.cancelButton = Button(parent, text="Cancel", command=lambda: onCancel(job))
+      self.cancelButton.grid(row=row, column=3, padx=5)
+      job.OnChanged = self.Update
+      self.Update(job)
+
+   def Update(self, job: Job):
+      self.progress.set(job.Progress)
+      self.status.set(job.Status if job.Error is None else job.Status + ": " + job.Error)
+      self.statusLabel.config(foreground='Red' if job.Error is not None else 'Black')
+      self.cancelButton["state"] = "active" if job.IsActive() else "disabled"
+
+   def Destroy(self):
+      for widget in (self.nameLabel, self.statusLabel, self.progressbar, self.cancelButton):
+         widget.destroy()
+
 class SetupWindow():
    def __init__(self, loop: asyncio.BaseEventLoop) -> None:
       self.configFile = None
       self.problemFile = None
       self.outputDirectory = None
       self.problemName = None
-      self.progress = None
       self.errorLabel = None
-      self.thread = None
-      self.terminateThreadEvent = None
       self.loop = loop
+      self.jobManager = JobManager(loop, onSucceeded=self.__OnSuccess)
+      self.jobRows = {}
+      self.nextJobRow = 0
       self.tasks = []
       self.tasks.append(loop.create_task(self.MainLoop()))
 
@@ -30,47 +55,53 @@ class SetupWindow():
    def __SelectOutputDirectory(self):
       self.outputDirectory.set(fd.askdirectory())
 
-   def __RunOptimization(self):
+   def __ShowError(self, error: str):
+      self.__HideError()
+      self.errorLabel = Label(self.MainFrame, text=error, foreground='Red')
+      self.errorLabel.grid(row=12, columnspan=2, sticky='s')
+
+   def __HideError(self):
       if self.errorLabel is not None:
          self.errorLabel.grid_remove()
          self.errorLabel = None
-      self.runButton["state"] = "disabled"
-      self.progress.set(0)
-      task, self.terminateThreadEvent = RunIMOPSE(self.loop
-         , self.configFile.get()
+
+   def __AddJob(self):
+      self.__HideError()
+      try:
+         self.jobManager.SetMaxRunningJobs(int(self.maxRunningJobs.get()))
+      except ValueError:
+         self.__ShowError("Parallel jobs must be a number")
+         return
+      if self.jobManager.IsOutputDirectoryUsed(self.outputDirectory.get()):
+         self.__ShowError("Output directory is used by another job")
+         return
+
+      job = Job(self.configFile.get()
          , self.problemFile.get()
          , self.problemName.get()
          , self.outputDirectory.get()
          , self.RunsCount.get()
-         , self.__UpdateProgessBar
-         , self.__OnError
-         , self.__OnSuccess
       )
-      self.tasks.append(task)
-
-   def __RunMatplotlib(self):
-      methodName, problemInstance = im.ReadInfo(self.outputDirectory.get())
+      self.jobRows[job] = JobRow(self.JobsFrame, self.nextJobRow, job, self.jobManager.Cancel)
+      self.nextJobRow += 1
+      self.jobManager.Submit(job)
+
+   def __ClearFinished(self):
+      for job in self.jobManager.RemoveFinished():
+         self.jobRows.pop(job).Destroy()
+
+   def __RunMatplotlib(self, outputDirectory: str = None):
+      if outputDirectory is None:
+         outputDirectory = self.outputDirectory.get()
+      methodName, problemInstance = im.ReadInfo(outputDirectory)
       RunDrawParetoFront(self.loop
-         , self.outputDirectory.get()
+         , outputDirectory
          , methodName
          , problemInstance
       )
 
-   def __UpdateProgessBar(self, progress: int):
-      self.progress.set(progress)
-
-   def __OnError(self, exitCode: int, error: str):
-      self.errorLabel = Label(self.MainFrame, text=error, foreground='Red')
-      self.errorLabel.grid(row=10, columnspan=2, sticky='s')
-      self.runButton["state"] = "active"
-      self.tasks = [self.tasks[0]]
-
-   def __OnSuccess(self):
-      self.runButton["state"] = "active"
-      self.tasks = [self.tasks[0]]
-      success = RunPareto(self.outputDirectory.get())
-      if success:
-         self.__RunMatplotlib()
+   def __OnSuccess(self, job: Job):
+      self.__RunMatplotlib(job.OutputDirectory)
 
    def __InitVariables(self):
       self.configFile = StringVar()
@@ -78,11 +109,10 @@ class SetupWindow():
       self.outputDirectory = StringVar()
       self.problemName = StringVar()
       self.RunsCount = StringVar(value=1)
-      self.progress = IntVar()
+      self.maxRunningJobs = StringVar(value=self.jobManager.MaxRunningJobs)
 
    def __OnClosing(self):
-      if self.thread is not None:
-         self.terminateThreadEvent.set()
+      self.jobManager.Shutdown()
       for task in self.tasks:
          task.cancel()
       self.loop.stop()
@@ -98,7 +128,7 @@ class SetupWindow():
 
    def CreateGUI(self):
       self.Root = Tk()
-      self.Root.geometry("500x350")
+      self.Root.geometry("600x550")
       self.Root.protocol("WM_DELETE_WINDOW", self.__OnClosing)
       self.Root.title("iMOPSE Demo")
 
@@ -150,12 +180,28 @@ class SetupWindow():
       self.RunsCountEntry = Entry(self.MainFrame, width=60, textvariable=self.RunsCount)
       self.RunsCountEntry.grid(row=9, column=0, sticky='ew')
 
-      self.runButton = Button(self.MainFrame, text="Run optimization", command=self.__RunOptimization)
-      self.runButton.grid(row=10, pady=10)
-      showData = Button(self.MainFrame, text="Show data", command=self.__RunMatplotlib)
-      showData.grid(row=10, column=1, padx=10, sticky='ew')
+      labelMaxRunningJobsFrame = Frame(self.MainFrame)
+      labelMaxRunningJobsFrame.grid(row=10, column=0, sticky='nesw')
+      labelMaxRunningJobs = Label(labelMaxRunningJobsFrame, text="Parallel jobs:")
+      labelMaxRunningJobs.pack(side=LEFT)
+      self.MaxRunningJobsEntry = Entry(self.MainFrame, width=60, textvariable=self.maxRunningJobs)
+      self.MaxRunningJobsEntry.grid(row=11, column=0, sticky='ew')
 
-      self.Progressbar = ttk.Progressbar(self.MainFrame, variable=self.progress)
-      self.Progressbar.grid(row=11, columnspan=2, sticky='ew')
+      self.runButton = Button(self.MainFrame, text="Add job", command=self.__AddJob)
+      self.runButton.grid(row=13, pady=10)
+      showData = Button(self.MainFrame, text="Show data", command=self.__RunMatplotlib)
+      showData.grid(row=13, column=1, padx=10, sticky='ew')
+
+      labelJobsFrame = Frame(self.MainFrame)
+      labelJobsFrame.grid(row=14, column=0, sticky='nesw')
+      labelJobs = Label(labelJobsFrame, text="Jobs:")
+      labelJobs.pack(side=LEFT)
+      clearFinished = Button(self.MainFrame, text="Clear finished", command=self.__ClearFinished)
+      clearFinished.grid(row=14, column=1, padx=10, sticky='ew')
+
+      self.JobsFrame = Frame(self.MainFrame)
+      self.JobsFrame.grid(row=15, columnspan=2, sticky='ew')
+      self.JobsFrame.grid_columnconfigure(0, weight=2)
+      self.JobsFrame.grid_columnconfigure(1, weight=1)
 
       return self.Root
\ No newline at end of file